@@ -0,0 +1,4 @@
+"""
+Benchmark suites for the OPLang compiler.
+Run a suite from the project root, e.g. python -m benchmarks.bench_list_scaling
+"""
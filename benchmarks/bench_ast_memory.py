@@ -0,0 +1,135 @@
+"""
+AST memory: slotted node classes against per-instance __dict__ nodes.
+
+Builds a program of about a million AST nodes in a fresh interpreter per
+layout and reports the node count, bytes per node (the node objects
+themselves, fields they share such as names and literal values are not
+counted), RSS after the build and peak RSS. The tree is built from
+repeated parses of one generated class with the fast parser. For the
+"dict" layout every parsed chunk is copied into plain classes of the
+same names with the fields in __dict__ (plus line and column, as the
+nodes used to carry) and the slotted chunk is dropped, so both layouts
+hold one full tree at their peak.
+
+Usage: python -m benchmarks.bench_ast_memory [--nodes N] [--layouts slots dict]
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import ROOT_DIR, print_table
+from benchmarks.bench_parse_modes import large_program
+from src.frontend.fast_parser import parse
+from src.utils.nodes import ASTNode, Program
+
+LAYOUTS = ("slots", "dict")
+CHUNK_STATEMENTS = 1000
+
+_dict_classes = {}
+
+
+def dict_copy(value):
+    """Copy value, replacing every node with an unslotted class of the same name."""
+    if isinstance(value, list):
+        return [dict_copy(v) for v in value]
+    if not isinstance(value, ASTNode):
+        return value
+    cls = _dict_classes.get(type(value))
+    if cls is None:
+        cls = _dict_classes[type(value)] = type(type(value).__name__, (), {})
+    node = cls()
+    node.line = None
+    node.column = None
+    for name, field in value.fields():
+        setattr(node, name, dict_copy(field))
+    return node
+
+
+def walk(value):
+    """Every node object under value."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, ASTNode):
+            yield value
+            stack.extend(field for _, field in value.fields())
+        elif hasattr(value, "__dict__"):
+            yield value
+            stack.extend(v for k, v in vars(value).items() if k not in ("line", "column"))
+
+
+def node_bytes(node):
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+def current_rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def build(layout, nodes):
+    """Build a tree of at least `nodes` nodes in this process and return its measurements."""
+    source = large_program(CHUNK_STATEMENTS)
+    start = time.perf_counter()
+    class_decls = []
+    count = 0
+    while count < nodes:
+        chunk = parse(source).class_decls
+        count += sum(1 for _ in walk(chunk))
+        class_decls.extend(dict_copy(chunk) if layout == "dict" else chunk)
+    program = Program([]) if layout == "slots" else dict_copy(Program([]))
+    program.class_decls = class_decls
+    seconds = time.perf_counter() - start
+    del chunk
+    gc.collect()
+    objects = list(walk(program))
+    return {
+        "nodes": len(objects),
+        "bytes_per_node": sum(node_bytes(n) for n in objects) / len(objects),
+        "rss": current_rss(),
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "seconds": seconds,
+    }
+
+
+def run_child(layout, nodes):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bench_ast_memory", "--child", layout, "--nodes", str(nodes)],
+                         env=env, cwd=ROOT_DIR, capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--nodes", type=int, default=1_000_000)
+    arg_parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    arg_parser.add_argument("--child", choices=LAYOUTS, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(build(args.child, args.nodes)))
+        return
+
+    results = {layout: run_child(layout, args.nodes) for layout in args.layouts}
+    base = results[args.layouts[-1]]
+    rows = []
+    for layout, r in results.items():
+        rows.append([layout, f"{r['nodes']:,}", f"{r['bytes_per_node']:.0f}", f"{r['rss'] / 2**20:.0f}",
+                     f"{r['peak_rss'] / 2**20:.0f}", f"{r['seconds']:.1f}",
+                     f"{base['bytes_per_node'] / r['bytes_per_node']:.2f}x"])
+    print_table(["layout", "nodes", "bytes/node", "RSS MiB", "peak RSS MiB", "build s", "node size ratio"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Checking thousands of small programs: io class rebuilt per program against the shared builtin library.
+
+Generates small, type-correct programs and checks all of them with a
+StaticChecker whose program scope builds the io class from a dict literal
+for every program, as the checker used to, and with a StaticChecker
+declaring the prebuilt classes of the builtin library. Both must give the
+same results; the table shows the time per program and how much of it
+the program scope took.
+
+Usage: python -m benchmarks.bench_builtin_library [--programs N ...] [--repeat N]
+"""
+
+import argparse
+
+from benchmarks.common import timed, print_table
+from benchmarks.bench_parallel_checker import check
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+from src.semantics.symbol_table import Symbol, ClassScope, ProgramScope
+from src.utils.type_table import INT, FLOAT, BOOLEAN, STRING, VOID
+
+
+class RebuildingChecker(StaticChecker):
+    """StaticChecker building a new io class for every program."""
+
+    def program_scope(self):
+        io_methods = {
+            "readInt": (INT, []),
+            "writeInt": (VOID, [INT]),
+            "writeIntLn": (VOID, [INT]),
+            "readFloat": (FLOAT, []),
+            "writeFloat": (VOID, [FLOAT]),
+            "writeFloatLn": (VOID, [FLOAT]),
+            "readBool": (BOOLEAN, []),
+            "writeBool": (VOID, [BOOLEAN]),
+            "writeBoolLn": (VOID, [BOOLEAN]),
+            "readStr": (STRING, []),
+            "writeStr": (VOID, [STRING]),
+            "writeStrLn": (VOID, [STRING]),
+        }
+        program = ProgramScope()
+        program.declare(ClassScope("io", None, {
+            name: Symbol(name, retType, is_static=True, params=params)
+            for name, (retType, params) in io_methods.items()
+        }))
+        return program
+
+
+def small_program(k):
+    return (f"class Main {{ static void main() {{ int x := {k}; "
+            f"if x > 1 then io.writeIntLn(x * 2); else io.writeStrLn(\"none\"); }} }}")
+
+
+def check_all(checker, asts):
+    return [check(checker, ast) for ast in asts]
+
+
+def scopes(checker, count):
+    for _ in range(count):
+        checker.program_scope()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--programs", type=int, nargs="+", default=[1000, 10000])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for count in args.programs:
+        asts = [parse(small_program(k)) for k in range(count)]
+        results = None
+        for name, checker in (("rebuilt per program", RebuildingChecker()), ("shared library", StaticChecker())):
+            seconds, result = timed(check_all, checker, asts, repeat=args.repeat)
+            scope_seconds, _ = timed(scopes, checker, count, repeat=args.repeat)
+            if results is not None and result != results:
+                raise SystemExit(f"{count} programs: {name} gives different results")
+            results = result
+            rows.append([count, name, f"{seconds / count * 1e6:.1f}", f"{scope_seconds / count * 1e6:.2f}"])
+    print_table(["programs", "io class", "check us/program", "scope us/program"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark for checker runs that fail on large expressions.
+
+Each program nests postfix calls (a.f(a.f(...(1 + true)...))) so the type
+error raised at the innermost operand is caught and re-raised by every
+enclosing postfix expression and finally by the invocation statement.
+The suite times the failing check and the rendering of the message
+separately; checking must not pay for stringifying the expression.
+
+Usage: python -m benchmarks.bench_checker_errors [--max-depth N] [--cap N]
+"""
+
+import argparse
+import sys
+
+from benchmarks.common import build_ast, timed, print_table
+from src.semantics.static_checker import StaticChecker
+from src.semantics.static_error import StaticError
+
+
+def failing_program(depth, width):
+    wide = " + ".join(["1"] * width)
+    expr = f"({wide}) + true"
+    for _ in range(depth):
+        expr = f"a.f({expr}, {wide})"
+    return (
+        "class A { int f(int x; int y) { return x; } }\n"
+        "class Main { static void main() { A a := new A(); " + expr + "; } }\n"
+    )
+
+
+def check_and_catch(ast):
+    try:
+        StaticChecker().check_program(ast)
+    except StaticError as error:
+        return error
+    raise AssertionError("program was expected to fail")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--max-depth", type=int, default=40)
+    arg_parser.add_argument("--width", type=int, default=50)
+    arg_parser.add_argument("--cap", type=int, default=None, help="StaticError.max_message_length")
+    args = arg_parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 200 * args.max_depth))
+    StaticError.max_message_length = args.cap
+
+    rows = []
+    for depth in sorted({d for d in (5, 10, 20, args.max_depth) if d <= args.max_depth}):
+        ast = build_ast(failing_program(depth, args.width))
+        check_seconds, error = timed(check_and_catch, ast, repeat=3)
+        render_seconds, message = timed(str, error)
+        rows.append([depth, f"{check_seconds * 1000:.2f}", f"{render_seconds * 1000:.2f}", len(message)])
+    print_table(["depth", "check ms", "render ms", "message chars"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Subtype checks on long inheritance chains: hierarchy index against a chain walk.
+
+Generates programs with a chain of N classes (C1 extends C0, C2 extends
+C1, ...) followed by a class whose methods assign and pass objects of
+the most derived class to variables and parameters of the base class, so
+every statement needs a subtype test across the whole chain. The
+programs are checked with StaticChecker, whose subtype tests use the
+class-hierarchy index, and with a checker that rebuilds the superclass
+list on every test as compareType used to. Both must give the same
+result before anything is reported.
+
+Usage: python -m benchmarks.bench_class_hierarchy [--classes N ...] [--statements N] [--repeat N]
+"""
+
+import argparse
+
+from benchmarks.common import timed, print_table
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+
+
+class ChainWalkChecker(StaticChecker):
+    """StaticChecker with the superclass walk compareType did before the index."""
+
+    def is_subclass(self, name, ancestor, program):
+        parentlist = [name]
+        if program.lookup(name) is not None:
+            parent = program.lookup(name).superclass
+            while parent is not None:
+                parentlist.append(parent)
+                parent = program.lookup(parent).superclass
+        return ancestor in parentlist
+
+
+def chain_program(classes, statements):
+    last = f"C{classes - 1}"
+    lines = ["class C0 { void keep(C0 p) {} }"]
+    lines += [f"class C{i} extends C{i - 1} {{}}" for i in range(1, classes)]
+    body = "\n".join(
+        f"        base := new {last}(); base.keep(deep); mid := deep;" for _ in range(statements)
+    )
+    lines.append(
+        f"class Main {{\n    static void main() {{\n        C0 base; C{classes // 2} mid; {last} deep := new {last}();\n"
+        f"{body}\n    }}\n}}"
+    )
+    return "\n".join(lines)
+
+
+def check(checker, ast):
+    try:
+        checker.check_program(ast)
+        return "Static checking passed"
+    except Exception as e:
+        return str(e)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--classes", type=int, nargs="+", default=[10, 100, 1000, 2000])
+    arg_parser.add_argument("--statements", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for classes in args.classes:
+        ast = parse(chain_program(classes, args.statements))
+        walk_time, walk = timed(check, ChainWalkChecker(), ast, repeat=args.repeat)
+        index_time, index = timed(check, StaticChecker(), ast, repeat=args.repeat)
+        if walk != index:
+            raise SystemExit(f"{classes} classes: checkers disagree: {walk!r} vs {index!r}")
+        for name, seconds in (("chain walk", walk_time), ("hierarchy index", index_time)):
+            rows.append([classes, args.statements, name, f"{seconds:.3f}",
+                         f"{seconds / args.statements * 1e6:.0f}", f"{walk_time / seconds:.1f}x"])
+    print_table(["classes", "statements", "subtype test", "check s", "us/statement", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+First-parse latency of a new process with and without the DFA cache.
+
+Trains a DFA cache on the test corpus, then starts fresh interpreters
+that import the front end and time their first parse (lexer, parser and
+ASTGeneration), once with the cache disabled (cold) and once with it
+loaded at import (warm). Two inputs are measured: a test-corpus program
+the cache was trained on and a generated program it has never seen.
+
+Usage: python -m benchmarks.bench_dfa_cache [--runs N] [--statements N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import ROOT_DIR, print_table
+from benchmarks.bench_fast_parser import valid_sources
+from benchmarks.bench_parse_modes import large_program
+from src.frontend.corpus import load_test_corpus
+from src.frontend.dfa_cache import DFA_CACHE_ENV, save_dfa_cache, train_dfa_cache
+from src.frontend.parsing import clear_dfa_caches
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+
+# run in the child: import time (the cache loads here), then the first and a second parse
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import src.frontend
+from benchmarks.common import build_ast
+imported = time.perf_counter()
+source = open(sys.argv[1], encoding="utf-8").read()
+build_ast(source)
+first = time.perf_counter()
+build_ast(source)
+second = time.perf_counter()
+print(json.dumps([imported - start, first - imported, second - first]))
+"""
+
+
+def run_child(source_file, cache):
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    env[DFA_CACHE_ENV] = cache or ""
+    out = subprocess.run([sys.executable, "-c", CHILD, source_file], env=env, cwd=ROOT_DIR,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--statements", type=int, default=100)
+    args = arg_parser.parse_args(argv)
+
+    corpus = load_test_corpus()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "OPLang.dfa")
+        clear_dfa_caches(OPLangLexer, OPLangParser)
+        train_dfa_cache(corpus)
+        states = save_dfa_cache(cache)
+        print(f"cache: {states} DFA states, {os.path.getsize(cache) / 1024:.0f} KiB\n")
+
+        inputs = [
+            ("largest test program (trained)", max(valid_sources(corpus), key=len)),
+            (f"generated {args.statements} stmts (unseen)", large_program(args.statements)),
+        ]
+        rows = []
+        for name, source in inputs:
+            source_file = os.path.join(tmp, "input.opl")
+            with open(source_file, "w", encoding="utf-8") as f:
+                f.write(source)
+            results = {}
+            for start, cache_file in (("cold", None), ("warm", cache)):
+                runs = [run_child(source_file, cache_file) for _ in range(args.runs)]
+                results[start] = [statistics.median(r[k] for r in runs) for k in range(3)]
+            for start, (imported, first, second) in results.items():
+                rows.append([name, start, f"{imported * 1000:.0f}", f"{first * 1000:.0f}",
+                             f"{second * 1000:.0f}", f"{results['cold'][1] / first:.1f}x"])
+    print_table(["input", "start", "import ms", "first parse ms", "second parse ms", "first parse speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Fast parser against the ANTLR front end.
+
+Builds the AST of the valid test-suite programs and of a generated large
+program with both backends: ANTLR (lexer, parser, ASTGeneration) and the
+hand-written fast parser. ANTLR is timed warm, after one untimed pass has
+filled its DFA caches. Every AST is checked to be identical between the
+two backends before anything is reported.
+
+Usage: python -m benchmarks.bench_fast_parser [--statements N] [--repeat N]
+"""
+
+import argparse
+
+from benchmarks.common import timed, print_table, build_ast
+from benchmarks.bench_parse_modes import large_program
+from src.frontend.corpus import load_test_corpus
+from src.frontend.fast_lexer import tokenize
+from src.frontend.fast_parser import parse
+
+
+def valid_sources(sources):
+    valid = []
+    for source in sources:
+        try:
+            parse(source)
+        except Exception:
+            continue
+        valid.append(source)
+    return valid
+
+
+def antlr_all(sources):
+    return [build_ast(source) for source in sources]
+
+
+def fast_all(sources):
+    return [parse(source) for source in sources]
+
+
+def tokenize_all(sources):
+    return [tokenize(source) for source in sources]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--statements", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    suites = [
+        ("test corpus (valid)", valid_sources(load_test_corpus())),
+        (f"large program ({args.statements} stmts)", [large_program(args.statements)]),
+    ]
+    rows = []
+    for name, sources in suites:
+        antlr_all(sources)  # warm the DFA caches
+        antlr_time, antlr_asts = timed(antlr_all, sources, repeat=args.repeat)
+        lex_time, _ = timed(tokenize_all, sources, repeat=args.repeat)
+        fast_time, fast_asts = timed(fast_all, sources, repeat=args.repeat)
+        if [str(x) for x in antlr_asts] != [str(x) for x in fast_asts]:
+            raise SystemExit(f"{name}: the backends built different ASTs")
+        rows.append([name, len(sources), f"{antlr_time:.3f}", f"{lex_time:.3f}", f"{fast_time:.3f}",
+                     f"{antlr_time / fast_time:.1f}x"])
+    print_table(["suite", "inputs", "antlr s", "fast lex s", "fast total s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
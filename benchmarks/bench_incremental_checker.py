@@ -0,0 +1,63 @@
+"""
+Re-checking large files after small edits: full check against an incremental session.
+
+Generates programs with many classes whose methods have long, type-correct
+bodies, then checks a stream of edited versions of each with StaticChecker
+and with a warm IncrementalChecker. A body edit changes the body of one
+method; a signature edit adds a method to the first class, which re-runs
+pass 0 of that class but re-checks only the new method. Both checkers
+must give the same result for every version. The incremental time
+includes hashing every member, which is most of it.
+
+Usage: python -m benchmarks.bench_incremental_checker [--methods N ...] [--statements N] [--repeat N]
+"""
+
+import argparse
+import itertools
+
+from benchmarks.common import timed, print_table
+from benchmarks.bench_parallel_checker import large_program, check
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+from src.semantics.incremental_checker import IncrementalChecker
+
+
+def edits(source, kind, count=4):
+    """count versions of source, each differing from the one before in a body or a signature."""
+    if kind == "body":
+        return [source.replace("return total;", f"return total + {k};", 1) for k in range(count)]
+    return [source.replace("class K0 {", f"class K0 {{ int extra{k}() {{ return {k}; }}", 1) for k in range(count)]
+
+
+def check_each(checker, asts):
+    return [check(checker, ast) for ast in asts]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--methods", type=int, nargs="+", default=[200, 1000, 4000])
+    arg_parser.add_argument("--statements", type=int, default=20, help="statements per method body")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for methods in args.methods:
+        source = large_program(methods, args.statements)
+        for kind in ("body", "signature"):
+            asts = [parse(x) for x in edits(source, kind)]
+            full_time, full = timed(check_each, StaticChecker(), asts, repeat=args.repeat)
+            session = IncrementalChecker()
+            session.check_program(parse(source))
+            stream = itertools.cycle(asts)
+            # every run after the first sees one edit against the version before
+            incremental_time, incremental = timed(
+                check_each, session, [next(stream) for _ in asts], repeat=args.repeat)
+            if incremental != full:
+                raise SystemExit(f"{methods} methods, {kind} edit: {incremental!r} vs {full!r}")
+            rows.append([methods, kind, f"{full_time / len(asts):.3f}", f"{incremental_time / len(asts):.3f}",
+                         session.checked, f"{full_time / incremental_time:.1f}x"])
+    print_table(["methods", "edit", "full s", "incremental s", "re-checked", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Scaling benchmark for list-shaped constructs.
+
+Builds programs with a growing number of statements in one block and a
+growing number of classes in one file, then times parsing and AST
+generation. Time per element should stay flat as the size grows and no
+size may hit the Python recursion limit.
+
+Usage: python -m benchmarks.bench_list_scaling [--max-statements N] [--max-classes N]
+"""
+
+import argparse
+import sys
+
+from benchmarks.common import parse_tree, timed, print_table
+from src.astgen.ast_generation import ASTGeneration
+
+
+def statements_program(n):
+    body = "\n".join(f"            x := x + {i};" for i in range(n))
+    return (
+        "class Main {\n"
+        "    static void main() {\n"
+        "        int x := 0;\n"
+        f"{body}\n"
+        "    }\n"
+        "}\n"
+    )
+
+
+def classes_program(n):
+    classes = "\n".join(f"class C{i} {{ int a{i}, b{i}; }}" for i in range(n))
+    return classes + "\nclass Main { static void main() {} }\n"
+
+
+def sizes_up_to(limit, start):
+    size = start
+    while size < limit:
+        yield size
+        size *= 10
+    yield limit
+
+
+def run_case(make_source, size, count_of):
+    source = make_source(size)
+    parse_time, tree = timed(parse_tree, source)
+    ast_time, ast = timed(ASTGeneration().visit, tree)
+    assert count_of(ast) >= size
+    total = parse_time + ast_time
+    return [size, f"{parse_time:.3f}", f"{ast_time:.3f}", f"{total / size * 1e6:.1f}"]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--max-statements", type=int, default=100_000)
+    arg_parser.add_argument("--max-classes", type=int, default=10_000)
+    args = arg_parser.parse_args(argv)
+
+    # keep the limit low so that any regression to recursive list building fails loudly
+    sys.setrecursionlimit(2000)
+    headers = ["size", "parse s", "ast s", "us/elem"]
+
+    print("Statements in one block")
+    rows = [
+        run_case(statements_program, n, lambda ast: len(ast.class_decls[0].members[0].body.statements))
+        for n in sizes_up_to(args.max_statements, 100)
+    ]
+    print_table(headers, rows)
+    print()
+
+    print("Classes in one file")
+    rows = [
+        run_case(classes_program, n, lambda ast: len(ast.class_decls))
+        for n in sizes_up_to(args.max_classes, 10)
+    ]
+    print_table(headers, rows)
+
+
+if __name__ == "__main__":
+    main()
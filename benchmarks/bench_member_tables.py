@@ -0,0 +1,116 @@
+"""
+Class member tables on wide, deep hierarchies: chained scopes against flattened copies.
+
+Generates programs with W independent inheritance chains of D classes
+each, every class declaring M attributes and one method of its own, and
+a main method that reads inherited attributes and calls inherited
+methods on the most derived class of every chain. The programs are
+checked with StaticChecker, whose class scopes only hold their own
+members and resolve inherited names through the superclass chain, and
+with the class scopes the checker used to build, which copy the whole
+member table of the superclass into every subclass. Both must give the
+same result; the table reports the best check time and the peak memory
+traced while checking.
+
+Usage: python -m benchmarks.bench_member_tables [--shape WxD ...] [--members M] [--statements N] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import tracemalloc
+
+from benchmarks.common import timed, print_table
+from src.frontend.fast_parser import parse
+from src.semantics import static_checker
+from src.semantics.static_checker import StaticChecker
+from src.semantics.symbol_table import ClassScope
+
+
+class FlatClassScope(ClassScope):
+    """Class scope holding a copy of every inherited member, as before the chained tables."""
+
+    __slots__ = ()
+
+    def __init__(self, name, parent=None, members=None):
+        super().__init__(name, parent, members)
+        if parent is not None:
+            flat = parent.members.copy()
+            flat.update(self.members)
+            self.members = flat
+
+    def lookup(self, name):
+        return self.members.get(name)
+
+
+@contextlib.contextmanager
+def flat_class_scopes():
+    chained = static_checker.ClassScope
+    static_checker.ClassScope = FlatClassScope
+    try:
+        yield
+    finally:
+        static_checker.ClassScope = chained
+
+
+def hierarchy_program(width, depth, members, statements):
+    lines = []
+    for w in range(width):
+        for d in range(depth):
+            ext = f" extends K{w}_{d - 1}" if d else ""
+            attrs = " ".join(f"int a{d}_{m};" for m in range(members))
+            lines.append(f"class K{w}_{d}{ext} {{ {attrs} int get{d}() {{ return {d}; }} }}")
+    body = []
+    for i in range(statements):
+        w, d = i % width, i % depth
+        body.append(f"x{w}.a{d}_{i % members} := x{w}.get{d}() + x{w}.a0_0;")
+    decls = " ".join(f"K{w}_{depth - 1} x{w} := new K{w}_{depth - 1}();" for w in range(width))
+    lines.append(f"class Main {{ static void main() {{ {decls} {' '.join(body)} }} }}")
+    return "\n".join(lines)
+
+
+def check(ast):
+    try:
+        StaticChecker().check_program(ast)
+        return "Static checking passed"
+    except Exception as e:
+        return str(e)
+
+
+def traced_peak(ast):
+    tracemalloc.start()
+    try:
+        check(ast)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--shape", nargs="+", default=["1x50", "1x400", "20x50", "20x200"],
+                            help="WIDTHxDEPTH of the generated hierarchies")
+    arg_parser.add_argument("--members", type=int, default=10)
+    arg_parser.add_argument("--statements", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for shape in args.shape:
+        width, depth = map(int, shape.split("x"))
+        ast = parse(hierarchy_program(width, depth, args.members, args.statements))
+        with flat_class_scopes():
+            flat_time, flat = timed(check, ast, repeat=args.repeat)
+            flat_peak = traced_peak(ast)
+        chained_time, chained = timed(check, ast, repeat=args.repeat)
+        chained_peak = traced_peak(ast)
+        if flat != chained:
+            raise SystemExit(f"{shape}: member tables disagree: {flat!r} vs {chained!r}")
+        for name, seconds, peak in (("flattened copies", flat_time, flat_peak),
+                                    ("chained scopes", chained_time, chained_peak)):
+            rows.append([f"{width}x{depth}", width * depth, name, f"{seconds:.3f}",
+                         f"{peak / 2 ** 20:.1f}", f"{flat_time / seconds:.1f}x"])
+    print_table(["shape", "classes", "member tables", "check s", "peak MiB", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Name resolution: cost of the slot-assigning pass next to parsing and checking.
+
+Generates programs with many classes whose methods have long, type-correct
+bodies, then times the fast parser, StaticChecker and NameResolver on each.
+The table shows how much the resolution pass adds to a front end run and
+how many names it bound, and compares the declarations of every frame
+with the slots it needs once blocks give theirs back.
+
+Usage: python -m benchmarks.bench_name_resolution [--methods N ...] [--statements N] [--repeat N]
+"""
+
+import argparse
+
+from benchmarks.common import timed, print_table
+from benchmarks.bench_parallel_checker import check
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+from src.semantics.name_resolution import NameResolver
+
+
+def scoped_body(statements):
+    lines = ["int total := 0; int i;"]
+    for k in range(statements):
+        lines.append(f"{{ int a{k} := total + p; float b := a{k} * 1.5; total := a{k} - {k}; }}")
+    lines.append("for i := 1 to p do { int c := i * 2; total := total + c; }")
+    lines.append("return total;")
+    return " ".join(lines)
+
+
+def scoped_program(methods, statements, per_class=20):
+    classes = []
+    body = scoped_body(statements)
+    for c in range((methods + per_class - 1) // per_class):
+        count = min(per_class, methods - c * per_class)
+        members = [f"int m{m}(int p) {{ {body} }}" for m in range(count)]
+        classes.append(f"class K{c} {{ {' '.join(members)} }}")
+    classes.append("class Main { static void main() { K0 k := new K0(); io.writeInt(k.m0(1)); } }")
+    return "\n".join(classes)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--methods", type=int, nargs="+", default=[200, 1000, 4000])
+    arg_parser.add_argument("--statements", type=int, default=20, help="blocks per method body")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for methods in args.methods:
+        source = scoped_program(methods, args.statements)
+        parse_time, ast = timed(parse, source, repeat=args.repeat)
+        check_time, result = timed(check, StaticChecker(), ast, repeat=args.repeat)
+        if result != "Static checking passed":
+            raise SystemExit(f"{methods} methods: {result}")
+        resolve_time, bindings = timed(NameResolver().resolve, ast, repeat=args.repeat)
+        declarations = sum(len(frame.declarations) for frame in bindings.frames.values())
+        slots = sum(frame.size for frame in bindings.frames.values())
+        rows.append([methods, f"{parse_time:.3f}", f"{check_time:.3f}", f"{resolve_time:.3f}",
+                     f"{resolve_time / (parse_time + check_time):.0%}", len(bindings.bindings),
+                     declarations, slots])
+    print_table(["methods", "parse s", "check s", "resolve s", "resolve/front end", "bound names",
+                 "declarations", "slots"], rows)
+
+
+if __name__ == "__main__":
+    main()
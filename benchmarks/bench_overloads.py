@@ -0,0 +1,102 @@
+"""
+Constructor overload resolution: linear scan against the overload index.
+
+Generates a class with hundreds of constructors of one arity (every
+combination of int, string and boolean parameters) and a method creating
+objects with argument lists matching constructors at random positions,
+then checks it with StaticChecker and with a StaticChecker scanning every
+constructor with compareType, in pass 0 to find redeclared constructors
+and at every object creation. Both must give the same result. A variant
+adds float parameters, whose overloads accept int arguments and are
+compared one by one in both checkers.
+
+Usage: python -m benchmarks.bench_overloads [--constructors N ...] [--creations N] [--repeat N]
+"""
+
+import argparse
+import itertools
+import random
+
+from benchmarks.common import timed, print_table
+from benchmarks.bench_parallel_checker import check
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+from src.semantics.static_error import Redeclared, TypeMismatchInExpression
+from src.semantics.symbol_table import Lifecycle
+from src.utils.type_table import class_type
+
+VALUES = {"int": "1", "string": "\"s\"", "boolean": "true", "float": "2.5"}
+
+
+class LinearScanChecker(StaticChecker):
+    """StaticChecker comparing every constructor, as before the overload index."""
+
+    def visit_constructor_decl(self, node, o=None):
+        if o[0] == 1:
+            return super().visit_constructor_decl(node, o)
+        name = node.name
+        paramlist = {}
+        [self.visit(x, (0, paramlist)) for x in node.params]
+        paramlist = list(paramlist.values())
+        if o[1].get(name) is None:
+            o[1][name] = Lifecycle(name)
+            o[1][name].constructors = [paramlist]
+        elif o[1][name].constructors is not None:
+            for params in o[1][name].constructors:
+                if all(self.compareType(x, y, o) for x, y in zip(params, paramlist)):
+                    raise Redeclared("Constructor", name)
+            o[1][name].constructors.append(paramlist)
+        else:
+            o[1][name].constructors = [paramlist]
+
+    def visit_object_creation(self, node, o=None):
+        if o.program.lookup(node.class_name) is None or not node.args:
+            return super().visit_object_creation(node, o)
+        args = [self.visit(x, o)[0] for x in node.args]
+        lifecycle = o.program.lookup(node.class_name).lookup(node.class_name)
+        if lifecycle is not None and lifecycle.constructors is not None:
+            for params in lifecycle.constructors:
+                if all(self.compareType(x, y, o) for x, y in zip(params, args)):
+                    return class_type(node.class_name), True
+        raise TypeMismatchInExpression(node)
+
+
+def overload_program(constructors, creations, types, seed=0):
+    arity = 1
+    while len(types) ** arity < constructors:
+        arity += 1
+    signatures = list(itertools.product(types, repeat=arity))[:constructors]
+    rng = random.Random(seed)
+    lines = [f"K({'; '.join(f'{t} p{i}' for i, t in enumerate(s))}) {{}}" for s in signatures]
+    calls = []
+    for _ in range(creations):
+        signature = rng.choice(signatures)
+        # float parameters are passed ints, so they only match through coercion
+        args = ", ".join(VALUES["int" if t == "float" else t] for t in signature)
+        calls.append(f"K k{len(calls)} := new K({args});")
+    return (f"class K {{ {' '.join(lines)} }}\n"
+            f"class Main {{ static void main() {{ {' '.join(calls)} }} }}")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--constructors", type=int, nargs="+", default=[27, 243, 729])
+    arg_parser.add_argument("--creations", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for types in (("int", "string", "boolean"), ("int", "string", "boolean", "float")):
+        for constructors in args.constructors:
+            ast = parse(overload_program(constructors, args.creations, types))
+            linear_time, linear = timed(check, LinearScanChecker(), ast, repeat=args.repeat)
+            index_time, indexed = timed(check, StaticChecker(), ast, repeat=args.repeat)
+            if linear != indexed:
+                raise SystemExit(f"{constructors} constructors: {indexed!r} vs linear scan {linear!r}")
+            rows.append(["/".join(types), constructors, f"{linear_time:.3f}", f"{index_time:.3f}",
+                         f"{linear_time / index_time:.1f}x", indexed[:40]])
+    print_table(["parameter types", "constructors", "scan s", "index s", "speedup", "result"], rows)
+
+
+if __name__ == "__main__":
+    main()
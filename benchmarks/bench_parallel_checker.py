@@ -0,0 +1,75 @@
+"""
+Static checking of large files: serial pass 1 against a process pool.
+
+Generates programs with many classes whose methods have long, type-correct
+bodies, and checks each with StaticChecker and with ParallelStaticChecker
+at several pool sizes. All runs must give the same result. Speedups need
+as many free cores as workers; on fewer cores the table shows the cost of
+starting the pool and shipping the signature table and method batches.
+
+Usage: python -m benchmarks.bench_parallel_checker [--methods N ...] [--statements N] [--workers N ...] [--repeat N]
+"""
+
+import argparse
+
+from benchmarks.common import timed, print_table
+from src.frontend.fast_parser import parse
+from src.semantics.static_checker import StaticChecker
+from src.semantics.parallel_checker import ParallelStaticChecker, default_workers
+
+
+def method_body(statements):
+    lines = ["int i; int total := 0; float f := 1.5; string s := \"a\";"]
+    for k in range(statements):
+        lines.append(f"total := total + p * {k} - this.n; f := f * 2 + total; "
+                     f"if total > {k} then s := s ^ \"b\"; else this.n := total % 7;")
+    lines.append("for i := 1 to p do { total := total + i; }")
+    lines.append("return total;")
+    return " ".join(lines)
+
+
+def large_program(methods, statements, per_class=20):
+    classes = []
+    body = method_body(statements)
+    for c in range((methods + per_class - 1) // per_class):
+        count = min(per_class, methods - c * per_class)
+        members = [f"int m{m}(int p) {{ {body} }}" for m in range(count)]
+        classes.append(f"class K{c} {{ int n := 3; {' '.join(members)} }}")
+    classes.append("class Main { static void main() { K0 k := new K0(); io.writeInt(k.m0(1)); } }")
+    return "\n".join(classes)
+
+
+def check(checker, ast):
+    try:
+        checker.check_program(ast)
+        return "Static checking passed"
+    except Exception as e:
+        return str(e)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--methods", type=int, nargs="+", default=[200, 1000, 4000])
+    arg_parser.add_argument("--statements", type=int, default=20, help="statements per method body")
+    arg_parser.add_argument("--workers", type=int, nargs="+",
+                            default=sorted({2, 4, default_workers()} - {1}))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    print(f"{default_workers()} usable CPUs")
+    rows = []
+    for methods in args.methods:
+        ast = parse(large_program(methods, args.statements))
+        serial_time, serial = timed(check, StaticChecker(), ast, repeat=args.repeat)
+        rows.append([methods, "serial", f"{serial_time:.3f}", "1.0x"])
+        for workers in args.workers:
+            checker = ParallelStaticChecker(workers=workers, min_members=0)
+            seconds, result = timed(check, checker, ast, repeat=args.repeat)
+            if result != serial:
+                raise SystemExit(f"{methods} methods, {workers} workers: {result!r} vs serial {serial!r}")
+            rows.append([methods, f"{workers} workers", f"{seconds:.3f}", f"{serial_time / seconds:.1f}x"])
+    print_table(["methods", "pass 1", "check s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
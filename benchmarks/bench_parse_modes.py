@@ -0,0 +1,68 @@
+"""
+Parse latency by prediction mode.
+
+Parses the test-suite corpus and a generated large program with full LL,
+pure SLL and two-stage (SLL, then LL on error) prediction, and reports
+wall time plus how often the two-stage fallback fired. Every mode starts
+from cold DFA caches so the numbers are comparable.
+
+Usage: python -m benchmarks.bench_parse_modes [--statements N] [--repeat N]
+"""
+
+import argparse
+
+from antlr4 import InputStream, CommonTokenStream
+from benchmarks.common import timed, print_table
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.frontend.corpus import load_test_corpus
+from src.frontend.parsing import ParseStats, run_program, clear_dfa_caches, TWO_STAGE, PARSE_MODES
+
+
+def large_program(statements):
+    methods = []
+    for m in range(max(statements // 100, 1)):
+        body = "\n".join(
+            f"        if a[{i % 10}] > {i} then io.writeIntLn(a[{i % 10}] * {i}); else b := b ^ \"x\";"
+            for i in range(100)
+        )
+        methods.append(f"    void m{m}() {{\n        int[10] a; string b := \"\";\n{body}\n    }}")
+    return "class Big {\n" + "\n".join(methods) + "\n    static void main() {}\n}\n"
+
+
+def parse_all(sources, mode, stats):
+    failures = 0  # lexer errors, syntax errors are recovered since no listener is attached
+    for source in sources:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        try:
+            run_program(parser, mode, stats)
+        except Exception:
+            failures += 1
+    return failures
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--statements", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    suites = [
+        ("test corpus", load_test_corpus()),
+        (f"large program ({args.statements} stmts)", [large_program(args.statements)]),
+    ]
+    rows = []
+    for name, sources in suites:
+        for mode in PARSE_MODES:
+            clear_dfa_caches(OPLangLexer, OPLangParser)
+            stats = ParseStats()
+            cold, _ = timed(parse_all, sources, mode, stats)
+            warm, failures = timed(parse_all, sources, mode, ParseStats(), repeat=args.repeat)
+            fallbacks = f"{stats.ll_fallbacks}/{stats.sll_attempts}" if mode == TWO_STAGE else "-"
+            rows.append([name, mode, len(sources), failures, f"{cold:.3f}", f"{warm:.3f}", fallbacks])
+    print_table(["suite", "mode", "inputs", "raised", "cold s", "warm s", "LL fallbacks"], rows)
+
+
+if __name__ == "__main__":
+    main()
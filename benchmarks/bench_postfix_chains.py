@@ -0,0 +1,95 @@
+"""
+Regression benchmark for postfix chains in ASTGeneration.
+
+Generates deep call chains (a.f(b.f(...))), long builder chains
+(new B().m().m()...) and nested index chains (a[a[...]]), times AST
+generation and counts how often each parse-tree node is visited. The
+suite exits with status 1 if any node is visited more than once.
+
+Usage: python -m benchmarks.bench_postfix_chains [--max-depth N] [--max-length N]
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from benchmarks.common import parse_tree, timed, print_table
+from src.astgen.ast_generation import ASTGeneration
+
+
+class CountingASTGeneration(ASTGeneration):
+    """ASTGeneration that records how many times each parse-tree node is visited."""
+
+    def __init__(self):
+        super().__init__()
+        self.visits = Counter()
+
+    def visit(self, tree):
+        self.visits[id(tree)] += 1
+        return super().visit(tree)
+
+
+def call_chain(depth):
+    expr = "x"
+    for i in range(depth):
+        expr = f"a{i}.f({expr}, {i})"
+    return expr
+
+
+def builder_chain(length):
+    return "new Builder()" + "".join(f".with{i % 7}({i})" for i in range(length)) + ".build()"
+
+
+def index_chain(depth):
+    expr = "0"
+    for _ in range(depth):
+        expr = f"a[{expr}]"
+    return expr
+
+
+def program_for(expr):
+    return "class Main { static void main() { " + expr + "; x := " + expr + "; } }"
+
+
+def run_case(name, size, expr):
+    tree = parse_tree(program_for(expr))
+    generator = CountingASTGeneration()
+    seconds, _ = timed(generator.visit, tree)
+    nodes = len(generator.visits)
+    max_visits = max(generator.visits.values())
+    return [name, size, nodes, max_visits, f"{seconds * 1000:.2f}"], max_visits
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--max-depth", type=int, default=60)
+    arg_parser.add_argument("--max-length", type=int, default=2000)
+    args = arg_parser.parse_args(argv)
+
+    # nested chains recurse through the ANTLR parser itself
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 200 * args.max_depth))
+
+    rows = []
+    worst = 0
+    depths = sorted({d for d in (5, 10, 20, 40, args.max_depth) if d <= args.max_depth})
+    lengths = sorted({n for n in (10, 100, 1000, args.max_length) if n <= args.max_length})
+    cases = (
+        [("call chain", d, call_chain(d)) for d in depths]
+        + [("builder chain", n, builder_chain(n)) for n in lengths]
+        + [("index chain", d, index_chain(d)) for d in depths]
+    )
+    for name, size, expr in cases:
+        row, max_visits = run_case(name, size, expr)
+        rows.append(row)
+        worst = max(worst, max_visits)
+
+    print_table(["case", "size", "nodes", "max visits", "ast ms"], rows)
+    if worst > 1:
+        print(f"FAIL: a parse-tree node was visited {worst} times")
+        return 1
+    print("OK: every parse-tree node visited exactly once")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
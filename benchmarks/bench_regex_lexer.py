@@ -0,0 +1,74 @@
+"""
+Lexer throughput: ANTLR lexer against the regex master-pattern lexer.
+
+Builds multi-megabyte inputs by concatenating the test programs that lex
+without error, then tokenizes them with OPLangLexer, with RegexLexer
+(CommonTokens, as fed to the parser) and with the bare regex scan()
+loop. Token streams are checked to be identical before anything is
+reported.
+
+Usage: python -m benchmarks.bench_regex_lexer [--megabytes N ...] [--repeat N]
+"""
+
+import argparse
+
+from antlr4 import InputStream
+from benchmarks.common import timed, print_table
+from build.OPLangLexer import OPLangLexer
+from src.frontend.corpus import load_test_corpus
+from src.frontend.regex_lexer import RegexLexer, scan, lexer_tables
+
+
+def lexable_corpus():
+    sources = []
+    for source in load_test_corpus():
+        try:
+            list(scan(source))
+        except Exception:
+            continue
+        sources.append(source)
+    return "\n".join(sources)
+
+
+def sized_input(corpus, megabytes):
+    size = int(megabytes * 1024 * 1024)
+    return (corpus + "\n") * (size // (len(corpus) + 1) + 1)
+
+
+def antlr_tokens(source):
+    return OPLangLexer(InputStream(source)).getAllTokens()
+
+
+def regex_tokens(source):
+    return RegexLexer(InputStream(source)).getAllTokens()
+
+
+def scan_tokens(source):
+    return list(scan(source))
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 4])
+    arg_parser.add_argument("--repeat", type=int, default=1)
+    args = arg_parser.parse_args(argv)
+
+    lexer_tables()  # read the grammar outside the timings
+    corpus = lexable_corpus()
+    rows = []
+    for megabytes in args.megabytes:
+        source = sized_input(corpus, megabytes)
+        mb = len(source) / (1024 * 1024)
+        antlr_time, antlr = timed(antlr_tokens, source, repeat=args.repeat)
+        regex_time, regex = timed(regex_tokens, source, repeat=args.repeat)
+        scan_time, _ = timed(scan_tokens, source, repeat=args.repeat)
+        if [(t.type, t.text, t.line, t.column) for t in antlr] != [(t.type, t.text, t.line, t.column) for t in regex]:
+            raise SystemExit(f"{megabytes} MB: the lexers produced different tokens")
+        for name, seconds in (("antlr", antlr_time), ("regex", regex_time), ("regex scan", scan_time)):
+            rows.append([f"{mb:.1f}", len(antlr), name, f"{seconds:.2f}", f"{mb / seconds:.2f}",
+                         f"{antlr_time / seconds:.1f}x"])
+    print_table(["MB", "tokens", "lexer", "seconds", "MB/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Per-input cost of new front-end objects against a pooled session.
+
+Runs many small inputs the way the test helpers used to, with a new
+InputStream, lexer, token stream, parser and ASTGeneration per input,
+and through one CompilationSession that resets and reuses them. Two
+workloads: the valid test-suite programs and generated one-method
+snippets, each set up only (objects ready, nothing lexed), tokenized
+and built into ASTs. The pooled ASTs are checked to be identical to the
+fresh ones before anything is reported; ANTLR is timed warm in both
+cases.
+
+Usage: python -m benchmarks.bench_session_pool [--snippets N] [--repeat N]
+"""
+
+import argparse
+
+from antlr4 import InputStream, CommonTokenStream
+from benchmarks.common import timed, print_table, build_ast
+from benchmarks.bench_fast_parser import valid_sources
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.frontend.corpus import load_test_corpus
+from src.frontend.session import CompilationSession
+
+
+def snippets(count):
+    return [
+        f"class C{i} {{ int f{i}(int a; int b) {{ var x := a * {i} + b; return x - {i % 7}; }} }}"
+        for i in range(count)
+    ]
+
+
+def fresh_setup(sources):
+    return [OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source)))) for source in sources]
+
+
+def pooled_setup(session, sources):
+    return [session.load(source) for source in sources]
+
+
+def fresh_tokens(sources):
+    result = []
+    for source in sources:
+        stream = CommonTokenStream(OPLangLexer(InputStream(source)))
+        stream.fill()
+        result.append(stream.tokens)
+    return result
+
+
+def pooled_tokens(session, sources):
+    return [session.tokens(source) for source in sources]
+
+
+def fresh_asts(sources):
+    return [build_ast(source) for source in sources]
+
+
+def pooled_asts(session, sources):
+    return [session.build_ast(source) for source in sources]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--snippets", type=int, default=5000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    session = CompilationSession()
+    workloads = [
+        ("test programs", valid_sources(load_test_corpus())),
+        (f"{args.snippets} snippets", snippets(args.snippets)),
+    ]
+    rows = []
+    for name, sources in workloads:
+        fresh_asts(sources)  # fill the DFA caches
+        if list(map(str, fresh_asts(sources))) != list(map(str, pooled_asts(session, sources))):
+            raise SystemExit(f"{name}: the pooled session built different ASTs")
+        stages = (("setup", fresh_setup, pooled_setup), ("tokens", fresh_tokens, pooled_tokens),
+                  ("ast", fresh_asts, pooled_asts))
+        for stage, fresh, pooled in stages:
+            fresh_time, _ = timed(fresh, sources, repeat=args.repeat)
+            pooled_time, _ = timed(pooled, session, sources, repeat=args.repeat)
+            for how, seconds in (("fresh", fresh_time), ("pooled", pooled_time)):
+                rows.append([name, stage, how, f"{seconds:.3f}", f"{seconds / len(sources) * 1e6:.0f}",
+                             f"{fresh_time / seconds:.2f}x"])
+    print_table(["inputs", "stage", "objects", "seconds", "us/input", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
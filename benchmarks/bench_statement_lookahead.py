@@ -0,0 +1,76 @@
+"""
+Lookahead needed by statement-level grammar decisions.
+
+Profiles the test corpus and a generated program full of long
+assignment targets (a.b.c[i].d := ...) and nested if/for statements,
+and prints, for each decision in a statement-level rule, how many tokens
+of lookahead ANTLR needed to pick an alternative. Bounded decisions keep
+the same maximum however long the statements get.
+
+    python -m benchmarks.bench_statement_lookahead
+"""
+
+import argparse
+
+from benchmarks.common import print_table
+from build.OPLangParser import OPLangParser
+from src.frontend.corpus import load_test_corpus
+from src.frontend.profiler import profile_sources
+
+STATEMENT_RULES = (
+    "vardecllist",
+    "statementlist",
+    "statement",
+    "exprstatement",
+    "reassign",
+    "lhs",
+    "ifstatement",
+    "iftail",
+    "forstatement",
+)
+
+
+def long_statements(depth):
+    """A method whose assignments, calls and if/for headers grow with depth."""
+    chain = "".join(f".f{i}" for i in range(depth)) + "[0]"
+    cond = " && ".join(f"(x{i} > {i})" for i in range(depth))
+    bound = " + ".join(f"n{i}" for i in range(depth))
+    body = "\n".join([
+        f"        this{chain} := 1;",
+        f"        this{chain}.g();",
+        f"        if {cond} then {{ x := 1; }} else {{ x := 2; }}",
+        f"        if {cond} then x := 1; else x := 2;",
+        f"        for i := 0 to {bound} do {{ x := i; }}",
+        f"        for i := 0 to {bound} do x := i;",
+    ])
+    return f"class A {{\n    void m() {{\n{body}\n    }}\n}}"
+
+
+def rule_rows(decisions, suite):
+    rows = []
+    for rule in STATEMENT_RULES:
+        if rule not in OPLangParser.ruleNames:
+            continue
+        infos = [d for d in decisions if d.rule_name == rule]
+        used = [d for d in infos if d.invocations]
+        if not used:
+            rows.append([suite, rule, "-", "LL(1)" if infos else "no decision", "-", "-", "-", "-"])
+        for d in used:
+            rows.append([suite, rule, d.decision, d.invocations, f"{d.average_look:.2f}",
+                         d.max_look, d.ll_fallbacks, d.ambiguities])
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--depths", type=int, nargs="+", default=[4, 16, 64])
+    args = arg_parser.parse_args()
+
+    rows = rule_rows(profile_sources(load_test_corpus()), "test corpus")
+    for depth in args.depths:
+        rows += rule_rows(profile_sources([long_statements(depth)]), f"depth {depth}")
+    print_table(["suite", "rule", "decision", "invocations", "avg look", "max look", "LL fallbacks", "ambiguities"], rows)
+
+
+if __name__ == "__main__":
+    main()
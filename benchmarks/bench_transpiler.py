@@ -0,0 +1,62 @@
+"""
+Transpiler: the programs of bench_vm run as Python code objects and on the virtual machine.
+
+Each program is loaded through a CodeCache in a temporary directory, once
+with the cache empty, which parses, checks, folds, transpiles and
+compiles it, and once with its code object cached, which reads the
+marshalled code object back and skips the front end. The table shows both
+load times, the best run time of the code object under Runtime and of the
+bytecode of CodeGenerator on the VirtualMachine, and how much faster the
+Python back end runs; the run checks the output of both back ends against
+the value the program must print.
+
+Usage: python -m benchmarks.bench_transpiler [--scale N] [--programs NAME ...] [--repeat N]
+"""
+
+import argparse
+import io
+import tempfile
+
+from benchmarks.common import timed, print_table
+from benchmarks.bench_vm import PROGRAMS, compile_source, execute
+from src.codegen import CodeCache, Runtime
+
+
+def cold_load(cache, source):
+    cache.clear()
+    return cache.load(source)
+
+
+def run_python(code):
+    output = io.StringIO()
+    Runtime(io.StringIO(), output).run(code)
+    return output.getvalue()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--scale", type=int, default=2, help="work per program")
+    arg_parser.add_argument("--programs", nargs="+", choices=list(PROGRAMS), default=list(PROGRAMS))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CodeCache(directory)
+        for name in args.programs:
+            source, expected = PROGRAMS[name](args.scale)
+            cold_time, code = timed(cold_load, cache, source, repeat=args.repeat)
+            cached_time, code = timed(cache.load, source, repeat=args.repeat)
+            module = compile_source(source, True)
+            vm_time, vm_output = timed(execute, module, repeat=args.repeat)
+            python_time, python_output = timed(run_python, code, repeat=args.repeat)
+            for result in (vm_output, python_output):
+                if result != expected:
+                    raise SystemExit(f"{name}: printed {result!r}, expected {expected!r}")
+            rows.append([name, f"{cold_time:.3f}", f"{cached_time * 1000:.2f}", f"{vm_time:.3f}",
+                         f"{python_time:.3f}", f"{vm_time / python_time:.2f}x"])
+    print_table(["program", "compile s", "cached load ms", "vm run s", "python run s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
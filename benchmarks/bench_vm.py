@@ -0,0 +1,197 @@
+"""
+Virtual machine: compute-heavy OPLang programs compiled to bytecode and run.
+
+Each program is parsed with the fast parser, compiled by CodeGenerator
+with and without constant folding, and run on the VirtualMachine. The
+table shows the time to compile, the size of the bytecode and the best
+run time of both builds, and the run checks the output of every program
+against the value it must print.
+
+Usage: python -m benchmarks.bench_vm [--scale N] [--programs NAME ...] [--repeat N]
+"""
+
+import argparse
+import io
+
+from benchmarks.common import timed, print_table
+from src.frontend.fast_parser import parse
+from src.codegen import CodeGenerator, VirtualMachine
+
+
+def fib(scale):
+    n = 20 + scale
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    source = f"""
+class Fib {{
+    static int fib(int n) {{
+        if n < 2 then return n;
+        return Fib.fib(n - 1) + Fib.fib(n - 2);
+    }}
+    static void main() {{ io.writeIntLn(Fib.fib({n})); }}
+}}"""
+    return source, f"{a}\n"
+
+
+def sieve(scale):
+    n = 20000 * scale
+    flags = bytearray([1]) * (n + 1)
+    flags[0:2] = b"\0\0"
+    for i in range(2, int(n ** 0.5) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+    source = f"""
+class Sieve {{
+    static void main() {{
+        boolean[{n + 1}] composite;
+        int i, j, count := 0;
+        for i := 2 to {n} do {{
+            if composite[i] then continue;
+            count := count + 1;
+            for j := i to {n} \\ i do composite[i * j] := true;
+        }}
+        io.writeIntLn(count);
+    }}
+}}"""
+    return source, f"{sum(flags)}\n"
+
+
+def matrix(scale):
+    n = 12 + 4 * scale
+    a = [[(i + j) % 7 for j in range(n)] for i in range(n)]
+    b = [[(i * j) % 5 for j in range(n)] for i in range(n)]
+    trace = sum(a[i][k] * b[k][i] for i in range(n) for k in range(n))
+    source = f"""
+class Matrix {{
+    static final int N := {n};
+    static void main() {{
+        int[{n * n}] a, b, c;
+        int i, j, k, trace := 0;
+        for i := 0 to Matrix.N - 1 do
+            for j := 0 to Matrix.N - 1 do {{
+                a[i * Matrix.N + j] := (i + j) % 7;
+                b[i * Matrix.N + j] := (i * j) % 5;
+            }}
+        for i := 0 to Matrix.N - 1 do
+            for j := 0 to Matrix.N - 1 do {{
+                int sum := 0;
+                for k := 0 to Matrix.N - 1 do
+                    sum := sum + a[i * Matrix.N + k] * b[k * Matrix.N + j];
+                c[i * Matrix.N + j] := sum;
+            }}
+        for i := 0 to Matrix.N - 1 do trace := trace + c[i * Matrix.N + i];
+        io.writeIntLn(trace);
+    }}
+}}"""
+    return source, f"{trace}\n"
+
+
+def particles(scale):
+    steps = 400 * scale
+    x, v = [float(i) for i in range(8)], [1.0 - i * 0.25 for i in range(8)]
+    for _ in range(steps):
+        for i in range(8):
+            v[i] = v[i] * 0.5 - x[i] * 0.125
+            x[i] = x[i] + v[i]
+    total = 0.0
+    for i in range(8):
+        total = total + x[i]
+    source = f"""
+class Particle {{
+    float x, v;
+    Particle(float x; float v) {{ this.x := x; this.v := v; }}
+    void step() {{
+        this.v := this.v * 0.5 - this.x * 0.125;
+        this.x := this.x + this.v;
+    }}
+}}
+class Simulation {{
+    static void main() {{
+        Particle[8] ps;
+        int i, t;
+        float total := 0;
+        for i := 0 to 7 do ps[i] := new Particle(i, 1 - i * 0.25);
+        for t := 1 to {steps} do
+            for i := 0 to 7 do ps[i].step();
+        for i := 0 to 7 do total := total + ps[i].x;
+        io.writeFloatLn(total);
+    }}
+}}"""
+    return source, f"{total!r}\n"
+
+
+def collatz(scale):
+    limit = 1000 * scale
+    best, best_steps = 1, 0
+    for start in range(1, limit + 1):
+        n, steps = start, 0
+        while n != 1:
+            n = n // 2 if n % 2 == 0 else 3 * n + 1
+            steps += 1
+        if steps > best_steps:
+            best, best_steps = start, steps
+    source = f"""
+class Collatz {{
+    static int steps(int start) {{
+        int n := start, count := 0, guard;
+        for guard := 1 to 100000 do {{
+            if n == 1 then break;
+            if n % 2 == 0 then n := n \\ 2; else n := 3 * n + 1;
+            count := count + 1;
+        }}
+        return count;
+    }}
+    static void main() {{
+        int start, best := 1, bestSteps := 0;
+        for start := 1 to {limit} do {{
+            int s := Collatz.steps(start);
+            if s > bestSteps then {{ best := start; bestSteps := s; }}
+        }}
+        io.writeIntLn(best);
+        io.writeIntLn(bestSteps);
+    }}
+}}"""
+    return source, f"{best}\n{best_steps}\n"
+
+
+PROGRAMS = {"fib": fib, "sieve": sieve, "matrix": matrix, "particles": particles, "collatz": collatz}
+
+
+def compile_source(source, fold):
+    return CodeGenerator().generate(parse(source), fold=fold)
+
+
+def execute(module):
+    output = io.StringIO()
+    VirtualMachine(io.StringIO(), output).run(module)
+    return output.getvalue()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--scale", type=int, default=2, help="work per program")
+    arg_parser.add_argument("--programs", nargs="+", choices=list(PROGRAMS), default=list(PROGRAMS))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args(argv)
+
+    rows = []
+    for name in args.programs:
+        source, expected = PROGRAMS[name](args.scale)
+        compile_time, module = timed(compile_source, source, True, repeat=args.repeat)
+        plain = compile_source(source, False)
+        run_time, output = timed(execute, module, repeat=args.repeat)
+        plain_time, plain_output = timed(execute, plain, repeat=args.repeat)
+        for result in (output, plain_output):
+            if result != expected:
+                raise SystemExit(f"{name}: printed {result!r}, expected {expected!r}")
+        words = sum(len(x.code) for x in module.functions)
+        plain_words = sum(len(x.code) for x in plain.functions)
+        rows.append([name, f"{compile_time:.3f}", words, plain_words, f"{run_time:.3f}",
+                     f"{plain_time:.3f}", f"{plain_time / run_time:.2f}x"])
+    print_table(["program", "compile s", "words", "unfolded words", "run s", "unfolded run s",
+                 "folding speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Shared helpers for the OPLang benchmark suites: path setup, timing and
+front-end shortcuts used by every bench_* module.
+"""
+
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "build"))
+sys.path.insert(0, ROOT_DIR)
+
+from antlr4 import InputStream, CommonTokenStream
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+
+
+def parse_tree(source):
+    """Parse source with the ANTLR front end and return the parse tree."""
+    lexer = OPLangLexer(InputStream(source))
+    parser = OPLangParser(CommonTokenStream(lexer))
+    return parser.program()
+
+
+def build_ast(source):
+    """Parse source and return its AST."""
+    return ASTGeneration().visit(parse_tree(source))
+
+
+def timed(fn, *args, repeat=1):
+    """Run fn(*args) `repeat` times and return (best seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def print_table(headers, rows):
+    """Print rows as a fixed-width table."""
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(str(c))) for w, c in zip(widths, row)]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
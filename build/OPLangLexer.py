@@ -0,0 +1,359 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+from lexererr import *
+
+
+def serializedATN():
+    return [
+        4,0,64,471,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,1,0,1,0,5,0,138,8,0,10,0,12,0,141,9,0,1,0,1,0,
+        1,1,1,1,1,1,1,1,1,1,1,1,5,1,151,8,1,10,1,12,1,154,9,1,1,1,1,1,1,
+        1,1,1,1,1,1,2,1,2,1,2,1,2,1,2,1,2,5,2,167,8,2,10,2,12,2,170,9,2,
+        1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,
+        1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,
+        1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,10,
+        1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,12,1,12,1,12,1,12,1,13,
+        1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,
+        1,15,1,15,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,17,
+        1,18,1,18,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,
+        1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,22,1,22,1,22,1,22,1,22,1,23,
+        1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,
+        1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,28,1,28,
+        1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,33,1,34,1,34,
+        1,34,1,35,1,35,1,36,1,36,1,37,1,37,1,37,1,38,1,38,1,38,1,39,1,39,
+        1,39,1,40,1,40,1,40,1,41,1,41,1,42,1,42,1,43,1,43,1,43,1,44,1,44,
+        1,45,1,45,1,46,1,46,1,47,1,47,1,48,1,48,1,49,1,49,1,50,1,50,1,51,
+        1,51,1,52,1,52,1,53,1,53,1,54,1,54,1,55,1,55,1,56,1,56,5,56,374,
+        8,56,10,56,12,56,377,9,56,1,57,1,57,1,58,4,58,382,8,58,11,58,12,
+        58,383,1,59,4,59,387,8,59,11,59,12,59,388,1,59,1,59,5,59,393,8,59,
+        10,59,12,59,396,9,59,1,59,1,59,3,59,400,8,59,1,59,4,59,403,8,59,
+        11,59,12,59,404,3,59,407,8,59,1,59,4,59,410,8,59,11,59,12,59,411,
+        1,59,1,59,3,59,416,8,59,1,59,4,59,419,8,59,11,59,12,59,420,3,59,
+        423,8,59,1,60,1,60,1,60,1,61,1,61,1,62,1,62,1,62,5,62,433,8,62,10,
+        62,12,62,436,9,62,1,62,1,62,1,62,1,62,1,63,1,63,1,63,5,63,445,8,
+        63,10,63,12,63,448,9,63,1,63,1,63,1,63,1,64,4,64,454,8,64,11,64,
+        12,64,455,1,64,1,64,1,65,1,65,1,65,5,65,463,8,65,10,65,12,65,466,
+        9,65,1,65,1,65,1,66,1,66,0,0,67,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,
+        8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,
+        19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,
+        30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,
+        41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,51,
+        103,52,105,53,107,54,109,55,111,56,113,57,115,0,117,58,119,59,121,
+        0,123,0,125,60,127,61,129,62,131,63,133,64,1,0,11,2,0,10,10,13,13,
+        1,0,42,42,1,0,47,47,4,0,39,39,65,90,95,95,97,122,5,0,39,39,48,57,
+        65,90,95,95,97,122,1,0,48,57,2,0,69,69,101,101,2,0,43,43,45,45,7,
+        0,34,34,92,92,98,98,102,102,110,110,114,114,116,116,4,0,0,9,11,33,
+        35,91,93,127,3,0,9,10,12,13,32,32,490,0,1,1,0,0,0,0,3,1,0,0,0,0,
+        5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,
+        1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,
+        1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,
+        1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,
+        1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,
+        1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,
+        1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,
+        1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,
+        1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,
+        1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,
+        105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,
+        0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,0,129,
+        1,0,0,0,0,131,1,0,0,0,0,133,1,0,0,0,1,135,1,0,0,0,3,144,1,0,0,0,
+        5,160,1,0,0,0,7,173,1,0,0,0,9,181,1,0,0,0,11,187,1,0,0,0,13,193,
+        1,0,0,0,15,202,1,0,0,0,17,205,1,0,0,0,19,210,1,0,0,0,21,218,1,0,
+        0,0,23,224,1,0,0,0,25,227,1,0,0,0,27,231,1,0,0,0,29,235,1,0,0,0,
+        31,242,1,0,0,0,33,247,1,0,0,0,35,251,1,0,0,0,37,258,1,0,0,0,39,263,
+        1,0,0,0,41,269,1,0,0,0,43,274,1,0,0,0,45,278,1,0,0,0,47,283,1,0,
+        0,0,49,289,1,0,0,0,51,296,1,0,0,0,53,299,1,0,0,0,55,306,1,0,0,0,
+        57,308,1,0,0,0,59,310,1,0,0,0,61,312,1,0,0,0,63,314,1,0,0,0,65,316,
+        1,0,0,0,67,318,1,0,0,0,69,321,1,0,0,0,71,324,1,0,0,0,73,326,1,0,
+        0,0,75,328,1,0,0,0,77,331,1,0,0,0,79,334,1,0,0,0,81,337,1,0,0,0,
+        83,340,1,0,0,0,85,342,1,0,0,0,87,344,1,0,0,0,89,347,1,0,0,0,91,349,
+        1,0,0,0,93,351,1,0,0,0,95,353,1,0,0,0,97,355,1,0,0,0,99,357,1,0,
+        0,0,101,359,1,0,0,0,103,361,1,0,0,0,105,363,1,0,0,0,107,365,1,0,
+        0,0,109,367,1,0,0,0,111,369,1,0,0,0,113,371,1,0,0,0,115,378,1,0,
+        0,0,117,381,1,0,0,0,119,422,1,0,0,0,121,424,1,0,0,0,123,427,1,0,
+        0,0,125,429,1,0,0,0,127,441,1,0,0,0,129,453,1,0,0,0,131,459,1,0,
+        0,0,133,469,1,0,0,0,135,139,5,35,0,0,136,138,8,0,0,0,137,136,1,0,
+        0,0,138,141,1,0,0,0,139,137,1,0,0,0,139,140,1,0,0,0,140,142,1,0,
+        0,0,141,139,1,0,0,0,142,143,6,0,0,0,143,2,1,0,0,0,144,145,5,47,0,
+        0,145,146,5,42,0,0,146,152,1,0,0,0,147,151,8,1,0,0,148,149,5,42,
+        0,0,149,151,8,2,0,0,150,147,1,0,0,0,150,148,1,0,0,0,151,154,1,0,
+        0,0,152,150,1,0,0,0,152,153,1,0,0,0,153,155,1,0,0,0,154,152,1,0,
+        0,0,155,156,5,42,0,0,156,157,5,47,0,0,157,158,1,0,0,0,158,159,6,
+        1,0,0,159,4,1,0,0,0,160,161,5,47,0,0,161,162,5,42,0,0,162,168,1,
+        0,0,0,163,167,8,1,0,0,164,165,5,42,0,0,165,167,8,2,0,0,166,163,1,
+        0,0,0,166,164,1,0,0,0,167,170,1,0,0,0,168,166,1,0,0,0,168,169,1,
+        0,0,0,169,171,1,0,0,0,170,168,1,0,0,0,171,172,6,2,0,0,172,6,1,0,
+        0,0,173,174,5,98,0,0,174,175,5,111,0,0,175,176,5,111,0,0,176,177,
+        5,108,0,0,177,178,5,101,0,0,178,179,5,97,0,0,179,180,5,110,0,0,180,
+        8,1,0,0,0,181,182,5,98,0,0,182,183,5,114,0,0,183,184,5,101,0,0,184,
+        185,5,97,0,0,185,186,5,107,0,0,186,10,1,0,0,0,187,188,5,99,0,0,188,
+        189,5,108,0,0,189,190,5,97,0,0,190,191,5,115,0,0,191,192,5,115,0,
+        0,192,12,1,0,0,0,193,194,5,99,0,0,194,195,5,111,0,0,195,196,5,110,
+        0,0,196,197,5,116,0,0,197,198,5,105,0,0,198,199,5,110,0,0,199,200,
+        5,117,0,0,200,201,5,101,0,0,201,14,1,0,0,0,202,203,5,100,0,0,203,
+        204,5,111,0,0,204,16,1,0,0,0,205,206,5,101,0,0,206,207,5,108,0,0,
+        207,208,5,115,0,0,208,209,5,101,0,0,209,18,1,0,0,0,210,211,5,101,
+        0,0,211,212,5,120,0,0,212,213,5,116,0,0,213,214,5,101,0,0,214,215,
+        5,110,0,0,215,216,5,100,0,0,216,217,5,115,0,0,217,20,1,0,0,0,218,
+        219,5,102,0,0,219,220,5,108,0,0,220,221,5,111,0,0,221,222,5,97,0,
+        0,222,223,5,116,0,0,223,22,1,0,0,0,224,225,5,105,0,0,225,226,5,102,
+        0,0,226,24,1,0,0,0,227,228,5,105,0,0,228,229,5,110,0,0,229,230,5,
+        116,0,0,230,26,1,0,0,0,231,232,5,110,0,0,232,233,5,101,0,0,233,234,
+        5,119,0,0,234,28,1,0,0,0,235,236,5,115,0,0,236,237,5,116,0,0,237,
+        238,5,114,0,0,238,239,5,105,0,0,239,240,5,110,0,0,240,241,5,103,
+        0,0,241,30,1,0,0,0,242,243,5,116,0,0,243,244,5,104,0,0,244,245,5,
+        101,0,0,245,246,5,110,0,0,246,32,1,0,0,0,247,248,5,102,0,0,248,249,
+        5,111,0,0,249,250,5,114,0,0,250,34,1,0,0,0,251,252,5,114,0,0,252,
+        253,5,101,0,0,253,254,5,116,0,0,254,255,5,117,0,0,255,256,5,114,
+        0,0,256,257,5,110,0,0,257,36,1,0,0,0,258,259,5,116,0,0,259,260,5,
+        114,0,0,260,261,5,117,0,0,261,262,5,101,0,0,262,38,1,0,0,0,263,264,
+        5,102,0,0,264,265,5,97,0,0,265,266,5,108,0,0,266,267,5,115,0,0,267,
+        268,5,101,0,0,268,40,1,0,0,0,269,270,5,118,0,0,270,271,5,111,0,0,
+        271,272,5,105,0,0,272,273,5,100,0,0,273,42,1,0,0,0,274,275,5,110,
+        0,0,275,276,5,105,0,0,276,277,5,108,0,0,277,44,1,0,0,0,278,279,5,
+        116,0,0,279,280,5,104,0,0,280,281,5,105,0,0,281,282,5,115,0,0,282,
+        46,1,0,0,0,283,284,5,102,0,0,284,285,5,105,0,0,285,286,5,110,0,0,
+        286,287,5,97,0,0,287,288,5,108,0,0,288,48,1,0,0,0,289,290,5,115,
+        0,0,290,291,5,116,0,0,291,292,5,97,0,0,292,293,5,116,0,0,293,294,
+        5,105,0,0,294,295,5,99,0,0,295,50,1,0,0,0,296,297,5,116,0,0,297,
+        298,5,111,0,0,298,52,1,0,0,0,299,300,5,100,0,0,300,301,5,111,0,0,
+        301,302,5,119,0,0,302,303,5,110,0,0,303,304,5,116,0,0,304,305,5,
+        111,0,0,305,54,1,0,0,0,306,307,5,43,0,0,307,56,1,0,0,0,308,309,5,
+        45,0,0,309,58,1,0,0,0,310,311,5,42,0,0,311,60,1,0,0,0,312,313,5,
+        47,0,0,313,62,1,0,0,0,314,315,5,92,0,0,315,64,1,0,0,0,316,317,5,
+        37,0,0,317,66,1,0,0,0,318,319,5,33,0,0,319,320,5,61,0,0,320,68,1,
+        0,0,0,321,322,5,61,0,0,322,323,5,61,0,0,323,70,1,0,0,0,324,325,5,
+        60,0,0,325,72,1,0,0,0,326,327,5,62,0,0,327,74,1,0,0,0,328,329,5,
+        60,0,0,329,330,5,61,0,0,330,76,1,0,0,0,331,332,5,62,0,0,332,333,
+        5,61,0,0,333,78,1,0,0,0,334,335,5,124,0,0,335,336,5,124,0,0,336,
+        80,1,0,0,0,337,338,5,38,0,0,338,339,5,38,0,0,339,82,1,0,0,0,340,
+        341,5,33,0,0,341,84,1,0,0,0,342,343,5,94,0,0,343,86,1,0,0,0,344,
+        345,5,58,0,0,345,346,5,61,0,0,346,88,1,0,0,0,347,348,5,91,0,0,348,
+        90,1,0,0,0,349,350,5,93,0,0,350,92,1,0,0,0,351,352,5,123,0,0,352,
+        94,1,0,0,0,353,354,5,125,0,0,354,96,1,0,0,0,355,356,5,40,0,0,356,
+        98,1,0,0,0,357,358,5,41,0,0,358,100,1,0,0,0,359,360,5,59,0,0,360,
+        102,1,0,0,0,361,362,5,58,0,0,362,104,1,0,0,0,363,364,5,46,0,0,364,
+        106,1,0,0,0,365,366,5,44,0,0,366,108,1,0,0,0,367,368,5,38,0,0,368,
+        110,1,0,0,0,369,370,5,126,0,0,370,112,1,0,0,0,371,375,7,3,0,0,372,
+        374,7,4,0,0,373,372,1,0,0,0,374,377,1,0,0,0,375,373,1,0,0,0,375,
+        376,1,0,0,0,376,114,1,0,0,0,377,375,1,0,0,0,378,379,7,5,0,0,379,
+        116,1,0,0,0,380,382,3,115,57,0,381,380,1,0,0,0,382,383,1,0,0,0,383,
+        381,1,0,0,0,383,384,1,0,0,0,384,118,1,0,0,0,385,387,3,115,57,0,386,
+        385,1,0,0,0,387,388,1,0,0,0,388,386,1,0,0,0,388,389,1,0,0,0,389,
+        390,1,0,0,0,390,394,5,46,0,0,391,393,3,115,57,0,392,391,1,0,0,0,
+        393,396,1,0,0,0,394,392,1,0,0,0,394,395,1,0,0,0,395,406,1,0,0,0,
+        396,394,1,0,0,0,397,399,7,6,0,0,398,400,7,7,0,0,399,398,1,0,0,0,
+        399,400,1,0,0,0,400,402,1,0,0,0,401,403,3,115,57,0,402,401,1,0,0,
+        0,403,404,1,0,0,0,404,402,1,0,0,0,404,405,1,0,0,0,405,407,1,0,0,
+        0,406,397,1,0,0,0,406,407,1,0,0,0,407,423,1,0,0,0,408,410,3,115,
+        57,0,409,408,1,0,0,0,410,411,1,0,0,0,411,409,1,0,0,0,411,412,1,0,
+        0,0,412,413,1,0,0,0,413,415,7,6,0,0,414,416,7,7,0,0,415,414,1,0,
+        0,0,415,416,1,0,0,0,416,418,1,0,0,0,417,419,3,115,57,0,418,417,1,
+        0,0,0,419,420,1,0,0,0,420,418,1,0,0,0,420,421,1,0,0,0,421,423,1,
+        0,0,0,422,386,1,0,0,0,422,409,1,0,0,0,423,120,1,0,0,0,424,425,5,
+        92,0,0,425,426,7,8,0,0,426,122,1,0,0,0,427,428,7,9,0,0,428,124,1,
+        0,0,0,429,434,5,34,0,0,430,433,3,121,60,0,431,433,3,123,61,0,432,
+        430,1,0,0,0,432,431,1,0,0,0,433,436,1,0,0,0,434,432,1,0,0,0,434,
+        435,1,0,0,0,435,437,1,0,0,0,436,434,1,0,0,0,437,438,5,92,0,0,438,
+        439,8,8,0,0,439,440,6,62,1,0,440,126,1,0,0,0,441,446,5,34,0,0,442,
+        445,3,121,60,0,443,445,3,123,61,0,444,442,1,0,0,0,444,443,1,0,0,
+        0,445,448,1,0,0,0,446,444,1,0,0,0,446,447,1,0,0,0,447,449,1,0,0,
+        0,448,446,1,0,0,0,449,450,5,34,0,0,450,451,6,63,2,0,451,128,1,0,
+        0,0,452,454,7,10,0,0,453,452,1,0,0,0,454,455,1,0,0,0,455,453,1,0,
+        0,0,455,456,1,0,0,0,456,457,1,0,0,0,457,458,6,64,0,0,458,130,1,0,
+        0,0,459,464,5,34,0,0,460,463,3,121,60,0,461,463,3,123,61,0,462,460,
+        1,0,0,0,462,461,1,0,0,0,463,466,1,0,0,0,464,462,1,0,0,0,464,465,
+        1,0,0,0,465,467,1,0,0,0,466,464,1,0,0,0,467,468,6,65,3,0,468,132,
+        1,0,0,0,469,470,9,0,0,0,470,134,1,0,0,0,24,0,139,150,152,166,168,
+        375,383,388,394,399,404,406,411,415,420,422,432,434,444,446,455,
+        462,464,4,6,0,0,1,62,0,1,63,1,1,65,2
+    ]
+
+class OPLangLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    LINECOMMENT = 1
+    BLOCKCOMMENT = 2
+    UNCLOSEDBLOCKCOMMENT = 3
+    BOOLEAN = 4
+    BREAK = 5
+    CLASS = 6
+    CONTINUE = 7
+    DO = 8
+    ELSE = 9
+    EXTENDS = 10
+    FLOAT = 11
+    IF = 12
+    INT = 13
+    NEW = 14
+    STRING = 15
+    THEN = 16
+    FOR = 17
+    RETURN = 18
+    TRUE = 19
+    FALSE = 20
+    VOID = 21
+    NIL = 22
+    THIS = 23
+    FINAL = 24
+    STATIC = 25
+    TO = 26
+    DOWNTO = 27
+    ADDOP = 28
+    SUBOP = 29
+    MULOP = 30
+    FLOATDIVOP = 31
+    INTDIVOP = 32
+    MODULUS = 33
+    NOTEQ = 34
+    EQ = 35
+    LESSTHAN = 36
+    GREATERTHAN = 37
+    LESSEQ = 38
+    GREATEREQ = 39
+    LOGICOR = 40
+    LOGICAND = 41
+    LOGICNOT = 42
+    CONCAT = 43
+    ASSIGNING = 44
+    LSQUAREBRACKET = 45
+    RSQUAREBRACKET = 46
+    LPAREN = 47
+    RPAREN = 48
+    LBRACKET = 49
+    RBRACKET = 50
+    SEMICOLON = 51
+    COLON = 52
+    DOT = 53
+    COMMA = 54
+    REFERENCE = 55
+    DESTRUCT = 56
+    IDENTIFIERS = 57
+    INTLIT = 58
+    FLOATLIT = 59
+    ILLEGAL_ESCAPE = 60
+    STRINGLIT = 61
+    WS = 62
+    UNCLOSE_STRING = 63
+    ERROR_CHAR = 64
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "'boolean'", "'break'", "'class'", "'continue'", "'do'", "'else'", 
+            "'extends'", "'float'", "'if'", "'int'", "'new'", "'string'", 
+            "'then'", "'for'", "'return'", "'true'", "'false'", "'void'", 
+            "'nil'", "'this'", "'final'", "'static'", "'to'", "'downto'", 
+            "'+'", "'-'", "'*'", "'/'", "'\\'", "'%'", "'!='", "'=='", "'<'", 
+            "'>'", "'<='", "'>='", "'||'", "'&&'", "'!'", "'^'", "':='", 
+            "'['", "']'", "'{'", "'}'", "'('", "')'", "';'", "':'", "'.'", 
+            "','", "'&'", "'~'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "LINECOMMENT", "BLOCKCOMMENT", "UNCLOSEDBLOCKCOMMENT", "BOOLEAN", 
+            "BREAK", "CLASS", "CONTINUE", "DO", "ELSE", "EXTENDS", "FLOAT", 
+            "IF", "INT", "NEW", "STRING", "THEN", "FOR", "RETURN", "TRUE", 
+            "FALSE", "VOID", "NIL", "THIS", "FINAL", "STATIC", "TO", "DOWNTO", 
+            "ADDOP", "SUBOP", "MULOP", "FLOATDIVOP", "INTDIVOP", "MODULUS", 
+            "NOTEQ", "EQ", "LESSTHAN", "GREATERTHAN", "LESSEQ", "GREATEREQ", 
+            "LOGICOR", "LOGICAND", "LOGICNOT", "CONCAT", "ASSIGNING", "LSQUAREBRACKET", 
+            "RSQUAREBRACKET", "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", 
+            "SEMICOLON", "COLON", "DOT", "COMMA", "REFERENCE", "DESTRUCT", 
+            "IDENTIFIERS", "INTLIT", "FLOATLIT", "ILLEGAL_ESCAPE", "STRINGLIT", 
+            "WS", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    ruleNames = [ "LINECOMMENT", "BLOCKCOMMENT", "UNCLOSEDBLOCKCOMMENT", 
+                  "BOOLEAN", "BREAK", "CLASS", "CONTINUE", "DO", "ELSE", 
+                  "EXTENDS", "FLOAT", "IF", "INT", "NEW", "STRING", "THEN", 
+                  "FOR", "RETURN", "TRUE", "FALSE", "VOID", "NIL", "THIS", 
+                  "FINAL", "STATIC", "TO", "DOWNTO", "ADDOP", "SUBOP", "MULOP", 
+                  "FLOATDIVOP", "INTDIVOP", "MODULUS", "NOTEQ", "EQ", "LESSTHAN", 
+                  "GREATERTHAN", "LESSEQ", "GREATEREQ", "LOGICOR", "LOGICAND", 
+                  "LOGICNOT", "CONCAT", "ASSIGNING", "LSQUAREBRACKET", "RSQUAREBRACKET", 
+                  "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", "SEMICOLON", 
+                  "COLON", "DOT", "COMMA", "REFERENCE", "DESTRUCT", "IDENTIFIERS", 
+                  "Digit", "INTLIT", "FLOATLIT", "ESC", "ASCII", "ILLEGAL_ESCAPE", 
+                  "STRINGLIT", "WS", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    grammarFileName = "OPLang.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
+    def emit(self):
+        tk = self.type
+        if tk == self.UNCLOSE_STRING:       
+            result = super().emit();
+            raise UncloseString(result.text);
+        elif tk == self.ILLEGAL_ESCAPE:
+            result = super().emit();
+            raise IllegalEscape(result.text);
+        elif tk == self.ERROR_CHAR:
+            result = super().emit();
+            raise ErrorToken(result.text); 
+        else:
+            return super().emit();
+
+
+    def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
+        if self._actions is None:
+            actions = dict()
+            actions[62] = self.ILLEGAL_ESCAPE_action 
+            actions[63] = self.STRINGLIT_action 
+            actions[65] = self.UNCLOSE_STRING_action 
+            self._actions = actions
+        action = self._actions.get(ruleIndex, None)
+        if action is not None:
+            action(localctx, actionIndex)
+        else:
+            raise Exception("No registered action for:" + str(ruleIndex))
+
+
+    def ILLEGAL_ESCAPE_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 0:
+
+                raise IllegalEscape(self.text[1:])
+
+     
+
+    def STRINGLIT_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 1:
+            self.text = self.text[1:-1]
+     
+
+    def UNCLOSE_STRING_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 2:
+
+                self.text = self.text[1:]
+                raise UncloseString(self.text)
+
+     
+
+
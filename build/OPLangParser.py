@@ -0,0 +1,4856 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,64,588,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
+        7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
+        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,32,2,33,
+        7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,39,7,39,
+        2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,45,2,46,
+        7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,52,7,52,
+        2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,58,2,59,
+        7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,65,7,65,
+        2,66,7,66,2,67,7,67,2,68,7,68,1,0,1,0,1,0,1,1,4,1,143,8,1,11,1,12,
+        1,144,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,3,2,155,8,2,1,3,1,3,1,3,1,
+        3,1,4,5,4,162,8,4,10,4,12,4,165,9,4,1,5,1,5,1,5,1,5,3,5,171,8,5,
+        1,6,1,6,1,6,1,6,1,6,1,6,1,6,3,6,180,8,6,1,7,1,7,1,7,3,7,185,8,7,
+        1,8,1,8,1,8,1,8,1,8,1,8,3,8,193,8,8,1,9,1,9,1,9,1,9,1,9,1,10,1,10,
+        3,10,202,8,10,1,10,1,10,3,10,206,8,10,1,10,1,10,3,10,210,8,10,1,
+        10,1,10,3,10,214,8,10,1,10,1,10,3,10,218,8,10,3,10,220,8,10,1,11,
+        1,11,1,11,5,11,225,8,11,10,11,12,11,228,9,11,1,12,1,12,3,12,232,
+        8,12,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,
+        1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,3,16,270,
+        8,16,1,17,1,17,1,17,1,17,1,18,1,18,1,18,5,18,279,8,18,10,18,12,18,
+        282,9,18,3,18,284,8,18,1,19,1,19,1,19,1,20,1,20,1,20,5,20,292,8,
+        20,10,20,12,20,295,9,20,1,21,1,21,1,21,1,21,3,21,301,8,21,1,22,1,
+        22,1,22,3,22,306,8,22,1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,
+        24,1,24,1,24,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,
+        27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,5,28,337,8,28,10,28,12,28,
+        340,9,28,1,29,1,29,1,29,1,29,1,29,1,29,5,29,348,8,29,10,29,12,29,
+        351,9,29,1,30,1,30,1,30,1,30,1,30,3,30,358,8,30,1,31,1,31,1,32,1,
+        32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,5,32,371,8,32,10,32,12,32,
+        374,9,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,5,33,383,8,33,10,33,
+        12,33,386,9,33,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,
+        3,35,398,8,35,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,
+        3,37,410,8,37,1,38,5,38,413,8,38,10,38,12,38,416,9,38,1,39,1,39,
+        1,39,1,39,1,39,1,39,3,39,424,8,39,1,40,1,40,1,40,1,40,1,41,1,41,
+        1,41,1,42,1,42,1,42,5,42,436,8,42,10,42,12,42,439,9,42,3,42,441,
+        8,42,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,
+        1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,47,5,47,463,8,47,10,47,12,47,
+        466,9,47,1,48,1,48,1,48,1,48,1,48,1,48,3,48,474,8,48,1,49,1,49,1,
+        49,1,49,1,49,1,49,1,49,1,49,1,50,1,50,3,50,486,8,50,1,51,1,51,1,
+        51,5,51,491,8,51,10,51,12,51,494,9,51,1,52,1,52,1,52,3,52,499,8,
+        52,1,53,1,53,1,53,5,53,504,8,53,10,53,12,53,507,9,53,1,54,1,54,3,
+        54,511,8,54,1,55,1,55,1,55,1,55,1,56,5,56,518,8,56,10,56,12,56,521,
+        9,56,1,57,1,57,1,57,3,57,526,8,57,1,58,1,58,1,58,1,58,1,58,1,58,
+        1,58,3,58,535,8,58,1,59,1,59,1,59,1,59,3,59,541,8,59,1,59,1,59,1,
+        60,1,60,1,60,1,60,1,60,1,60,3,60,551,8,60,1,61,1,61,1,61,1,61,1,
+        61,1,61,1,61,1,61,1,61,1,62,1,62,1,63,1,63,1,64,1,64,1,64,1,65,1,
+        65,1,65,1,66,1,66,1,66,1,66,1,67,1,67,1,67,1,67,1,68,1,68,1,68,5,
+        68,583,8,68,10,68,12,68,586,9,68,1,68,0,4,56,58,64,66,69,0,2,4,6,
+        8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,
+        52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,92,94,
+        96,98,100,102,104,106,108,110,112,114,116,118,120,122,124,126,128,
+        130,132,134,136,0,3,1,0,34,39,2,0,30,33,43,43,1,0,26,27,600,0,138,
+        1,0,0,0,2,142,1,0,0,0,4,154,1,0,0,0,6,156,1,0,0,0,8,163,1,0,0,0,
+        10,170,1,0,0,0,12,179,1,0,0,0,14,184,1,0,0,0,16,192,1,0,0,0,18,194,
+        1,0,0,0,20,219,1,0,0,0,22,221,1,0,0,0,24,231,1,0,0,0,26,233,1,0,
+        0,0,28,237,1,0,0,0,30,246,1,0,0,0,32,269,1,0,0,0,34,271,1,0,0,0,
+        36,283,1,0,0,0,38,285,1,0,0,0,40,288,1,0,0,0,42,300,1,0,0,0,44,305,
+        1,0,0,0,46,307,1,0,0,0,48,312,1,0,0,0,50,318,1,0,0,0,52,322,1,0,
+        0,0,54,328,1,0,0,0,56,330,1,0,0,0,58,341,1,0,0,0,60,357,1,0,0,0,
+        62,359,1,0,0,0,64,361,1,0,0,0,66,375,1,0,0,0,68,387,1,0,0,0,70,397,
+        1,0,0,0,72,399,1,0,0,0,74,409,1,0,0,0,76,414,1,0,0,0,78,423,1,0,
+        0,0,80,425,1,0,0,0,82,429,1,0,0,0,84,440,1,0,0,0,86,442,1,0,0,0,
+        88,448,1,0,0,0,90,454,1,0,0,0,92,458,1,0,0,0,94,464,1,0,0,0,96,473,
+        1,0,0,0,98,475,1,0,0,0,100,485,1,0,0,0,102,487,1,0,0,0,104,495,1,
+        0,0,0,106,500,1,0,0,0,108,510,1,0,0,0,110,512,1,0,0,0,112,519,1,
+        0,0,0,114,525,1,0,0,0,116,534,1,0,0,0,118,536,1,0,0,0,120,544,1,
+        0,0,0,122,552,1,0,0,0,124,561,1,0,0,0,126,563,1,0,0,0,128,565,1,
+        0,0,0,130,568,1,0,0,0,132,571,1,0,0,0,134,575,1,0,0,0,136,579,1,
+        0,0,0,138,139,3,2,1,0,139,140,5,0,0,1,140,1,1,0,0,0,141,143,3,4,
+        2,0,142,141,1,0,0,0,143,144,1,0,0,0,144,142,1,0,0,0,144,145,1,0,
+        0,0,145,3,1,0,0,0,146,147,5,6,0,0,147,148,5,57,0,0,148,155,3,6,3,
+        0,149,150,5,6,0,0,150,151,5,57,0,0,151,152,5,10,0,0,152,153,5,57,
+        0,0,153,155,3,6,3,0,154,146,1,0,0,0,154,149,1,0,0,0,155,5,1,0,0,
+        0,156,157,5,47,0,0,157,158,3,8,4,0,158,159,5,48,0,0,159,7,1,0,0,
+        0,160,162,3,10,5,0,161,160,1,0,0,0,162,165,1,0,0,0,163,161,1,0,0,
+        0,163,164,1,0,0,0,164,9,1,0,0,0,165,163,1,0,0,0,166,171,3,12,6,0,
+        167,171,3,30,15,0,168,171,3,44,22,0,169,171,3,52,26,0,170,166,1,
+        0,0,0,170,167,1,0,0,0,170,168,1,0,0,0,170,169,1,0,0,0,171,11,1,0,
+        0,0,172,173,3,14,7,0,173,174,3,14,7,0,174,175,3,16,8,0,175,176,3,
+        22,11,0,176,177,5,51,0,0,177,180,1,0,0,0,178,180,3,28,14,0,179,172,
+        1,0,0,0,179,178,1,0,0,0,180,13,1,0,0,0,181,185,5,25,0,0,182,185,
+        5,24,0,0,183,185,1,0,0,0,184,181,1,0,0,0,184,182,1,0,0,0,184,183,
+        1,0,0,0,185,15,1,0,0,0,186,193,5,4,0,0,187,193,5,11,0,0,188,193,
+        5,13,0,0,189,193,5,15,0,0,190,193,5,57,0,0,191,193,3,18,9,0,192,
+        186,1,0,0,0,192,187,1,0,0,0,192,188,1,0,0,0,192,189,1,0,0,0,192,
+        190,1,0,0,0,192,191,1,0,0,0,193,17,1,0,0,0,194,195,3,20,10,0,195,
+        196,5,45,0,0,196,197,5,58,0,0,197,198,5,46,0,0,198,19,1,0,0,0,199,
+        201,5,13,0,0,200,202,5,55,0,0,201,200,1,0,0,0,201,202,1,0,0,0,202,
+        220,1,0,0,0,203,205,5,4,0,0,204,206,5,55,0,0,205,204,1,0,0,0,205,
+        206,1,0,0,0,206,220,1,0,0,0,207,209,5,11,0,0,208,210,5,55,0,0,209,
+        208,1,0,0,0,209,210,1,0,0,0,210,220,1,0,0,0,211,213,5,15,0,0,212,
+        214,5,55,0,0,213,212,1,0,0,0,213,214,1,0,0,0,214,220,1,0,0,0,215,
+        217,5,57,0,0,216,218,5,55,0,0,217,216,1,0,0,0,217,218,1,0,0,0,218,
+        220,1,0,0,0,219,199,1,0,0,0,219,203,1,0,0,0,219,207,1,0,0,0,219,
+        211,1,0,0,0,219,215,1,0,0,0,220,21,1,0,0,0,221,226,3,24,12,0,222,
+        223,5,54,0,0,223,225,3,24,12,0,224,222,1,0,0,0,225,228,1,0,0,0,226,
+        224,1,0,0,0,226,227,1,0,0,0,227,23,1,0,0,0,228,226,1,0,0,0,229,232,
+        3,26,13,0,230,232,5,57,0,0,231,229,1,0,0,0,231,230,1,0,0,0,232,25,
+        1,0,0,0,233,234,5,57,0,0,234,235,5,44,0,0,235,236,3,54,27,0,236,
+        27,1,0,0,0,237,238,3,14,7,0,238,239,3,14,7,0,239,240,3,16,8,0,240,
+        241,5,55,0,0,241,242,3,22,11,0,242,243,5,44,0,0,243,244,3,54,27,
+        0,244,245,5,51,0,0,245,29,1,0,0,0,246,247,3,14,7,0,247,248,3,32,
+        16,0,248,249,5,57,0,0,249,250,3,34,17,0,250,251,3,90,45,0,251,31,
+        1,0,0,0,252,253,5,13,0,0,253,270,5,55,0,0,254,255,5,11,0,0,255,270,
+        5,55,0,0,256,257,5,4,0,0,257,270,5,55,0,0,258,259,5,15,0,0,259,270,
+        5,55,0,0,260,261,5,57,0,0,261,270,5,55,0,0,262,270,5,13,0,0,263,
+        270,5,11,0,0,264,270,5,4,0,0,265,270,5,15,0,0,266,270,5,21,0,0,267,
+        270,5,57,0,0,268,270,3,18,9,0,269,252,1,0,0,0,269,254,1,0,0,0,269,
+        256,1,0,0,0,269,258,1,0,0,0,269,260,1,0,0,0,269,262,1,0,0,0,269,
+        263,1,0,0,0,269,264,1,0,0,0,269,265,1,0,0,0,269,266,1,0,0,0,269,
+        267,1,0,0,0,269,268,1,0,0,0,270,33,1,0,0,0,271,272,5,49,0,0,272,
+        273,3,36,18,0,273,274,5,50,0,0,274,35,1,0,0,0,275,280,3,38,19,0,
+        276,277,5,51,0,0,277,279,3,38,19,0,278,276,1,0,0,0,279,282,1,0,0,
+        0,280,278,1,0,0,0,280,281,1,0,0,0,281,284,1,0,0,0,282,280,1,0,0,
+        0,283,275,1,0,0,0,283,284,1,0,0,0,284,37,1,0,0,0,285,286,3,42,21,
+        0,286,287,3,40,20,0,287,39,1,0,0,0,288,293,5,57,0,0,289,290,5,54,
+        0,0,290,292,5,57,0,0,291,289,1,0,0,0,292,295,1,0,0,0,293,291,1,0,
+        0,0,293,294,1,0,0,0,294,41,1,0,0,0,295,293,1,0,0,0,296,297,3,16,
+        8,0,297,298,5,55,0,0,298,301,1,0,0,0,299,301,3,16,8,0,300,296,1,
+        0,0,0,300,299,1,0,0,0,301,43,1,0,0,0,302,306,3,46,23,0,303,306,3,
+        48,24,0,304,306,3,50,25,0,305,302,1,0,0,0,305,303,1,0,0,0,305,304,
+        1,0,0,0,306,45,1,0,0,0,307,308,5,57,0,0,308,309,5,49,0,0,309,310,
+        5,50,0,0,310,311,3,90,45,0,311,47,1,0,0,0,312,313,5,57,0,0,313,314,
+        5,49,0,0,314,315,5,57,0,0,315,316,5,50,0,0,316,317,3,90,45,0,317,
+        49,1,0,0,0,318,319,5,57,0,0,319,320,3,34,17,0,320,321,3,90,45,0,
+        321,51,1,0,0,0,322,323,5,56,0,0,323,324,5,57,0,0,324,325,5,49,0,
+        0,325,326,5,50,0,0,326,327,3,90,45,0,327,53,1,0,0,0,328,329,3,56,
+        28,0,329,55,1,0,0,0,330,331,6,28,-1,0,331,332,3,58,29,0,332,338,
+        1,0,0,0,333,334,10,2,0,0,334,335,5,40,0,0,335,337,3,58,29,0,336,
+        333,1,0,0,0,337,340,1,0,0,0,338,336,1,0,0,0,338,339,1,0,0,0,339,
+        57,1,0,0,0,340,338,1,0,0,0,341,342,6,29,-1,0,342,343,3,60,30,0,343,
+        349,1,0,0,0,344,345,10,2,0,0,345,346,5,41,0,0,346,348,3,60,30,0,
+        347,344,1,0,0,0,348,351,1,0,0,0,349,347,1,0,0,0,349,350,1,0,0,0,
+        350,59,1,0,0,0,351,349,1,0,0,0,352,353,3,64,32,0,353,354,3,62,31,
+        0,354,355,3,64,32,0,355,358,1,0,0,0,356,358,3,64,32,0,357,352,1,
+        0,0,0,357,356,1,0,0,0,358,61,1,0,0,0,359,360,7,0,0,0,360,63,1,0,
+        0,0,361,362,6,32,-1,0,362,363,3,66,33,0,363,372,1,0,0,0,364,365,
+        10,3,0,0,365,366,5,28,0,0,366,371,3,66,33,0,367,368,10,2,0,0,368,
+        369,5,29,0,0,369,371,3,66,33,0,370,364,1,0,0,0,370,367,1,0,0,0,371,
+        374,1,0,0,0,372,370,1,0,0,0,372,373,1,0,0,0,373,65,1,0,0,0,374,372,
+        1,0,0,0,375,376,6,33,-1,0,376,377,3,70,35,0,377,384,1,0,0,0,378,
+        379,10,2,0,0,379,380,3,68,34,0,380,381,3,70,35,0,381,383,1,0,0,0,
+        382,378,1,0,0,0,383,386,1,0,0,0,384,382,1,0,0,0,384,385,1,0,0,0,
+        385,67,1,0,0,0,386,384,1,0,0,0,387,388,7,1,0,0,388,69,1,0,0,0,389,
+        390,5,28,0,0,390,398,3,70,35,0,391,392,5,29,0,0,392,398,3,70,35,
+        0,393,394,5,42,0,0,394,398,3,70,35,0,395,398,3,72,36,0,396,398,3,
+        78,39,0,397,389,1,0,0,0,397,391,1,0,0,0,397,393,1,0,0,0,397,395,
+        1,0,0,0,397,396,1,0,0,0,398,71,1,0,0,0,399,400,3,74,37,0,400,401,
+        3,76,38,0,401,73,1,0,0,0,402,410,3,88,44,0,403,404,5,49,0,0,404,
+        405,3,54,27,0,405,406,5,50,0,0,406,410,1,0,0,0,407,410,5,57,0,0,
+        408,410,5,23,0,0,409,402,1,0,0,0,409,403,1,0,0,0,409,407,1,0,0,0,
+        409,408,1,0,0,0,410,75,1,0,0,0,411,413,3,114,57,0,412,411,1,0,0,
+        0,413,416,1,0,0,0,414,412,1,0,0,0,414,415,1,0,0,0,415,77,1,0,0,0,
+        416,414,1,0,0,0,417,424,5,58,0,0,418,424,5,59,0,0,419,424,5,61,0,
+        0,420,424,3,134,67,0,421,424,5,19,0,0,422,424,5,20,0,0,423,417,1,
+        0,0,0,423,418,1,0,0,0,423,419,1,0,0,0,423,420,1,0,0,0,423,421,1,
+        0,0,0,423,422,1,0,0,0,424,79,1,0,0,0,425,426,5,45,0,0,426,427,3,
+        54,27,0,427,428,5,46,0,0,428,81,1,0,0,0,429,430,5,53,0,0,430,431,
+        5,57,0,0,431,83,1,0,0,0,432,437,3,54,27,0,433,434,5,54,0,0,434,436,
+        3,54,27,0,435,433,1,0,0,0,436,439,1,0,0,0,437,435,1,0,0,0,437,438,
+        1,0,0,0,438,441,1,0,0,0,439,437,1,0,0,0,440,432,1,0,0,0,440,441,
+        1,0,0,0,441,85,1,0,0,0,442,443,5,53,0,0,443,444,5,57,0,0,444,445,
+        5,49,0,0,445,446,3,84,42,0,446,447,5,50,0,0,447,87,1,0,0,0,448,449,
+        5,14,0,0,449,450,5,57,0,0,450,451,5,49,0,0,451,452,3,84,42,0,452,
+        453,5,50,0,0,453,89,1,0,0,0,454,455,5,47,0,0,455,456,3,92,46,0,456,
+        457,5,48,0,0,457,91,1,0,0,0,458,459,3,94,47,0,459,460,3,112,56,0,
+        460,93,1,0,0,0,461,463,3,96,48,0,462,461,1,0,0,0,463,466,1,0,0,0,
+        464,462,1,0,0,0,464,465,1,0,0,0,465,95,1,0,0,0,466,464,1,0,0,0,467,
+        468,3,100,50,0,468,469,3,16,8,0,469,470,3,102,51,0,470,471,5,51,
+        0,0,471,474,1,0,0,0,472,474,3,98,49,0,473,467,1,0,0,0,473,472,1,
+        0,0,0,474,97,1,0,0,0,475,476,3,100,50,0,476,477,3,16,8,0,477,478,
+        5,55,0,0,478,479,3,106,53,0,479,480,5,44,0,0,480,481,3,54,27,0,481,
+        482,5,51,0,0,482,99,1,0,0,0,483,486,5,24,0,0,484,486,1,0,0,0,485,
+        483,1,0,0,0,485,484,1,0,0,0,486,101,1,0,0,0,487,492,3,104,52,0,488,
+        489,5,54,0,0,489,491,3,104,52,0,490,488,1,0,0,0,491,494,1,0,0,0,
+        492,490,1,0,0,0,492,493,1,0,0,0,493,103,1,0,0,0,494,492,1,0,0,0,
+        495,498,5,57,0,0,496,497,5,44,0,0,497,499,3,54,27,0,498,496,1,0,
+        0,0,498,499,1,0,0,0,499,105,1,0,0,0,500,505,3,108,54,0,501,502,5,
+        54,0,0,502,504,3,108,54,0,503,501,1,0,0,0,504,507,1,0,0,0,505,503,
+        1,0,0,0,505,506,1,0,0,0,506,107,1,0,0,0,507,505,1,0,0,0,508,511,
+        3,110,55,0,509,511,5,57,0,0,510,508,1,0,0,0,510,509,1,0,0,0,511,
+        109,1,0,0,0,512,513,5,57,0,0,513,514,5,44,0,0,514,515,3,54,27,0,
+        515,111,1,0,0,0,516,518,3,116,58,0,517,516,1,0,0,0,518,521,1,0,0,
+        0,519,517,1,0,0,0,519,520,1,0,0,0,520,113,1,0,0,0,521,519,1,0,0,
+        0,522,526,3,82,41,0,523,526,3,86,43,0,524,526,3,80,40,0,525,522,
+        1,0,0,0,525,523,1,0,0,0,525,524,1,0,0,0,526,115,1,0,0,0,527,535,
+        3,118,59,0,528,535,3,90,45,0,529,535,3,120,60,0,530,535,3,122,61,
+        0,531,535,3,128,64,0,532,535,3,130,65,0,533,535,3,132,66,0,534,527,
+        1,0,0,0,534,528,1,0,0,0,534,529,1,0,0,0,534,530,1,0,0,0,534,531,
+        1,0,0,0,534,532,1,0,0,0,534,533,1,0,0,0,535,117,1,0,0,0,536,540,
+        3,54,27,0,537,538,4,59,5,1,538,539,5,44,0,0,539,541,3,54,27,0,540,
+        537,1,0,0,0,540,541,1,0,0,0,541,542,1,0,0,0,542,543,5,51,0,0,543,
+        119,1,0,0,0,544,545,5,12,0,0,545,546,3,54,27,0,546,547,5,16,0,0,
+        547,550,3,116,58,0,548,549,5,9,0,0,549,551,3,116,58,0,550,548,1,
+        0,0,0,550,551,1,0,0,0,551,121,1,0,0,0,552,553,5,17,0,0,553,554,3,
+        124,62,0,554,555,5,44,0,0,555,556,3,54,27,0,556,557,3,126,63,0,557,
+        558,3,54,27,0,558,559,5,8,0,0,559,560,3,116,58,0,560,123,1,0,0,0,
+        561,562,5,57,0,0,562,125,1,0,0,0,563,564,7,2,0,0,564,127,1,0,0,0,
+        565,566,5,5,0,0,566,567,5,51,0,0,567,129,1,0,0,0,568,569,5,7,0,0,
+        569,570,5,51,0,0,570,131,1,0,0,0,571,572,5,18,0,0,572,573,3,54,27,
+        0,573,574,5,51,0,0,574,133,1,0,0,0,575,576,5,47,0,0,576,577,3,136,
+        68,0,577,578,5,48,0,0,578,135,1,0,0,0,579,584,3,54,27,0,580,581,
+        5,54,0,0,581,583,3,54,27,0,582,580,1,0,0,0,583,586,1,0,0,0,584,582,
+        1,0,0,0,584,585,1,0,0,0,585,137,1,0,0,0,586,584,1,0,0,0,46,144,154,
+        163,170,179,184,192,201,205,209,213,217,219,226,231,269,280,283,
+        293,300,305,338,349,357,370,372,384,397,409,414,423,437,440,464,
+        473,485,492,498,505,510,519,525,534,540,550,584
+    ]
+
+class OPLangParser ( Parser ):
+
+    grammarFileName = "OPLang.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                     "'boolean'", "'break'", "'class'", "'continue'", "'do'", 
+                     "'else'", "'extends'", "'float'", "'if'", "'int'", 
+                     "'new'", "'string'", "'then'", "'for'", "'return'", 
+                     "'true'", "'false'", "'void'", "'nil'", "'this'", "'final'", 
+                     "'static'", "'to'", "'downto'", "'+'", "'-'", "'*'", 
+                     "'/'", "'\\'", "'%'", "'!='", "'=='", "'<'", "'>'", 
+                     "'<='", "'>='", "'||'", "'&&'", "'!'", "'^'", "':='", 
+                     "'['", "']'", "'{'", "'}'", "'('", "')'", "';'", "':'", 
+                     "'.'", "','", "'&'", "'~'" ]
+
+    symbolicNames = [ "<INVALID>", "LINECOMMENT", "BLOCKCOMMENT", "UNCLOSEDBLOCKCOMMENT", 
+                      "BOOLEAN", "BREAK", "CLASS", "CONTINUE", "DO", "ELSE", 
+                      "EXTENDS", "FLOAT", "IF", "INT", "NEW", "STRING", 
+                      "THEN", "FOR", "RETURN", "TRUE", "FALSE", "VOID", 
+                      "NIL", "THIS", "FINAL", "STATIC", "TO", "DOWNTO", 
+                      "ADDOP", "SUBOP", "MULOP", "FLOATDIVOP", "INTDIVOP", 
+                      "MODULUS", "NOTEQ", "EQ", "LESSTHAN", "GREATERTHAN", 
+                      "LESSEQ", "GREATEREQ", "LOGICOR", "LOGICAND", "LOGICNOT", 
+                      "CONCAT", "ASSIGNING", "LSQUAREBRACKET", "RSQUAREBRACKET", 
+                      "LPAREN", "RPAREN", "LBRACKET", "RBRACKET", "SEMICOLON", 
+                      "COLON", "DOT", "COMMA", "REFERENCE", "DESTRUCT", 
+                      "IDENTIFIERS", "INTLIT", "FLOATLIT", "ILLEGAL_ESCAPE", 
+                      "STRINGLIT", "WS", "UNCLOSE_STRING", "ERROR_CHAR" ]
+
+    RULE_program = 0
+    RULE_classdecllist = 1
+    RULE_classdecl = 2
+    RULE_memberblock = 3
+    RULE_memberlist = 4
+    RULE_classmember = 5
+    RULE_attributedecl = 6
+    RULE_memberspec = 7
+    RULE_vartype = 8
+    RULE_arraytype = 9
+    RULE_elementtype = 10
+    RULE_attrlist = 11
+    RULE_attrunit = 12
+    RULE_assign = 13
+    RULE_referencememdecl = 14
+    RULE_methoddecl = 15
+    RULE_returntype = 16
+    RULE_paramlistblock = 17
+    RULE_paramlist = 18
+    RULE_parameter = 19
+    RULE_idlist = 20
+    RULE_paramtype = 21
+    RULE_constructor = 22
+    RULE_defaultconstructor = 23
+    RULE_copyconstructor = 24
+    RULE_userdefinedconstructor = 25
+    RULE_destructor = 26
+    RULE_expression = 27
+    RULE_orexpression = 28
+    RULE_andexpression = 29
+    RULE_relationalexpression = 30
+    RULE_relationaloperators = 31
+    RULE_arithmeticexpression = 32
+    RULE_terms = 33
+    RULE_termoperators = 34
+    RULE_factor = 35
+    RULE_postfixexp = 36
+    RULE_unaryfactor = 37
+    RULE_postfixlist = 38
+    RULE_primaryfactor = 39
+    RULE_indexing = 40
+    RULE_memaccess = 41
+    RULE_expressionlist = 42
+    RULE_methodinvoke = 43
+    RULE_objcreate = 44
+    RULE_blockstatement = 45
+    RULE_blockstatementbody = 46
+    RULE_vardecllist = 47
+    RULE_vardecl = 48
+    RULE_referencedecl = 49
+    RULE_varspec = 50
+    RULE_varlist = 51
+    RULE_varunit = 52
+    RULE_referencelist = 53
+    RULE_referenceunit = 54
+    RULE_assignvar = 55
+    RULE_statementlist = 56
+    RULE_lhspostfix = 57
+    RULE_statement = 58
+    RULE_exprstatement = 59
+    RULE_ifstatement = 60
+    RULE_forstatement = 61
+    RULE_scalar = 62
+    RULE_fordirection = 63
+    RULE_breakstatement = 64
+    RULE_continuestatement = 65
+    RULE_returnstatement = 66
+    RULE_arraylit = 67
+    RULE_literallist = 68
+
+    ruleNames =  [ "program", "classdecllist", "classdecl", "memberblock", 
+                   "memberlist", "classmember", "attributedecl", "memberspec", 
+                   "vartype", "arraytype", "elementtype", "attrlist", "attrunit", 
+                   "assign", "referencememdecl", "methoddecl", "returntype", 
+                   "paramlistblock", "paramlist", "parameter", "idlist", 
+                   "paramtype", "constructor", "defaultconstructor", "copyconstructor", 
+                   "userdefinedconstructor", "destructor", "expression", 
+                   "orexpression", "andexpression", "relationalexpression", 
+                   "relationaloperators", "arithmeticexpression", "terms", 
+                   "termoperators", "factor", "postfixexp", "unaryfactor", 
+                   "postfixlist", "primaryfactor", "indexing", "memaccess", 
+                   "expressionlist", "methodinvoke", "objcreate", "blockstatement", 
+                   "blockstatementbody", "vardecllist", "vardecl", "referencedecl", 
+                   "varspec", "varlist", "varunit", "referencelist", "referenceunit", 
+                   "assignvar", "statementlist", "lhspostfix", "statement", 
+                   "exprstatement", "ifstatement", "forstatement", "scalar", 
+                   "fordirection", "breakstatement", "continuestatement", 
+                   "returnstatement", "arraylit", "literallist" ]
+
+    EOF = Token.EOF
+    LINECOMMENT=1
+    BLOCKCOMMENT=2
+    UNCLOSEDBLOCKCOMMENT=3
+    BOOLEAN=4
+    BREAK=5
+    CLASS=6
+    CONTINUE=7
+    DO=8
+    ELSE=9
+    EXTENDS=10
+    FLOAT=11
+    IF=12
+    INT=13
+    NEW=14
+    STRING=15
+    THEN=16
+    FOR=17
+    RETURN=18
+    TRUE=19
+    FALSE=20
+    VOID=21
+    NIL=22
+    THIS=23
+    FINAL=24
+    STATIC=25
+    TO=26
+    DOWNTO=27
+    ADDOP=28
+    SUBOP=29
+    MULOP=30
+    FLOATDIVOP=31
+    INTDIVOP=32
+    MODULUS=33
+    NOTEQ=34
+    EQ=35
+    LESSTHAN=36
+    GREATERTHAN=37
+    LESSEQ=38
+    GREATEREQ=39
+    LOGICOR=40
+    LOGICAND=41
+    LOGICNOT=42
+    CONCAT=43
+    ASSIGNING=44
+    LSQUAREBRACKET=45
+    RSQUAREBRACKET=46
+    LPAREN=47
+    RPAREN=48
+    LBRACKET=49
+    RBRACKET=50
+    SEMICOLON=51
+    COLON=52
+    DOT=53
+    COMMA=54
+    REFERENCE=55
+    DESTRUCT=56
+    IDENTIFIERS=57
+    INTLIT=58
+    FLOATLIT=59
+    ILLEGAL_ESCAPE=60
+    STRINGLIT=61
+    WS=62
+    UNCLOSE_STRING=63
+    ERROR_CHAR=64
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+    def isAssignable(self, ctx):
+        # only a bare postfix expression (a, this.x, a.f()[i], (a).b ...) can be assigned to
+        node = ctx
+        while node.getChildCount() == 1 and not isinstance(node, OPLangParser.PostfixexpContext):
+            node = node.getChild(0)
+        return isinstance(node, OPLangParser.PostfixexpContext)
+
+
+
+    class ProgramContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def classdecllist(self):
+            return self.getTypedRuleContext(OPLangParser.ClassdecllistContext,0)
+
+
+        def EOF(self):
+            return self.getToken(OPLangParser.EOF, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_program
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProgram" ):
+                return visitor.visitProgram(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def program(self):
+
+        localctx = OPLangParser.ProgramContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_program)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 138
+            self.classdecllist()
+            self.state = 139
+            self.match(OPLangParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClassdecllistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def classdecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ClassdeclContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ClassdeclContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classdecllist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClassdecllist" ):
+                return visitor.visitClassdecllist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classdecllist(self):
+
+        localctx = OPLangParser.ClassdecllistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_classdecllist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 142 
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while True:
+                self.state = 141
+                self.classdecl()
+                self.state = 144 
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if not (_la==6):
+                    break
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClassdeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CLASS(self):
+            return self.getToken(OPLangParser.CLASS, 0)
+
+        def IDENTIFIERS(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.IDENTIFIERS)
+            else:
+                return self.getToken(OPLangParser.IDENTIFIERS, i)
+
+        def memberblock(self):
+            return self.getTypedRuleContext(OPLangParser.MemberblockContext,0)
+
+
+        def EXTENDS(self):
+            return self.getToken(OPLangParser.EXTENDS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classdecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClassdecl" ):
+                return visitor.visitClassdecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classdecl(self):
+
+        localctx = OPLangParser.ClassdeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_classdecl)
+        try:
+            self.state = 154
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 146
+                self.match(OPLangParser.CLASS)
+                self.state = 147
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 148
+                self.memberblock()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 149
+                self.match(OPLangParser.CLASS)
+                self.state = 150
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 151
+                self.match(OPLangParser.EXTENDS)
+                self.state = 152
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 153
+                self.memberblock()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberblockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(OPLangParser.LPAREN, 0)
+
+        def memberlist(self):
+            return self.getTypedRuleContext(OPLangParser.MemberlistContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(OPLangParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_memberblock
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberblock" ):
+                return visitor.visitMemberblock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memberblock(self):
+
+        localctx = OPLangParser.MemberblockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_memberblock)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 156
+            self.match(OPLangParser.LPAREN)
+            self.state = 157
+            self.memberlist()
+            self.state = 158
+            self.match(OPLangParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def classmember(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ClassmemberContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ClassmemberContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_memberlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberlist" ):
+                return visitor.visitMemberlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memberlist(self):
+
+        localctx = OPLangParser.MemberlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 8, self.RULE_memberlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 163
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 216172782166255632) != 0):
+                self.state = 160
+                self.classmember()
+                self.state = 165
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ClassmemberContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attributedecl(self):
+            return self.getTypedRuleContext(OPLangParser.AttributedeclContext,0)
+
+
+        def methoddecl(self):
+            return self.getTypedRuleContext(OPLangParser.MethoddeclContext,0)
+
+
+        def constructor(self):
+            return self.getTypedRuleContext(OPLangParser.ConstructorContext,0)
+
+
+        def destructor(self):
+            return self.getTypedRuleContext(OPLangParser.DestructorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_classmember
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitClassmember" ):
+                return visitor.visitClassmember(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def classmember(self):
+
+        localctx = OPLangParser.ClassmemberContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_classmember)
+        try:
+            self.state = 170
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,3,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 166
+                self.attributedecl()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 167
+                self.methoddecl()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 168
+                self.constructor()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 169
+                self.destructor()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AttributedeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def memberspec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.MemberspecContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.MemberspecContext,i)
+
+
+        def vartype(self):
+            return self.getTypedRuleContext(OPLangParser.VartypeContext,0)
+
+
+        def attrlist(self):
+            return self.getTypedRuleContext(OPLangParser.AttrlistContext,0)
+
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def referencememdecl(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencememdeclContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attributedecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttributedecl" ):
+                return visitor.visitAttributedecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attributedecl(self):
+
+        localctx = OPLangParser.AttributedeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_attributedecl)
+        try:
+            self.state = 179
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,4,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 172
+                self.memberspec()
+                self.state = 173
+                self.memberspec()
+                self.state = 174
+                self.vartype()
+                self.state = 175
+                self.attrlist()
+                self.state = 176
+                self.match(OPLangParser.SEMICOLON)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 178
+                self.referencememdecl()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemberspecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STATIC(self):
+            return self.getToken(OPLangParser.STATIC, 0)
+
+        def FINAL(self):
+            return self.getToken(OPLangParser.FINAL, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_memberspec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemberspec" ):
+                return visitor.visitMemberspec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memberspec(self):
+
+        localctx = OPLangParser.MemberspecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_memberspec)
+        try:
+            self.state = 184
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 181
+                self.match(OPLangParser.STATIC)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 182
+                self.match(OPLangParser.FINAL)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VartypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BOOLEAN(self):
+            return self.getToken(OPLangParser.BOOLEAN, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_vartype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVartype" ):
+                return visitor.visitVartype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def vartype(self):
+
+        localctx = OPLangParser.VartypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_vartype)
+        try:
+            self.state = 192
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 186
+                self.match(OPLangParser.BOOLEAN)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 187
+                self.match(OPLangParser.FLOAT)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 188
+                self.match(OPLangParser.INT)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 189
+                self.match(OPLangParser.STRING)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 190
+                self.match(OPLangParser.IDENTIFIERS)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 191
+                self.arraytype()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArraytypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def elementtype(self):
+            return self.getTypedRuleContext(OPLangParser.ElementtypeContext,0)
+
+
+        def LSQUAREBRACKET(self):
+            return self.getToken(OPLangParser.LSQUAREBRACKET, 0)
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def RSQUAREBRACKET(self):
+            return self.getToken(OPLangParser.RSQUAREBRACKET, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraytype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraytype" ):
+                return visitor.visitArraytype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraytype(self):
+
+        localctx = OPLangParser.ArraytypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_arraytype)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 194
+            self.elementtype()
+            self.state = 195
+            self.match(OPLangParser.LSQUAREBRACKET)
+            self.state = 196
+            self.match(OPLangParser.INTLIT)
+            self.state = 197
+            self.match(OPLangParser.RSQUAREBRACKET)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ElementtypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def REFERENCE(self):
+            return self.getToken(OPLangParser.REFERENCE, 0)
+
+        def BOOLEAN(self):
+            return self.getToken(OPLangParser.BOOLEAN, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_elementtype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitElementtype" ):
+                return visitor.visitElementtype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def elementtype(self):
+
+        localctx = OPLangParser.ElementtypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_elementtype)
+        self._la = 0 # Token type
+        try:
+            self.state = 219
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [13]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 199
+                self.match(OPLangParser.INT)
+                self.state = 201
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 200
+                    self.match(OPLangParser.REFERENCE)
+
+
+                pass
+            elif token in [4]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 203
+                self.match(OPLangParser.BOOLEAN)
+                self.state = 205
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 204
+                    self.match(OPLangParser.REFERENCE)
+
+
+                pass
+            elif token in [11]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 207
+                self.match(OPLangParser.FLOAT)
+                self.state = 209
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 208
+                    self.match(OPLangParser.REFERENCE)
+
+
+                pass
+            elif token in [15]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 211
+                self.match(OPLangParser.STRING)
+                self.state = 213
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 212
+                    self.match(OPLangParser.REFERENCE)
+
+
+                pass
+            elif token in [57]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 215
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 217
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==55:
+                    self.state = 216
+                    self.match(OPLangParser.REFERENCE)
+
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AttrlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def attrunit(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.AttrunitContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.AttrunitContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attrlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttrlist" ):
+                return visitor.visitAttrlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attrlist(self):
+
+        localctx = OPLangParser.AttrlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_attrlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 221
+            self.attrunit()
+            self.state = 226
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 222
+                self.match(OPLangParser.COMMA)
+                self.state = 223
+                self.attrunit()
+                self.state = 228
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AttrunitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assign(self):
+            return self.getTypedRuleContext(OPLangParser.AssignContext,0)
+
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_attrunit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAttrunit" ):
+                return visitor.visitAttrunit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def attrunit(self):
+
+        localctx = OPLangParser.AttrunitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_attrunit)
+        try:
+            self.state = 231
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,14,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 229
+                self.assign()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 230
+                self.match(OPLangParser.IDENTIFIERS)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_assign
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssign" ):
+                return visitor.visitAssign(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assign(self):
+
+        localctx = OPLangParser.AssignContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_assign)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 233
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 234
+            self.match(OPLangParser.ASSIGNING)
+            self.state = 235
+            self.expression()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferencememdeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def memberspec(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.MemberspecContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.MemberspecContext,i)
+
+
+        def vartype(self):
+            return self.getTypedRuleContext(OPLangParser.VartypeContext,0)
+
+
+        def REFERENCE(self):
+            return self.getToken(OPLangParser.REFERENCE, 0)
+
+        def attrlist(self):
+            return self.getTypedRuleContext(OPLangParser.AttrlistContext,0)
+
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referencememdecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferencememdecl" ):
+                return visitor.visitReferencememdecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referencememdecl(self):
+
+        localctx = OPLangParser.ReferencememdeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_referencememdecl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 237
+            self.memberspec()
+            self.state = 238
+            self.memberspec()
+            self.state = 239
+            self.vartype()
+            self.state = 240
+            self.match(OPLangParser.REFERENCE)
+            self.state = 241
+            self.attrlist()
+            self.state = 242
+            self.match(OPLangParser.ASSIGNING)
+            self.state = 243
+            self.expression()
+            self.state = 244
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MethoddeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def memberspec(self):
+            return self.getTypedRuleContext(OPLangParser.MemberspecContext,0)
+
+
+        def returntype(self):
+            return self.getTypedRuleContext(OPLangParser.ReturntypeContext,0)
+
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def paramlistblock(self):
+            return self.getTypedRuleContext(OPLangParser.ParamlistblockContext,0)
+
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_methoddecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMethoddecl" ):
+                return visitor.visitMethoddecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def methoddecl(self):
+
+        localctx = OPLangParser.MethoddeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_methoddecl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 246
+            self.memberspec()
+            self.state = 247
+            self.returntype()
+            self.state = 248
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 249
+            self.paramlistblock()
+            self.state = 250
+            self.blockstatement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturntypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INT(self):
+            return self.getToken(OPLangParser.INT, 0)
+
+        def REFERENCE(self):
+            return self.getToken(OPLangParser.REFERENCE, 0)
+
+        def FLOAT(self):
+            return self.getToken(OPLangParser.FLOAT, 0)
+
+        def BOOLEAN(self):
+            return self.getToken(OPLangParser.BOOLEAN, 0)
+
+        def STRING(self):
+            return self.getToken(OPLangParser.STRING, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def VOID(self):
+            return self.getToken(OPLangParser.VOID, 0)
+
+        def arraytype(self):
+            return self.getTypedRuleContext(OPLangParser.ArraytypeContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_returntype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturntype" ):
+                return visitor.visitReturntype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returntype(self):
+
+        localctx = OPLangParser.ReturntypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 32, self.RULE_returntype)
+        try:
+            self.state = 269
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 252
+                self.match(OPLangParser.INT)
+                self.state = 253
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 254
+                self.match(OPLangParser.FLOAT)
+                self.state = 255
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 256
+                self.match(OPLangParser.BOOLEAN)
+                self.state = 257
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 258
+                self.match(OPLangParser.STRING)
+                self.state = 259
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 260
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 261
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 262
+                self.match(OPLangParser.INT)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 263
+                self.match(OPLangParser.FLOAT)
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 264
+                self.match(OPLangParser.BOOLEAN)
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 265
+                self.match(OPLangParser.STRING)
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 266
+                self.match(OPLangParser.VOID)
+                pass
+
+            elif la_ == 11:
+                self.enterOuterAlt(localctx, 11)
+                self.state = 267
+                self.match(OPLangParser.IDENTIFIERS)
+                pass
+
+            elif la_ == 12:
+                self.enterOuterAlt(localctx, 12)
+                self.state = 268
+                self.arraytype()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamlistblockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def paramlist(self):
+            return self.getTypedRuleContext(OPLangParser.ParamlistContext,0)
+
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_paramlistblock
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamlistblock" ):
+                return visitor.visitParamlistblock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramlistblock(self):
+
+        localctx = OPLangParser.ParamlistblockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 34, self.RULE_paramlistblock)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 271
+            self.match(OPLangParser.LBRACKET)
+            self.state = 272
+            self.paramlist()
+            self.state = 273
+            self.match(OPLangParser.RBRACKET)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def parameter(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ParameterContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ParameterContext,i)
+
+
+        def SEMICOLON(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.SEMICOLON)
+            else:
+                return self.getToken(OPLangParser.SEMICOLON, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_paramlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamlist" ):
+                return visitor.visitParamlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramlist(self):
+
+        localctx = OPLangParser.ParamlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 36, self.RULE_paramlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 283
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 144115188075898896) != 0):
+                self.state = 275
+                self.parameter()
+                self.state = 280
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==51:
+                    self.state = 276
+                    self.match(OPLangParser.SEMICOLON)
+                    self.state = 277
+                    self.parameter()
+                    self.state = 282
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParameterContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def paramtype(self):
+            return self.getTypedRuleContext(OPLangParser.ParamtypeContext,0)
+
+
+        def idlist(self):
+            return self.getTypedRuleContext(OPLangParser.IdlistContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_parameter
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParameter" ):
+                return visitor.visitParameter(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parameter(self):
+
+        localctx = OPLangParser.ParameterContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 38, self.RULE_parameter)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 285
+            self.paramtype()
+            self.state = 286
+            self.idlist()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IdlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.IDENTIFIERS)
+            else:
+                return self.getToken(OPLangParser.IDENTIFIERS, i)
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_idlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdlist" ):
+                return visitor.visitIdlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def idlist(self):
+
+        localctx = OPLangParser.IdlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 40, self.RULE_idlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 288
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 293
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 289
+                self.match(OPLangParser.COMMA)
+                self.state = 290
+                self.match(OPLangParser.IDENTIFIERS)
+                self.state = 295
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamtypeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def vartype(self):
+            return self.getTypedRuleContext(OPLangParser.VartypeContext,0)
+
+
+        def REFERENCE(self):
+            return self.getToken(OPLangParser.REFERENCE, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_paramtype
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParamtype" ):
+                return visitor.visitParamtype(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def paramtype(self):
+
+        localctx = OPLangParser.ParamtypeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 42, self.RULE_paramtype)
+        try:
+            self.state = 300
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,19,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 296
+                self.vartype()
+                self.state = 297
+                self.match(OPLangParser.REFERENCE)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 299
+                self.vartype()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ConstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def defaultconstructor(self):
+            return self.getTypedRuleContext(OPLangParser.DefaultconstructorContext,0)
+
+
+        def copyconstructor(self):
+            return self.getTypedRuleContext(OPLangParser.CopyconstructorContext,0)
+
+
+        def userdefinedconstructor(self):
+            return self.getTypedRuleContext(OPLangParser.UserdefinedconstructorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_constructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitConstructor" ):
+                return visitor.visitConstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def constructor(self):
+
+        localctx = OPLangParser.ConstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 44, self.RULE_constructor)
+        try:
+            self.state = 305
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 302
+                self.defaultconstructor()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 303
+                self.copyconstructor()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 304
+                self.userdefinedconstructor()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DefaultconstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_defaultconstructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDefaultconstructor" ):
+                return visitor.visitDefaultconstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def defaultconstructor(self):
+
+        localctx = OPLangParser.DefaultconstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 46, self.RULE_defaultconstructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 307
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 308
+            self.match(OPLangParser.LBRACKET)
+            self.state = 309
+            self.match(OPLangParser.RBRACKET)
+            self.state = 310
+            self.blockstatement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CopyconstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.IDENTIFIERS)
+            else:
+                return self.getToken(OPLangParser.IDENTIFIERS, i)
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_copyconstructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCopyconstructor" ):
+                return visitor.visitCopyconstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def copyconstructor(self):
+
+        localctx = OPLangParser.CopyconstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 48, self.RULE_copyconstructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 312
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 313
+            self.match(OPLangParser.LBRACKET)
+            self.state = 314
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 315
+            self.match(OPLangParser.RBRACKET)
+            self.state = 316
+            self.blockstatement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UserdefinedconstructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def paramlistblock(self):
+            return self.getTypedRuleContext(OPLangParser.ParamlistblockContext,0)
+
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_userdefinedconstructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUserdefinedconstructor" ):
+                return visitor.visitUserdefinedconstructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def userdefinedconstructor(self):
+
+        localctx = OPLangParser.UserdefinedconstructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 50, self.RULE_userdefinedconstructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 318
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 319
+            self.paramlistblock()
+            self.state = 320
+            self.blockstatement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class DestructorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DESTRUCT(self):
+            return self.getToken(OPLangParser.DESTRUCT, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_destructor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitDestructor" ):
+                return visitor.visitDestructor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def destructor(self):
+
+        localctx = OPLangParser.DestructorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 52, self.RULE_destructor)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 322
+            self.match(OPLangParser.DESTRUCT)
+            self.state = 323
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 324
+            self.match(OPLangParser.LBRACKET)
+            self.state = 325
+            self.match(OPLangParser.RBRACKET)
+            self.state = 326
+            self.blockstatement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def orexpression(self):
+            return self.getTypedRuleContext(OPLangParser.OrexpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpression" ):
+                return visitor.visitExpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expression(self):
+
+        localctx = OPLangParser.ExpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 54, self.RULE_expression)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 328
+            self.orexpression(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class OrexpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def andexpression(self):
+            return self.getTypedRuleContext(OPLangParser.AndexpressionContext,0)
+
+
+        def orexpression(self):
+            return self.getTypedRuleContext(OPLangParser.OrexpressionContext,0)
+
+
+        def LOGICOR(self):
+            return self.getToken(OPLangParser.LOGICOR, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_orexpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitOrexpression" ):
+                return visitor.visitOrexpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def orexpression(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.OrexpressionContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 56
+        self.enterRecursionRule(localctx, 56, self.RULE_orexpression, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 331
+            self.andexpression(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 338
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.OrexpressionContext(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_orexpression)
+                    self.state = 333
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 334
+                    self.match(OPLangParser.LOGICOR)
+                    self.state = 335
+                    self.andexpression(0) 
+                self.state = 340
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,21,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class AndexpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def relationalexpression(self):
+            return self.getTypedRuleContext(OPLangParser.RelationalexpressionContext,0)
+
+
+        def andexpression(self):
+            return self.getTypedRuleContext(OPLangParser.AndexpressionContext,0)
+
+
+        def LOGICAND(self):
+            return self.getToken(OPLangParser.LOGICAND, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_andexpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAndexpression" ):
+                return visitor.visitAndexpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def andexpression(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.AndexpressionContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 58
+        self.enterRecursionRule(localctx, 58, self.RULE_andexpression, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 342
+            self.relationalexpression()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 349
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.AndexpressionContext(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_andexpression)
+                    self.state = 344
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 345
+                    self.match(OPLangParser.LOGICAND)
+                    self.state = 346
+                    self.relationalexpression() 
+                self.state = 351
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class RelationalexpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def arithmeticexpression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ArithmeticexpressionContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ArithmeticexpressionContext,i)
+
+
+        def relationaloperators(self):
+            return self.getTypedRuleContext(OPLangParser.RelationaloperatorsContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_relationalexpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationalexpression" ):
+                return visitor.visitRelationalexpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relationalexpression(self):
+
+        localctx = OPLangParser.RelationalexpressionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 60, self.RULE_relationalexpression)
+        try:
+            self.state = 357
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,23,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 352
+                self.arithmeticexpression(0)
+                self.state = 353
+                self.relationaloperators()
+                self.state = 354
+                self.arithmeticexpression(0)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 356
+                self.arithmeticexpression(0)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class RelationaloperatorsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def EQ(self):
+            return self.getToken(OPLangParser.EQ, 0)
+
+        def NOTEQ(self):
+            return self.getToken(OPLangParser.NOTEQ, 0)
+
+        def GREATERTHAN(self):
+            return self.getToken(OPLangParser.GREATERTHAN, 0)
+
+        def LESSTHAN(self):
+            return self.getToken(OPLangParser.LESSTHAN, 0)
+
+        def GREATEREQ(self):
+            return self.getToken(OPLangParser.GREATEREQ, 0)
+
+        def LESSEQ(self):
+            return self.getToken(OPLangParser.LESSEQ, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_relationaloperators
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitRelationaloperators" ):
+                return visitor.visitRelationaloperators(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def relationaloperators(self):
+
+        localctx = OPLangParser.RelationaloperatorsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 62, self.RULE_relationaloperators)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 359
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1082331758592) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArithmeticexpressionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def terms(self):
+            return self.getTypedRuleContext(OPLangParser.TermsContext,0)
+
+
+        def arithmeticexpression(self):
+            return self.getTypedRuleContext(OPLangParser.ArithmeticexpressionContext,0)
+
+
+        def ADDOP(self):
+            return self.getToken(OPLangParser.ADDOP, 0)
+
+        def SUBOP(self):
+            return self.getToken(OPLangParser.SUBOP, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arithmeticexpression
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArithmeticexpression" ):
+                return visitor.visitArithmeticexpression(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def arithmeticexpression(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.ArithmeticexpressionContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 64
+        self.enterRecursionRule(localctx, 64, self.RULE_arithmeticexpression, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 362
+            self.terms(0)
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 372
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,25,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 370
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,24,self._ctx)
+                    if la_ == 1:
+                        localctx = OPLangParser.ArithmeticexpressionContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_arithmeticexpression)
+                        self.state = 364
+                        if not self.precpred(self._ctx, 3):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
+                        self.state = 365
+                        self.match(OPLangParser.ADDOP)
+                        self.state = 366
+                        self.terms(0)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = OPLangParser.ArithmeticexpressionContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_arithmeticexpression)
+                        self.state = 367
+                        if not self.precpred(self._ctx, 2):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                        self.state = 368
+                        self.match(OPLangParser.SUBOP)
+                        self.state = 369
+                        self.terms(0)
+                        pass
+
+             
+                self.state = 374
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,25,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class TermsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def factor(self):
+            return self.getTypedRuleContext(OPLangParser.FactorContext,0)
+
+
+        def terms(self):
+            return self.getTypedRuleContext(OPLangParser.TermsContext,0)
+
+
+        def termoperators(self):
+            return self.getTypedRuleContext(OPLangParser.TermoperatorsContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_terms
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTerms" ):
+                return visitor.visitTerms(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def terms(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = OPLangParser.TermsContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 66
+        self.enterRecursionRule(localctx, 66, self.RULE_terms, _p)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 376
+            self.factor()
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 384
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,26,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    localctx = OPLangParser.TermsContext(self, _parentctx, _parentState)
+                    self.pushNewRecursionContext(localctx, _startState, self.RULE_terms)
+                    self.state = 378
+                    if not self.precpred(self._ctx, 2):
+                        from antlr4.error.Errors import FailedPredicateException
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
+                    self.state = 379
+                    self.termoperators()
+                    self.state = 380
+                    self.factor() 
+                self.state = 386
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,26,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class TermoperatorsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def MULOP(self):
+            return self.getToken(OPLangParser.MULOP, 0)
+
+        def FLOATDIVOP(self):
+            return self.getToken(OPLangParser.FLOATDIVOP, 0)
+
+        def INTDIVOP(self):
+            return self.getToken(OPLangParser.INTDIVOP, 0)
+
+        def MODULUS(self):
+            return self.getToken(OPLangParser.MODULUS, 0)
+
+        def CONCAT(self):
+            return self.getToken(OPLangParser.CONCAT, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_termoperators
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitTermoperators" ):
+                return visitor.visitTermoperators(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def termoperators(self):
+
+        localctx = OPLangParser.TermoperatorsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 68, self.RULE_termoperators)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 387
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 8812199149568) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FactorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ADDOP(self):
+            return self.getToken(OPLangParser.ADDOP, 0)
+
+        def factor(self):
+            return self.getTypedRuleContext(OPLangParser.FactorContext,0)
+
+
+        def SUBOP(self):
+            return self.getToken(OPLangParser.SUBOP, 0)
+
+        def LOGICNOT(self):
+            return self.getToken(OPLangParser.LOGICNOT, 0)
+
+        def postfixexp(self):
+            return self.getTypedRuleContext(OPLangParser.PostfixexpContext,0)
+
+
+        def primaryfactor(self):
+            return self.getTypedRuleContext(OPLangParser.PrimaryfactorContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_factor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFactor" ):
+                return visitor.visitFactor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def factor(self):
+
+        localctx = OPLangParser.FactorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 70, self.RULE_factor)
+        try:
+            self.state = 397
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [28]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 389
+                self.match(OPLangParser.ADDOP)
+                self.state = 390
+                self.factor()
+                pass
+            elif token in [29]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 391
+                self.match(OPLangParser.SUBOP)
+                self.state = 392
+                self.factor()
+                pass
+            elif token in [42]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 393
+                self.match(OPLangParser.LOGICNOT)
+                self.state = 394
+                self.factor()
+                pass
+            elif token in [14, 23, 49, 57]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 395
+                self.postfixexp()
+                pass
+            elif token in [19, 20, 47, 58, 59, 61]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 396
+                self.primaryfactor()
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixexpContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def unaryfactor(self):
+            return self.getTypedRuleContext(OPLangParser.UnaryfactorContext,0)
+
+
+        def postfixlist(self):
+            return self.getTypedRuleContext(OPLangParser.PostfixlistContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_postfixexp
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixexp" ):
+                return visitor.visitPostfixexp(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixexp(self):
+
+        localctx = OPLangParser.PostfixexpContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 72, self.RULE_postfixexp)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 399
+            self.unaryfactor()
+            self.state = 400
+            self.postfixlist()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class UnaryfactorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def objcreate(self):
+            return self.getTypedRuleContext(OPLangParser.ObjcreateContext,0)
+
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def THIS(self):
+            return self.getToken(OPLangParser.THIS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_unaryfactor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitUnaryfactor" ):
+                return visitor.visitUnaryfactor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def unaryfactor(self):
+
+        localctx = OPLangParser.UnaryfactorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 74, self.RULE_unaryfactor)
+        try:
+            self.state = 409
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [14]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 402
+                self.objcreate()
+                pass
+            elif token in [49]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 403
+                self.match(OPLangParser.LBRACKET)
+                self.state = 404
+                self.expression()
+                self.state = 405
+                self.match(OPLangParser.RBRACKET)
+                pass
+            elif token in [57]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 407
+                self.match(OPLangParser.IDENTIFIERS)
+                pass
+            elif token in [23]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 408
+                self.match(OPLangParser.THIS)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PostfixlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def lhspostfix(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.LhspostfixContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.LhspostfixContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_postfixlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPostfixlist" ):
+                return visitor.visitPostfixlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def postfixlist(self):
+
+        localctx = OPLangParser.PostfixlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 76, self.RULE_postfixlist)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 414
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,29,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 411
+                    self.lhspostfix() 
+                self.state = 416
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,29,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PrimaryfactorContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def INTLIT(self):
+            return self.getToken(OPLangParser.INTLIT, 0)
+
+        def FLOATLIT(self):
+            return self.getToken(OPLangParser.FLOATLIT, 0)
+
+        def STRINGLIT(self):
+            return self.getToken(OPLangParser.STRINGLIT, 0)
+
+        def arraylit(self):
+            return self.getTypedRuleContext(OPLangParser.ArraylitContext,0)
+
+
+        def TRUE(self):
+            return self.getToken(OPLangParser.TRUE, 0)
+
+        def FALSE(self):
+            return self.getToken(OPLangParser.FALSE, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_primaryfactor
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPrimaryfactor" ):
+                return visitor.visitPrimaryfactor(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def primaryfactor(self):
+
+        localctx = OPLangParser.PrimaryfactorContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 78, self.RULE_primaryfactor)
+        try:
+            self.state = 423
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [58]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 417
+                self.match(OPLangParser.INTLIT)
+                pass
+            elif token in [59]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 418
+                self.match(OPLangParser.FLOATLIT)
+                pass
+            elif token in [61]:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 419
+                self.match(OPLangParser.STRINGLIT)
+                pass
+            elif token in [47]:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 420
+                self.arraylit()
+                pass
+            elif token in [19]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 421
+                self.match(OPLangParser.TRUE)
+                pass
+            elif token in [20]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 422
+                self.match(OPLangParser.FALSE)
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IndexingContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LSQUAREBRACKET(self):
+            return self.getToken(OPLangParser.LSQUAREBRACKET, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def RSQUAREBRACKET(self):
+            return self.getToken(OPLangParser.RSQUAREBRACKET, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_indexing
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIndexing" ):
+                return visitor.visitIndexing(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def indexing(self):
+
+        localctx = OPLangParser.IndexingContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 80, self.RULE_indexing)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 425
+            self.match(OPLangParser.LSQUAREBRACKET)
+            self.state = 426
+            self.expression()
+            self.state = 427
+            self.match(OPLangParser.RSQUAREBRACKET)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MemaccessContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_memaccess
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMemaccess" ):
+                return visitor.visitMemaccess(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def memaccess(self):
+
+        localctx = OPLangParser.MemaccessContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 82, self.RULE_memaccess)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 429
+            self.match(OPLangParser.DOT)
+            self.state = 430
+            self.match(OPLangParser.IDENTIFIERS)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExpressionlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExpressionContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_expressionlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpressionlist" ):
+                return visitor.visitExpressionlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def expressionlist(self):
+
+        localctx = OPLangParser.ExpressionlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 84, self.RULE_expressionlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 440
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315357412048257024) != 0):
+                self.state = 432
+                self.expression()
+                self.state = 437
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==54:
+                    self.state = 433
+                    self.match(OPLangParser.COMMA)
+                    self.state = 434
+                    self.expression()
+                    self.state = 439
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class MethodinvokeContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def DOT(self):
+            return self.getToken(OPLangParser.DOT, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def expressionlist(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionlistContext,0)
+
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_methodinvoke
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitMethodinvoke" ):
+                return visitor.visitMethodinvoke(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def methodinvoke(self):
+
+        localctx = OPLangParser.MethodinvokeContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 86, self.RULE_methodinvoke)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 442
+            self.match(OPLangParser.DOT)
+            self.state = 443
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 444
+            self.match(OPLangParser.LBRACKET)
+            self.state = 445
+            self.expressionlist()
+            self.state = 446
+            self.match(OPLangParser.RBRACKET)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ObjcreateContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def NEW(self):
+            return self.getToken(OPLangParser.NEW, 0)
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def LBRACKET(self):
+            return self.getToken(OPLangParser.LBRACKET, 0)
+
+        def expressionlist(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionlistContext,0)
+
+
+        def RBRACKET(self):
+            return self.getToken(OPLangParser.RBRACKET, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_objcreate
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitObjcreate" ):
+                return visitor.visitObjcreate(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def objcreate(self):
+
+        localctx = OPLangParser.ObjcreateContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 88, self.RULE_objcreate)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 448
+            self.match(OPLangParser.NEW)
+            self.state = 449
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 450
+            self.match(OPLangParser.LBRACKET)
+            self.state = 451
+            self.expressionlist()
+            self.state = 452
+            self.match(OPLangParser.RBRACKET)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(OPLangParser.LPAREN, 0)
+
+        def blockstatementbody(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementbodyContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(OPLangParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_blockstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockstatement" ):
+                return visitor.visitBlockstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockstatement(self):
+
+        localctx = OPLangParser.BlockstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 90, self.RULE_blockstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 454
+            self.match(OPLangParser.LPAREN)
+            self.state = 455
+            self.blockstatementbody()
+            self.state = 456
+            self.match(OPLangParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockstatementbodyContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def vardecllist(self):
+            return self.getTypedRuleContext(OPLangParser.VardecllistContext,0)
+
+
+        def statementlist(self):
+            return self.getTypedRuleContext(OPLangParser.StatementlistContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_blockstatementbody
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlockstatementbody" ):
+                return visitor.visitBlockstatementbody(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def blockstatementbody(self):
+
+        localctx = OPLangParser.BlockstatementbodyContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 92, self.RULE_blockstatementbody)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 458
+            self.vardecllist()
+            self.state = 459
+            self.statementlist()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VardecllistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def vardecl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.VardeclContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.VardeclContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_vardecllist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVardecllist" ):
+                return visitor.visitVardecllist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def vardecllist(self):
+
+        localctx = OPLangParser.VardecllistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 94, self.RULE_vardecllist)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 464
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    self.state = 461
+                    self.vardecl() 
+                self.state = 466
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VardeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varspec(self):
+            return self.getTypedRuleContext(OPLangParser.VarspecContext,0)
+
+
+        def vartype(self):
+            return self.getTypedRuleContext(OPLangParser.VartypeContext,0)
+
+
+        def varlist(self):
+            return self.getTypedRuleContext(OPLangParser.VarlistContext,0)
+
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def referencedecl(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencedeclContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_vardecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVardecl" ):
+                return visitor.visitVardecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def vardecl(self):
+
+        localctx = OPLangParser.VardeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 96, self.RULE_vardecl)
+        try:
+            self.state = 473
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 467
+                self.varspec()
+                self.state = 468
+                self.vartype()
+                self.state = 469
+                self.varlist()
+                self.state = 470
+                self.match(OPLangParser.SEMICOLON)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 472
+                self.referencedecl()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferencedeclContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varspec(self):
+            return self.getTypedRuleContext(OPLangParser.VarspecContext,0)
+
+
+        def vartype(self):
+            return self.getTypedRuleContext(OPLangParser.VartypeContext,0)
+
+
+        def REFERENCE(self):
+            return self.getToken(OPLangParser.REFERENCE, 0)
+
+        def referencelist(self):
+            return self.getTypedRuleContext(OPLangParser.ReferencelistContext,0)
+
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referencedecl
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferencedecl" ):
+                return visitor.visitReferencedecl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referencedecl(self):
+
+        localctx = OPLangParser.ReferencedeclContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 98, self.RULE_referencedecl)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 475
+            self.varspec()
+            self.state = 476
+            self.vartype()
+            self.state = 477
+            self.match(OPLangParser.REFERENCE)
+            self.state = 478
+            self.referencelist()
+            self.state = 479
+            self.match(OPLangParser.ASSIGNING)
+            self.state = 480
+            self.expression()
+            self.state = 481
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarspecContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FINAL(self):
+            return self.getToken(OPLangParser.FINAL, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_varspec
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarspec" ):
+                return visitor.visitVarspec(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varspec(self):
+
+        localctx = OPLangParser.VarspecContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 100, self.RULE_varspec)
+        try:
+            self.state = 485
+            self._errHandler.sync(self)
+            token = self._input.LA(1)
+            if token in [24]:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 483
+                self.match(OPLangParser.FINAL)
+                pass
+            elif token in [4, 11, 13, 15, 57]:
+                self.enterOuterAlt(localctx, 2)
+
+                pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def varunit(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.VarunitContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.VarunitContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_varlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarlist" ):
+                return visitor.visitVarlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varlist(self):
+
+        localctx = OPLangParser.VarlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 102, self.RULE_varlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 487
+            self.varunit()
+            self.state = 492
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 488
+                self.match(OPLangParser.COMMA)
+                self.state = 489
+                self.varunit()
+                self.state = 494
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarunitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_varunit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVarunit" ):
+                return visitor.visitVarunit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def varunit(self):
+
+        localctx = OPLangParser.VarunitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 104, self.RULE_varunit)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 495
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 498
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==44:
+                self.state = 496
+                self.match(OPLangParser.ASSIGNING)
+                self.state = 497
+                self.expression()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferencelistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def referenceunit(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ReferenceunitContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ReferenceunitContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referencelist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferencelist" ):
+                return visitor.visitReferencelist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referencelist(self):
+
+        localctx = OPLangParser.ReferencelistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 106, self.RULE_referencelist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 500
+            self.referenceunit()
+            self.state = 505
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 501
+                self.match(OPLangParser.COMMA)
+                self.state = 502
+                self.referenceunit()
+                self.state = 507
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReferenceunitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def assignvar(self):
+            return self.getTypedRuleContext(OPLangParser.AssignvarContext,0)
+
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_referenceunit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReferenceunit" ):
+                return visitor.visitReferenceunit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def referenceunit(self):
+
+        localctx = OPLangParser.ReferenceunitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 108, self.RULE_referenceunit)
+        try:
+            self.state = 510
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,39,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 508
+                self.assignvar()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 509
+                self.match(OPLangParser.IDENTIFIERS)
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class AssignvarContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_assignvar
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitAssignvar" ):
+                return visitor.visitAssignvar(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def assignvar(self):
+
+        localctx = OPLangParser.AssignvarContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 110, self.RULE_assignvar)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 512
+            self.match(OPLangParser.IDENTIFIERS)
+            self.state = 513
+            self.match(OPLangParser.ASSIGNING)
+            self.state = 514
+            self.expression()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StatementlistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def statement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StatementContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StatementContext,i)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_statementlist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStatementlist" ):
+                return visitor.visitStatementlist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def statementlist(self):
+
+        localctx = OPLangParser.StatementlistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 112, self.RULE_statementlist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 519
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3315357412048654496) != 0):
+                self.state = 516
+                self.statement()
+                self.state = 521
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LhspostfixContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def memaccess(self):
+            return self.getTypedRuleContext(OPLangParser.MemaccessContext,0)
+
+
+        def methodinvoke(self):
+            return self.getTypedRuleContext(OPLangParser.MethodinvokeContext,0)
+
+
+        def indexing(self):
+            return self.getTypedRuleContext(OPLangParser.IndexingContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_lhspostfix
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLhspostfix" ):
+                return visitor.visitLhspostfix(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def lhspostfix(self):
+
+        localctx = OPLangParser.LhspostfixContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 114, self.RULE_lhspostfix)
+        try:
+            self.state = 525
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,41,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 522
+                self.memaccess()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 523
+                self.methodinvoke()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 524
+                self.indexing()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def exprstatement(self):
+            return self.getTypedRuleContext(OPLangParser.ExprstatementContext,0)
+
+
+        def blockstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BlockstatementContext,0)
+
+
+        def ifstatement(self):
+            return self.getTypedRuleContext(OPLangParser.IfstatementContext,0)
+
+
+        def forstatement(self):
+            return self.getTypedRuleContext(OPLangParser.ForstatementContext,0)
+
+
+        def breakstatement(self):
+            return self.getTypedRuleContext(OPLangParser.BreakstatementContext,0)
+
+
+        def continuestatement(self):
+            return self.getTypedRuleContext(OPLangParser.ContinuestatementContext,0)
+
+
+        def returnstatement(self):
+            return self.getTypedRuleContext(OPLangParser.ReturnstatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_statement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStatement" ):
+                return visitor.visitStatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def statement(self):
+
+        localctx = OPLangParser.StatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 116, self.RULE_statement)
+        try:
+            self.state = 534
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,42,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 527
+                self.exprstatement()
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 528
+                self.blockstatement()
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 529
+                self.ifstatement()
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 530
+                self.forstatement()
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 531
+                self.breakstatement()
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 532
+                self.continuestatement()
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 533
+                self.returnstatement()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+            self.target = None # ExpressionContext
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExpressionContext,i)
+
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_exprstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExprstatement" ):
+                return visitor.visitExprstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def exprstatement(self):
+
+        localctx = OPLangParser.ExprstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 118, self.RULE_exprstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 536
+            localctx.target = self.expression()
+            self.state = 540
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,43,self._ctx)
+            if la_ == 1:
+                self.state = 537
+                if not self.isAssignable(localctx.target):
+                    from antlr4.error.Errors import FailedPredicateException
+                    raise FailedPredicateException(self, "self.isAssignable($target.ctx)")
+                self.state = 538
+                self.match(OPLangParser.ASSIGNING)
+                self.state = 539
+                self.expression()
+
+
+            self.state = 542
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class IfstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IF(self):
+            return self.getToken(OPLangParser.IF, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def THEN(self):
+            return self.getToken(OPLangParser.THEN, 0)
+
+        def statement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.StatementContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.StatementContext,i)
+
+
+        def ELSE(self):
+            return self.getToken(OPLangParser.ELSE, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_ifstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIfstatement" ):
+                return visitor.visitIfstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ifstatement(self):
+
+        localctx = OPLangParser.IfstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 120, self.RULE_ifstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 544
+            self.match(OPLangParser.IF)
+            self.state = 545
+            self.expression()
+            self.state = 546
+            self.match(OPLangParser.THEN)
+            self.state = 547
+            self.statement()
+            self.state = 550
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,44,self._ctx)
+            if la_ == 1:
+                self.state = 548
+                self.match(OPLangParser.ELSE)
+                self.state = 549
+                self.statement()
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ForstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def FOR(self):
+            return self.getToken(OPLangParser.FOR, 0)
+
+        def scalar(self):
+            return self.getTypedRuleContext(OPLangParser.ScalarContext,0)
+
+
+        def ASSIGNING(self):
+            return self.getToken(OPLangParser.ASSIGNING, 0)
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExpressionContext,i)
+
+
+        def fordirection(self):
+            return self.getTypedRuleContext(OPLangParser.FordirectionContext,0)
+
+
+        def DO(self):
+            return self.getToken(OPLangParser.DO, 0)
+
+        def statement(self):
+            return self.getTypedRuleContext(OPLangParser.StatementContext,0)
+
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_forstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitForstatement" ):
+                return visitor.visitForstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def forstatement(self):
+
+        localctx = OPLangParser.ForstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 122, self.RULE_forstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 552
+            self.match(OPLangParser.FOR)
+            self.state = 553
+            self.scalar()
+            self.state = 554
+            self.match(OPLangParser.ASSIGNING)
+            self.state = 555
+            self.expression()
+            self.state = 556
+            self.fordirection()
+            self.state = 557
+            self.expression()
+            self.state = 558
+            self.match(OPLangParser.DO)
+            self.state = 559
+            self.statement()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ScalarContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def IDENTIFIERS(self):
+            return self.getToken(OPLangParser.IDENTIFIERS, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_scalar
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitScalar" ):
+                return visitor.visitScalar(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def scalar(self):
+
+        localctx = OPLangParser.ScalarContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 124, self.RULE_scalar)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 561
+            self.match(OPLangParser.IDENTIFIERS)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class FordirectionContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def TO(self):
+            return self.getToken(OPLangParser.TO, 0)
+
+        def DOWNTO(self):
+            return self.getToken(OPLangParser.DOWNTO, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_fordirection
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitFordirection" ):
+                return visitor.visitFordirection(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def fordirection(self):
+
+        localctx = OPLangParser.FordirectionContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 126, self.RULE_fordirection)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 563
+            _la = self._input.LA(1)
+            if not(_la==26 or _la==27):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BreakstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def BREAK(self):
+            return self.getToken(OPLangParser.BREAK, 0)
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_breakstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBreakstatement" ):
+                return visitor.visitBreakstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def breakstatement(self):
+
+        localctx = OPLangParser.BreakstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 128, self.RULE_breakstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 565
+            self.match(OPLangParser.BREAK)
+            self.state = 566
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ContinuestatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def CONTINUE(self):
+            return self.getToken(OPLangParser.CONTINUE, 0)
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_continuestatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitContinuestatement" ):
+                return visitor.visitContinuestatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def continuestatement(self):
+
+        localctx = OPLangParser.ContinuestatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 130, self.RULE_continuestatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 568
+            self.match(OPLangParser.CONTINUE)
+            self.state = 569
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ReturnstatementContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def RETURN(self):
+            return self.getToken(OPLangParser.RETURN, 0)
+
+        def expression(self):
+            return self.getTypedRuleContext(OPLangParser.ExpressionContext,0)
+
+
+        def SEMICOLON(self):
+            return self.getToken(OPLangParser.SEMICOLON, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_returnstatement
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReturnstatement" ):
+                return visitor.visitReturnstatement(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def returnstatement(self):
+
+        localctx = OPLangParser.ReturnstatementContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 132, self.RULE_returnstatement)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 571
+            self.match(OPLangParser.RETURN)
+            self.state = 572
+            self.expression()
+            self.state = 573
+            self.match(OPLangParser.SEMICOLON)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArraylitContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LPAREN(self):
+            return self.getToken(OPLangParser.LPAREN, 0)
+
+        def literallist(self):
+            return self.getTypedRuleContext(OPLangParser.LiterallistContext,0)
+
+
+        def RPAREN(self):
+            return self.getToken(OPLangParser.RPAREN, 0)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_arraylit
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArraylit" ):
+                return visitor.visitArraylit(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def arraylit(self):
+
+        localctx = OPLangParser.ArraylitContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 134, self.RULE_arraylit)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 575
+            self.match(OPLangParser.LPAREN)
+            self.state = 576
+            self.literallist()
+            self.state = 577
+            self.match(OPLangParser.RPAREN)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class LiterallistContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(OPLangParser.ExpressionContext)
+            else:
+                return self.getTypedRuleContext(OPLangParser.ExpressionContext,i)
+
+
+        def COMMA(self, i:int=None):
+            if i is None:
+                return self.getTokens(OPLangParser.COMMA)
+            else:
+                return self.getToken(OPLangParser.COMMA, i)
+
+        def getRuleIndex(self):
+            return OPLangParser.RULE_literallist
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitLiterallist" ):
+                return visitor.visitLiterallist(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def literallist(self):
+
+        localctx = OPLangParser.LiterallistContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 136, self.RULE_literallist)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 579
+            self.expression()
+            self.state = 584
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==54:
+                self.state = 580
+                self.match(OPLangParser.COMMA)
+                self.state = 581
+                self.expression()
+                self.state = 586
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[28] = self.orexpression_sempred
+        self._predicates[29] = self.andexpression_sempred
+        self._predicates[32] = self.arithmeticexpression_sempred
+        self._predicates[33] = self.terms_sempred
+        self._predicates[59] = self.exprstatement_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def orexpression_sempred(self, localctx:OrexpressionContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 2)
+         
+
+    def andexpression_sempred(self, localctx:AndexpressionContext, predIndex:int):
+            if predIndex == 1:
+                return self.precpred(self._ctx, 2)
+         
+
+    def arithmeticexpression_sempred(self, localctx:ArithmeticexpressionContext, predIndex:int):
+            if predIndex == 2:
+                return self.precpred(self._ctx, 3)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 2)
+         
+
+    def terms_sempred(self, localctx:TermsContext, predIndex:int):
+            if predIndex == 4:
+                return self.precpred(self._ctx, 2)
+         
+
+    def exprstatement_sempred(self, localctx:ExprstatementContext, predIndex:int):
+            if predIndex == 5:
+                return self.isAssignable(localctx.target)
+         
+
+
+
+
@@ -0,0 +1,358 @@
+# Generated from OPLang.g4 by ANTLR 4.13.2
+from antlr4 import *
+if "." in __name__:
+    from .OPLangParser import OPLangParser
+else:
+    from OPLangParser import OPLangParser
+
+# This class defines a complete generic visitor for a parse tree produced by OPLangParser.
+
+class OPLangVisitor(ParseTreeVisitor):
+
+    # Visit a parse tree produced by OPLangParser#program.
+    def visitProgram(self, ctx:OPLangParser.ProgramContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#classdecllist.
+    def visitClassdecllist(self, ctx:OPLangParser.ClassdecllistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#classdecl.
+    def visitClassdecl(self, ctx:OPLangParser.ClassdeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#memberblock.
+    def visitMemberblock(self, ctx:OPLangParser.MemberblockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#memberlist.
+    def visitMemberlist(self, ctx:OPLangParser.MemberlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#classmember.
+    def visitClassmember(self, ctx:OPLangParser.ClassmemberContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attributedecl.
+    def visitAttributedecl(self, ctx:OPLangParser.AttributedeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#memberspec.
+    def visitMemberspec(self, ctx:OPLangParser.MemberspecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#vartype.
+    def visitVartype(self, ctx:OPLangParser.VartypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arraytype.
+    def visitArraytype(self, ctx:OPLangParser.ArraytypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#elementtype.
+    def visitElementtype(self, ctx:OPLangParser.ElementtypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attrlist.
+    def visitAttrlist(self, ctx:OPLangParser.AttrlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#attrunit.
+    def visitAttrunit(self, ctx:OPLangParser.AttrunitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#assign.
+    def visitAssign(self, ctx:OPLangParser.AssignContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#referencememdecl.
+    def visitReferencememdecl(self, ctx:OPLangParser.ReferencememdeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#methoddecl.
+    def visitMethoddecl(self, ctx:OPLangParser.MethoddeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#returntype.
+    def visitReturntype(self, ctx:OPLangParser.ReturntypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#paramlistblock.
+    def visitParamlistblock(self, ctx:OPLangParser.ParamlistblockContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#paramlist.
+    def visitParamlist(self, ctx:OPLangParser.ParamlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#parameter.
+    def visitParameter(self, ctx:OPLangParser.ParameterContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#idlist.
+    def visitIdlist(self, ctx:OPLangParser.IdlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#paramtype.
+    def visitParamtype(self, ctx:OPLangParser.ParamtypeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#constructor.
+    def visitConstructor(self, ctx:OPLangParser.ConstructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#defaultconstructor.
+    def visitDefaultconstructor(self, ctx:OPLangParser.DefaultconstructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#copyconstructor.
+    def visitCopyconstructor(self, ctx:OPLangParser.CopyconstructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#userdefinedconstructor.
+    def visitUserdefinedconstructor(self, ctx:OPLangParser.UserdefinedconstructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#destructor.
+    def visitDestructor(self, ctx:OPLangParser.DestructorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#expression.
+    def visitExpression(self, ctx:OPLangParser.ExpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#orexpression.
+    def visitOrexpression(self, ctx:OPLangParser.OrexpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#andexpression.
+    def visitAndexpression(self, ctx:OPLangParser.AndexpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#relationalexpression.
+    def visitRelationalexpression(self, ctx:OPLangParser.RelationalexpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#relationaloperators.
+    def visitRelationaloperators(self, ctx:OPLangParser.RelationaloperatorsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arithmeticexpression.
+    def visitArithmeticexpression(self, ctx:OPLangParser.ArithmeticexpressionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#terms.
+    def visitTerms(self, ctx:OPLangParser.TermsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#termoperators.
+    def visitTermoperators(self, ctx:OPLangParser.TermoperatorsContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#factor.
+    def visitFactor(self, ctx:OPLangParser.FactorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#postfixexp.
+    def visitPostfixexp(self, ctx:OPLangParser.PostfixexpContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#unaryfactor.
+    def visitUnaryfactor(self, ctx:OPLangParser.UnaryfactorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#postfixlist.
+    def visitPostfixlist(self, ctx:OPLangParser.PostfixlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#primaryfactor.
+    def visitPrimaryfactor(self, ctx:OPLangParser.PrimaryfactorContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#indexing.
+    def visitIndexing(self, ctx:OPLangParser.IndexingContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#memaccess.
+    def visitMemaccess(self, ctx:OPLangParser.MemaccessContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#expressionlist.
+    def visitExpressionlist(self, ctx:OPLangParser.ExpressionlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#methodinvoke.
+    def visitMethodinvoke(self, ctx:OPLangParser.MethodinvokeContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#objcreate.
+    def visitObjcreate(self, ctx:OPLangParser.ObjcreateContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#blockstatement.
+    def visitBlockstatement(self, ctx:OPLangParser.BlockstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#blockstatementbody.
+    def visitBlockstatementbody(self, ctx:OPLangParser.BlockstatementbodyContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#vardecllist.
+    def visitVardecllist(self, ctx:OPLangParser.VardecllistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#vardecl.
+    def visitVardecl(self, ctx:OPLangParser.VardeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#referencedecl.
+    def visitReferencedecl(self, ctx:OPLangParser.ReferencedeclContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#varspec.
+    def visitVarspec(self, ctx:OPLangParser.VarspecContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#varlist.
+    def visitVarlist(self, ctx:OPLangParser.VarlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#varunit.
+    def visitVarunit(self, ctx:OPLangParser.VarunitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#referencelist.
+    def visitReferencelist(self, ctx:OPLangParser.ReferencelistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#referenceunit.
+    def visitReferenceunit(self, ctx:OPLangParser.ReferenceunitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#assignvar.
+    def visitAssignvar(self, ctx:OPLangParser.AssignvarContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#statementlist.
+    def visitStatementlist(self, ctx:OPLangParser.StatementlistContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#lhspostfix.
+    def visitLhspostfix(self, ctx:OPLangParser.LhspostfixContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#statement.
+    def visitStatement(self, ctx:OPLangParser.StatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#exprstatement.
+    def visitExprstatement(self, ctx:OPLangParser.ExprstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#ifstatement.
+    def visitIfstatement(self, ctx:OPLangParser.IfstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#forstatement.
+    def visitForstatement(self, ctx:OPLangParser.ForstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#scalar.
+    def visitScalar(self, ctx:OPLangParser.ScalarContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#fordirection.
+    def visitFordirection(self, ctx:OPLangParser.FordirectionContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#breakstatement.
+    def visitBreakstatement(self, ctx:OPLangParser.BreakstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#continuestatement.
+    def visitContinuestatement(self, ctx:OPLangParser.ContinuestatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#returnstatement.
+    def visitReturnstatement(self, ctx:OPLangParser.ReturnstatementContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#arraylit.
+    def visitArraylit(self, ctx:OPLangParser.ArraylitContext):
+        return self.visitChildren(ctx)
+
+
+    # Visit a parse tree produced by OPLangParser#literallist.
+    def visitLiterallist(self, ctx:OPLangParser.LiterallistContext):
+        return self.visitChildren(ctx)
+
+
+
+del OPLangParser
\ No newline at end of file
@@ -204,6 +204,18 @@ class OPLangBuilder:
             )
         )
         print()
+        print(self.colors.green("Profiling:"))
+        print(
+            self.colors.yellow(
+                "  python3 run.py profile-grammar [--corpus PATH ...] - Rank grammar decisions by lookahead cost"
+            )
+        )
+        print(
+            self.colors.yellow(
+                "  python3 run.py dfa-cache [--corpus PATH ...] - Train and save the parser DFA cache"
+            )
+        )
+        print()
         print(self.colors.green("Cleaning:"))
         print(
             self.colors.yellow(
@@ -686,6 +698,63 @@ class OPLangBuilder:
         )
         self.clean_cache()
 
+    def profile_grammar(self, corpus=None):
+        """Profile grammar decisions over a corpus and write a ranked report."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Profiling grammar decisions..."))
+
+        profile_report_dir = self.report_dir / "profile"
+        profile_report_dir.mkdir(parents=True, exist_ok=True)
+        report_file = profile_report_dir / "decisions.txt"
+
+        python = self.venv_python3 if self.venv_python3.exists() else Path(sys.executable)
+        self.run_command(
+            [
+                str(python),
+                "-m",
+                "src.frontend.profiler",
+                "--output",
+                str(report_file),
+            ]
+            + list(corpus or []),
+        )
+
+        print(
+            self.colors.green(
+                f"Grammar profile completed. Report generated at {report_file}"
+            )
+        )
+
+    def dfa_cache(self, corpus=None):
+        """Parse a corpus and save the warmed prediction DFAs for later processes."""
+        if not self.build_dir.exists():
+            print(
+                self.colors.yellow("Build directory not found. Running build first...")
+            )
+            self.build_grammar()
+
+        print(self.colors.yellow("Training DFA cache..."))
+
+        cache_file = self.build_dir / "OPLang.dfa"
+        python = self.venv_python3 if self.venv_python3.exists() else Path(sys.executable)
+        self.run_command(
+            [
+                str(python),
+                "-m",
+                "src.frontend.train_dfa",
+                "--output",
+                str(cache_file),
+            ]
+            + list(corpus or []),
+        )
+
+        print(self.colors.green(f"DFA cache saved to {cache_file}"))
+
 
 def main():
     """Main entry point."""
@@ -707,12 +776,15 @@ Available commands:
   test-ast      Run AST generation tests
   test-checker  Run semantic checker tests
   test-codegen  Run code generation tests
+  profile-grammar  Rank grammar decisions by lookahead cost (--corpus to pick the programs)
+  dfa-cache     Train and save the parser DFA cache loaded by later runs (--corpus to pick the programs)
 
 Examples:
   python3 run.py setup
   python3 run.py build
   python3 run.py test-lexer
   python3 run.py test-ast
+  python3 run.py profile-grammar --corpus examples/
         """,
     )
 
@@ -734,9 +806,17 @@ Examples:
             "test-ast",
             "test-checker",
             "test-codegen",
+            "profile-grammar",
+            "dfa-cache",
         ],
         help="Command to execute",
     )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        metavar="PATH",
+        help="OPLang files or directories for profile-grammar and dfa-cache (default: the test programs)",
+    )
 
     args = parser.parse_args()
 
@@ -756,6 +836,8 @@ Examples:
         "test-ast": builder.test_ast,
         "test-checker": builder.test_checker,
         "test-codegen": builder.test_codegen,
+        "profile-grammar": lambda: builder.profile_grammar(args.corpus),
+        "dfa-cache": lambda: builder.dfa_cache(args.corpus),
     }
 
     if args.command in commands:
@@ -8,6 +8,7 @@ from functools import reduce
 from build.OPLangVisitor import OPLangVisitor
 from build.OPLangParser import OPLangParser
 from src.utils.nodes import *
+from src.utils.type_table import primitive_type, class_type, array_type, reference_type
 
 
 class ASTGeneration(OPLangVisitor):
@@ -19,11 +20,7 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitClassdecllist(self, ctx): # this returns a list of classDecl objects
-        classlist = [self.visit(ctx.classdecl())]
-        if (ctx.classdecllist()):
-            classlist += self.visit(ctx.classdecllist())
-        
-        return classlist
+        return [self.visit(x) for x in ctx.classdecl()]
     
 
     def visitClassdecl(self, ctx): # this returns an object of ClassDecl
@@ -36,17 +33,7 @@ class ASTGeneration(OPLangVisitor):
 
 
     def visitMemberlist(self, ctx): # this returns a list of ClassMember objects
-        memberlist = [self.visit(ctx.classmember())] if ctx.classmember() else []
-        if (ctx.membertail()):
-            memberlist += self.visit(ctx.membertail())
-
-        return memberlist
-
-    
-    def visitMembertail(self, ctx): # this also returns a list of ClassMember objects
-        if (ctx.classmember()):
-            return [self.visit(ctx.classmember())] + self.visit(ctx.membertail())
-        return []
+        return [self.visit(x) for x in ctx.classmember()]
     
 
     def visitClassmember(self, ctx): 
@@ -80,7 +67,7 @@ class ASTGeneration(OPLangVisitor):
         memspecs = [self.visit(x) for x in ctx.memberspec()]
         is_static = "static" in memspecs
         is_final = "final" in memspecs
-        return AttributeDecl(is_static, is_final, ReferenceType(self.visit(ctx.vartype())), self.visit(ctx.attrlist()))
+        return AttributeDecl(is_static, is_final, reference_type(self.visit(ctx.vartype())), self.visit(ctx.attrlist()))
     
 
     def visitMemberspec(self, ctx): #return a memspec
@@ -91,13 +78,7 @@ class ASTGeneration(OPLangVisitor):
 
 
     def visitAttrlist(self, ctx): # this returns a list of Attribute objects
-        return [self.visit(ctx.attrunit())] + (self.visit(ctx.attrtail()) if ctx.attrtail() else None)
-
-
-    def visitAttrtail(self, ctx): # this returns a list of Attribute objects
-        if (ctx.attrunit()):
-            return [self.visit(ctx.attrunit())] + self.visit(ctx.attrtail())
-        return []
+        return [self.visit(x) for x in ctx.attrunit()]
     
 
     def visitAttrunit(self, ctx): # this returns an Attribute object
@@ -113,35 +94,35 @@ class ASTGeneration(OPLangVisitor):
 
     def visitVartype(self, ctx): # this returns an object of Type
         if (ctx.INT()):
-            return PrimitiveType(ctx.INT().getText())
+            return primitive_type(ctx.INT().getText())
         elif (ctx.FLOAT()):
-            return PrimitiveType(ctx.FLOAT().getText())
+            return primitive_type(ctx.FLOAT().getText())
         elif (ctx.BOOLEAN()):
-            return PrimitiveType(ctx.BOOLEAN().getText())
+            return primitive_type(ctx.BOOLEAN().getText())
         elif (ctx.STRING()):
-            return PrimitiveType(ctx.STRING().getText())
+            return primitive_type(ctx.STRING().getText())
         elif (ctx.IDENTIFIERS()):
-            return ClassType(ctx.IDENTIFIERS().getText())
+            return class_type(ctx.IDENTIFIERS().getText())
         else:
             return self.visit(ctx.arraytype())
         
 
     def visitArraytype(self, ctx): # returns ArrayType object
-        return ArrayType(self.visit(ctx.elementtype()), int(ctx.INTLIT().getText()))
+        return array_type(self.visit(ctx.elementtype()), int(ctx.INTLIT().getText()))
     
 
     def visitElementtype(self, ctx): #return PrimitiveType object
         ref = ctx.REFERENCE() != None
         if (ctx.INT()):
-            return PrimitiveType(ctx.INT().getText()) if not ref else ReferenceType(PrimitiveType(ctx.INT().getText()))
+            return primitive_type(ctx.INT().getText()) if not ref else reference_type(primitive_type(ctx.INT().getText()))
         elif (ctx.FLOAT()):
-            return PrimitiveType(ctx.FLOAT().getText()) if not ref else ReferenceType(PrimitiveType(ctx.FLOAT().getText()))
+            return primitive_type(ctx.FLOAT().getText()) if not ref else reference_type(primitive_type(ctx.FLOAT().getText()))
         elif (ctx.BOOLEAN()):
-            return PrimitiveType(ctx.BOOLEAN().getText()) if not ref else ReferenceType(PrimitiveType(ctx.BOOLEAN().getText()))
+            return primitive_type(ctx.BOOLEAN().getText()) if not ref else reference_type(primitive_type(ctx.BOOLEAN().getText()))
         elif (ctx.STRING()):
-            return PrimitiveType(ctx.STRING().getText()) if not ref else ReferenceType(PrimitiveType(ctx.STRING().getText()))
+            return primitive_type(ctx.STRING().getText()) if not ref else reference_type(primitive_type(ctx.STRING().getText()))
         else:
-            return ClassType(ctx.IDENTIFIERS().getText()) if not ref else ReferenceType(ClassType(ctx.IDENTIFIERS().getText()))
+            return class_type(ctx.IDENTIFIERS().getText()) if not ref else reference_type(class_type(ctx.IDENTIFIERS().getText()))
         
         
 
@@ -177,19 +158,19 @@ class ASTGeneration(OPLangVisitor):
     def visitReturntype(self, ctx): #returns an object of Type
         ref = ctx.REFERENCE() != None
         if (ctx.INT()):
-            return PrimitiveType(ctx.INT().getText()) if not ref else ReferenceType(PrimitiveType(ctx.INT().getText()))
+            return primitive_type(ctx.INT().getText()) if not ref else reference_type(primitive_type(ctx.INT().getText()))
         elif (ctx.FLOAT()):
-            return PrimitiveType(ctx.FLOAT().getText()) if not ref else ReferenceType(PrimitiveType(ctx.FLOAT().getText()))
+            return primitive_type(ctx.FLOAT().getText()) if not ref else reference_type(primitive_type(ctx.FLOAT().getText()))
         elif (ctx.STRING()):
-            return PrimitiveType(ctx.STRING().getText()) if not ref else ReferenceType(PrimitiveType(ctx.STRING().getText()))
+            return primitive_type(ctx.STRING().getText()) if not ref else reference_type(primitive_type(ctx.STRING().getText()))
         elif (ctx.BOOLEAN()):
-            return PrimitiveType(ctx.BOOLEAN().getText()) if not ref else ReferenceType(PrimitiveType(ctx.BOOLEAN().getText()))
+            return primitive_type(ctx.BOOLEAN().getText()) if not ref else reference_type(primitive_type(ctx.BOOLEAN().getText()))
         elif (ctx.IDENTIFIERS()):
-            return ClassType(ctx.IDENTIFIERS().getText()) if not ref else ReferenceType(ClassType(ctx.IDENTIFIERS().getText()))
+            return class_type(ctx.IDENTIFIERS().getText()) if not ref else reference_type(class_type(ctx.IDENTIFIERS().getText()))
         elif (ctx.VOID()):
-            return PrimitiveType(ctx.VOID().getText()) if not ref else ReferenceType(PrimitiveType(ctx.VOID().getText()))
+            return primitive_type(ctx.VOID().getText()) if not ref else reference_type(primitive_type(ctx.VOID().getText()))
         elif (ctx.arraytype()):
-            return self.visit(ctx.arraytype()) if not ref else ReferenceType(self.visit(ctx.arraytype()))
+            return self.visit(ctx.arraytype()) if not ref else reference_type(self.visit(ctx.arraytype()))
         
 
     def visitParamlistblock(self, ctx): #returns a list of Parameter objects
@@ -197,15 +178,10 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitParamlist(self, ctx): #returns a list of Parameter objects
-        if (ctx.parameter()):
-            return self.visit(ctx.parameter()) + self.visit(ctx.paramtail())
-        return []
-    
-
-    def visitParamtail(self, ctx): #returns a list of Parameter objects
-        if (ctx.parameter()):
-            return self.visit(ctx.parameter()) + self.visit(ctx.paramtail())
-        return []
+        params = []
+        for x in ctx.parameter():
+            params.extend(self.visit(x))
+        return params
     
 
     def visitParameter(self, ctx): #returns a list of parameter object
@@ -215,18 +191,12 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitIdlist(self, ctx): #returns list of variable string
-        return [ctx.IDENTIFIERS().getText()] + self.visit(ctx.idtail())
-
-
-    def visitIdtail(self, ctx):
-        if (ctx.IDENTIFIERS()):
-            return [ctx.IDENTIFIERS()] + self.visit(ctx.idtail())
-        return []
+        return [x.getText() for x in ctx.IDENTIFIERS()]
     
 
     def visitParamtype(self, ctx): #returns a Type object for parameter types
         if (ctx.REFERENCE()):
-            return ReferenceType(self.visit(ctx.vartype()))
+            return reference_type(self.visit(ctx.vartype()))
         
         return self.visit(ctx.vartype())
 
@@ -240,10 +210,7 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitVardecllist(self, ctx): #returns a list of VariableDecl
-        if (ctx.vardecl()):
-            return [self.visit(ctx.vardecl())] + self.visit(ctx.vardecllist())
-        
-        return []
+        return [self.visit(x) for x in ctx.vardecl()]
     
 
     def visitVardecl(self, ctx): #returns a VariableDecl object
@@ -263,19 +230,22 @@ class ASTGeneration(OPLangVisitor):
 
 
     def visitVarlist(self, ctx): #returns list of Variable objects
-        return [self.visit(ctx.varunit())] + (self.visit(ctx.vartail()) if ctx.vartail() else None)
-    
-
-    def visitVartail(self, ctx): #returns list of Variable objects
-        if (ctx.varunit()):
-            return [self.visit(ctx.varunit())] + self.visit(ctx.vartail())
-        return []
+        return [self.visit(x) for x in ctx.varunit()]
     
 
     def visitVarunit(self, ctx): #return a Variable object
+        init_value = self.visit(ctx.expression()) if ctx.expression() else None
+        return Variable(ctx.IDENTIFIERS().getText(), init_value)
+
+
+    def visitReferencelist(self, ctx): #returns list of Variable objects for reference declaration
+        return [self.visit(x) for x in ctx.referenceunit()]
+
+
+    def visitReferenceunit(self, ctx): #return a Variable object
         if (ctx.assignvar()):
             return self.visit(ctx.assignvar())
-        
+
         return Variable(ctx.IDENTIFIERS().getText())
     
 
@@ -284,60 +254,45 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitReferencedecl(self, ctx): #returns a VariableDecl object with references
-        return VariableDecl(self.visit(ctx.varspec()), ReferenceType(self.visit(ctx.vartype())), self.visit(ctx.varlist()))
+        var_list = self.visit(ctx.referencelist())
+        var_list[-1].init_value = self.visit(ctx.expression()) # the trailing ':= expression' initialises the last reference
+        return VariableDecl(self.visit(ctx.varspec()), reference_type(self.visit(ctx.vartype())), var_list)
     
 
     def visitStatementlist(self, ctx): #returns a list of Statement objects
-        if (ctx.statement()):
-            return [self.visit(ctx.statement())] + self.visit(ctx.statementlist())
-        return []
+        return [self.visit(x) for x in ctx.statement()]
     
 
     def visitStatement(self, ctx): #returns a Statement object
-        if (ctx.expression()):
-            return MethodInvocationStatement(self.visit(ctx.expression()))
-        if ctx.getChild(0):
-            return self.visit(ctx.getChild(0))
-        # if (ctx.reassign()):
-        #     return self.visit(ctx.reassign())
-        # elif (ctx.expression()):
-        #     pass
-        # elif (ctx.blockstatement):
-        #     return self.visit(ctx.blockstatement())
-        # elif (ctx.ifstatement()):
-        #     return self.visit(ctx.ifstatement())
-        # elif (ctx.forstatement()):
-        #     return self.visit(ctx.forstatement())
-        # elif (ctx.breakstatement()):
-        #     return self.visit(ctx.breakstatement())
-        # elif (ctx.returnstatement()):
-        #     return self.visit(ctx.returnstatement())
-        # else:
-        #     return self.visit(ctx.continuestatement())
-        
+        return self.visit(ctx.getChild(0))
 
-    def visitReassign(self, ctx): #return an object of type AssignmentStatement
-        return AssignmentStatement(self.visit(ctx.lhs()), self.visit(ctx.expression()))
-    
 
-    def visitLhs(self, ctx): #return an object of type LHS
-        if (ctx.IDENTIFIERS()):
-            return IdLHS(ctx.IDENTIFIERS().getText())
-        return PostfixLHS(self.visit(ctx.postfixexp()))
-        
+    def visitExprstatement(self, ctx): #returns an AssignmentStatement or a MethodInvocationStatement
+        if (ctx.ASSIGNING()):
+            return AssignmentStatement(self.buildLhs(ctx.target), self.visit(ctx.expression(1)))
+        return MethodInvocationStatement(self.visit(ctx.target))
+
+
+    def buildLhs(self, ctx): #return an object of type LHS for an assignment target
+        #the parser only accepts targets that are a bare postfix expression, so walk down to it
+        while not isinstance(ctx, OPLangParser.PostfixexpContext):
+            ctx = ctx.getChild(0)
+        if (ctx.unaryfactor().IDENTIFIERS() and not ctx.postfixlist().lhspostfix()):
+            return IdLHS(ctx.unaryfactor().IDENTIFIERS().getText())
+        return PostfixLHS(self.visit(ctx))
     
 
     def visitPostfixexp(self, ctx): #returns an object of type PostfixExpression
+        #every child is visited exactly once, nested chains like a.f(b.g(c.h())) stay linear
         postlist = self.visit(ctx.postfixlist())
+        primary = self.visit(ctx.unaryfactor())
         if (len(postlist) >= 1):
-            return PostfixExpression(self.visit(ctx.unaryfactor()), self.visit(ctx.postfixlist())) 
-        return self.visit(ctx.unaryfactor())
+            return PostfixExpression(primary, postlist)
+        return primary
 
 
     def visitPostfixlist(self, ctx): #returns a list of postfixOp
-        if (ctx.lhspostfix()):
-            return [self.visit(ctx.lhspostfix())] + self.visit(ctx.postfixlist())
-        return []
+        return [self.visit(x) for x in ctx.lhspostfix()]
     
 
     def visitLhspostfix(self, ctx): #returns an object of type PostfixOp
@@ -362,34 +317,16 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitExpressionlist(self, ctx): #returns list of expressions for methodcall
-        return [self.visit(ctx.expression())] + self.visit(ctx.expressiontail()) if ctx.expression() else []
-    
-
-    def visitExpressiontail(self, ctx):
-        if (ctx.expression()):
-            return [self.visit(ctx.expression())] + self.visit(ctx.expressiontail())
-        return []
+        return [self.visit(x) for x in ctx.expression()]
 
 
     def visitIfstatement(self, ctx): #return an object of type IfStatement
-        then_stmt = self.visit(ctx.statement()) if ctx.statement() else self.visit(ctx.blockstatement())
-        else_stmt = self.visit(ctx.iftail()) if ctx.iftail() else None
-        return IfStatement(self.visit(ctx.expression()), then_stmt, else_stmt)
-    
-
-    def visitIftail(self, ctx): #returns Statement object when visiting else statement
-        if (ctx.blockstatement()):
-            return self.visit(ctx.blockstatement())
-        elif (ctx.statement()):
-            return self.visit(ctx.statement())
+        else_stmt = self.visit(ctx.statement(1)) if ctx.ELSE() else None
+        return IfStatement(self.visit(ctx.expression()), self.visit(ctx.statement(0)), else_stmt)
 
 
     def visitForstatement(self, ctx): #return a ForStatement object
-        if (ctx.statement()):
-            for_stmt = self.visit(ctx.statement())
-        else:
-            for_stmt = self.visit(ctx.blockstatement())
-        return ForStatement(self.visit(ctx.scalar()), self.visit(ctx.expression(0)), self.visit(ctx.fordirection()), self.visit(ctx.expression(1)), for_stmt)
+        return ForStatement(self.visit(ctx.scalar()), self.visit(ctx.expression(0)), self.visit(ctx.fordirection()), self.visit(ctx.expression(1)), self.visit(ctx.statement()))
     
 
     def visitScalar(self, ctx): #return a string indicating the scalar variable used in for statement
@@ -417,16 +354,24 @@ class ASTGeneration(OPLangVisitor):
     def visitExpression(self, ctx): #return an object of type Expression
         return self.visit(ctx.orexpression())
     
+    def foldBinaryChain(self, ctx): #folds a left-recursive binary rule into BinaryOp objects
+        #walk down the left spine instead of recursing so long chains (a + b + c ...) use constant stack depth
+        operands = []
+        while ctx.getChildCount() > 1:
+            operands.append((ctx.getChild(1).getText(), ctx.getChild(2)))
+            ctx = ctx.getChild(0)
+        result = self.visit(ctx.getChild(0))
+        for op, right in reversed(operands):
+            result = BinaryOp(result, op, self.visit(right))
+        return result
+
+
     def visitOrexpression(self, ctx):
-        if (ctx.orexpression()):
-            return BinaryOp(self.visit(ctx.orexpression()), ctx.LOGICOR().getText(), self.visit(ctx.andexpression()))
-        return self.visit(ctx.andexpression())
+        return self.foldBinaryChain(ctx)
 
 
     def visitAndexpression(self, ctx):
-        if (ctx.andexpression()):
-            return BinaryOp(self.visit(ctx.andexpression()), ctx.LOGICAND().getText(), self.visit(ctx.relationalexpression()))
-        return self.visit(ctx.relationalexpression())
+        return self.foldBinaryChain(ctx)
     
 
     def visitRelationalexpression(self, ctx):
@@ -440,15 +385,11 @@ class ASTGeneration(OPLangVisitor):
     
 
     def visitArithmeticexpression(self, ctx):
-        if (ctx.getChildCount() > 1):
-            return BinaryOp(self.visit(ctx.arithmeticexpression()), ctx.getChild(1).getText(), self.visit(ctx.terms()))
-        return self.visit(ctx.terms())
+        return self.foldBinaryChain(ctx)
 
 
     def visitTerms(self, ctx):
-        if (ctx.terms()):
-            return BinaryOp(self.visit(ctx.terms()), self.visit(ctx.termoperators()), self.visit(ctx.factor()))
-        return self.visit(ctx.factor())
+        return self.foldBinaryChain(ctx)
     
 
     def visitTermoperators(self, ctx):
@@ -456,11 +397,15 @@ class ASTGeneration(OPLangVisitor):
 
 
     def visitFactor(self, ctx):
-        if (ctx.factor()):
-            return UnaryOp(ctx.getChild(0).getText(), self.visit(ctx.factor()))
-        elif (ctx.postfixexp()):
-            return self.visit(ctx.postfixexp())
-        return self.visit(ctx.primaryfactor())
+        #prefix operators are collected in a loop for the same reason as foldBinaryChain
+        operators = []
+        while (ctx.factor()):
+            operators.append(ctx.getChild(0).getText())
+            ctx = ctx.factor()
+        result = self.visit(ctx.postfixexp()) if ctx.postfixexp() else self.visit(ctx.primaryfactor())
+        for op in reversed(operators):
+            result = UnaryOp(op, result)
+        return result
         
 
     def visitUnaryfactor(self, ctx): #returns an object of type Expression for unaryfactor
@@ -496,11 +441,7 @@ class ASTGeneration(OPLangVisitor):
 
 
     def visitLiterallist(self, ctx):
-        return [self.visit(ctx.expression())] + self.visit(ctx.literallisttail()) if (ctx.literallisttail()) else [self.visit(ctx.anyliteral())]
-    
-
-    def visitLiterallisttail(self, ctx):
-        return [self.visit(ctx.expression())] + self.visit(ctx.literallisttail()) if (ctx.literallisttail()) else []
+        return [self.visit(x) for x in ctx.expression()]
     
 
     def visitAnyliteral(self, ctx):
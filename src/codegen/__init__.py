@@ -0,0 +1,35 @@
+"""
+Code generation for OPLang: a bytecode compiler and the virtual machine
+running it, and a translator to Python.
+
+CodeGenerator compiles a checked program into a Module of bytecode
+functions (src/codegen/bytecode.py) and VirtualMachine runs it.
+Transpiler translates it into a Python module whose code object Runtime
+runs, and CodeCache keeps those code objects on disk.
+"""
+
+from .bytecode import Module, CodeObject, disassemble
+from .codegen import CodeGenerator
+from .vm import VirtualMachine
+from .transpiler import Transpiler
+from .runtime import Runtime
+from .cache import CodeCache
+from .error import CodegenError, ExecutionError, DivisionByZero, IndexOutOfRange, NilDereference, StackOverflow, InvalidInput
+
+__all__ = [
+    'CodeGenerator',
+    'VirtualMachine',
+    'Transpiler',
+    'Runtime',
+    'CodeCache',
+    'Module',
+    'CodeObject',
+    'disassemble',
+    'CodegenError',
+    'ExecutionError',
+    'DivisionByZero',
+    'IndexOutOfRange',
+    'NilDereference',
+    'StackOverflow',
+    'InvalidInput',
+]
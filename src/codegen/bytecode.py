@@ -0,0 +1,176 @@
+"""
+Bytecode of the OPLang virtual machine.
+
+CodeGenerator compiles every method, constructor and destructor of a
+checked program into a CodeObject. Its instructions are stored flat in an
+array('i'): an opcode followed by as many int operands as ARITY gives
+for it, so a method costs a few bytes per instruction and code objects
+are cheap to build, compare and serialize. Constants an instruction
+cannot hold as an int (floats, strings, default values) live in the
+consts tuple of the code object and are named by their index.
+
+The machine is a stack machine. An instruction pops its operands from
+the operand stack and pushes its result; locals live in a frame, a list
+of CodeObject.nlocals values indexed by the slots NameResolver gave them,
+with the receiver in slot 0 of every frame but that of a static method.
+A reference (T &) is a (container, index) pair, container being the list
+that holds the value it aliases: a frame, an array or the fields of an
+object, see src/codegen/vm.py.
+
+Operands of the instructions below: s a frame slot, k a constant index,
+t a jump target (an index into the code), i a field or static field
+index, f a function index, c a class index, v a vtable index, n a count.
+"""
+
+from array import array
+
+OPCODES = (
+    "LOAD", "LOAD2", "LOAD_CONST", "STORE", "LOAD_REF", "STORE_REF", "REF_LOCAL", "CONST", "POP", "DUP",
+    "ADD", "SUB", "MUL", "DIV", "IDIV", "MOD", "EQ", "NE", "LT", "LE", "GT", "GE",
+    "NEG", "NOT", "TO_FLOAT",
+    "JUMP", "JUMP_IF_FALSE", "JUMP_IF_TRUE", "JUMP_IF_FALSE_OR_POP", "JUMP_IF_TRUE_OR_POP",
+    "FOR_TO", "FOR_DOWNTO", "LOOP_UP", "LOOP_DOWN",
+    "GET_FIELD", "SET_FIELD", "REF_FIELD", "GET_STATIC", "SET_STATIC", "REF_STATIC",
+    "GET_INDEX", "SET_INDEX", "REF_INDEX", "DEREF", "BOX", "NEW", "NEW_ARRAY", "ARRAY",
+    "CALL", "CALL_METHOD", "CALL_NATIVE", "RETURN", "RETURN_NONE", "LEAVE",
+)
+
+(
+    # frame slots
+    LOAD,           # s: push frame[s]
+    LOAD2,          # s r: push frame[s], then frame[r]
+    LOAD_CONST,     # s k: push frame[s], then consts[k]
+    STORE,          # s: frame[s] = pop
+    LOAD_REF,       # s: push the value the reference in frame[s] aliases
+    STORE_REF,      # s: store pop into what the reference in frame[s] aliases
+    REF_LOCAL,      # s: push a reference to frame[s]
+    CONST,          # k: push consts[k]
+    POP,
+    DUP,
+    # arithmetic, on the two topmost values
+    ADD, SUB, MUL, DIV, IDIV, MOD,
+    EQ, NE, LT, LE, GT, GE,
+    NEG, NOT, TO_FLOAT,
+    # control flow
+    JUMP,               # t
+    JUMP_IF_FALSE,      # t: pop, jump when false
+    JUMP_IF_TRUE,       # t: pop, jump when true
+    JUMP_IF_FALSE_OR_POP,  # t: jump keeping the value when false, pop it otherwise (&&)
+    JUMP_IF_TRUE_OR_POP,   # t: jump keeping the value when true, pop it otherwise (||)
+    FOR_TO,         # s e t: jump to t when frame[s] > frame[e]
+    FOR_DOWNTO,     # s e t: jump to t when frame[s] < frame[e]
+    LOOP_UP,        # s e t: frame[s] += 1, jump to t when frame[s] <= frame[e]
+    LOOP_DOWN,      # s e t: frame[s] -= 1, jump to t when frame[s] >= frame[e]
+    # objects, arrays and references
+    GET_FIELD,      # i: push pop()[i]
+    SET_FIELD,      # i: value = pop, object = pop, object[i] = value
+    REF_FIELD,      # i: push a reference to field i of pop
+    GET_STATIC,     # i
+    SET_STATIC,     # i
+    REF_STATIC,     # i
+    GET_INDEX,      # index = pop, array = pop, push array[index]
+    SET_INDEX,      # value = pop, index = pop, array = pop, array[index] = value
+    REF_INDEX,      # push a reference to array[index]
+    DEREF,          # push the value the reference pop aliases
+    BOX,            # push a reference to a new location holding pop
+    NEW,            # c: push a new object of class c, its fields set to their defaults
+    NEW_ARRAY,      # n k: push an array of n times consts[k]
+    ARRAY,          # n: push an array of the n topmost values
+    # calls
+    CALL,           # f: call function f on its nparams topmost values
+    CALL_METHOD,    # v n: call vtable entry v of the object under the n topmost values
+    CALL_NATIVE,    # f n: call native function f on the n topmost values
+    RETURN,         # return pop
+    RETURN_NONE,    # return None, the end of a void method
+    LEAVE,          # return without a result, the end of a destructor
+) = range(len(OPCODES))
+
+
+ARITY = [0] * len(OPCODES)  # operands following each opcode
+for op in (LOAD, STORE, LOAD_REF, STORE_REF, REF_LOCAL, CONST,
+           JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP,
+           GET_FIELD, SET_FIELD, REF_FIELD, GET_STATIC, SET_STATIC, REF_STATIC,
+           NEW, ARRAY, CALL):
+    ARITY[op] = 1
+for op in (LOAD2, LOAD_CONST, NEW_ARRAY, CALL_METHOD, CALL_NATIVE):
+    ARITY[op] = 2
+for op in (FOR_TO, FOR_DOWNTO, LOOP_UP, LOOP_DOWN):
+    ARITY[op] = 3
+
+JUMPS = {JUMP: 0, JUMP_IF_FALSE: 0, JUMP_IF_TRUE: 0, JUMP_IF_FALSE_OR_POP: 0, JUMP_IF_TRUE_OR_POP: 0,
+         FOR_TO: 2, FOR_DOWNTO: 2, LOOP_UP: 2, LOOP_DOWN: 2}  # jump opcode -> position of its target among its operands
+
+BINARY = {"+": ADD, "-": SUB, "*": MUL, "/": DIV, "\\": IDIV, "%": MOD, "^": ADD,
+          "==": EQ, "!=": NE, "<": LT, "<=": LE, ">": GT, ">=": GE}
+
+UNARY = {"-": NEG, "!": NOT}  # unary + computes nothing
+
+
+class CodeObject:
+    """The compiled body of one method, constructor or destructor."""
+
+    __slots__ = ("name", "code", "consts", "nparams", "nlocals")
+
+    def __init__(self, name, code, consts, nparams, nlocals):
+        self.name = name          # Class.member
+        self.code = code          # array('i') of opcodes and their operands
+        self.consts = consts      # tuple of the constants CONST and NEW_ARRAY name
+        self.nparams = nparams    # values a call passes, the receiver included
+        self.nlocals = nlocals    # frame size, parameters and temporaries included
+
+    def __repr__(self):
+        return f"CodeObject({self.name}, {len(self.code)} words)"
+
+    def instructions(self):
+        """(position, opcode, operands) of every instruction."""
+        code = self.code
+        pc = 0
+        while pc < len(code):
+            op = code[pc]
+            yield pc, op, tuple(code[pc + 1:pc + 1 + ARITY[op]])
+            pc += 1 + ARITY[op]
+
+
+class ClassInfo:
+    """What the machine needs to create and dispatch on the objects of one class."""
+
+    __slots__ = ("name", "superclass", "fields", "vtable", "init", "destructor")
+
+    def __init__(self, name, superclass, fields, vtable, init, destructor):
+        self.name = name
+        self.superclass = superclass  # class index, -1 for none
+        self.fields = fields          # default value of every field, inherited ones first
+        self.vtable = vtable          # function index of every instance method
+        self.init = init              # function index of the field initializers, -1 for none
+        self.destructor = destructor  # function index, -1 for none
+
+
+class Module:
+    """A compiled program: its functions, classes and static fields."""
+
+    __slots__ = ("functions", "classes", "statics", "natives", "static_init", "entry", "receiver")
+
+    def __init__(self):
+        self.functions = []    # CodeObject of every function, CALL operands index it
+        self.classes = []      # ClassInfo of every class, NEW operands index it
+        self.statics = []      # default value of every static field
+        self.natives = []      # (class, method) of every builtin method called
+        self.static_init = -1  # function setting the static fields with initializers
+        self.entry = -1        # function index of main
+        self.receiver = -1     # class to create an object of for an instance main, -1 for static
+
+
+def assemble(words):
+    """The array('i') holding a list of opcodes and operands."""
+    return array("i", words)
+
+
+def disassemble(code_object):
+    """A listing of code_object, one instruction a line."""
+    lines = [f"{code_object.name}: {code_object.nparams} params, {code_object.nlocals} locals"]
+    for pc, op, operands in code_object.instructions():
+        text = f"{pc:5} {OPCODES[op]:<20} {' '.join(map(str, operands))}"
+        if op == CONST or op == LOAD_CONST:
+            text += f"  ({code_object.consts[operands[-1]]!r})"
+        lines.append(text.rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,110 @@
+"""
+On-disk cache of OPLang programs compiled to Python code objects.
+
+CodeCache maps the text of a program to the code object Transpiler
+compiles from it (see src/codegen/transpiler.py), so a program run again
+is not lexed, parsed, checked or translated again. Code objects are
+stored with marshal, one file per program named by a digest of its text,
+of the options it was compiled with, of the bytecode version of the
+running Python and of the sources of the compiler, every Python file and
+the grammar under src/: a file written by another Python or by a
+compiler with any source changed is never read, and a file that cannot
+be read is compiled and written again. The cache is only an optimization, so a directory that
+cannot be written leaves programs compiled on every load.
+
+The default directory is build/transpiled, next to the DFA cache of
+src/frontend/dfa_cache.py.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import types
+
+from .transpiler import Transpiler
+from ..frontend.backends import FAST, parse_source
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(ROOT_DIR, "build", "transpiled")
+SOURCE_DIR = os.path.join(ROOT_DIR, "src")
+SOURCE_SUFFIXES = (".py", ".g4")
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_digest():
+    """Digest of the sources of the compiler, read once per process."""
+    digest = hashlib.sha256()
+    for directory, subdirectories, files in os.walk(SOURCE_DIR):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(SOURCE_SUFFIXES):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, SOURCE_DIR).encode() + b"\0")
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.digest()
+
+
+class CodeCache:
+    """
+    Code objects of transpiled programs, kept in a directory.
+
+    Args:
+        directory (str): where code objects are written, created on the first write
+        fold (bool): whether programs are folded before they are translated
+        backend: the front end parsing a program that is not cached, see src/frontend/backends.py
+    """
+
+    def __init__(self, directory=CACHE_DIR, fold=True, backend=FAST):
+        self.directory = directory
+        self.fold = fold
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source):
+        digest = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+        digest.update(compiler_digest())
+        digest.update(f"{int(self.fold)}:".encode())
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def path(self, source):
+        return os.path.join(self.directory, self.key(source) + ".marshal")
+
+    def load(self, source):
+        """The code object of program source, compiled on a miss; raises the static errors of an invalid program."""
+        path = self.path(source)
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+            if isinstance(code, types.CodeType):
+                self.hits += 1
+                return code
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        self.misses += 1
+        code = Transpiler().compile(parse_source(source, self.backend), self.fold,
+                                    filename=f"<oplang {self.key(source)[:12]}>")
+        self.store(path, code)
+        return code
+
+    def store(self, path, code):
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(temp, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove every code object of the directory."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".marshal"):
+                os.remove(os.path.join(self.directory, name))
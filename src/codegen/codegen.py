@@ -0,0 +1,654 @@
+"""
+Bytecode generator for checked OPLang programs.
+
+CodeGenerator lowers the AST of a program that passes the checker into a
+Module of CodeObjects (see src/codegen/bytecode.py) run by the
+VirtualMachine of src/codegen/vm.py. It reads what the front end worked
+out instead of inferring it again: ConstantFolder folds the program and
+hands back its TypedAST, for the type of every expression and the class
+every member was looked up on, and its Bindings, for the frame slot of
+every parameter and local.
+
+Classes are laid out once, before any code is compiled:
+
+- the fields of an object are a list, those of its superclasses first, so
+  a field has the same index in every subclass and is read with one
+  index; a field redeclared in a subclass gets a slot of its own;
+- static fields are slots of one list for the whole program;
+- instance methods are called through a vtable: a subclass starts from
+  the vtable of its superclass and puts the methods it redeclares in
+  their slots, so a call site knows the slot from the static type;
+- fields whose initializer is a literal (folded or not) start with its
+  value; the others, and arrays, are set by an initializer function run
+  by every object creation, superclass fields first.
+
+Values follow src/utils/operators.py. An int stored in a float variable,
+field, parameter or return value is converted where it is stored, as the
+checker allows it, so every float is a Python float when an operator
+sees it. Variables are set when their declaration runs: to their
+initializer, or to the default value of their type (0, 0.0, false, "",
+nil, or a new array of defaults).
+
+A reference is an alias: a reference parameter or variable holds the
+location it aliases and reading or assigning it reads or writes that
+location. A reference is taken to a variable, a field, a static field,
+an array element or the result of a method returning a reference; any
+other expression gets a new location of its own holding its value. A
+reference variable is set by the trailing ':= expression' of its
+declaration, which the AST keeps for the last variable of the list; one
+without an initializer, before the last of a list, is a CodegenError. A
+reference attribute holds its value like any other attribute; the AST
+keeps no initializer for it, so it starts with the default value of its
+type.
+
+Calls pass an argument for every parameter: as the checker matches
+parameter and argument lists on their common prefix, a missing argument
+is the default value of its parameter and an extra one is evaluated and
+dropped. An object creation runs the first constructor, in declaration
+order, matching its arguments, and the one without parameters, if any,
+when it has none.
+"""
+
+import re
+from typing import Any
+
+from .bytecode import (
+    Module, ClassInfo, BINARY, UNARY,
+    LOAD, STORE, LOAD_REF, STORE_REF, REF_LOCAL, CONST, POP, DUP, ADD, SUB, GT, LT,
+    TO_FLOAT, JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP,
+    FOR_TO, FOR_DOWNTO, LOOP_UP, LOOP_DOWN, GET_FIELD, SET_FIELD, REF_FIELD, GET_STATIC, SET_STATIC, REF_STATIC,
+    GET_INDEX, SET_INDEX, REF_INDEX, DEREF, BOX, NEW, NEW_ARRAY, ARRAY,
+    CALL, CALL_METHOD, CALL_NATIVE, RETURN, RETURN_NONE, LEAVE,
+)
+from .emitter import Emitter
+from .error import CodegenError
+from ..semantics.builtins import BUILTINS
+from ..semantics.constant_folding import ConstantFolder
+from ..semantics.name_resolution import NameResolver
+from ..semantics.typed_ast import TypingChecker
+from ..utils.visitor import BaseVisitor
+from ..utils.nodes import (
+    AttributeDecl, MethodDecl, ConstructorDecl, DestructorDecl, ArrayType, ClassType, ReferenceType,
+    IdLHS, Identifier, ParenthesizedExpression, PostfixExpression, MemberAccess, ArrayAccess,
+    IntLiteral, FloatLiteral, BoolLiteral, StringLiteral, NilLiteral,
+)
+from ..utils.type_table import INT, FLOAT, BOOLEAN, STRING, canonical_type
+
+ESCAPES = {"b": "\b", "f": "\f", "r": "\r", "n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+ESCAPE = re.compile(r"\\(.)")
+
+SCALAR_LITERALS = (IntLiteral, FloatLiteral, BoolLiteral, StringLiteral, NilLiteral)
+
+
+def unescape(text):
+    """The string a string literal denotes, from its text (see src/utils/operators.py)."""
+    if "\\" not in text:
+        return text
+    return ESCAPE.sub(lambda m: ESCAPES.get(m.group(1), m.group(0)), text)
+
+
+def value_type(t):
+    """t without the references around it, canonical."""
+    while isinstance(t, ReferenceType):
+        t = t.referenced_type
+    return canonical_type(t) if t is not None else None
+
+
+def default_value(t):
+    """The value a variable of scalar type t starts with."""
+    t = value_type(t)
+    if t is INT:
+        return 0
+    if t is FLOAT:
+        return 0.0
+    if t is BOOLEAN:
+        return False
+    if t is STRING:
+        return ""
+    return None
+
+
+def literal_value(node, declared_type):
+    """The value of scalar literal node stored in a slot of declared_type."""
+    if isinstance(node, NilLiteral):
+        return None
+    if isinstance(node, StringLiteral):
+        return unescape(node.value)
+    if value_type(declared_type) is FLOAT:
+        return float(node.value)
+    return node.value
+
+
+class ClassLayout:
+    """Where the members of one class live at run time."""
+
+    __slots__ = ("decl", "index", "superclass", "fields", "defaults", "statics", "methods",
+                 "vindex", "vtable", "constructors", "destructor", "init", "field_inits")
+
+    def __init__(self, decl, index, superclass):
+        self.decl = decl
+        self.index = index
+        self.superclass = superclass  # ClassLayout, None for none
+        inherited = superclass is not None
+        self.fields = dict(superclass.fields) if inherited else {}      # name -> field index
+        self.defaults = list(superclass.defaults) if inherited else []  # field index -> starting value
+        self.statics = dict(superclass.statics) if inherited else {}    # name -> static field index
+        self.methods = dict(superclass.methods) if inherited else {}    # name -> (MethodDecl, function index)
+        self.vindex = dict(superclass.vindex) if inherited else {}      # instance method name -> vtable index
+        self.vtable = list(superclass.vtable) if inherited else []      # vtable index -> function index
+        self.constructors = []  # (ConstructorDecl, function index), own ones only
+        self.destructor = superclass.destructor if inherited else -1
+        self.init = superclass.init if inherited else -1
+        self.field_inits = []   # (AttributeDecl, Attribute, field index) set by the initializer function
+
+    def is_subclass(self, name):
+        layout = self
+        while layout is not None:
+            if layout.decl.name == name:
+                return True
+            layout = layout.superclass
+        return False
+
+
+class CodeGenerator(BaseVisitor):
+    """Compiles a checked program into a Module, see the module docstring."""
+
+    def generate(self, node, fold=True):
+        """
+        The Module of program node; raises the first static error of an invalid program.
+
+        With fold, ConstantFolder folds node in place first.
+        """
+        self.analyze(node, fold)
+        self.visit(node)
+        return self.module
+
+    def analyze(self, node, fold=True):
+        """Check, fold and resolve program node and lay out its classes, all that generate does before compiling."""
+        if fold:
+            folding = ConstantFolder().fold(node)
+            self.typed, self.bindings = folding.typed, folding.bindings
+        else:
+            self.typed = TypingChecker().check_typed(node)
+            self.bindings = NameResolver().resolve(node)
+        # Variable node -> its Declaration, the bindings only map the names using it
+        self.variables = {x.node: x for frame in self.bindings.frames.values() for x in frame.declarations}
+        self.module = Module()
+        self.decls = {x.name: x for x in node.class_decls}
+        self.layouts = {}
+        self.functions = {}  # member declaration -> function index
+        self.natives = {}    # (class, method) -> native index
+        self.static_inits = []
+        for x in node.class_decls:
+            self.layout(x.name)
+
+    # _________________________________Layout_________________________________
+    def layout(self, name):
+        """The ClassLayout of class name, laid out after its superclass on first use."""
+        layout = self.layouts.get(name)
+        if layout is not None or name not in self.decls:
+            return layout
+        decl = self.decls[name]
+        superclass = self.layout(decl.superclass) if decl.superclass else None
+        layout = self.layouts[name] = ClassLayout(decl, len(self.module.classes), superclass)
+        self.module.classes.append(None)
+        for member in decl.members:
+            if isinstance(member, AttributeDecl):
+                self.layout_attributes(layout, member)
+            elif isinstance(member, MethodDecl):
+                f = self.declare_function(member)
+                layout.methods[member.name] = (member, f)
+                if not member.is_static:
+                    if member.name not in layout.vindex:
+                        layout.vindex[member.name] = len(layout.vtable)
+                        layout.vtable.append(f)
+                    layout.vtable[layout.vindex[member.name]] = f
+            elif isinstance(member, ConstructorDecl):
+                layout.constructors.append((member, self.declare_function(member)))
+            elif isinstance(member, DestructorDecl):
+                layout.destructor = self.declare_function(member)
+        if layout.field_inits:
+            # compiled with the other functions, superclass fields first
+            layout.init = self.declare_function(decl)
+        return layout
+
+    def layout_attributes(self, layout, decl):
+        statics = self.module.statics
+        for x in decl.attributes:
+            init = x.init_value
+            literal = init is None and not isinstance(value_type(decl.attr_type), ArrayType) \
+                or isinstance(init, SCALAR_LITERALS)
+            value = literal_value(init, decl.attr_type) if init is not None and literal \
+                else default_value(decl.attr_type)
+            if decl.is_static:
+                layout.statics[x.name] = len(statics)
+                statics.append(value)
+                if not literal:
+                    self.static_inits.append((decl, x, len(statics) - 1))
+            else:
+                layout.fields[x.name] = len(layout.defaults)
+                layout.defaults.append(value)
+                if not literal:
+                    layout.field_inits.append((decl, x, len(layout.defaults) - 1))
+
+    def declare_function(self, member):
+        f = self.functions[member] = len(self.module.functions)
+        self.module.functions.append(None)
+        return f
+
+    # _________________________________Declarations_________________________________
+    def visit_program(self, node, o: Any = None):
+        module = self.module
+        for x in node.class_decls:
+            self.visit(x)
+        if self.static_inits:
+            emitter = Emitter("<static>", 0, 0)
+            for decl, x, index in self.static_inits:
+                self.emit_initializer(decl, x, emitter)
+                emitter.emit(SET_STATIC, index)
+            emitter.emit(RETURN_NONE)
+            module.static_init = len(module.functions)
+            module.functions.append(emitter.finish())
+        for x in node.class_decls:
+            member = self.layouts[x.name].methods.get("main")
+            if member is not None and any(m is member[0] for m in x.members):
+                module.entry = member[1]
+                if not member[0].is_static:
+                    module.receiver = self.layouts[x.name].index
+                break
+        else:
+            raise CodegenError("no main method")
+
+    def visit_class_decl(self, node, o: Any = None):
+        layout = self.layouts[node.name]
+        self.module.classes[layout.index] = ClassInfo(
+            node.name, layout.superclass.index if layout.superclass else -1, layout.defaults,
+            layout.vtable, layout.init, layout.destructor)
+        for x in node.members:
+            if not isinstance(x, AttributeDecl):
+                self.visit(x, layout)
+        if layout.field_inits:
+            emitter = Emitter(f"{node.name}.<init>", 1, 1)
+            if layout.superclass is not None and layout.superclass.init >= 0:
+                emitter.emit(LOAD, 0)
+                emitter.emit(CALL, layout.superclass.init)
+                emitter.emit(POP)
+            for decl, x, index in layout.field_inits:
+                emitter.emit(LOAD, 0)
+                self.emit_initializer(decl, x, emitter)
+                emitter.emit(SET_FIELD, index)
+            emitter.emit(RETURN_NONE)
+            self.module.functions[layout.init] = emitter.finish()
+
+    def emit_initializer(self, decl, node, o):
+        if node.init_value is None:
+            self.emit_default(decl.attr_type, o)
+        else:
+            self.emit_value(node.init_value, decl.attr_type, o)
+
+    def visit_method_decl(self, node, o: Any = None):
+        self.compile_member(node, f"{o.decl.name}.{node.name}", node.return_type, RETURN_NONE)
+
+    def visit_constructor_decl(self, node, o: Any = None):
+        self.compile_member(node, f"{o.decl.name}.{node.name}", None, RETURN_NONE)
+
+    def visit_destructor_decl(self, node, o: Any = None):
+        self.compile_member(node, f"{o.decl.name}.~{node.name}", None, LEAVE)
+
+    def compile_member(self, node, name, return_type, epilogue):
+        frame = self.bindings.frame_of(node)
+        emitter = Emitter(name, frame.params + frame.receiver, frame.size, return_type)
+        self.visit(node.body, emitter)
+        emitter.emit(epilogue)
+        self.module.functions[self.functions[node]] = emitter.finish()
+
+    # _________________________________Statements_________________________________
+    # o: the Emitter of the function being compiled
+    def visit_block_statement(self, node, o: Any = None):
+        for x in node.var_decls:
+            self.visit(x, o)
+        for x in node.statements:
+            self.visit(x, o)
+
+    def visit_variable_decl(self, node, o: Any = None):
+        for x in node.variables:
+            slot = self.variables[x].slot
+            init = x.init_value
+            if isinstance(node.var_type, ReferenceType):
+                if init is None:
+                    raise CodegenError(f"reference {x.name} has no initializer")
+                if isinstance(init, NilLiteral):
+                    self.emit_default(node.var_type, o)
+                    o.emit(BOX)
+                else:
+                    self.emit_reference(init, o)
+            elif init is None or isinstance(init, NilLiteral):
+                self.emit_default(node.var_type, o)
+            else:
+                self.emit_value(init, node.var_type, o)
+            o.emit(STORE, slot)
+
+    def visit_assignment_statement(self, node, o: Any = None):
+        lhs = node.lhs
+        if isinstance(lhs, IdLHS):
+            declaration = self.bindings.declaration_of(lhs)
+            self.emit_value(node.rhs, declaration.type, o)
+            self.emit_store(declaration, o)
+            return
+        target = lhs.postfix_expr
+        if not isinstance(target, PostfixExpression) or not target.postfix_ops:
+            raise CodegenError(f"cannot assign to {target}")
+        static = self.emit_chain(target.primary, target.postfix_ops[:-1], o)
+        last = target.postfix_ops[-1]
+        target_type = self.typed.type_of(target)
+        if isinstance(last, MemberAccess):
+            layout = self.layouts[self.typed.owners[last]]
+            self.emit_value(node.rhs, target_type, o)
+            if static is not None:
+                o.emit(SET_STATIC, layout.statics[last.member_name])
+            else:
+                o.emit(SET_FIELD, layout.fields[last.member_name])
+        elif isinstance(last, ArrayAccess):
+            self.visit(last.index, o)
+            self.emit_value(node.rhs, target_type, o)
+            o.emit(SET_INDEX)
+        else:
+            raise CodegenError(f"cannot assign to {target}")
+
+    def emit_store(self, declaration, o):
+        if isinstance(declaration.type, ReferenceType):
+            o.emit(STORE_REF, declaration.slot)
+        else:
+            o.emit(STORE, declaration.slot)
+
+    def emit_load(self, declaration, o):
+        if isinstance(declaration.type, ReferenceType):
+            o.emit(LOAD_REF, declaration.slot)
+        else:
+            o.emit(LOAD, declaration.slot)
+
+    def visit_if_statement(self, node, o: Any = None):
+        condition = node.condition
+        if isinstance(condition, BoolLiteral):
+            # folded: only the branch taken is compiled
+            taken = node.then_stmt if condition.value else node.else_stmt
+            if taken is not None:
+                self.visit(taken, o)
+            return
+        self.visit(condition, o)
+        skip_then = o.jump(JUMP_IF_FALSE)
+        self.visit(node.then_stmt, o)
+        if node.else_stmt is None:
+            o.patch(skip_then)
+            return
+        skip_else = o.jump(JUMP)
+        o.patch(skip_then)
+        self.visit(node.else_stmt, o)
+        o.patch(skip_else)
+
+    def visit_for_statement(self, node, o: Any = None):
+        declaration = self.bindings.declaration_of(node)
+        variable = declaration.slot
+        upward = node.direction == "to"
+        self.emit_value(node.start_expr, INT, o)
+        self.emit_store(declaration, o)
+        end = o.temp()
+        self.emit_value(node.end_expr, INT, o)
+        o.emit(STORE, end)
+        if isinstance(declaration.type, ReferenceType):
+            top = o.label()
+            o.emit(LOAD_REF, variable)
+            o.emit(LOAD, end)
+            o.emit(GT if upward else LT)
+            done = o.jump(JUMP_IF_TRUE)
+        else:
+            # tested once on entry, then by LOOP_UP/LOOP_DOWN at the end of every pass
+            done = o.jump(FOR_TO if upward else FOR_DOWNTO, variable, end)
+            top = o.label()
+        breaks, continues = [], []
+        o.loops.append((breaks, continues))
+        self.visit(node.body, o)
+        o.loops.pop()
+        for at in continues:
+            o.patch(at)
+        if isinstance(declaration.type, ReferenceType):
+            o.emit(LOAD_REF, variable)
+            o.emit(CONST, o.constant(1))
+            o.emit(ADD if upward else SUB)
+            o.emit(STORE_REF, variable)
+            o.jump_to(JUMP, top)
+        else:
+            o.jump_to(LOOP_UP if upward else LOOP_DOWN, top, variable, end)
+        o.patch(done)
+        for at in breaks:
+            o.patch(at)
+        o.release(end)
+
+    def visit_break_statement(self, node, o: Any = None):
+        o.loops[-1][0].append(o.jump(JUMP))
+
+    def visit_continue_statement(self, node, o: Any = None):
+        o.loops[-1][1].append(o.jump(JUMP))
+
+    def visit_return_statement(self, node, o: Any = None):
+        if isinstance(o.return_type, ReferenceType):
+            self.emit_reference(node.value, o)
+        else:
+            self.emit_value(node.value, o.return_type, o)
+        o.emit(RETURN)
+
+    def visit_method_invocation_statement(self, node, o: Any = None):
+        call = node.method_call
+        if isinstance(call, PostfixExpression) and call.postfix_ops:
+            static = self.emit_chain(call.primary, call.postfix_ops[:-1], o)
+            self.emit_operation(call.postfix_ops[-1], static, o, reference=True)
+        else:
+            self.visit(call, o)
+        o.emit(POP)
+
+    # _________________________________Expressions_________________________________
+    # visit expressions emitting the code that pushes their value
+    def emit_value(self, node, declared_type, o):
+        """Push the value of node stored in a slot of declared_type, converting an int to float."""
+        if value_type(declared_type) is not FLOAT:
+            self.visit(node, o)
+        elif isinstance(node, IntLiteral):
+            o.emit(CONST, o.constant(float(node.value)))
+        else:
+            self.visit(node, o)
+            if value_type(self.typed.type_of(node)) is INT:
+                o.emit(TO_FLOAT)
+
+    def emit_default(self, declared_type, o):
+        t = value_type(declared_type)
+        if isinstance(t, ArrayType):
+            o.emit(NEW_ARRAY, t.size, o.constant(default_value(t.element_type)))
+        else:
+            o.emit(CONST, o.constant(default_value(t)))
+
+    def emit_reference(self, node, o):
+        """Push a reference to what node denotes, or to a new location holding its value."""
+        while isinstance(node, ParenthesizedExpression):
+            node = node.expr
+        if isinstance(node, Identifier):
+            declaration = self.bindings.declaration_of(node)
+            if declaration is not None:
+                if isinstance(declaration.type, ReferenceType):
+                    o.emit(LOAD, declaration.slot)
+                else:
+                    o.emit(REF_LOCAL, declaration.slot)
+                return
+        if isinstance(node, PostfixExpression) and node.postfix_ops:
+            static = self.emit_chain(node.primary, node.postfix_ops[:-1], o)
+            if not self.emit_operation(node.postfix_ops[-1], static, o, reference=True):
+                o.emit(BOX)
+            return
+        self.visit(node, o)
+        o.emit(BOX)
+
+    def emit_chain(self, primary, operations, o):
+        """Push the value of primary followed by operations; the class name when they denote a class."""
+        static = None
+        if isinstance(primary, Identifier) and self.bindings.declaration_of(primary) is None:
+            static = self.typed.type_of(primary)
+            if not isinstance(static, str):
+                raise CodegenError(f"unbound name {primary.name}")
+        else:
+            self.visit(primary, o)
+        for x in operations:
+            self.emit_operation(x, static, o)
+            static = None
+        return static
+
+    def emit_operation(self, node, static, o, reference=False):
+        """
+        Apply postfix operation node to the value pushed, or to class static.
+
+        With reference, push a reference to the member or element, or the
+        reference a method returns; returns whether a reference was pushed.
+        """
+        if isinstance(node, MemberAccess):
+            layout = self.layouts[self.typed.owners[node]]
+            if static is not None:
+                o.emit(REF_STATIC if reference else GET_STATIC, layout.statics[node.member_name])
+            else:
+                o.emit(REF_FIELD if reference else GET_FIELD, layout.fields[node.member_name])
+            return reference
+        if isinstance(node, ArrayAccess):
+            self.visit(node.index, o)
+            o.emit(REF_INDEX if reference else GET_INDEX)
+            return reference
+        returns_reference = self.emit_call(node, static, o)
+        if returns_reference and not reference:
+            o.emit(DEREF)
+        return returns_reference and reference
+
+    def emit_call(self, node, static, o):
+        """Call method node on the object pushed or on class static; True when it returns a reference."""
+        owner = self.typed.owners[node]
+        layout = self.layouts.get(owner)
+        if layout is None:
+            if node.method_name not in BUILTINS.classes.get(owner, {}):
+                raise CodegenError(f"unknown method {owner}.{node.method_name}")
+            _, params = BUILTINS.classes[owner][node.method_name]
+            self.emit_arguments(params, node.args, o)
+            native = self.natives.setdefault((owner, node.method_name), len(self.natives))
+            if native == len(self.module.natives):
+                self.module.natives.append((owner, node.method_name))
+            o.emit(CALL_NATIVE, native, len(params))
+            return False
+        decl, f = layout.methods[node.method_name]
+        params = [x.param_type for x in decl.params]
+        self.emit_arguments(params, node.args, o)
+        if decl.is_static:
+            o.emit(CALL, f)
+        else:
+            o.emit(CALL_METHOD, layout.vindex[node.method_name], len(params) + 1)
+        return isinstance(decl.return_type, ReferenceType)
+
+    def emit_arguments(self, params, args, o):
+        """Push an argument for every parameter, see the module docstring."""
+        for i, param in enumerate(params):
+            if i >= len(args):
+                self.emit_default(param, o)
+                if isinstance(param, ReferenceType):
+                    o.emit(BOX)
+            elif isinstance(param, ReferenceType):
+                self.emit_reference(args[i], o)
+            else:
+                self.emit_value(args[i], param, o)
+        for x in args[len(params):]:
+            self.visit(x, o)
+            o.emit(POP)
+
+    def visit_postfix_expression(self, node, o: Any = None):
+        if not node.postfix_ops:
+            self.visit(node.primary, o)
+            return
+        static = self.emit_chain(node.primary, node.postfix_ops[:-1], o)
+        self.emit_operation(node.postfix_ops[-1], static, o)
+
+    def visit_binary_op(self, node, o: Any = None):
+        self.visit(node.left, o)
+        if node.operator in ("&&", "||"):
+            end = o.jump(JUMP_IF_FALSE_OR_POP if node.operator == "&&" else JUMP_IF_TRUE_OR_POP)
+            self.visit(node.right, o)
+            o.patch(end)
+            return
+        self.visit(node.right, o)
+        o.emit(BINARY[node.operator])
+
+    def visit_unary_op(self, node, o: Any = None):
+        self.visit(node.operand, o)
+        if node.operator in UNARY:
+            o.emit(UNARY[node.operator])
+
+    def visit_parenthesized_expression(self, node, o: Any = None):
+        self.visit(node.expr, o)
+
+    def visit_object_creation(self, node, o: Any = None):
+        layout = self.layouts[node.class_name]
+        o.emit(NEW, layout.index)
+        if layout.init >= 0:
+            o.emit(DUP)
+            o.emit(CALL, layout.init)
+            o.emit(POP)
+        constructor = self.constructor(layout, node.args)
+        if constructor is not None:
+            decl, f = constructor
+            o.emit(DUP)
+            self.emit_arguments([x.param_type for x in decl.params], node.args, o)
+            o.emit(CALL, f)
+            o.emit(POP)
+
+    def constructor(self, layout, args):
+        """(ConstructorDecl, function index) an object creation with args runs, None for none."""
+        types = [self.typed.type_of(x) for x in args]
+        for decl, f in layout.constructors:
+            if not args:
+                if not decl.params:
+                    return decl, f
+            elif all(self.accepts(x.param_type, t) for x, t in zip(decl.params, types)):
+                return decl, f
+        return None
+
+    def accepts(self, param, arg):
+        """True when an argument of type arg can be passed for a parameter of type param."""
+        param, arg = value_type(param), value_type(arg)
+        if param is arg:
+            return True
+        if param is FLOAT:
+            return arg is INT
+        if isinstance(param, ClassType) and isinstance(arg, ClassType):
+            layout = self.layouts.get(arg.class_name)
+            return layout is not None and layout.is_subclass(param.class_name)
+        return False
+
+    def visit_identifier(self, node, o: Any = None):
+        declaration = self.bindings.declaration_of(node)
+        if declaration is None:
+            raise CodegenError(f"unbound name {node.name}")
+        self.emit_load(declaration, o)
+
+    def visit_this_expression(self, node, o: Any = None):
+        o.emit(LOAD, 0)
+
+    def visit_int_literal(self, node, o: Any = None):
+        o.emit(CONST, o.constant(node.value))
+
+    def visit_float_literal(self, node, o: Any = None):
+        o.emit(CONST, o.constant(float(node.value)))
+
+    def visit_bool_literal(self, node, o: Any = None):
+        o.emit(CONST, o.constant(node.value))
+
+    def visit_string_literal(self, node, o: Any = None):
+        o.emit(CONST, o.constant(unescape(node.value)))
+
+    def visit_nil_literal(self, node, o: Any = None):
+        o.emit(CONST, o.constant(None))
+
+    def visit_array_literal(self, node, o: Any = None):
+        for x in node.value:
+            self.visit(x, o)
+        o.emit(ARRAY, len(node.value))
@@ -0,0 +1,93 @@
+"""
+Emitter: the code of one function while CodeGenerator builds it.
+"""
+
+from .bytecode import LOAD, LOAD2, LOAD_CONST, CONST, CodeObject, assemble
+
+
+class Emitter:
+    """
+    Instructions, constants and frame slots of one function being compiled.
+
+    Args:
+        name (str): Class.member, the name of the CodeObject
+        nparams (int): values a call passes, the receiver included
+        nlocals (int): slots of its frame (Frame.size), temporaries are added past them
+        return_type: declared return type, None for constructors and destructors
+    """
+
+    __slots__ = ("name", "words", "consts", "const_index", "nparams", "nlocals", "temps",
+                 "return_type", "loops", "last", "labels")
+
+    def __init__(self, name, nparams, nlocals, return_type=None):
+        self.name = name
+        self.words = []
+        self.consts = []
+        self.const_index = {}  # (type, value) -> index in consts
+        self.nparams = nparams
+        self.nlocals = nlocals
+        self.temps = nlocals   # next free temporary slot
+        self.return_type = return_type
+        self.loops = []        # (break jumps, continue jumps) of every enclosing for statement
+        self.last = -1         # position of the last instruction emitted
+        self.labels = set()    # positions jumps go to
+
+    def emit(self, op, *operands):
+        """
+        Append an instruction. A LOAD followed by a LOAD or a CONST becomes
+        one LOAD2 or LOAD_CONST, unless a jump goes to the second of them.
+        """
+        words = self.words
+        last = self.last
+        if ((op == LOAD or op == CONST) and last >= 0 and words[last] == LOAD
+                and last == len(words) - 2 and len(words) not in self.labels):
+            words[last] = LOAD2 if op == LOAD else LOAD_CONST
+            words.append(operands[0])
+            return
+        self.last = len(words)
+        words.append(op)
+        words.extend(operands)
+
+    def constant(self, value):
+        """Index of value in the constant pool; 1, 1.0 and True are kept apart."""
+        key = (type(value), value)
+        index = self.const_index.get(key)
+        if index is None:
+            index = self.const_index[key] = len(self.consts)
+            self.consts.append(value)
+        return index
+
+    def position(self):
+        return len(self.words)
+
+    def label(self):
+        """The current position, as the target of a jump."""
+        self.labels.add(len(self.words))
+        return len(self.words)
+
+    def jump(self, op, *operands):
+        """Emit jump op with its target left open and return where to patch it."""
+        self.emit(op, *operands, 0)
+        return len(self.words) - 1
+
+    def jump_to(self, op, target, *operands):
+        self.emit(op, *operands, target)
+
+    def patch(self, at, target=None):
+        """Make the jump operand at at go to target, the current position by default."""
+        self.words[at] = self.label() if target is None else target
+
+    def temp(self):
+        """A frame slot of its own until release is called, past those of the locals."""
+        slot = self.temps
+        self.temps += 1
+        if self.temps > self.nlocals:
+            self.nlocals = self.temps
+        return slot
+
+    def release(self, slot):
+        self.temps = slot
+
+    def finish(self):
+        return CodeObject(self.name, assemble(self.words), tuple(self.consts), self.nparams, self.nlocals)
+
@@ -0,0 +1,68 @@
+"""
+Errors of compiling and running OPLang programs.
+
+A checked program compiles, so CodegenError only reports what the back
+end does not handle. ExecutionError and its subclasses are raised by the
+virtual machine when a program fails while it runs; like the static
+errors, they print as their name followed by their arguments.
+"""
+
+
+class CodegenError(Exception):
+    """Raised when a checked program uses something the back end cannot compile."""
+
+
+class ExecutionError(Exception):
+    """Base class for the errors of a running OPLang program."""
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({', '.join(map(str, self.args))})"
+
+
+class DivisionByZero(ExecutionError):
+    """Raised by /, \\ or % with a zero divisor."""
+
+
+class IndexOutOfRange(ExecutionError):
+    """
+    Raised when an array is indexed outside of its bounds.
+
+    Args:
+        index (int): the index used
+        size (int): the size of the array
+    """
+
+    def __init__(self, index, size):
+        self.index = index
+        self.size = size
+        super().__init__(index, size)
+
+
+class NilDereference(ExecutionError):
+    """Raised when a member of nil is accessed or called."""
+
+
+class StackOverflow(ExecutionError):
+    """
+    Raised when calls nest deeper than the machine allows.
+
+    Args:
+        depth (int): the most calls the machine nests
+    """
+
+    def __init__(self, depth):
+        self.depth = depth
+        super().__init__(depth)
+
+
+class InvalidInput(ExecutionError):
+    """
+    Raised when io reads a value of the wrong type or past the end of the input.
+
+    Args:
+        text (str): the text read, empty at the end of the input
+    """
+
+    def __init__(self, text):
+        self.text = text
+        super().__init__(text)
@@ -0,0 +1,85 @@
+"""
+Runtime of the builtin io class.
+
+Console implements the io methods src/semantics/builtins.py declares, on
+the streams of one run of the virtual machine. Values are read one line
+at a time and written in the way OPLang prints them: booleans as true and
+false, floats with a decimal point.
+"""
+
+import sys
+
+from .error import InvalidInput
+
+BOOLEANS = {"true": True, "false": False}
+
+
+def float_text(value):
+    return repr(float(value))
+
+
+class Console:
+    """
+    The io methods of one run, reading stdin and writing stdout.
+
+    Args:
+        stdin: a text stream read by the read methods
+        stdout: a text stream written by the write methods
+    """
+
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = sys.stdin if stdin is None else stdin
+        self.stdout = sys.stdout if stdout is None else stdout
+
+    def native(self, class_name, method):
+        """The function running builtin method class_name.method."""
+        return getattr(self, method)
+
+    def read_line(self):
+        line = self.stdin.readline()
+        if not line:
+            raise InvalidInput("")
+        return line.rstrip("\r\n")
+
+    def read(self, convert):
+        text = self.read_line()
+        try:
+            return convert(text.strip())
+        except (ValueError, KeyError):
+            raise InvalidInput(text) from None
+
+    def readInt(self):
+        return self.read(int)
+
+    def readFloat(self):
+        return self.read(float)
+
+    def readBool(self):
+        return self.read(BOOLEANS.__getitem__)
+
+    def readStr(self):
+        return self.read_line()
+
+    def writeInt(self, value):
+        self.stdout.write(str(value))
+
+    def writeIntLn(self, value):
+        self.stdout.write(f"{value}\n")
+
+    def writeFloat(self, value):
+        self.stdout.write(float_text(value))
+
+    def writeFloatLn(self, value):
+        self.stdout.write(float_text(value) + "\n")
+
+    def writeBool(self, value):
+        self.stdout.write("true" if value else "false")
+
+    def writeBoolLn(self, value):
+        self.stdout.write("true\n" if value else "false\n")
+
+    def writeStr(self, value):
+        self.stdout.write(value)
+
+    def writeStrLn(self, value):
+        self.stdout.write(value + "\n")
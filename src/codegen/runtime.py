@@ -0,0 +1,225 @@
+"""
+Runtime of OPLang programs transpiled to Python.
+
+Transpiler (src/codegen/transpiler.py) turns a checked program into a
+Python module and Runtime runs its code object. The module names the
+helpers below with a leading underscore; Runtime puts them, with the io
+methods of its Console, into the globals of every run, so a code object
+holds no reference to its run and can be cached and run again.
+
+Values are those of the virtual machine (src/codegen/vm.py): ints,
+floats, bools, strings, None for nil, lists for arrays, and objects of
+the Python classes the module defines for the OPLang ones. A reference
+is a Cell: a container and an index into it, a list and an int for a
+variable or an array element, the globals of the run and a name for a
+static field; an object and an attribute name for a field (FieldCell).
+
+Python reports a failing program with its own exceptions, which run
+turns into the ExecutionError the virtual machine raises for the same
+failure: ZeroDivisionError into DivisionByZero, the AttributeError of an
+attribute of None and the TypeError of the length of None, which is how
+the module reads a field, calls a method or indexes an array through
+nil, into NilDereference, and RecursionError into StackOverflow; the
+helpers raise NilDereference themselves. Any other exception is a bug of
+the back end and is raised as it is. Array indices are checked by the
+module itself, as Python accepts negative ones.
+
+An object of a class with a destructor runs it as soon as CPython frees
+it, and objects in reference cycles at the end of the run after
+collecting them. Objects still reachable from a static field when the
+program ends are not destroyed. CPython defers freeing objects past a
+few dozen nested deallocations, so destructors that create objects with
+destructors without end run out of memory, not of stack as on the
+virtual machine. Python ignores what __del__ raises, so an error raised
+by a destructor is raised again, by a trace function, in the next line
+the program runs.
+"""
+
+import gc
+import sys
+
+from .error import ExecutionError, DivisionByZero, IndexOutOfRange, NilDereference, StackOverflow
+from .io import Console
+from ..utils.operators import int_divide, remainder
+
+
+class Cell:
+    """A reference to container[index]."""
+
+    __slots__ = ("container", "index")
+
+    def __init__(self, container, index):
+        self.container = container
+        self.index = index
+
+    def get(self):
+        return self.container[self.index]
+
+    def set(self, value):
+        self.container[self.index] = value
+
+
+class FieldCell:
+    """A reference to the field of an object, named by its attribute."""
+
+    __slots__ = ("instance", "name")
+
+    def __init__(self, instance, name):
+        self.instance = instance
+        self.name = name
+
+    def get(self):
+        return getattr(self.instance, self.name)
+
+    def set(self, value):
+        setattr(self.instance, self.name, value)
+
+
+def box(value):
+    """A reference to a new location holding value."""
+    return Cell([value], 0)
+
+
+def index_error(array, index):
+    if array is None:
+        raise NilDereference()
+    raise IndexOutOfRange(index, len(array))
+
+
+def element(array, index):
+    """array[index], for the index expressions the module does not check inline."""
+    if array is None or not -1 < index < len(array):
+        index_error(array, index)
+    return array[index]
+
+
+def element_cell(array, index):
+    if array is None or not -1 < index < len(array):
+        index_error(array, index)
+    return Cell(array, index)
+
+
+def field_cell(instance, name):
+    if instance is None:
+        raise NilDereference()
+    return FieldCell(instance, name)
+
+
+def drop(*values):
+    """No arguments, once the extra arguments of a call were evaluated."""
+    return ()
+
+
+HELPERS = {
+    "_new": object.__new__,
+    "_Cell": Cell,
+    "_box": box,
+    "_index_error": index_error,
+    "_element": element,
+    "_element_cell": element_cell,
+    "_field_cell": field_cell,
+    "_idiv": int_divide,
+    "_mod": remainder,
+    "_drop": drop,
+}
+
+
+# what len(None) raises, in the index checks of the module
+NO_LENGTH = "object of type 'NoneType' has no len()"
+
+
+def execution_error(error):
+    """The ExecutionError a Python exception raised by a running program stands for, None for none."""
+    if isinstance(error, ExecutionError):
+        return error
+    if isinstance(error, ZeroDivisionError):
+        return DivisionByZero()
+    # the lookup of an attribute on None; an AttributeError raised otherwise has no name
+    if isinstance(error, AttributeError) and error.name is not None and error.obj is None:
+        return NilDereference()
+    if isinstance(error, TypeError) and str(error) == NO_LENGTH:
+        return NilDereference()
+    return None
+
+
+def stack_depth():
+    frame, depth = sys._getframe(), 0
+    while frame is not None:
+        frame, depth = frame.f_back, depth + 1
+    return depth
+
+
+class Runtime:
+    """
+    Runs OPLang programs transpiled to Python code objects.
+
+    Args:
+        stdin: text stream io reads, sys.stdin by default
+        stdout: text stream io writes, sys.stdout by default
+        max_depth (int): calls a program can nest before StackOverflow is raised
+    """
+
+    def __init__(self, stdin=None, stdout=None, max_depth=100000):
+        self.console = Console(stdin, stdout)
+        self.max_depth = max_depth
+        self.live = False
+        self.failure = None
+
+    def run(self, code):
+        """Run the module code, as Transpiler.compile returns it; raises an ExecutionError when the program fails."""
+        namespace = dict(HELPERS)
+        namespace["_io"] = self.console
+        namespace["_g"] = namespace
+        namespace["_destroy"] = self.destroy
+        self.live = True
+        self.failure = None
+        limit, trace = sys.getrecursionlimit(), sys.gettrace()
+        # a call is a Python call, and the helpers add a frame at most
+        sys.setrecursionlimit(stack_depth() + self.max_depth + 2)
+        try:
+            exec(code, namespace)
+            namespace["_main"]()
+            # the statics are still reachable, only the other cycles are destroyed
+            gc.collect()
+        except RecursionError:
+            raise StackOverflow(self.max_depth) from None
+        except Exception as e:
+            error = execution_error(e)
+            if error is None:
+                raise
+            raise error from None
+        finally:
+            self.live = False
+            sys.setrecursionlimit(limit)
+            sys.settrace(trace)
+        if self.failure is not None:
+            raise self.failure
+
+    def destroy(self, instance):
+        """Run the destructor of instance, which CPython is freeing."""
+        if not self.live:
+            return
+        try:
+            instance.D()
+        except RecursionError:
+            self.stop(StackOverflow(self.max_depth))
+        except BaseException as e:
+            # Python would only print it, even a KeyboardInterrupt
+            self.stop(execution_error(e) or e)
+
+    def stop(self, error):
+        """Stop the program with error, raised by a destructor, unless a destructor failed before."""
+        if self.failure is None:
+            self.live = False
+            self.failure = error
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_trace != self.trace and frame.f_code is not Runtime.run.__code__:
+            frame.f_trace = self.trace
+            frame = frame.f_back
+        sys.settrace(self.trace)
+
+    def trace(self, frame, event, arg):
+        """Raise the failure of a destructor in frame, unless frame runs a destructor from __del__."""
+        if frame.f_code is Runtime.destroy.__code__ or frame.f_code.co_name == "__del__":
+            return self.trace
+        raise self.failure
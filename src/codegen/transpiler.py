@@ -0,0 +1,751 @@
+"""
+Python back end for checked OPLang programs.
+
+Transpiler translates the AST of a program that passes the checker into
+the source of a Python module, and compile turns that into a code object
+run by Runtime (src/codegen/runtime.py); CodeCache (src/codegen/cache.py)
+keeps code objects on disk. The module computes what the bytecode of
+CodeGenerator computes from the same class layouts and the same
+conventions (see src/codegen/codegen.py), so both back ends print the
+same output and raise the same errors, destructors aside (see below):
+
+- an OPLang class is a Python class with __slots__, a slot per field it
+  declares; an object creation allocates the object with object.__new__,
+  calls the method I setting every field, superclass fields first, then
+  the constructor chosen for its arguments, both returning the object, so
+  that creating objects, like calling methods, nests only Python frames
+  and never the C stack of the interpreter;
+- instance methods are Python methods, dispatched by Python, static
+  methods are static methods, and static fields are module globals;
+- parameters and locals are Python locals; a for statement is a for loop
+  over a range, unless its body assigns its variable or the variable is
+  a reference or is aliased, which makes it a while loop;
+- an array index is checked against the length of the array inline, the
+  index and the array evaluated once and in order.
+
+CPython runs a destructor when the statement dropping the last reference
+to its object ends, the VM before its next native call or method return,
+so both print in the same order, but what a destructor writes to a field
+or a static field is seen earlier here than on the VM. In a program with
+destructors the temporaries a statement set are cleared after it, so they
+keep no object alive longer than the operand stack of the VM does.
+
+A variable a reference is taken to lives in a list of one element, which
+the Cell aliasing it indexes. Names are prefixed by what they denote, so
+no OPLang name clashes with another, with a Python keyword or builtin, or
+with the runtime helpers, which start with an underscore: C_ classes,
+F<index>_ fields, S<index>_ static fields, M_ methods, K<index>
+constructors, I field initializers, D destructors, L<slot>_ parameters and locals, and T<n>
+temporaries.
+"""
+
+import math
+from typing import Any
+
+from .codegen import CodeGenerator, value_type, default_value, unescape
+from .error import CodegenError
+from ..semantics.builtins import BUILTINS
+from ..utils.visitor import BaseVisitor
+from ..utils.nodes import (
+    AttributeDecl, MethodDecl, ConstructorDecl, DestructorDecl, ArrayType, ReferenceType,
+    IdLHS, Identifier, ThisExpression, ParenthesizedExpression, PostfixExpression, MemberAccess, ArrayAccess,
+    MethodCall, IfStatement, BlockStatement, Literal, IntLiteral, BoolLiteral, NilLiteral,
+)
+from ..utils.type_table import INT, FLOAT
+
+# precedence of the Python expressions written, loosest first
+CONDITIONAL, OR, AND, NOT, COMPARISON, SUM, PRODUCT, NEGATION, POSTFIX, ATOM = range(10)
+
+OPERATORS = {
+    "+": ("+", SUM), "-": ("-", SUM), "^": ("+", SUM), "*": ("*", PRODUCT), "/": ("/", PRODUCT),
+    "==": ("==", COMPARISON), "!=": ("!=", COMPARISON), "<": ("<", COMPARISON), "<=": ("<=", COMPARISON),
+    ">": (">", COMPARISON), ">=": (">=", COMPARISON), "&&": ("and", AND), "||": ("or", OR),
+}
+
+# the int division helpers of src/codegen/runtime.py and the Python operator they round toward zero
+INT_DIVISIONS = {"\\": ("_idiv", "//"), "%": ("_mod", "%")}
+
+METHOD, CONSTRUCTOR, DESTRUCTOR = "method", "constructor", "destructor"
+
+
+def literal(value):
+    """The Python expression of a constant and its precedence."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"float('{value}')", POSTFIX
+    text = repr(value)
+    return text, NEGATION if text.startswith("-") else ATOM
+
+
+def wrap(expression, precedence):
+    """The text of expression, parenthesized when it binds more loosely than precedence."""
+    text, own = expression
+    return text if own >= precedence else f"({text})"
+
+
+class Writer:
+    """
+    Lines of Python source, and the state of the function they belong to.
+
+    Args:
+        depth (int): indentation of the lines written
+        kind: METHOD, CONSTRUCTOR or DESTRUCTOR, None at module level
+        return_type: declared return type of a method
+    """
+
+    __slots__ = ("lines", "depth", "kind", "return_type", "temps", "loops", "globals")
+
+    def __init__(self, depth=0, kind=None, return_type=None):
+        self.lines = []
+        self.depth = depth
+        self.kind = kind
+        self.return_type = return_type
+        self.temps = 0
+        self.loops = []        # the lines continue runs first, for every enclosing for statement
+        self.globals = set()   # static fields the function assigns
+
+    def line(self, text):
+        self.lines.append("    " * self.depth + text)
+
+    def temp(self):
+        self.temps += 1
+        return f"T{self.temps - 1}"
+
+
+class AliasScan(BaseVisitor):
+    """
+    Finds the parameters and locals a program takes references to, and the
+    for statements whose body assigns their own variable.
+    """
+
+    def __init__(self, transpiler):
+        self.transpiler = transpiler
+        self.bindings = transpiler.bindings
+        self.aliased = set()  # Declarations
+        self.stepped = set()  # ForStatements
+        self.loops = []       # (Declaration, ForStatement) of the enclosing for statements
+        self.return_type = None
+
+    def alias(self, node):
+        while isinstance(node, ParenthesizedExpression):
+            node = node.expr
+        if isinstance(node, Identifier):
+            declaration = self.bindings.declaration_of(node)
+            if declaration is not None and not isinstance(declaration.type, ReferenceType):
+                self.aliased.add(declaration)
+
+    def alias_arguments(self, params, args):
+        for param, arg in zip(params, args):
+            if isinstance(param, ReferenceType):
+                self.alias(arg)
+
+    def visit_method_decl(self, node, o: Any = None):
+        self.return_type = node.return_type
+        self.visit(node.body, o)
+
+    def visit_constructor_decl(self, node, o: Any = None):
+        self.return_type = None
+        self.visit(node.body, o)
+
+    def visit_destructor_decl(self, node, o: Any = None):
+        self.return_type = None
+        self.visit(node.body, o)
+
+    def visit_variable_decl(self, node, o: Any = None):
+        for x in node.variables:
+            if x.init_value is not None:
+                if isinstance(node.var_type, ReferenceType):
+                    self.alias(x.init_value)
+                self.visit(x.init_value, o)
+
+    def visit_return_statement(self, node, o: Any = None):
+        if isinstance(self.return_type, ReferenceType):
+            self.alias(node.value)
+        self.visit(node.value, o)
+
+    def visit_for_statement(self, node, o: Any = None):
+        self.loops.append((self.bindings.declaration_of(node), node))
+        super().visit_for_statement(node, o)
+        self.loops.pop()
+
+    def visit_id_lhs(self, node, o: Any = None):
+        declaration = self.bindings.declaration_of(node)
+        for variable, loop in self.loops:
+            if variable is declaration:
+                self.stepped.add(loop)
+
+    def visit_method_call(self, node, o: Any = None):
+        self.alias_arguments(self.transpiler.parameters(node), node.args)
+        super().visit_method_call(node, o)
+
+    def visit_object_creation(self, node, o: Any = None):
+        constructor = self.transpiler.lowering.constructor(self.transpiler.layouts[node.class_name], node.args)
+        if constructor is not None:
+            self.alias_arguments([x.param_type for x in constructor[0].params], node.args)
+            for x in node.args:
+                self.visit(x, o)
+
+
+class Transpiler(BaseVisitor):
+    """Translates a checked program into a Python module, see the module docstring."""
+
+    def transpile(self, node, fold=True):
+        """
+        The Python source of program node; raises the first static error of an invalid program.
+
+        With fold, ConstantFolder folds node in place first.
+        """
+        lowering = self.lowering = CodeGenerator()
+        lowering.analyze(node, fold)
+        self.typed, self.bindings = lowering.typed, lowering.bindings
+        self.variables = lowering.variables
+        self.layouts = lowering.layouts
+        self.finalizing = any(x.destructor >= 0 for x in self.layouts.values())
+        self.field_names = {}  # ClassLayout -> Python name of every field, by index
+        for layout in sorted(self.layouts.values(), key=lambda x: x.index):
+            inherited = self.field_names[layout.superclass] if layout.superclass is not None else []
+            names = self.field_names[layout] = list(inherited)
+            for member in layout.decl.members:
+                if isinstance(member, AttributeDecl) and not member.is_static:
+                    names.extend(self.field_name(layout, x.name) for x in member.attributes)
+        scan = AliasScan(self)
+        scan.visit(node)
+        self.aliased, self.stepped = scan.aliased, scan.stepped
+        writer = Writer()
+        self.visit(node, writer)
+        return "\n".join(writer.lines) + "\n"
+
+    def compile(self, node, fold=True, filename="<oplang>"):
+        """The code object of the module transpile writes for node, to be run by Runtime."""
+        source = self.transpile(node, fold)
+        try:
+            return compile(source, filename, "exec")
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            # CPython limits how deeply blocks and expressions nest
+            raise CodegenError(f"cannot compile the Python module: {e}") from None
+
+    # _________________________________Names_________________________________
+    def local_name(self, declaration):
+        return f"L{declaration.slot}_{declaration.name}"
+
+    def static_name(self, layout, name):
+        return f"S{layout.statics[name]}_{name}"
+
+    def field_name(self, layout, name):
+        return f"F{layout.fields[name]}_{name}"
+
+    def allocate(self, layout):
+        """A new object of layout, its fields initialized."""
+        if self.field_names[layout]:
+            return f"_new(C_{layout.decl.name}).I()"
+        return f"_new(C_{layout.decl.name})"
+
+    def parameters(self, node):
+        """The parameter types of the method a MethodCall node calls."""
+        owner = self.typed.owners[node]
+        layout = self.layouts.get(owner)
+        if layout is None:
+            if node.method_name not in BUILTINS.classes.get(owner, {}):
+                raise CodegenError(f"unknown method {owner}.{node.method_name}")
+            return list(BUILTINS.classes[owner][node.method_name][1])
+        return [x.param_type for x in layout.methods[node.method_name][0].params]
+
+    def stable(self, node):
+        """True when node is a Python name or constant no other part of a statement can change."""
+        while isinstance(node, ParenthesizedExpression):
+            node = node.expr
+        if isinstance(node, PostfixExpression) and not node.postfix_ops:
+            return self.stable(node.primary)
+        if isinstance(node, Identifier):
+            declaration = self.bindings.declaration_of(node)
+            return declaration is not None and not isinstance(declaration.type, ReferenceType) \
+                and declaration not in self.aliased
+        return isinstance(node, (Literal, ThisExpression))
+
+    # _________________________________Declarations_________________________________
+    # o: the Writer of the module, class or function being written
+    def visit_program(self, node, o: Any = None):
+        layouts = sorted(self.layouts.values(), key=lambda x: x.index)
+        statics = self.lowering.module.statics
+        for layout in layouts:
+            for member in layout.decl.members:
+                if isinstance(member, AttributeDecl) and member.is_static:
+                    for x in member.attributes:
+                        index = layout.statics[x.name]
+                        o.line(f"{self.static_name(layout, x.name)} = {literal(statics[index])[0]}")
+        for layout in layouts:
+            self.visit(layout.decl, o)
+        for decl, x, index in self.lowering.static_inits:
+            layout = next(y for y in layouts if y.statics.get(x.name) == index)
+            o.line(f"{self.static_name(layout, x.name)} = {self.initializer(decl, x, o)}")
+        for x in node.class_decls:
+            member = self.layouts[x.name].methods.get("main")
+            if member is not None and any(m is member[0] for m in x.members):
+                if member[0].is_static:
+                    o.line(f"_main = C_{x.name}.M_main")
+                else:
+                    o.line(f"_main = lambda: {self.allocate(self.layouts[x.name])}.M_main()")
+                break
+        else:
+            raise CodegenError("no main method")
+
+    def initializer(self, decl, node, o):
+        if node.init_value is None:
+            return self.default(decl.attr_type)
+        return self.value(node.init_value, decl.attr_type, o)[0]
+
+    def visit_class_decl(self, node, o: Any = None):
+        layout = self.layouts[node.name]
+        superclass = layout.superclass
+        names = self.field_names[layout]
+        inherited = self.field_names[superclass] if superclass is not None else []
+        o.line(f"class C_{node.name}{f'(C_{superclass.decl.name})' if superclass else ''}:")
+        o.depth += 1
+        own = names[len(inherited):]
+        o.line(f"__slots__ = {tuple(own)!r}")
+        if own or layout.field_inits:
+            self.write_init(layout, o)
+        constructors = 0
+        for member in node.members:
+            if isinstance(member, MethodDecl):
+                self.write_function(member, f"M_{member.name}", METHOD, o)
+            elif isinstance(member, ConstructorDecl):
+                self.write_function(member, f"K{constructors}", CONSTRUCTOR, o)
+                constructors += 1
+            elif isinstance(member, DestructorDecl):
+                self.write_function(member, "D", DESTRUCTOR, o)
+                o.line("def __del__(self):")
+                o.line("    _destroy(self)")
+        o.depth -= 1
+
+    def write_init(self, layout, o):
+        """I: every field set to its literal or default value, then the other initializers, superclass first."""
+        writer = Writer(o.depth + 1, METHOD)
+        for index, name in enumerate(self.field_names[layout]):
+            writer.line(f"self.{name} = {literal(layout.defaults[index])[0]}")
+        chain = []
+        while layout is not None:
+            chain.append(layout)
+            layout = layout.superclass
+        for layout in reversed(chain):
+            for decl, x, index in layout.field_inits:
+                writer.line(f"self.{self.field_names[layout][index]} = {self.initializer(decl, x, writer)}")
+        writer.line("return self")
+        o.line("def I(self):")
+        o.lines.extend(writer.lines)
+
+    def write_function(self, node, name, kind, o):
+        frame = self.bindings.frame_of(node)
+        params = [self.local_name(x) for x in frame.declarations[:frame.params]]
+        writer = Writer(o.depth + 1, kind, node.return_type if kind is METHOD else None)
+        for x in frame.declarations[:frame.params]:
+            if x in self.aliased:
+                writer.line(f"{self.local_name(x)} = [{self.local_name(x)}]")
+        self.visit(node.body, writer)
+        if kind is CONSTRUCTOR:
+            writer.line("return self")
+        if frame.receiver:
+            params.insert(0, "self")
+        else:
+            o.line("@staticmethod")
+        o.line(f"def {name}({', '.join(params)}):")
+        if writer.globals:
+            o.line(f"    global {', '.join(sorted(writer.globals))}")
+        if not writer.lines and not writer.globals:
+            writer.line("pass")
+        o.lines.extend(writer.lines)
+
+    # _________________________________Statements_________________________________
+    def write_body(self, node, o):
+        """Write statement node one level deeper, as the body of a compound statement."""
+        o.depth += 1
+        start = len(o.lines)
+        self.write_statement(node, o)
+        if len(o.lines) == start:
+            o.line("pass")
+        o.depth -= 1
+
+    def write_statement(self, node, o):
+        """
+        Write statement or declaration node. In a program with destructors,
+        the temporaries it set are cleared after it, so an object it
+        evaluated is dropped when the statement ends, as on the VM.
+        """
+        first = o.temps
+        self.visit(node, o)
+        if self.finalizing and o.temps > first and not isinstance(node, BlockStatement):
+            o.line(" = ".join(f"T{i}" for i in range(first, o.temps)) + " = None")
+
+    def visit_block_statement(self, node, o: Any = None):
+        for x in node.var_decls:
+            self.write_statement(x, o)
+        for x in node.statements:
+            self.write_statement(x, o)
+
+    def visit_variable_decl(self, node, o: Any = None):
+        for x in node.variables:
+            declaration = self.variables[x]
+            name = self.local_name(declaration)
+            init = x.init_value
+            if isinstance(node.var_type, ReferenceType):
+                if init is None:
+                    raise CodegenError(f"reference {x.name} has no initializer")
+                if isinstance(init, NilLiteral):
+                    o.line(f"{name} = _box({self.default(node.var_type)})")
+                else:
+                    o.line(f"{name} = {self.reference(init, o)}")
+                continue
+            if init is None or isinstance(init, NilLiteral):
+                value = self.default(node.var_type)
+            else:
+                value = self.value(init, node.var_type, o)[0]
+            o.line(f"{name} = [{value}]" if declaration in self.aliased else f"{name} = {value}")
+
+    def store(self, declaration, value):
+        """The statement storing the text value into the variable of declaration."""
+        name = self.local_name(declaration)
+        if isinstance(declaration.type, ReferenceType):
+            return f"{name}.set({value})"
+        if declaration in self.aliased:
+            return f"{name}[0] = {value}"
+        return f"{name} = {value}"
+
+    def load(self, declaration):
+        name = self.local_name(declaration)
+        if isinstance(declaration.type, ReferenceType):
+            return f"{name}.get()", POSTFIX
+        if declaration in self.aliased:
+            return f"{name}[0]", POSTFIX
+        return name, ATOM
+
+    def visit_assignment_statement(self, node, o: Any = None):
+        lhs = node.lhs
+        if isinstance(lhs, IdLHS):
+            declaration = self.bindings.declaration_of(lhs)
+            o.line(self.store(declaration, self.value(node.rhs, declaration.type, o)[0]))
+            return
+        target = lhs.postfix_expr
+        if not isinstance(target, PostfixExpression) or not target.postfix_ops:
+            raise CodegenError(f"cannot assign to {target}")
+        container, stable, static = self.chain(target.primary, target.postfix_ops[:-1], o)
+        last = target.postfix_ops[-1]
+        target_type = self.typed.type_of(target)
+        if isinstance(last, MemberAccess):
+            layout = self.layouts[self.typed.owners[last]]
+            if static is not None:
+                name = self.static_name(layout, last.member_name)
+                o.globals.add(name)
+                o.line(f"{name} = {self.value(node.rhs, target_type, o)[0]}")
+                return
+            if not stable and not self.stable(node.rhs):
+                # Python evaluates the value first, the object must come before it
+                container = self.hoist(container, o)
+            value = self.value(node.rhs, target_type, o)[0]
+            o.line(f"{wrap(container, POSTFIX)}.{self.field_name(layout, last.member_name)} = {value}")
+        elif isinstance(last, ArrayAccess):
+            array = container if stable else self.hoist(container, o)
+            index = self.expression(last.index, o)
+            if not self.stable(last.index):
+                index = self.hoist(index, o)
+            value = self.value(node.rhs, target_type, o)
+            if not self.stable(node.rhs):
+                value = self.hoist(value, o)
+            array, index = wrap(array, POSTFIX), index[0]
+            o.line(f"if {self.in_bounds(array, index)}:")
+            o.line(f"    {array}[{index}] = {value[0]}")
+            o.line("else:")
+            o.line(f"    _index_error({array}, {index})")
+        else:
+            raise CodegenError(f"cannot assign to {target}")
+
+    def hoist(self, expression, o):
+        """Evaluate expression into a new temporary, now, and return the temporary."""
+        name = o.temp()
+        o.line(f"{name} = {expression[0]}")
+        return name, ATOM
+
+    def in_bounds(self, array, index):
+        if index.isdigit():
+            return f"{index} < len({array})"
+        return f"-1 < {index} < len({array})"
+
+    def visit_if_statement(self, node, o: Any = None):
+        keyword = "if"
+        while True:
+            condition = node.condition
+            if isinstance(condition, BoolLiteral):
+                # folded: only the branch taken is written
+                taken = node.then_stmt if condition.value else node.else_stmt
+                if keyword == "if":
+                    if taken is not None:
+                        self.visit(taken, o)
+                elif taken is not None:
+                    o.line("else:")
+                    self.write_body(taken, o)
+                return
+            o.line(f"{keyword} {self.expression(condition, o)[0]}:")
+            self.write_body(node.then_stmt, o)
+            node = node.else_stmt
+            if node is None:
+                return
+            if not isinstance(node, IfStatement):
+                o.line("else:")
+                self.write_body(node, o)
+                return
+            keyword = "elif"
+
+    def visit_for_statement(self, node, o: Any = None):
+        declaration = self.bindings.declaration_of(node)
+        upward = node.direction == "to"
+        start = self.value(node.start_expr, INT, o)[0]
+        o.line(self.store(declaration, start))
+        if isinstance(node.end_expr, IntLiteral):
+            end = literal(node.end_expr.value)[0]
+        else:
+            end = self.hoist(self.value(node.end_expr, INT, o), o)[0]
+        if isinstance(declaration.type, ReferenceType) or declaration in self.aliased or node in self.stepped:
+            variable = self.load(declaration)
+            step = self.store(declaration, f"{variable[0]} {'+' if upward else '-'} 1")
+            o.line(f"while {variable[0]} {'<=' if upward else '>='} {end}:")
+            o.loops.append([step])
+            o.depth += 1
+            self.visit(node.body, o)
+            o.line(step)
+            o.depth -= 1
+            o.loops.pop()
+            return
+        name = self.local_name(declaration)
+        bound = self.offset(end, 1 if upward else -1)
+        o.line(f"for {name} in range({name}, {bound}):" if upward else f"for {name} in range({name}, {bound}, -1):")
+        o.loops.append([])
+        self.write_body(node.body, o)
+        o.loops.pop()
+        # a loop running to its end leaves its variable one step past the end bound
+        o.line("else:")
+        o.line(f"    {name} = {'max' if upward else 'min'}({name}, {bound})")
+
+    def offset(self, end, step):
+        if end.lstrip("-").isdigit():
+            return str(int(end) + step)
+        return f"{end} + 1" if step > 0 else f"{end} - 1"
+
+    def visit_break_statement(self, node, o: Any = None):
+        o.line("break")
+
+    def visit_continue_statement(self, node, o: Any = None):
+        for x in o.loops[-1]:
+            o.line(x)
+        o.line("continue")
+
+    def visit_return_statement(self, node, o: Any = None):
+        if o.kind is METHOD:
+            if isinstance(o.return_type, ReferenceType):
+                o.line(f"return {self.reference(node.value, o)}")
+            else:
+                o.line(f"return {self.value(node.value, o.return_type, o)[0]}")
+            return
+        if not self.stable(node.value):
+            o.line(self.expression(node.value, o)[0])
+        o.line("return self" if o.kind is CONSTRUCTOR else "return")
+
+    def visit_method_invocation_statement(self, node, o: Any = None):
+        call = node.method_call
+        if isinstance(call, PostfixExpression) and call.postfix_ops and isinstance(call.postfix_ops[-1], MethodCall):
+            container, _, static = self.chain(call.primary, call.postfix_ops[:-1], o)
+            o.line(self.call(call.postfix_ops[-1], container, static, o)[0])
+        else:
+            o.line(self.expression(call, o)[0])
+
+    # _________________________________Expressions_________________________________
+    # expressions are written as (text, precedence)
+    def expression(self, node, o):
+        return self.visit(node, o)
+
+    def value(self, node, declared_type, o):
+        """node stored in a slot of declared_type, converting an int to float."""
+        if value_type(declared_type) is not FLOAT:
+            return self.visit(node, o)
+        if isinstance(node, IntLiteral):
+            return literal(float(node.value))
+        expression = self.visit(node, o)
+        if value_type(self.typed.type_of(node)) is INT:
+            return f"float({expression[0]})", POSTFIX
+        return expression
+
+    def default(self, declared_type):
+        t = value_type(declared_type)
+        if isinstance(t, ArrayType):
+            return f"[{literal(default_value(t.element_type))[0]}] * {t.size}"
+        return literal(default_value(t))[0]
+
+    def reference(self, node, o):
+        """A Cell aliasing what node denotes, or a new location holding its value."""
+        while isinstance(node, ParenthesizedExpression):
+            node = node.expr
+        if isinstance(node, Identifier):
+            declaration = self.bindings.declaration_of(node)
+            if declaration is not None:
+                if isinstance(declaration.type, ReferenceType):
+                    return self.local_name(declaration)
+                return f"_Cell({self.local_name(declaration)}, 0)"
+        if isinstance(node, PostfixExpression) and node.postfix_ops:
+            container, _, static = self.chain(node.primary, node.postfix_ops[:-1], o)
+            return self.reference_operation(node.postfix_ops[-1], container, static, o)
+        return f"_box({self.visit(node, o)[0]})"
+
+    def chain(self, primary, operations, o):
+        """(expression, stable, class name) of primary followed by operations; the class name when they denote one."""
+        if isinstance(primary, Identifier) and self.bindings.declaration_of(primary) is None:
+            static = self.typed.type_of(primary)
+            if not isinstance(static, str):
+                raise CodegenError(f"unbound name {primary.name}")
+            expression, stable = None, True
+        else:
+            static = None
+            expression, stable = self.visit(primary, o), self.stable(primary)
+        for x in operations:
+            expression = self.operation(x, expression, stable, static, o)
+            static, stable = None, False
+        return expression, stable, static
+
+    def operation(self, node, expression, stable, static, o):
+        """Apply postfix operation node to expression, or to class static."""
+        if isinstance(node, MemberAccess):
+            layout = self.layouts[self.typed.owners[node]]
+            if static is not None:
+                return self.static_name(layout, node.member_name), ATOM
+            return f"{wrap(expression, POSTFIX)}.{self.field_name(layout, node.member_name)}", POSTFIX
+        if isinstance(node, ArrayAccess):
+            return self.element(expression, stable, node.index, o)
+        call, returns_reference = self.call(node, expression, static, o)
+        return (f"{call}.get()", POSTFIX) if returns_reference else (call, POSTFIX)
+
+    def reference_operation(self, node, expression, static, o):
+        """A Cell aliasing the member or element postfix operation node denotes, or the one a method returns."""
+        if isinstance(node, MemberAccess):
+            layout = self.layouts[self.typed.owners[node]]
+            if static is not None:
+                return f"_Cell(_g, {self.static_name(layout, node.member_name)!r})"
+            return f"_field_cell({expression[0]}, {self.field_name(layout, node.member_name)!r})"
+        if isinstance(node, ArrayAccess):
+            return f"_element_cell({expression[0]}, {self.visit(node.index, o)[0]})"
+        call, returns_reference = self.call(node, expression, static, o)
+        return call if returns_reference else f"_box({call})"
+
+    def element(self, array, stable, index_node, o):
+        """array[index], its bounds checked after array and index are evaluated, in that order."""
+        index = self.visit(index_node, o)
+        if stable and self.stable(index_node):
+            a, i = wrap(array, POSTFIX), index[0]
+            return f"({a}[{i}] if {self.in_bounds(a, i)} else _index_error({a}, {i}))", ATOM
+        if self.stable(index_node):
+            t, i = o.temp(), index[0]
+            return f"({t}[{i}] if len({t} := {array[0]}) > {i} > -1 else _index_error({t}, {i}))", ATOM
+        if stable:
+            a, t = wrap(array, POSTFIX), o.temp()
+            return f"({a}[{t}] if -1 < ({t} := {index[0]}) < len({a}) else _index_error({a}, {t}))", ATOM
+        return f"_element({array[0]}, {index[0]})", POSTFIX
+
+    def call(self, node, expression, static, o):
+        """(text, returns a reference) of the call of method node on expression or on class static."""
+        owner = self.typed.owners[node]
+        layout = self.layouts.get(owner)
+        args = self.arguments(self.parameters(node), node.args, o)
+        if layout is None:
+            return f"_io.{node.method_name}({args})", False
+        decl = layout.methods[node.method_name][0]
+        receiver = f"C_{owner}" if static is not None else wrap(expression, POSTFIX)
+        return f"{receiver}.M_{node.method_name}({args})", isinstance(decl.return_type, ReferenceType)
+
+    def arguments(self, params, args, o):
+        """An argument for every parameter, see the module docstring of src/codegen/codegen.py."""
+        texts = []
+        for i, param in enumerate(params):
+            if i >= len(args):
+                default = self.default(param)
+                texts.append(f"_box({default})" if isinstance(param, ReferenceType) else default)
+            elif isinstance(param, ReferenceType):
+                texts.append(self.reference(args[i], o))
+            else:
+                texts.append(self.value(args[i], param, o)[0])
+        if len(args) > len(params):
+            texts.append(f"*_drop({', '.join(self.visit(x, o)[0] for x in args[len(params):])})")
+        return ", ".join(texts)
+
+    def visit_postfix_expression(self, node, o: Any = None):
+        if not node.postfix_ops:
+            return self.visit(node.primary, o)
+        expression, stable, static = self.chain(node.primary, node.postfix_ops[:-1], o)
+        return self.operation(node.postfix_ops[-1], expression, stable, static, o)
+
+    def visit_binary_op(self, node, o: Any = None):
+        if node.operator in INT_DIVISIONS:
+            return self.int_division(node, o)
+        symbol, precedence = OPERATORS[node.operator]
+        left, right = self.visit(node.left, o), self.visit(node.right, o)
+        # comparisons do not chain as Python's do
+        left = wrap(left, precedence + 1 if precedence == COMPARISON else precedence)
+        return f"{left} {symbol} {wrap(right, precedence + 1)}", precedence
+
+    def int_division(self, node, o):
+        """left \\ right or left % right on ints, rounded toward zero (see src/utils/operators.py)."""
+        helper, symbol = INT_DIVISIONS[node.operator]
+        left, right = self.visit(node.left, o), self.visit(node.right, o)
+        if isinstance(node.right, IntLiteral) and node.right.value > 0:
+            k = right[0]
+            if self.stable(node.left):
+                a = wrap(left, NEGATION)
+                return f"({a} {symbol} {k} if {a} >= 0 else -(-{a} {symbol} {k}))", ATOM
+            t = o.temp()
+            return f"({t} {symbol} {k} if ({t} := {left[0]}) >= 0 else -(-{t} {symbol} {k}))", ATOM
+        if self.stable(node.left) and self.stable(node.right):
+            a, b = wrap(left, NEGATION), wrap(right, PRODUCT + 1)
+            return f"({a} {symbol} {b} if ({a} < 0) == ({b} < 0) else -(-{a} {symbol} {b}))", ATOM
+        return f"{helper}({left[0]}, {right[0]})", POSTFIX
+
+    def visit_unary_op(self, node, o: Any = None):
+        operand = self.visit(node.operand, o)
+        if node.operator == "-":
+            return f"-{wrap(operand, NEGATION)}", NEGATION
+        if node.operator == "!":
+            return f"not {wrap(operand, NOT)}", NOT
+        return operand
+
+    def visit_parenthesized_expression(self, node, o: Any = None):
+        return self.visit(node.expr, o)
+
+    def visit_object_creation(self, node, o: Any = None):
+        layout = self.layouts[node.class_name]
+        constructor = self.lowering.constructor(layout, node.args)
+        if constructor is None:
+            return self.allocate(layout), POSTFIX
+        decl = constructor[0]
+        k = [x for x, _ in layout.constructors].index(decl)
+        args = self.arguments([x.param_type for x in decl.params], node.args, o)
+        return f"{self.allocate(layout)}.K{k}({args})", POSTFIX
+
+    def visit_identifier(self, node, o: Any = None):
+        declaration = self.bindings.declaration_of(node)
+        if declaration is None:
+            raise CodegenError(f"unbound name {node.name}")
+        return self.load(declaration)
+
+    def visit_this_expression(self, node, o: Any = None):
+        return "self", ATOM
+
+    def visit_int_literal(self, node, o: Any = None):
+        return literal(node.value)
+
+    def visit_float_literal(self, node, o: Any = None):
+        return literal(float(node.value))
+
+    def visit_bool_literal(self, node, o: Any = None):
+        return literal(node.value)
+
+    def visit_string_literal(self, node, o: Any = None):
+        return literal(unescape(node.value))
+
+    def visit_nil_literal(self, node, o: Any = None):
+        return "None", ATOM
+
+    def visit_array_literal(self, node, o: Any = None):
+        return f"[{', '.join(self.visit(x, o)[0] for x in node.value)}]", ATOM
@@ -0,0 +1,482 @@
+"""
+Stack virtual machine running the bytecode of src/codegen/bytecode.py.
+
+VirtualMachine.run loads a Module and runs its main method. Loading
+turns every CodeObject into a Routine: the code is unpacked from its
+array into a list once, as indexing a list does not box the ints it
+holds, and the parameter-less part of a frame is prepared as a list to
+append to the arguments of each call.
+
+One loop runs a whole program. A call saves the code, constants,
+position and frame of the caller on a call stack and switches to those
+of the callee, a return switches back, so OPLang recursion does not grow
+the Python stack (calls nest up to max_depth deep); all calls share one
+operand stack. The loop tests the opcodes of locals, constants and
+arithmetic first.
+
+Values are Python values: ints, floats, bools, strings, None for nil,
+lists for arrays and Instance objects, lists of field values that know
+their RuntimeClass, for objects. A reference is a (container, index)
+tuple of one of these lists, or of a frame, which is a list too.
+
+An object of a class with a destructor is an Instance whose __del__
+queues it once Python finds it unreachable, at the instruction dropping
+its last reference; a method returning drops its locals first slot first,
+as CPython drops those of a function. The machine runs the queued
+destructors, in the order they were queued, before the next native call,
+so before anything the program prints next, when the next method
+returns, and at the end of the run after collecting cycles, so they print
+where the Python back end prints them. Objects still reachable from a
+static field when the program ends are not destroyed.
+"""
+
+import gc
+import sys
+
+from .bytecode import (
+    LOAD, LOAD2, LOAD_CONST, STORE, LOAD_REF, STORE_REF, REF_LOCAL, CONST, POP, DUP,
+    ADD, SUB, MUL, DIV, IDIV, MOD, EQ, NE, LT, LE, GT, GE, NEG, NOT, TO_FLOAT,
+    JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP,
+    FOR_TO, FOR_DOWNTO, LOOP_UP, LOOP_DOWN,
+    GET_FIELD, SET_FIELD, REF_FIELD, GET_STATIC, SET_STATIC, REF_STATIC,
+    GET_INDEX, SET_INDEX, REF_INDEX, DEREF, BOX, NEW, NEW_ARRAY, ARRAY,
+    CALL, CALL_METHOD, CALL_NATIVE, RETURN, RETURN_NONE, LEAVE,
+)
+from .error import ExecutionError, DivisionByZero, IndexOutOfRange, NilDereference, StackOverflow
+from .io import Console
+from ..utils.operators import int_divide, remainder
+
+
+class Instance(list):
+    """An object: the values of its fields, in the order of ClassInfo.fields."""
+
+    __slots__ = ("cls",)
+
+
+class FinalizedInstance(Instance):
+    """An object of a class with a destructor, queued for it once unreachable."""
+
+    __slots__ = ()
+
+    def __del__(self):
+        self.cls.pending.append(self)
+
+
+class RuntimeClass:
+    """A ClassInfo loaded into one run."""
+
+    __slots__ = ("name", "fields", "vtable", "init", "destructor", "type", "pending")
+
+    def __init__(self, info, routines, pending):
+        self.name = info.name
+        self.fields = info.fields
+        self.vtable = [routines[f] for f in info.vtable]
+        self.init = routines[info.init] if info.init >= 0 else None
+        self.destructor = routines[info.destructor] if info.destructor >= 0 else None
+        self.type = Instance if self.destructor is None else FinalizedInstance
+        self.pending = pending  # objects waiting for their destructor
+
+    def new(self):
+        instance = self.type(self.fields)
+        instance.cls = self
+        return instance
+
+
+class Routine:
+    """A CodeObject loaded into one run."""
+
+    __slots__ = ("name", "code", "consts", "nparams", "padding")
+
+    def __init__(self, code_object):
+        self.name = code_object.name
+        self.code = code_object.code.tolist()
+        self.consts = code_object.consts
+        self.nparams = code_object.nparams
+        self.padding = [None] * (code_object.nlocals - code_object.nparams)
+
+
+def index_error(array, index):
+    if array is None:
+        return NilDereference()
+    return IndexOutOfRange(index, len(array))
+
+
+class VirtualMachine:
+    """
+    Runs compiled OPLang programs.
+
+    Args:
+        stdin: text stream io reads, sys.stdin by default
+        stdout: text stream io writes, sys.stdout by default
+        max_depth (int): calls a program can nest before StackOverflow is raised
+    """
+
+    def __init__(self, stdin=None, stdout=None, max_depth=100000):
+        self.console = Console(stdin, stdout)
+        self.max_depth = max_depth
+
+    def load(self, module):
+        self.routines = [Routine(x) for x in module.functions]
+        self.pending = []
+        self.classes = [RuntimeClass(x, self.routines, self.pending) for x in module.classes]
+        self.finalizing = any(x.destructor is not None for x in self.classes)
+        self.statics = list(module.statics)
+        self.natives = [self.console.native(c, m) for c, m in module.natives]
+
+    def run(self, module):
+        """Run the main method of module; raises an ExecutionError when the program fails."""
+        self.load(module)
+        if module.static_init >= 0:
+            self.execute(self.routines[module.static_init], [])
+        main = self.routines[module.entry]
+        args = [None] * main.nparams
+        if module.receiver >= 0:
+            receiver = self.classes[module.receiver].new()
+            if receiver.cls.init is not None:
+                self.execute(receiver.cls.init, [receiver])
+            args[0] = receiver
+            del receiver
+        self.execute(main, args)
+        del args
+        self.finalize()
+        gc.collect()
+        self.finalize()
+
+    def finalize(self):
+        """Run the destructors of the objects queued since the last method returned."""
+        while self.pending:
+            batch = self.pending[:]
+            del self.pending[:]
+            for instance in batch:
+                self.execute(instance.cls.destructor, [instance])
+
+    @staticmethod
+    def release(frame):
+        """Drop the values of a returning frame, first slot first as CPython drops locals, unless a reference holds it."""
+        # the frame variable of execute, the parameter and the argument of getrefcount
+        if sys.getrefcount(frame) == 3:
+            for i in range(len(frame)):
+                frame[i] = None
+
+    @staticmethod
+    def destroy(batch, calls, resume):
+        """
+        Start running the destructors of the objects of batch one after the other, then resume.
+
+        Returns the code, constants, position and frame of the first; the
+        others and resume are pushed on calls, so each starts as the one
+        before returns.
+        """
+        calls.append(resume)
+        for instance in reversed(batch[1:]):
+            destructor = instance.cls.destructor
+            calls.append((destructor.code, destructor.consts, 0, [instance] + destructor.padding))
+        destructor = batch[0].cls.destructor
+        return destructor.code, destructor.consts, 0, [batch[0]] + destructor.padding
+
+    def execute(self, routine, args):
+        """Run routine on args, the values of its parameters, and return its result."""
+        functions = self.routines
+        statics = self.statics
+        natives = self.natives
+        pending = self.pending
+        finalizing = self.finalizing
+        release = self.release
+        max_depth = self.max_depth
+        code = routine.code
+        consts = routine.consts
+        frame = args + routine.padding
+        del args
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        calls = []
+        pc = 0
+        try:
+            while True:
+                op = code[pc]
+                if op == LOAD:
+                    push(frame[code[pc + 1]])
+                    pc += 2
+                elif op == LOAD2:
+                    push(frame[code[pc + 1]])
+                    push(frame[code[pc + 2]])
+                    pc += 3
+                elif op == LOAD_CONST:
+                    push(frame[code[pc + 1]])
+                    push(consts[code[pc + 2]])
+                    pc += 3
+                elif op == CONST:
+                    push(consts[code[pc + 1]])
+                    pc += 2
+                elif op == STORE:
+                    frame[code[pc + 1]] = pop()
+                    pc += 2
+                elif op == GET_INDEX:
+                    index = pop()
+                    array = stack[-1]
+                    try:
+                        if index < 0:
+                            raise IndexError
+                        stack[-1] = array[index]
+                    except (IndexError, TypeError):
+                        raise index_error(array, index) from None
+                    pc += 1
+                elif op == ADD:
+                    value = pop()
+                    stack[-1] += value
+                    pc += 1
+                elif op == SUB:
+                    value = pop()
+                    stack[-1] -= value
+                    pc += 1
+                elif op == MUL:
+                    value = pop()
+                    stack[-1] *= value
+                    pc += 1
+                elif op == LT:
+                    value = pop()
+                    stack[-1] = stack[-1] < value
+                    pc += 1
+                elif op == GT:
+                    value = pop()
+                    stack[-1] = stack[-1] > value
+                    pc += 1
+                elif op == LE:
+                    value = pop()
+                    stack[-1] = stack[-1] <= value
+                    pc += 1
+                elif op == GE:
+                    value = pop()
+                    stack[-1] = stack[-1] >= value
+                    pc += 1
+                elif op == EQ:
+                    value = pop()
+                    stack[-1] = stack[-1] == value
+                    pc += 1
+                elif op == NE:
+                    value = pop()
+                    stack[-1] = stack[-1] != value
+                    pc += 1
+                elif op == JUMP_IF_FALSE:
+                    if pop():
+                        pc += 2
+                    else:
+                        pc = code[pc + 1]
+                elif op == LOOP_UP:
+                    slot = code[pc + 1]
+                    value = frame[slot] + 1
+                    frame[slot] = value
+                    if value <= frame[code[pc + 2]]:
+                        pc = code[pc + 3]
+                    else:
+                        pc += 4
+                elif op == JUMP:
+                    pc = code[pc + 1]
+                elif op == GET_FIELD:
+                    try:
+                        stack[-1] = stack[-1][code[pc + 1]]
+                    except TypeError:
+                        raise NilDereference() from None
+                    pc += 2
+                elif op == SET_FIELD:
+                    value = pop()
+                    try:
+                        pop()[code[pc + 1]] = value
+                    except TypeError:
+                        raise NilDereference() from None
+                    pc += 2
+                elif op == SET_INDEX:
+                    value = pop()
+                    index = pop()
+                    array = pop()
+                    try:
+                        if index < 0:
+                            raise IndexError
+                        array[index] = value
+                    except (IndexError, TypeError):
+                        raise index_error(array, index) from None
+                    pc += 1
+                elif op == MOD:
+                    value = pop()
+                    left = stack[-1]
+                    if left >= 0 and value > 0:
+                        stack[-1] = left % value
+                    else:
+                        stack[-1] = remainder(left, value)
+                    pc += 1
+                elif op == IDIV:
+                    value = pop()
+                    left = stack[-1]
+                    if left >= 0 and value > 0:
+                        stack[-1] = left // value
+                    else:
+                        stack[-1] = int_divide(left, value)
+                    pc += 1
+                elif op == DIV:
+                    value = pop()
+                    stack[-1] = stack[-1] / value
+                    pc += 1
+                elif op == CALL:
+                    if len(calls) >= max_depth:
+                        raise StackOverflow(max_depth)
+                    callee = functions[code[pc + 1]]
+                    calls.append((code, consts, pc + 2, frame))
+                    n = callee.nparams
+                    if n:
+                        frame = stack[-n:]
+                        del stack[-n:]
+                        frame += callee.padding
+                    else:
+                        frame = callee.padding[:]
+                    code = callee.code
+                    consts = callee.consts
+                    pc = 0
+                elif op == CALL_METHOD:
+                    if len(calls) >= max_depth:
+                        raise StackOverflow(max_depth)
+                    n = code[pc + 2]
+                    try:
+                        callee = stack[-n].cls.vtable[code[pc + 1]]
+                    except AttributeError:
+                        raise NilDereference() from None
+                    calls.append((code, consts, pc + 3, frame))
+                    frame = stack[-n:]
+                    del stack[-n:]
+                    frame += callee.padding
+                    code = callee.code
+                    consts = callee.consts
+                    pc = 0
+                elif op == RETURN or op == RETURN_NONE or op == LEAVE:
+                    value = pop() if op == RETURN else None
+                    if finalizing:
+                        release(frame)
+                    if not calls:
+                        return value
+                    code, consts, pc, frame = calls.pop()
+                    if op != LEAVE:
+                        push(value)
+                    if pending:
+                        # run the destructors before going on with the caller
+                        code, consts, pc, frame = self.destroy(pending[:], calls, (code, consts, pc, frame))
+                        del pending[:]
+                elif op == LOAD_REF:
+                    container, index = frame[code[pc + 1]]
+                    push(container[index])
+                    pc += 2
+                elif op == STORE_REF:
+                    container, index = frame[code[pc + 1]]
+                    container[index] = pop()
+                    pc += 2
+                elif op == JUMP_IF_TRUE:
+                    if pop():
+                        pc = code[pc + 1]
+                    else:
+                        pc += 2
+                elif op == JUMP_IF_FALSE_OR_POP:
+                    if stack[-1]:
+                        pop()
+                        pc += 2
+                    else:
+                        pc = code[pc + 1]
+                elif op == JUMP_IF_TRUE_OR_POP:
+                    if stack[-1]:
+                        pc = code[pc + 1]
+                    else:
+                        pop()
+                        pc += 2
+                elif op == FOR_TO:
+                    if frame[code[pc + 1]] > frame[code[pc + 2]]:
+                        pc = code[pc + 3]
+                    else:
+                        pc += 4
+                elif op == LOOP_DOWN:
+                    slot = code[pc + 1]
+                    value = frame[slot] - 1
+                    frame[slot] = value
+                    if value >= frame[code[pc + 2]]:
+                        pc = code[pc + 3]
+                    else:
+                        pc += 4
+                elif op == FOR_DOWNTO:
+                    if frame[code[pc + 1]] < frame[code[pc + 2]]:
+                        pc = code[pc + 3]
+                    else:
+                        pc += 4
+                elif op == NEG:
+                    stack[-1] = -stack[-1]
+                    pc += 1
+                elif op == NOT:
+                    stack[-1] = not stack[-1]
+                    pc += 1
+                elif op == TO_FLOAT:
+                    stack[-1] = float(stack[-1])
+                    pc += 1
+                elif op == POP:
+                    pop()
+                    pc += 1
+                elif op == DUP:
+                    push(stack[-1])
+                    pc += 1
+                elif op == GET_STATIC:
+                    push(statics[code[pc + 1]])
+                    pc += 2
+                elif op == SET_STATIC:
+                    statics[code[pc + 1]] = pop()
+                    pc += 2
+                elif op == CALL_NATIVE:
+                    if pending:
+                        # destructors print before what this instruction prints
+                        code, consts, pc, frame = self.destroy(pending[:], calls, (code, consts, pc, frame))
+                        del pending[:]
+                        continue
+                    n = code[pc + 2]
+                    if n:
+                        values = stack[-n:]
+                        del stack[-n:]
+                        push(natives[code[pc + 1]](*values))
+                    else:
+                        push(natives[code[pc + 1]]())
+                    pc += 3
+                elif op == NEW:
+                    push(self.classes[code[pc + 1]].new())
+                    pc += 2
+                elif op == NEW_ARRAY:
+                    push([consts[code[pc + 2]]] * code[pc + 1])
+                    pc += 3
+                elif op == ARRAY:
+                    n = code[pc + 1]
+                    values = stack[-n:] if n else []
+                    if n:
+                        del stack[-n:]
+                    push(values)
+                    pc += 2
+                elif op == DEREF:
+                    container, index = stack[-1]
+                    stack[-1] = container[index]
+                    pc += 1
+                elif op == BOX:
+                    stack[-1] = ([stack[-1]], 0)
+                    pc += 1
+                elif op == REF_LOCAL:
+                    push((frame, code[pc + 1]))
+                    pc += 2
+                elif op == REF_FIELD:
+                    if stack[-1] is None:
+                        raise NilDereference()
+                    stack[-1] = (stack[-1], code[pc + 1])
+                    pc += 2
+                elif op == REF_STATIC:
+                    push((statics, code[pc + 1]))
+                    pc += 2
+                elif op == REF_INDEX:
+                    index = pop()
+                    array = stack[-1]
+                    if array is None or not 0 <= index < len(array):
+                        raise index_error(array, index)
+                    stack[-1] = (array, index)
+                    pc += 1
+                else:
+                    raise ExecutionError(f"bad opcode {op} at {pc}")
+        except ZeroDivisionError:
+            raise DivisionByZero() from None
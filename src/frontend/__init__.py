@@ -0,0 +1,31 @@
+"""
+Parsing front end for OPLang programming language.
+This module drives the generated ANTLR lexer and parser and provides
+the parsing options (prediction modes, statistics) shared by the tools,
+and selects between the ANTLR and the hand-written fast backend.
+Importing it loads the persisted prediction DFAs, see dfa_cache.
+"""
+
+from .parsing import *
+from .backends import ANTLR, FAST, BACKENDS, parse_source
+from .dfa_cache import save_dfa_cache, load_dfa_cache, train_dfa_cache, load_default_dfa_cache
+
+__all__ = [
+    "LL",
+    "SLL",
+    "TWO_STAGE",
+    "PARSE_MODES",
+    "ParseStats",
+    "PARSE_STATS",
+    "run_program",
+    "clear_dfa_caches",
+    "ANTLR",
+    "FAST",
+    "BACKENDS",
+    "parse_source",
+    "save_dfa_cache",
+    "load_dfa_cache",
+    "train_dfa_cache",
+]
+
+load_default_dfa_cache()
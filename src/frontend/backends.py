@@ -0,0 +1,62 @@
+"""
+Selectable front ends for OPLang.
+
+Two backends turn source text into a Program:
+
+    ANTLR  the generated lexer/parser plus ASTGeneration, the reference
+    FAST   the hand-written lexer and recursive-descent parser
+
+Both build the same AST for every valid program. The fast parser has no
+error reporting of its own, so when it rejects a program the source is
+parsed again by ANTLR, which raises (or recovers) exactly as it would
+have on its own.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from antlr4 import InputStream, CommonTokenStream
+from lexererr import LexerError
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.fast_parser import FastParseError, parse as fast_parse
+from src.frontend.parsing import LL, run_program
+
+ANTLR = "antlr"
+FAST = "fast"
+BACKENDS = (ANTLR, FAST)
+
+
+def antlr_parse(source, mode=LL, error_listener=None):
+    """Parse source with the ANTLR front end and return its Program."""
+    parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+    if error_listener is not None:
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+    return ASTGeneration().visit(run_program(parser, mode))
+
+
+def parse_source(source, backend=ANTLR, mode=LL, error_listener=None):
+    """
+    Parse source into a Program with the chosen backend.
+
+    Args:
+        source: OPLang program text
+        backend: ANTLR (default) or FAST
+        mode: prediction mode of the ANTLR parse, see run_program
+        error_listener: replaces the ANTLR parser's default listeners
+
+    Programs the fast parser rejects are handed to the ANTLR path, so the
+    errors raised are always the reference ones.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {BACKENDS}")
+    if backend == FAST:
+        try:
+            return fast_parse(source)
+        except (FastParseError, LexerError):
+            pass
+    return antlr_parse(source, mode, error_listener)
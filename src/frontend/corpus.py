@@ -0,0 +1,54 @@
+"""
+Test-suite corpus for OPLang front-end tools.
+
+Extracts the literal `source = ...` programs from the test modules without
+importing them, so profilers, benchmarks and differential tests can run
+over every program the test suite knows about.
+"""
+
+import ast
+import os
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "tests")
+TEST_MODULES = ("test_lexer.py", "test_parser.py", "test_ast_gen.py", "test_checker.py")
+
+
+def iter_test_sources(modules=TEST_MODULES, tests_dir=TESTS_DIR):
+    """Yield (test id, source) for every literal `source = ...` assignment in the test modules."""
+    for module in modules:
+        path = os.path.join(tests_dir, module)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for func in tree.body:
+            if not isinstance(func, ast.FunctionDef):
+                continue
+            for stmt in func.body:
+                if (
+                    isinstance(stmt, ast.Assign)
+                    and any(isinstance(t, ast.Name) and t.id == "source" for t in stmt.targets)
+                    and isinstance(stmt.value, ast.Constant)
+                    and isinstance(stmt.value.value, str)
+                ):
+                    yield f"{module}::{func.name}", stmt.value.value
+
+
+def load_test_corpus(modules=TEST_MODULES, tests_dir=TESTS_DIR):
+    """Return the list of test programs (sources only)."""
+    return [source for _, source in iter_test_sources(modules, tests_dir)]
+
+
+def load_corpus_files(paths):
+    """Read every file in paths (directories are searched recursively)."""
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    with open(os.path.join(root, name), encoding="utf-8") as f:
+                        sources.append(f.read())
+        else:
+            with open(path, encoding="utf-8") as f:
+                sources.append(f.read())
+    return sources
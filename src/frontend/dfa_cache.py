@@ -0,0 +1,248 @@
+"""
+Persisted prediction DFAs for OPLang.
+
+The generated OPLangLexer and OPLangParser keep their prediction DFAs in
+class-level decisionsToDFA lists. They start empty in every process, so
+the first parses of a short-lived command pay for the ATN simulation
+that later parses get from the cache. This module saves the DFAs built
+while parsing a training corpus and loads them back into a new process.
+
+The DFA graphs are flattened (edges become state indices) and pickled.
+References into the ATN are stored as state numbers and resolved
+against the ATN of the running process; the cache also records a
+fingerprint of the serialized ATNs and of the version of the antlr4
+runtime, and a cache written for another grammar or runtime is ignored.
+So is a cache that does not decode: every DFA is decoded before any is
+restored, and a failure leaves them all untouched.
+
+Importing src.frontend loads the default cache, build/OPLang.dfa, when
+it exists. The OPLANG_DFA_CACHE environment variable points to another
+file, or disables the cache when set to an empty string. Train it with:
+
+    python -m src.frontend.train_dfa [FILE|DIR ...] [--output PATH]
+"""
+
+import hashlib
+import importlib.metadata
+import io
+import os
+import pickle
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT_DIR, "build"))
+
+import antlr4
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.PredictionContext import PredictionContext
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNState import ATNState
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerAction import LexerSkipAction, LexerMoreAction, LexerPopModeAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFAState import DFAState
+from antlr4.Lexer import Lexer
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.frontend.parsing import LL, run_program
+
+DFA_CACHE_FILE = os.path.join(ROOT_DIR, "build", "OPLang.dfa")
+DFA_CACHE_ENV = "OPLANG_DFA_CACHE"
+CACHE_FORMAT = 1
+RECOGNIZERS = (OPLangLexer, OPLangParser)
+
+# runtime singletons that are compared by identity and must stay shared
+SINGLETONS = {
+    "empty-context": PredictionContext.EMPTY,
+    "no-predicate": SemanticContext.NONE,
+    "skip": LexerSkipAction.INSTANCE,
+    "more": LexerMoreAction.INSTANCE,
+    "pop-mode": LexerPopModeAction.INSTANCE,
+}
+ERROR_EDGE = -1
+
+
+def antlr_version():
+    """Version of the antlr4 runtime, or where it is installed when it has no metadata."""
+    try:
+        return importlib.metadata.version("antlr4-python3-runtime")
+    except importlib.metadata.PackageNotFoundError:
+        return os.path.dirname(antlr4.__file__)
+
+
+def atn_fingerprint(recognizer):
+    """Digest of the serialized ATN the recognizer class was generated with and of the antlr4 runtime."""
+    module = sys.modules[recognizer.__module__]
+    return hashlib.sha256(f"{antlr_version()}:{module.serializedATN()!r}".encode()).hexdigest()
+
+
+def error_state(recognizer):
+    return LexerATNSimulator.ERROR if issubclass(recognizer, Lexer) else ATNSimulator.ERROR
+
+
+class DFAPickler(pickle.Pickler):
+    """Pickles DFA contents with ATN states and runtime singletons by reference."""
+
+    def __init__(self, file, recognizer):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.states = {id(s): s.stateNumber for s in recognizer.atn.states}
+        self.singletons = {id(v): k for k, v in SINGLETONS.items()}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, ATNState):
+            return ("state", self.states[id(obj)])
+        key = self.singletons.get(id(obj))
+        if key is not None:
+            return (key,)
+        return None
+
+    def reducer_override(self, obj):
+        # the executor caches a string hash, which differs between processes
+        if isinstance(obj, LexerActionExecutor):
+            return LexerActionExecutor, (list(obj.lexerActions),)
+        return NotImplemented
+
+
+class DFAUnpickler(pickle.Unpickler):
+    def __init__(self, file, recognizer):
+        super().__init__(file)
+        self.atn = recognizer.atn
+
+    def persistent_load(self, pid):
+        if pid[0] == "state":
+            return self.atn.states[pid[1]]
+        return SINGLETONS[pid[0]]
+
+
+def flatten_dfa(dfa, error):
+    """Return (rows, s0 index): one row per DFA state, edges as row indices."""
+    order = []
+    index = {}
+
+    def number(state):
+        if id(state) not in index:
+            index[id(state)] = len(order)
+            order.append(state)
+        return index[id(state)]
+
+    for state in dfa._states:
+        number(state)
+    s0 = number(dfa.s0) if dfa.s0 is not None else None
+
+    rows = []
+    i = 0
+    while i < len(order):  # edges can add states, so the list grows as we go
+        state = order[i]
+        edges = None
+        if state.edges is not None:
+            edges = [
+                None if t is None else ERROR_EDGE if t is error else number(t)
+                for t in state.edges
+            ]
+        rows.append((state.stateNumber, state.configs, edges, state.isAcceptState, state.prediction,
+                     state.lexerActionExecutor, state.requiresFullContext, state.predicates))
+        i += 1
+    return rows, s0
+
+
+def decode_dfa(dfa, rows, s0, error):
+    """The states and start state of dfa flattened into rows and s0 by flatten_dfa."""
+    states = []
+    for number, configs, _, accept, prediction, executor, full_context, predicates in rows:
+        configs.cachedHashCode = -1
+        state = DFAState(number, configs)
+        state.isAcceptState = accept
+        state.prediction = prediction
+        state.lexerActionExecutor = executor
+        state.requiresFullContext = full_context
+        state.predicates = predicates
+        states.append(state)
+    for state, row in zip(states, rows):
+        edges = row[2]
+        if edges is not None:
+            state.edges = [None if t is None else error if t == ERROR_EDGE else states[t] for t in edges]
+    return ({state: state for k, state in enumerate(states) if not (dfa.precedenceDfa and k == s0)},
+            states[s0] if s0 is not None else None)
+
+
+def save_dfa_cache(path=DFA_CACHE_FILE, recognizers=RECOGNIZERS):
+    """Write the current DFAs of the recognizer classes to path, return the number of DFA states."""
+    cache = {"format": CACHE_FORMAT, "recognizers": {}}
+    total = 0
+    for recognizer in recognizers:
+        error = error_state(recognizer)
+        dfas = [flatten_dfa(dfa, error) for dfa in recognizer.decisionsToDFA]
+        total += sum(len(rows) for rows, _ in dfas)
+        buffer = io.BytesIO()
+        DFAPickler(buffer, recognizer).dump(dfas)
+        cache["recognizers"][recognizer.__name__] = (atn_fingerprint(recognizer), buffer.getvalue())
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp = path + ".tmp"
+    with open(temp, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, path)
+    return total
+
+
+def load_dfa_cache(path=DFA_CACHE_FILE, recognizers=RECOGNIZERS):
+    """
+    Load the DFAs saved in path into the recognizer classes.
+
+    Returns True when every recognizer was restored. Missing files, other
+    formats, caches built from another grammar or antlr4 runtime and caches
+    that do not decode leave the DFAs untouched and return False.
+    """
+    decoded = []
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+        if not isinstance(cache, dict) or cache.get("format") != CACHE_FORMAT:
+            return False
+        for recognizer in recognizers:
+            entry = cache.get("recognizers", {}).get(recognizer.__name__)
+            if entry is None or entry[0] != atn_fingerprint(recognizer):
+                return False
+            dfas = DFAUnpickler(io.BytesIO(entry[1]), recognizer).load()
+            if len(dfas) != len(recognizer.decisionsToDFA):
+                return False
+            error = error_state(recognizer)
+            for dfa, (rows, s0) in zip(recognizer.decisionsToDFA, dfas):
+                decoded.append((dfa, decode_dfa(dfa, rows, s0, error)))
+    except Exception:
+        # this runs on import: a cache of another runtime or layout must not break it
+        return False
+
+    for dfa, (states, s0) in decoded:
+        dfa._states = states
+        dfa.s0 = s0
+    return True
+
+
+def default_cache_path():
+    """The cache file to use, None when disabled through OPLANG_DFA_CACHE."""
+    path = os.environ.get(DFA_CACHE_ENV)
+    if path is None:
+        return DFA_CACHE_FILE
+    return path or None
+
+
+def load_default_dfa_cache():
+    """Load the default cache if there is one, see default_cache_path."""
+    path = default_cache_path()
+    if path is None or not os.path.exists(path):
+        return False
+    return load_dfa_cache(path)
+
+
+def train_dfa_cache(sources, mode=LL):
+    """Parse every source so the DFAs hold the states it needs. Errors are ignored."""
+    for source in sources:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        try:
+            run_program(parser, mode)
+        except Exception:
+            pass
@@ -0,0 +1,172 @@
+"""
+Hand-written lexer for the fast OPLang front end.
+
+Scans the source character by character and produces the same token
+sequence as the generated OPLangLexer: same longest-match rules, same
+skipped comments and whitespace, same lexer errors (ErrorToken,
+UncloseString, IllegalEscape) and the same line/column positions.
+
+Fixed tokens (keywords, operators, separators) use their own text as
+kind, the others use the ANTLR token name: IDENTIFIERS, INTLIT,
+FLOATLIT, STRINGLIT and EOF.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from lexererr import ErrorToken, UncloseString, IllegalEscape
+
+KEYWORDS = frozenset([
+    "boolean", "break", "class", "continue", "do", "else", "extends", "float",
+    "if", "int", "new", "string", "then", "for", "return", "true", "false",
+    "void", "nil", "this", "final", "static", "to", "downto",
+])
+
+# two-character operators are tried before their one-character prefixes
+OPERATORS_2 = frozenset(["!=", "==", "<=", ">=", "||", "&&", ":="])
+OPERATORS_1 = frozenset("+-*/\\%<>!^[]{}();:.,&~")
+
+ID_START = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'_")
+ID_PART = ID_START | frozenset("0123456789")
+DIGITS = frozenset("0123456789")
+WHITESPACE = frozenset(" \t\r\n\f")
+ESCAPES = frozenset('bfrnt"\\')
+
+
+class Token:
+    """One token: kind, text and the position of its first character."""
+
+    __slots__ = ("kind", "text", "line", "column")
+
+    def __init__(self, kind, text, line, column):
+        self.kind = kind
+        self.text = text
+        self.line = line
+        self.column = column
+
+    def __repr__(self):
+        return f"Token({self.kind!r}, {self.text!r}, {self.line}:{self.column})"
+
+
+def is_string_char(c):
+    # the grammar's ASCII fragment: 0-127 without newline, quote and backslash
+    return c < "\x80" and c not in '\n"\\'
+
+
+def tokenize(source):
+    """Return the list of tokens of source, ending with an EOF token."""
+    tokens = []
+    append = tokens.append
+    n = len(source)
+    i = 0
+    line = 1
+    line_start = 0  # index of the first character of the current line
+
+    while i < n:
+        c = source[i]
+
+        if c in WHITESPACE:
+            start = i
+            while i < n and source[i] in WHITESPACE:
+                i += 1
+            newlines = source.count("\n", start, i)
+            if newlines:
+                line += newlines
+                line_start = source.rindex("\n", start, i) + 1
+            continue
+
+        if c == "#":
+            while i < n and source[i] not in "\r\n":
+                i += 1
+            continue
+
+        if c == "/" and i + 1 < n and source[i + 1] == "*":
+            # body is (~'*' | '*' ~'/')*; the comment is closed only if the
+            # body stops at '*/', otherwise the unclosed-comment rule skips it
+            j = i + 2
+            while j < n:
+                if source[j] != "*":
+                    j += 1
+                elif j + 1 < n and source[j + 1] != "/":
+                    j += 2
+                else:
+                    break
+            if j + 1 < n and source[j] == "*":
+                j += 2
+            newlines = source.count("\n", i, j)
+            if newlines:
+                line += newlines
+                line_start = source.rindex("\n", i, j) + 1
+            i = j
+            continue
+
+        column = i - line_start
+
+        if c in ID_START:
+            j = i + 1
+            while j < n and source[j] in ID_PART:
+                j += 1
+            text = source[i:j]
+            append(Token(text if text in KEYWORDS else "IDENTIFIERS", text, line, column))
+            i = j
+            continue
+
+        if c in DIGITS:
+            j = i + 1
+            while j < n and source[j] in DIGITS:
+                j += 1
+            kind = "INTLIT"
+            if j < n and source[j] == ".":
+                kind = "FLOATLIT"
+                j += 1
+                while j < n and source[j] in DIGITS:
+                    j += 1
+            if j < n and source[j] in "eE":
+                k = j + 1
+                if k < n and source[k] in "+-":
+                    k += 1
+                if k < n and source[k] in DIGITS:
+                    while k < n and source[k] in DIGITS:
+                        k += 1
+                    kind = "FLOATLIT"
+                    j = k
+            append(Token(kind, source[i:j], line, column))
+            i = j
+            continue
+
+        if c == '"':
+            j = i + 1
+            while j < n:
+                d = source[j]
+                if d == "\\":
+                    if j + 1 >= n:
+                        break
+                    if source[j + 1] not in ESCAPES:
+                        raise IllegalEscape(source[i + 1:j + 2])
+                    j += 2
+                elif is_string_char(d):
+                    j += 1
+                else:
+                    break
+            if j < n and source[j] == '"':
+                append(Token("STRINGLIT", source[i + 1:j], line, column))
+                i = j + 1
+                continue
+            raise UncloseString(source[i + 1:j])
+
+        two = source[i:i + 2]
+        if two in OPERATORS_2:
+            append(Token(two, two, line, column))
+            i += 2
+            continue
+        if c in OPERATORS_1:
+            append(Token(c, c, line, column))
+            i += 1
+            continue
+
+        raise ErrorToken(c)
+
+    tokens.append(Token("EOF", "<EOF>", line, n - line_start))
+    return tokens
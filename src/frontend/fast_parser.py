@@ -0,0 +1,500 @@
+"""
+Hand-written recursive-descent parser for the fast OPLang front end.
+
+Parses the tokens of fast_lexer straight into src/utils/nodes.py objects,
+with no parse tree in between. The result is the same AST that
+ASTGeneration builds from the ANTLR parse tree, including its quirks
+(class-typed attributes and variables without initialiser get a
+NilLiteral, the trailing ':= expression' of a reference variable
+declaration initialises its last variable and that of a reference
+attribute declaration is parsed but dropped, copy constructors keep the
+parameter as a plain name). Binary expressions are parsed by precedence climbing.
+
+The parser accepts exactly the programs the grammar accepts but makes
+no attempt at ANTLR's error messages or recovery: the first problem
+raises FastParseError. Use src.frontend.backends.parse_source to get
+the reference error from the ANTLR parser in that case.
+"""
+
+from src.frontend.fast_lexer import tokenize
+from src.utils.nodes import *
+from src.utils.type_table import primitive_type, class_type, array_type, reference_type
+
+PRIMITIVE_TYPES = frozenset(["int", "float", "boolean", "string"])
+MEMBER_SPECS = frozenset(["static", "final"])
+RELATIONAL_OPERATORS = frozenset(["==", "!=", "<", ">", "<=", ">="])
+PREFIX_OPERATORS = frozenset(["+", "-", "!"])
+
+RELATIONAL = 3
+BINARY_PRECEDENCE = {
+    "||": 1,
+    "&&": 2,
+    "==": RELATIONAL, "!=": RELATIONAL, "<": RELATIONAL, ">": RELATIONAL, "<=": RELATIONAL, ">=": RELATIONAL,
+    "+": 4, "-": 4,
+    "*": 5, "/": 5, "\\": 5, "%": 5, "^": 5,
+}
+
+# tokens that can start an expression, the '{' of an array literal included
+EXPRESSION_START = frozenset([
+    "IDENTIFIERS", "INTLIT", "FLOATLIT", "STRINGLIT", "true", "false", "this", "new",
+    "(", "{", "+", "-", "!",
+])
+
+# postfixexp results, the only expressions that can be assigned to
+ASSIGNABLE = (Identifier, ThisExpression, ObjectCreation, ParenthesizedExpression, PostfixExpression)
+
+
+class FastParseError(Exception):
+    """The fast parser could not parse its input."""
+
+    def __init__(self, token, expected=None):
+        self.token = token
+        self.expected = expected
+        message = f"Error on line {token.line} col {token.column}: {token.text}"
+        if expected:
+            message += f" (expected {expected})"
+        super().__init__(message)
+
+
+class FastParser:
+    """Parses one token list into a Program."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.tok = tokens[0]
+
+    # ------------------------------------------------------------------
+    # token helpers
+    # ------------------------------------------------------------------
+
+    def advance(self):
+        tok = self.tok
+        if tok.kind != "EOF":
+            self.pos += 1
+            self.tok = self.tokens[self.pos]
+        return tok
+
+    def peek(self, offset=1):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else self.tokens[-1]
+
+    def expect(self, kind):
+        if self.tok.kind != kind:
+            raise FastParseError(self.tok, kind)
+        return self.advance()
+
+    def accept(self, kind):
+        if self.tok.kind == kind:
+            return self.advance()
+        return None
+
+    def reset(self, pos):
+        self.pos = pos
+        self.tok = self.tokens[pos]
+
+    # ------------------------------------------------------------------
+    # declarations
+    # ------------------------------------------------------------------
+
+    def parse_program(self):
+        class_decls = [self.parse_class_decl()]
+        while self.tok.kind == "class":
+            class_decls.append(self.parse_class_decl())
+        self.expect("EOF")
+        return Program(class_decls)
+
+    def parse_class_decl(self):
+        self.expect("class")
+        name = self.expect("IDENTIFIERS").text
+        superclass = None
+        if self.accept("extends"):
+            superclass = self.expect("IDENTIFIERS").text
+        self.expect("{")
+        members = []
+        while self.tok.kind != "}":
+            members.append(self.parse_class_member())
+        self.advance()
+        return ClassDecl(name, superclass, members)
+
+    def parse_class_member(self):
+        if self.tok.kind == "~":
+            return self.parse_destructor()
+        if self.tok.kind == "IDENTIFIERS" and self.peek().kind == "(":
+            return self.parse_constructor()
+
+        specs = []
+        while self.tok.kind in MEMBER_SPECS:
+            specs.append(self.advance())
+        if self.tok.kind == "void":
+            return self.parse_method(specs, primitive_type(self.advance().text))
+
+        base = self.tok
+        var_type = self.parse_vartype()
+        tok = self.tok
+        if tok.kind == "&":
+            next_tok = self.peek()
+            if next_tok.kind == "IDENTIFIERS" and self.peek(2).kind == "(" and not isinstance(var_type, ArrayType):
+                self.advance()
+                return self.parse_method(specs, reference_type(var_type))
+            if len(specs) > 2:
+                raise FastParseError(specs[2])
+            self.advance()
+            return self.parse_reference_attribute(specs, var_type)
+        if tok.kind == "IDENTIFIERS" and self.peek().kind == "(":
+            return self.parse_method(specs, var_type)
+        if len(specs) > 2:
+            raise FastParseError(specs[2])
+        return self.parse_attribute(specs, var_type)
+
+    def parse_attribute(self, specs, attr_type):
+        attributes = self.parse_attribute_list()
+        self.expect(";")
+        if isinstance(attr_type, ClassType):
+            for x in attributes:
+                if x.init_value == None:
+                    x.init_value = NilLiteral()
+        kinds = [x.kind for x in specs]
+        return AttributeDecl("static" in kinds, "final" in kinds, attr_type, attributes)
+
+    def parse_reference_attribute(self, specs, attr_type):
+        attributes = self.parse_attribute_list()
+        self.parse_trailing_assignment(attributes)
+        kinds = [x.kind for x in specs]
+        return AttributeDecl("static" in kinds, "final" in kinds, reference_type(attr_type), attributes)
+
+    def parse_attribute_list(self):
+        attributes = [self.parse_attribute_unit()]
+        while self.accept(","):
+            attributes.append(self.parse_attribute_unit())
+        return attributes
+
+    def parse_attribute_unit(self):
+        name = self.expect("IDENTIFIERS").text
+        if self.accept(":="):
+            return Attribute(name, self.parse_expression())
+        return Attribute(name)
+
+    def parse_trailing_assignment(self, units):
+        # reference declarations end with ':= expression ;', returned here;
+        # when the list is followed by ';' the last unit's own initialiser
+        # was that trailing assignment
+        if self.accept(":="):
+            value = self.parse_expression()
+        elif units[-1].init_value is not None and self.tok.kind == ";":
+            value, units[-1].init_value = units[-1].init_value, None
+        else:
+            raise FastParseError(self.tok, ":=")
+        self.expect(";")
+        return value
+
+    def parse_method(self, specs, return_type):
+        if len(specs) > 1:
+            raise FastParseError(specs[1])
+        name = self.expect("IDENTIFIERS").text
+        params = self.parse_param_list()
+        body = self.parse_block()
+        is_static = bool(specs) and specs[0].kind == "static"
+        return MethodDecl(is_static, return_type, name, params, body)
+
+    def parse_constructor(self):
+        name = self.advance().text
+        if self.peek().kind == ")":
+            self.advance()
+            self.advance()
+            return ConstructorDecl(name, [], self.parse_block())
+        if self.peek().kind == "IDENTIFIERS" and self.peek(2).kind == ")":
+            self.advance()
+            copy = self.advance().text
+            self.advance()
+            return ConstructorDecl(name, [copy], self.parse_block())
+        params = self.parse_param_list()
+        return ConstructorDecl(name, params, self.parse_block())
+
+    def parse_destructor(self):
+        self.expect("~")
+        name = self.expect("IDENTIFIERS").text
+        self.expect("(")
+        self.expect(")")
+        return DestructorDecl(name, self.parse_block())
+
+    def parse_param_list(self):
+        self.expect("(")
+        params = []
+        if self.tok.kind != ")":
+            params.extend(self.parse_parameter())
+            while self.accept(";"):
+                params.extend(self.parse_parameter())
+        self.expect(")")
+        return params
+
+    def parse_parameter(self):
+        param_type = self.parse_vartype()
+        if self.accept("&"):
+            param_type = reference_type(param_type)
+        names = [self.expect("IDENTIFIERS").text]
+        while self.accept(","):
+            names.append(self.expect("IDENTIFIERS").text)
+        return [Parameter(param_type, x) for x in names]
+
+    def parse_vartype(self):
+        tok = self.tok
+        if tok.kind in PRIMITIVE_TYPES:
+            element = primitive_type(tok.text)
+        elif tok.kind == "IDENTIFIERS":
+            element = class_type(tok.text)
+        else:
+            raise FastParseError(tok, "type")
+        self.advance()
+        # an '&' directly followed by '[' belongs to the element type
+        if self.tok.kind == "&" and self.peek().kind == "[":
+            self.advance()
+            element = reference_type(element)
+            return self.parse_array_size(element)
+        if self.tok.kind == "[":
+            return self.parse_array_size(element)
+        return element
+
+    def parse_array_size(self, element):
+        self.expect("[")
+        size = int(self.expect("INTLIT").text)
+        self.expect("]")
+        return array_type(element, size)
+
+    # ------------------------------------------------------------------
+    # statements
+    # ------------------------------------------------------------------
+
+    def parse_block(self):
+        self.expect("{")
+        var_decls = []
+        while self.at_var_decl():
+            var_decls.append(self.parse_var_decl())
+        statements = []
+        while self.tok.kind != "}":
+            statements.append(self.parse_statement())
+        self.advance()
+        return BlockStatement(var_decls, statements)
+
+    def at_var_decl(self):
+        kind = self.tok.kind
+        if kind == "final" or kind in PRIMITIVE_TYPES:
+            return True
+        if kind != "IDENTIFIERS":
+            return False
+        # Type name, Type& ..., Type[N] name, Type[N]& ...
+        next_kind = self.peek().kind
+        if next_kind in ("IDENTIFIERS", "&"):
+            return True
+        return (
+            next_kind == "["
+            and self.peek(2).kind == "INTLIT"
+            and self.peek(3).kind == "]"
+            and self.peek(4).kind in ("IDENTIFIERS", "&")
+        )
+
+    def parse_var_decl(self):
+        is_final = self.accept("final") is not None
+        var_type = self.parse_vartype()
+        if self.accept("&"):
+            variables = [self.parse_variable()]
+            while self.accept(","):
+                variables.append(self.parse_variable())
+            variables[-1].init_value = self.parse_trailing_assignment(variables)
+            return VariableDecl(is_final, reference_type(var_type), variables)
+        variables = [self.parse_variable()]
+        while self.accept(","):
+            variables.append(self.parse_variable())
+        self.expect(";")
+        if isinstance(var_type, ClassType):
+            for x in variables:
+                if x.init_value == None:
+                    x.init_value = NilLiteral()
+        return VariableDecl(is_final, var_type, variables)
+
+    def parse_variable(self):
+        name = self.expect("IDENTIFIERS").text
+        if self.accept(":="):
+            return Variable(name, self.parse_expression())
+        return Variable(name)
+
+    def parse_statement(self):
+        kind = self.tok.kind
+        if kind == "{":
+            if self.at_array_literal_statement():
+                return self.parse_expression_statement()
+            return self.parse_block()
+        if kind == "if":
+            return self.parse_if()
+        if kind == "for":
+            return self.parse_for()
+        if kind == "break":
+            self.advance()
+            self.expect(";")
+            return BreakStatement()
+        if kind == "continue":
+            self.advance()
+            self.expect(";")
+            return ContinueStatement()
+        if kind == "return":
+            self.advance()
+            value = self.parse_expression()
+            self.expect(";")
+            return ReturnStatement(value)
+        return self.parse_expression_statement()
+
+    def at_array_literal_statement(self):
+        # '{' starts a block unless it reads as a complete array literal
+        # followed by ';' or ':=' (an expression statement)
+        if self.peek().kind == "}":
+            return False
+        start = self.pos
+        try:
+            self.parse_expression()
+            return self.tok.kind in (";", ":=")
+        except FastParseError:
+            return False
+        finally:
+            self.reset(start)
+
+    def parse_expression_statement(self):
+        target = self.parse_expression()
+        if self.tok.kind == ":=":
+            if not isinstance(target, ASSIGNABLE):
+                raise FastParseError(self.tok, ";")
+            self.advance()
+            value = self.parse_expression()
+            self.expect(";")
+            if isinstance(target, Identifier):
+                return AssignmentStatement(IdLHS(target.name), value)
+            return AssignmentStatement(PostfixLHS(target), value)
+        self.expect(";")
+        return MethodInvocationStatement(target)
+
+    def parse_if(self):
+        self.expect("if")
+        condition = self.parse_expression()
+        self.expect("then")
+        then_stmt = self.parse_statement()
+        else_stmt = None
+        if self.accept("else"):
+            else_stmt = self.parse_statement()
+        return IfStatement(condition, then_stmt, else_stmt)
+
+    def parse_for(self):
+        self.expect("for")
+        variable = self.expect("IDENTIFIERS").text
+        self.expect(":=")
+        start = self.parse_expression()
+        if self.tok.kind not in ("to", "downto"):
+            raise FastParseError(self.tok, "to or downto")
+        direction = self.advance().text
+        end = self.parse_expression()
+        self.expect("do")
+        return ForStatement(variable, start, direction, end, self.parse_statement())
+
+    # ------------------------------------------------------------------
+    # expressions
+    # ------------------------------------------------------------------
+
+    def parse_expression(self, min_precedence=1):
+        left = self.parse_unary()
+        while True:
+            op = self.tok.kind
+            precedence = BINARY_PRECEDENCE.get(op)
+            if precedence is None or precedence < min_precedence:
+                return left
+            self.advance()
+            right = self.parse_expression(precedence + 1)
+            left = BinaryOp(left, op, right)
+            # relational operators do not chain: a < b < c is a syntax error
+            if precedence == RELATIONAL and self.tok.kind in RELATIONAL_OPERATORS:
+                raise FastParseError(self.tok)
+
+    def parse_unary(self):
+        operators = []
+        while self.tok.kind in PREFIX_OPERATORS:
+            operators.append(self.advance().text)
+        result = self.parse_operand()
+        for op in reversed(operators):
+            result = UnaryOp(op, result)
+        return result
+
+    def parse_operand(self):
+        tok = self.tok
+        kind = tok.kind
+        if kind == "INTLIT":
+            self.advance()
+            return IntLiteral(int(tok.text))
+        if kind == "FLOATLIT":
+            self.advance()
+            return FloatLiteral(float(tok.text))
+        if kind == "STRINGLIT":
+            self.advance()
+            return StringLiteral(tok.text)
+        if kind == "true" or kind == "false":
+            self.advance()
+            return BoolLiteral(kind == "true")
+        if kind == "{":
+            self.advance()
+            elements = [self.parse_expression()]
+            while self.accept(","):
+                elements.append(self.parse_expression())
+            self.expect("}")
+            return ArrayLiteral(elements)
+        return self.parse_postfix()
+
+    def parse_postfix(self):
+        tok = self.tok
+        kind = tok.kind
+        if kind == "IDENTIFIERS":
+            self.advance()
+            primary = Identifier(tok.text)
+        elif kind == "this":
+            self.advance()
+            primary = ThisExpression()
+        elif kind == "new":
+            self.advance()
+            name = self.expect("IDENTIFIERS").text
+            primary = ObjectCreation(name, self.parse_arguments())
+        elif kind == "(":
+            self.advance()
+            primary = ParenthesizedExpression(self.parse_expression())
+            self.expect(")")
+        else:
+            raise FastParseError(tok, "expression")
+
+        ops = []
+        while True:
+            kind = self.tok.kind
+            if kind == ".":
+                self.advance()
+                name = self.expect("IDENTIFIERS").text
+                if self.tok.kind == "(":
+                    ops.append(MethodCall(name, self.parse_arguments()))
+                else:
+                    ops.append(MemberAccess(name))
+            elif kind == "[":
+                self.advance()
+                ops.append(ArrayAccess(self.parse_expression()))
+                self.expect("]")
+            else:
+                break
+        if ops:
+            return PostfixExpression(primary, ops)
+        return primary
+
+    def parse_arguments(self):
+        self.expect("(")
+        args = []
+        if self.tok.kind != ")":
+            args.append(self.parse_expression())
+            while self.accept(","):
+                args.append(self.parse_expression())
+        self.expect(")")
+        return args
+
+
+def parse(source):
+    """Tokenize and parse source, return its Program."""
+    return FastParser(tokenize(source)).parse_program()
@@ -0,0 +1,116 @@
+"""
+Prediction-mode aware parsing for OPLang.
+
+ANTLR's default full-LL prediction is the safest but slowest mode. SLL
+prediction ignores the outer parser context, which is much cheaper and
+gives the same parse tree whenever it succeeds. The two-stage mode first
+parses with SLL and a bail-out error strategy, and only reparses with
+full LL (and the caller's error handling) when SLL reports an error.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from antlr4.PredictionContext import PredictionContextCache
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.dfa.DFA import DFA
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from lexererr import LexerError
+
+LL = "ll"
+SLL = "sll"
+TWO_STAGE = "two-stage"
+PARSE_MODES = (LL, SLL, TWO_STAGE)
+
+
+class ParseStats:
+    """Counters for parses run through run_program."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.parses = 0         # every call to run_program
+        self.sll_attempts = 0   # first stage of two-stage parses
+        self.sll_successes = 0  # two-stage parses finished by SLL alone
+        self.ll_fallbacks = 0   # two-stage parses that had to rerun with full LL
+
+    @property
+    def fallback_rate(self):
+        return self.ll_fallbacks / self.sll_attempts if self.sll_attempts else 0.0
+
+    def __str__(self):
+        return (f"ParseStats(parses={self.parses}, sll_attempts={self.sll_attempts}, "
+                f"sll_successes={self.sll_successes}, ll_fallbacks={self.ll_fallbacks})")
+
+
+PARSE_STATS = ParseStats()
+
+
+def clear_dfa_caches(*recognizer_classes):
+    """
+    Drop the prediction DFAs shared by every instance of the given generated
+    lexer/parser classes, so the next parse starts cold.
+    """
+    for recognizer in recognizer_classes:
+        dfas = recognizer.decisionsToDFA
+        for i in range(len(dfas)):
+            dfas[i] = DFA(recognizer.atn.getDecisionState(i), i)
+        if hasattr(recognizer, "sharedContextCache"):
+            recognizer.sharedContextCache = PredictionContextCache()
+
+
+def run_program(parser, mode=LL, stats=PARSE_STATS):
+    """
+    Run parser.program() in the given prediction mode and return the parse tree.
+
+    Args:
+        parser: an OPLangParser with its token stream and error listeners set up
+        mode: LL (default full-LL), SLL, or TWO_STAGE (SLL first, LL on error)
+        stats: ParseStats that records the run
+
+    In TWO_STAGE mode errors are only reported by the LL stage, so the
+    caller's error listeners see exactly what a plain LL parse reports.
+    """
+    if mode not in PARSE_MODES:
+        raise ValueError(f"unknown parse mode {mode!r}, expected one of {PARSE_MODES}")
+    stats.parses += 1
+    if mode == LL:
+        parser._interp.predictionMode = PredictionMode.LL
+        return parser.program()
+    if mode == SLL:
+        parser._interp.predictionMode = PredictionMode.SLL
+        return parser.program()
+
+    stats.sll_attempts += 1
+    listeners = parser._listeners
+    handler = parser._errHandler
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    relex = False
+    try:
+        tree = parser.program()
+        stats.sll_successes += 1
+        return tree
+    except ParseCancellationException:
+        pass
+    except LexerError:
+        relex = True
+    finally:
+        parser._listeners = listeners
+        parser._errHandler = handler
+
+    stats.ll_fallbacks += 1
+    token_stream = parser.getTokenStream()
+    if relex:
+        # the lexer stopped half way through, lex again from the start
+        token_stream.tokenSource.reset()
+        token_stream.setTokenSource(token_stream.tokenSource)
+    # tokens are buffered in the stream, rewinding is enough to parse them again
+    parser.reset()
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program()
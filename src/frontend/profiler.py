@@ -0,0 +1,217 @@
+"""
+Grammar decision profiling for OPLang.
+
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module
+provides one. It is attached to an OPLangParser in place of the normal
+ParserATNSimulator and records, for every decision that goes through
+adaptivePredict, how often it ran and how many tokens of lookahead it
+needed. Decisions ANTLR generates as plain LL(1) switches never call
+adaptivePredict and are not listed.
+
+Run it over a corpus to get the ranked hot-decision report:
+
+    python -m src.frontend.profiler [FILE|DIR ...] [--output report.txt]
+
+Without paths the programs of the test suite are profiled.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+from lexererr import LexerError
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+
+PREDICTION_MODES = {"ll": PredictionMode.LL, "sll": PredictionMode.SLL}
+
+
+class DecisionInfo:
+    """Counters for one grammar decision."""
+
+    def __init__(self, decision, rule_name):
+        self.decision = decision
+        self.rule_name = rule_name
+        self.invocations = 0
+        self.time_ns = 0            # time spent in adaptivePredict
+        self.sll_total_look = 0     # tokens examined by SLL prediction
+        self.sll_max_look = 0
+        self.ll_total_look = 0      # tokens examined after falling back to full LL
+        self.ll_max_look = 0
+        self.ll_fallbacks = 0       # SLL conflicts that needed full-context prediction
+        self.ambiguities = 0
+        self.context_sensitivities = 0
+        self.errors = 0             # predictions that hit a syntax error
+
+    @property
+    def total_look(self):
+        return self.sll_total_look + self.ll_total_look
+
+    @property
+    def max_look(self):
+        return max(self.sll_max_look, self.ll_max_look)
+
+    @property
+    def average_look(self):
+        return self.total_look / self.invocations if self.invocations else 0.0
+
+    def __str__(self):
+        return (f"DecisionInfo({self.decision}, {self.rule_name}, invocations={self.invocations}, "
+                f"total_look={self.total_look}, max_look={self.max_look}, "
+                f"ll_fallbacks={self.ll_fallbacks}, ambiguities={self.ambiguities})")
+
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """ParserATNSimulator that fills one DecisionInfo per decision."""
+
+    def __init__(self, parser, decisions=None):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        if decisions is None:
+            decisions = [
+                DecisionInfo(i, parser.ruleNames[parser.atn.getDecisionState(i).ruleIndex])
+                for i in range(len(parser.atn.decisionToState))
+            ]
+        self.decisions = decisions
+        self._currentDecision = -1
+        self._sllStopIndex = -1
+        self._llStopIndex = -1
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self._currentDecision = decision
+        self._sllStopIndex = -1
+        self._llStopIndex = -1
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info = self.decisions[decision]
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            if self._sllStopIndex >= 0:
+                look = self._sllStopIndex - self._startIndex + 1
+                info.sll_total_look += look
+                info.sll_max_look = max(info.sll_max_look, look)
+            if self._llStopIndex >= 0:
+                look = self._llStopIndex - self._startIndex + 1
+                info.ll_total_look += look
+                info.ll_max_look = max(info.ll_max_look, look)
+                info.ll_fallbacks += 1
+            self._currentDecision = -1
+
+    def getExistingTargetState(self, previousD, t):
+        # called once per SLL lookahead token, cached or not
+        self._sllStopIndex = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is self.ERROR:
+            self.decisions[self._currentDecision].errors += 1
+        return existing
+
+    def computeTargetState(self, dfa, previousD, t):
+        state = super().computeTargetState(dfa, previousD, t)
+        if state is self.ERROR:
+            self.decisions[self._currentDecision].errors += 1
+        return state
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            self._llStopIndex = self._input.index
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self.decisions[self._currentDecision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[self._currentDecision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def profile_sources(sources, mode=PredictionMode.LL):
+    """
+    Parse every source with a ProfilingATNSimulator attached and return the
+    list of DecisionInfo, indexed by decision number.
+
+    Syntax errors are recovered silently and lexer errors end that input,
+    so failing programs are profiled up to where they fail.
+    """
+    decisions = None
+    for source in sources:
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser._interp = ProfilingATNSimulator(parser, decisions)
+        parser._interp.predictionMode = mode
+        decisions = parser._interp.decisions
+        try:
+            parser.program()
+        except LexerError:
+            pass
+    if decisions is None:
+        parser = OPLangParser(None)
+        decisions = ProfilingATNSimulator(parser).decisions
+    return decisions
+
+
+def rank_decisions(decisions):
+    """Decisions that ran at least once, most total lookahead first."""
+    used = [d for d in decisions if d.invocations]
+    return sorted(used, key=lambda d: (-d.total_look, -d.ll_fallbacks, -d.invocations, d.decision))
+
+
+def format_report(decisions, inputs, top=None):
+    """Render the ranked hot-decision report as text."""
+    ranked = rank_decisions(decisions)
+    shown = ranked[:top] if top else ranked
+    headers = ["rank", "decision", "rule", "invocations", "total look", "avg look",
+               "max look", "SLL->LL", "ambiguities", "time ms"]
+    rows = [
+        [i, d.decision, d.rule_name, d.invocations, d.total_look, f"{d.average_look:.2f}",
+         d.max_look, d.ll_fallbacks, d.ambiguities, f"{d.time_ns / 1e6:.1f}"]
+        for i, d in enumerate(shown, 1)
+    ]
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(str(c))) for w, c in zip(widths, row)]
+
+    lines = [
+        "OPLang grammar decision profile",
+        f"inputs: {inputs}, decisions: {len(decisions)}, predicted: {len(ranked)}, "
+        f"LL(1) or unused: {len(decisions) - len(ranked)}",
+        f"predictions: {sum(d.invocations for d in ranked)}, "
+        f"total lookahead: {sum(d.total_look for d in ranked)}, "
+        f"SLL->LL fallbacks: {sum(d.ll_fallbacks for d in ranked)}, "
+        f"ambiguities: {sum(d.ambiguities for d in ranked)}",
+        "",
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)),
+        "  ".join("-" * w for w in widths),
+    ]
+    lines += ["  ".join(str(c).ljust(w) for c, w in zip(row, widths)).rstrip() for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    from src.frontend.corpus import load_corpus_files, load_test_corpus
+
+    arg_parser = argparse.ArgumentParser(description="Rank OPLang grammar decisions by lookahead cost.")
+    arg_parser.add_argument("paths", nargs="*", help="OPLang files or directories (default: the test programs)")
+    arg_parser.add_argument("--output", "-o", help="write the report to this file as well")
+    arg_parser.add_argument("--mode", choices=sorted(PREDICTION_MODES), default="ll")
+    arg_parser.add_argument("--top", type=int, default=None, help="only list the N hottest decisions")
+    args = arg_parser.parse_args(argv)
+
+    sources = load_corpus_files(args.paths) if args.paths else load_test_corpus()
+    report = format_report(profile_sources(sources, PREDICTION_MODES[args.mode]), len(sources), args.top)
+    print(report, end="")
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+Table-driven regex lexer for OPLang.
+
+The lexer rules of src/grammar/OPLang.g4 are translated into Python
+regular expressions and combined into one master pattern with a named
+group per rule. Each token is then a single master.match() call instead
+of a walk through the ANTLR lexer ATN.
+
+ANTLR picks the longest match and breaks ties by rule order, while a
+regex alternation takes the first alternative that matches, so the
+master pattern is ordered to give the same answer:
+
+- fixed-text rules that the identifier rule also matches (the keywords)
+  are not alternatives of their own, they are looked up in a table once
+  an identifier has matched
+- a rule that extends an earlier rule's match (FLOATLIT after INTLIT)
+  is tried before it
+- the remaining fixed-text rules (operators, separators) come after the
+  pattern rules as one alternative, longest text first
+- catch-all rules ('.') come last
+
+RegexLexer is a drop-in TokenSource: it takes an InputStream, emits the
+same CommonTokens as OPLangLexer (types, texts, positions) and raises
+the same lexer errors, so it can feed a CommonTokenStream and the
+generated parser.
+"""
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from antlr4 import InputStream
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Token import Token
+from lexererr import ErrorToken, UncloseString, IllegalEscape
+
+GRAMMAR_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "grammar", "OPLang.g4")
+
+# what the rule actions of OPLang.g4 do to a token: cut its text and, for
+# the error rules, raise it through emit()
+TEXT_SLICES = {
+    "STRINGLIT": slice(1, -1),
+    "ILLEGAL_ESCAPE": slice(1, None),
+    "UNCLOSE_STRING": slice(1, None),
+}
+ERROR_RULES = {
+    "ILLEGAL_ESCAPE": IllegalEscape,
+    "UNCLOSE_STRING": UncloseString,
+    "ERROR_CHAR": ErrorToken,
+}
+
+LITERALS_GROUP = "literal"
+
+ANTLR_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f"}
+
+
+class LexerRule:
+    """One lexer rule of the grammar, translated to a regex."""
+
+    def __init__(self, name, regex, type=None, literal=None, skip=False):
+        self.name = name
+        self.regex = regex
+        self.type = type          # token type, None for fragments
+        self.literal = literal    # the text of a rule that is a single string literal
+        self.skip = skip
+
+    @property
+    def alternatives(self):
+        return split_alternatives(self.regex)
+
+
+# ----------------------------------------------------------------------
+# grammar reading
+# ----------------------------------------------------------------------
+
+def read_grammar_elements(text):
+    """Split a .g4 file into (kind, value) elements, dropping comments."""
+    elements = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c.isspace():
+            i += 1
+        elif text.startswith("//", i):
+            i = text.find("\n", i)
+            i = n if i < 0 else i
+        elif text.startswith("/*", i):
+            i = text.index("*/", i) + 2
+        elif c == "'":
+            j = i + 1
+            while text[j] != "'":
+                j += 2 if text[j] == "\\" else 1
+            elements.append(("string", text[i + 1:j]))
+            i = j + 1
+        elif c == "[":
+            j = i + 1
+            while text[j] != "]":
+                j += 2 if text[j] == "\\" else 1
+            elements.append(("set", text[i + 1:j]))
+            i = j + 1
+        elif c == "{":
+            depth = 0
+            j = i
+            while True:
+                if text[j] == "{":
+                    depth += 1
+                elif text[j] == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j += 1
+            elements.append(("action", text[i + 1:j]))
+            i = j + 1
+        elif c.isalpha() or c == "_":
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            elements.append(("name", text[i:j]))
+            i = j
+        elif text.startswith("->", i):
+            elements.append(("op", "->"))
+            i += 2
+        else:
+            elements.append(("op", c))
+            i += 1
+    return elements
+
+
+def unescape(text):
+    """Resolve the escapes of an ANTLR string literal or set."""
+    out = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c == "\\":
+            e = text[i + 1]
+            if e == "u":
+                out.append(chr(int(text[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append(ANTLR_ESCAPES.get(e, e))
+            i += 2
+            continue
+        out.append(c)
+        i += 1
+    return out
+
+
+def set_to_regex(chars, negated=False):
+    parts = []
+    i = 0
+    while i < len(chars):
+        if i + 2 < len(chars) and chars[i + 1] == "-":
+            parts.append(f"{re.escape(chars[i])}-{re.escape(chars[i + 2])}")
+            i += 3
+        else:
+            parts.append(re.escape(chars[i]))
+            i += 1
+    return ("[^" if negated else "[") + "".join(parts) + "]"
+
+
+def split_alternatives(regex):
+    """Top-level alternatives of a regex built by this module."""
+    alternatives = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(regex):
+        c = regex[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i = regex.index("]", i + 2 if regex.startswith("[^", i) else i + 1) + 1
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            alternatives.append(regex[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(regex[start:])
+    return alternatives
+
+
+class RuleTranslator:
+    """Translates the element list of one lexer rule body into a regex."""
+
+    def __init__(self, elements, fragments):
+        self.elements = elements
+        self.fragments = fragments
+        self.pos = 0
+
+    def peek(self):
+        return self.elements[self.pos] if self.pos < len(self.elements) else ("op", ";")
+
+    def alternation(self):
+        alternatives = [self.sequence()]
+        while self.peek() == ("op", "|"):
+            self.pos += 1
+            alternatives.append(self.sequence())
+        return "|".join(alternatives)
+
+    def sequence(self):
+        parts = []
+        while self.peek() not in (("op", "|"), ("op", ")"), ("op", ";"), ("op", "->")):
+            kind, value = self.peek()
+            self.pos += 1
+            if kind == "action":
+                # embedded actions and predicates do not change what is matched
+                if self.peek() == ("op", "?"):
+                    self.pos += 1
+                continue
+            atom = self.atom(kind, value)
+            if self.peek()[0] == "op" and self.peek()[1] in "*+?":
+                atom = f"(?:{atom}){self.peek()[1]}"
+                self.pos += 1
+            parts.append(atom)
+        return "".join(parts)
+
+    def atom(self, kind, value):
+        if kind == "string":
+            return re.escape("".join(unescape(value)))
+        if kind == "set":
+            return set_to_regex(unescape(value))
+        if kind == "name":
+            return f"(?:{self.fragments[value]})"
+        if (kind, value) == ("op", "~"):
+            kind, value = self.peek()
+            self.pos += 1
+            # ~[set] or ~'c'
+            return set_to_regex(unescape(value), negated=True)
+        if (kind, value) == ("op", "."):
+            return r"[\s\S]"
+        if (kind, value) == ("op", "("):
+            inner = self.alternation()
+            self.pos += 1  # ')'
+            return f"(?:{inner})"
+        raise ValueError(f"unsupported lexer rule element {value!r}")
+
+
+def read_lexer_rules(grammar_file=GRAMMAR_FILE):
+    """
+    Return the token rules of the grammar in definition order, with their
+    ANTLR token types. Fragments are inlined and not returned.
+    """
+    with open(grammar_file, encoding="utf-8") as f:
+        elements = read_grammar_elements(f.read())
+
+    fragments = {}
+    rules = []
+    i = 0
+    while i < len(elements):
+        kind, value = elements[i]
+        is_fragment = (kind, value) == ("name", "fragment")
+        if is_fragment:
+            i += 1
+            kind, value = elements[i]
+        if (kind, value) == ("op", "@"):
+            # named actions: @lexer::header { ... }
+            while elements[i][0] != "action":
+                i += 1
+            i += 1
+        elif kind == "name" and elements[i + 1] == ("op", ":"):
+            end = i + 2
+            while elements[end] != ("op", ";"):
+                end += 1
+            body = elements[i + 2:end]
+            if value[0].isupper():
+                translator = RuleTranslator(body, fragments)
+                regex = translator.alternation()
+                skip = ("op", "->") in body and ("name", "skip") in body
+                if is_fragment:
+                    fragments[value] = regex
+                else:
+                    literal = None
+                    if len([e for e in body if e[0] != "action"]) == 1 and body[0][0] == "string":
+                        literal = "".join(unescape(body[0][1]))
+                    rules.append(LexerRule(value, regex, len(rules) + 1, literal, skip))
+            i = end + 1
+        else:
+            i += 1
+    return rules
+
+
+# ----------------------------------------------------------------------
+# master pattern
+# ----------------------------------------------------------------------
+
+class LexerTables:
+    """The master pattern plus the lookup tables that go with it."""
+
+    def __init__(self, rules):
+        self.rules = {rule.name: rule for rule in rules}
+        self.keywords = {}        # group name -> {text: token type}
+        self.literals = {}        # text -> token type for the literal group
+
+        pattern_rules = [r for r in rules if r.literal is None]
+        catch_all = [r for r in pattern_rules if r.regex == r"[\s\S]"]
+        pattern_rules = [r for r in pattern_rules if r not in catch_all]
+
+        for rule in rules:
+            if rule.literal is None:
+                continue
+            owner = next((r for r in pattern_rules if re.fullmatch(r.regex, rule.literal)), None)
+            if owner is None:
+                self.literals[rule.literal] = rule.type
+            elif rules.index(rule) < rules.index(owner):
+                # ties go to the earlier rule: the keyword
+                self.keywords.setdefault(owner.name, {})[rule.literal] = rule.type
+
+        ordered = []
+        for rule in pattern_rules:
+            # a rule that can extend the match of an earlier one must be tried first
+            index = next(
+                (k for k, earlier in enumerate(ordered)
+                 if any(alt.startswith(earlier.regex) and alt != earlier.regex for alt in rule.alternatives)),
+                len(ordered),
+            )
+            ordered.insert(index, rule)
+
+        groups = [f"(?P<{r.name}>{r.regex})" for r in ordered]
+        if self.literals:
+            texts = sorted(self.literals, key=len, reverse=True)
+            groups.append(f"(?P<{LITERALS_GROUP}>" + "|".join(re.escape(t) for t in texts) + ")")
+        groups += [f"(?P<{r.name}>{r.regex})" for r in catch_all]
+        self.order = [r.name for r in ordered] + ([LITERALS_GROUP] if self.literals else []) + [r.name for r in catch_all]
+        self.master = re.compile("|".join(groups))
+        # per group number: (token type, keyword table, skip, text slice, error)
+        self.actions = [None]
+        for name in self.order:
+            if name == LITERALS_GROUP:
+                self.actions.append((None, None, False, None, None))
+                continue
+            rule = self.rules[name]
+            self.actions.append((rule.type, self.keywords.get(name), rule.skip,
+                                 TEXT_SLICES.get(name), ERROR_RULES.get(name)))
+
+
+_tables = None
+
+
+def lexer_tables():
+    """The LexerTables of OPLang.g4, built on first use."""
+    global _tables
+    if _tables is None:
+        _tables = LexerTables(read_lexer_rules())
+    return _tables
+
+
+def scan(source, tables=None):
+    """
+    Yield (type, text, start, stop, line, column) for every token of source
+    that is not skipped, in order. Lexer errors are raised when the
+    scanner reaches them, after every token before them has been yielded.
+    """
+    tables = tables or lexer_tables()
+    actions = tables.actions
+    literals = tables.literals
+    line = 1
+    line_start = 0
+    # the catch-all rule matches any character, so the matches are contiguous
+    for m in tables.master.finditer(source):
+        token_type, keywords, skip, cut, error = actions[m.lastindex]
+        text = m.group()
+        start = m.start()
+        if not skip:
+            if error is not None:
+                raise error(text[cut] if cut else text)
+            if token_type is None:
+                token_type = literals[text]
+            elif keywords is not None:
+                token_type = keywords.get(text, token_type)
+            yield token_type, text[cut] if cut else text, start, m.end() - 1, line, start - line_start
+        if "\n" in text:
+            line += text.count("\n")
+            line_start = start + text.rindex("\n") + 1
+
+
+class RegexLexer:
+    """TokenSource over scan(), interchangeable with OPLangLexer."""
+
+    def __init__(self, input=None):
+        self._factory = CommonTokenFactory.DEFAULT
+        self.inputStream = input
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    @inputStream.setter
+    def inputStream(self, input):
+        # like OPLangLexer, a new input restarts the lexer
+        if isinstance(input, str):
+            input = InputStream(input)
+        self._input = input
+        self._source = (self, input)
+        self.reset()
+
+    def reset(self):
+        self._tokens = scan(self._input.strdata) if self._input is not None else iter(())
+        self.line = 1
+        self.column = 0
+        self._eof = None
+
+    def getInputStream(self):
+        return self._input
+
+    def getSourceName(self):
+        return self._input.getSourceName() if self._input is not None else "<unknown>"
+
+    def nextToken(self):
+        if self._eof is not None:
+            return self._eof
+        for token_type, text, start, stop, line, column in self._tokens:
+            self.line = line
+            self.column = column
+            return self._factory.create(self._source, token_type, text, Token.DEFAULT_CHANNEL, start, stop, line, column)
+        data = self._input.strdata if self._input is not None else ""
+        newline = data.rfind("\n")
+        self.line = data.count("\n") + 1
+        self.column = len(data) - newline - 1
+        self._eof = self._factory.create(self._source, Token.EOF, "<EOF>", Token.DEFAULT_CHANNEL,
+                                         len(data), len(data) - 1, self.line, self.column)
+        return self._eof
+
+    def getAllTokens(self):
+        tokens = []
+        token = self.nextToken()
+        while token.type != Token.EOF:
+            tokens.append(token)
+            token = self.nextToken()
+        return tokens
@@ -0,0 +1,130 @@
+"""
+Reusable compilation sessions for OPLang.
+
+Compiling a snippet the usual way builds a new InputStream, lexer,
+CommonTokenStream, OPLangParser, ASTGeneration and StaticChecker. For a
+few inputs that does not matter, for the thousands of snippets of a test
+suite or a generated corpus the setup is a large part of the run.
+
+A CompilationSession owns one of each and resets them for every input:
+the lexer is pointed at the new InputStream, the token stream at the
+lexer and the parser at the token stream, which resets their state
+(buffered tokens, parser context, error recovery). ASTGeneration and
+StaticChecker keep no state between programs and are shared as they are.
+
+A SessionPool lends sessions out and takes them back, so nested or
+interleaved work never shares a session:
+
+    with session_pool().session() as session:
+        ast = session.build_ast(source)
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "build"))
+
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
+from src.astgen.ast_generation import ASTGeneration
+from src.frontend.parsing import LL, run_program
+from src.semantics.static_checker import StaticChecker
+
+
+class CompilationSession:
+    """One lexer, token stream, parser, AST generator and checker, reused across inputs."""
+
+    def __init__(self, lexer_class=OPLangLexer):
+        self.lexer = lexer_class(InputStream(""))
+        self.token_stream = CommonTokenStream(self.lexer)
+        self.parser = OPLangParser(self.token_stream)
+        self.ast_generation = ASTGeneration()
+        self.checker = StaticChecker()
+        self.inputs = 0
+
+    def load(self, source, error_listener=None):
+        """
+        Point the session at source and return the reset parser.
+
+        error_listener replaces the parser's listeners for this input; by
+        default it reports to the console like a new OPLangParser does.
+        Nothing is lexed yet, lexer errors come from the first parse or
+        token read.
+        """
+        self.inputs += 1
+        self.lexer.inputStream = InputStream(source)
+        self.token_stream.setTokenSource(self.lexer)
+        self.parser.setTokenStream(self.token_stream)
+        # reset() leaves the ATN state of the last parse, which would become
+        # the invoking state of the new root context and mislead error recovery
+        self.parser.state = -1
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(error_listener or ConsoleErrorListener.INSTANCE)
+        return self.parser
+
+    def tokens(self, source):
+        """The tokens of source up to and including EOF."""
+        self.load(source)
+        self.token_stream.fill()
+        return list(self.token_stream.tokens)
+
+    def parse(self, source, mode=LL, error_listener=None):
+        """Parse source and return the parse tree, see run_program."""
+        return run_program(self.load(source, error_listener), mode)
+
+    def build_ast(self, source, mode=LL, error_listener=None):
+        """Parse source and return its AST."""
+        return self.ast_generation.visit(self.parse(source, mode, error_listener))
+
+    def check(self, ast):
+        """Run the static checker on ast; semantic errors are raised."""
+        self.checker.check_program(ast)
+        return ast
+
+    def check_all(self, ast):
+        """Run the static checker on ast in collecting mode and return its diagnostics."""
+        return self.checker.collect_errors(ast)
+
+    def compile(self, source, mode=LL, error_listener=None):
+        """Parse and check source, return its checked AST."""
+        return self.check(self.build_ast(source, mode, error_listener))
+
+
+class SessionPool:
+    """Free list of CompilationSessions for one lexer class."""
+
+    def __init__(self, lexer_class=OPLangLexer):
+        self.lexer_class = lexer_class
+        self.free = []
+        self.created = 0
+
+    def acquire(self):
+        if self.free:
+            return self.free.pop()
+        self.created += 1
+        return CompilationSession(self.lexer_class)
+
+    def release(self, session):
+        self.free.append(session)
+
+    @contextmanager
+    def session(self):
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+
+_pools = {}
+
+
+def session_pool(lexer_class=OPLangLexer):
+    """The shared SessionPool for lexer_class."""
+    pool = _pools.get(lexer_class)
+    if pool is None:
+        pool = _pools[lexer_class] = SessionPool(lexer_class)
+    return pool
@@ -0,0 +1,29 @@
+"""
+Train the persisted prediction DFA cache over a corpus, see dfa_cache.
+
+    python -m src.frontend.train_dfa [FILE|DIR ...] [--output PATH]
+
+Without paths the programs of the test suite are used. Kept apart from
+dfa_cache because importing src.frontend already imports that module.
+"""
+
+import argparse
+
+from src.frontend.corpus import load_corpus_files, load_test_corpus
+from src.frontend.dfa_cache import DFA_CACHE_FILE, save_dfa_cache, train_dfa_cache
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Train and save the OPLang prediction DFA cache.")
+    arg_parser.add_argument("paths", nargs="*", help="OPLang files or directories (default: the test programs)")
+    arg_parser.add_argument("--output", "-o", default=DFA_CACHE_FILE)
+    args = arg_parser.parse_args(argv)
+
+    sources = load_corpus_files(args.paths) if args.paths else load_test_corpus()
+    train_dfa_cache(sources)
+    states = save_dfa_cache(args.output)
+    print(f"Trained on {len(sources)} inputs, saved {states} DFA states to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
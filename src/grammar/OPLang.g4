@@ -20,6 +20,15 @@ def emit(self):
         return super().emit();
 }
 
+@parser::members {
+def isAssignable(self, ctx):
+    # only a bare postfix expression (a, this.x, a.f()[i], (a).b ...) can be assigned to
+    node = ctx
+    while node.getChildCount() == 1 and not isinstance(node, OPLangParser.PostfixexpContext):
+        node = node.getChild(0)
+    return isinstance(node, OPLangParser.PostfixexpContext)
+}
+
 options{
 	language=Python3;
 }
@@ -129,8 +138,7 @@ ERROR_CHAR: .;
 program: classdecllist EOF; // write for program rule here using vardecl and funcdecl
 
 classdecllist
-    : classdecl classdecllist 
-    | classdecl
+    : classdecl+
     ;
 
 classdecl
@@ -143,13 +151,7 @@ memberblock
     ;
 
 memberlist
-    : classmember membertail
-    |
-    ;
-
-membertail
-    : classmember membertail
-    | 
+    : classmember*
     ;
 
 classmember
@@ -192,13 +194,7 @@ elementtype
     ;
 
 attrlist
-    : attrunit attrtail
-    | attrunit
-    ;
-
-attrtail
-    : COMMA attrunit attrtail
-    | 
+    : attrunit (COMMA attrunit)*
     ;
 
 attrunit
@@ -238,13 +234,7 @@ paramlistblock
     ;
 
 paramlist
-    : parameter paramtail
-    | 
-    ;
-
-paramtail
-    : SEMICOLON parameter paramtail
-    | 
+    : (parameter (SEMICOLON parameter)*)?
     ;
 
 parameter
@@ -252,12 +242,7 @@ parameter
     ;
 
 idlist
-    : IDENTIFIERS idtail
-    ;
-
-idtail
-    : COMMA IDENTIFIERS idtail
-    |
+    : IDENTIFIERS (COMMA IDENTIFIERS)*
     ;
 
 paramtype
@@ -352,8 +337,7 @@ unaryfactor
     ;
 
 postfixlist
-    : lhspostfix postfixlist
-    | 
+    : lhspostfix*
     ;
 
 primaryfactor
@@ -374,13 +358,7 @@ memaccess
     ;
 
 expressionlist
-    : expression expressiontail 
-    |
-    ;
-
-expressiontail
-    : COMMA expression expressiontail 
-    | 
+    : (expression (COMMA expression)*)?
     ;
 
 methodinvoke
@@ -400,8 +378,7 @@ blockstatementbody
     ;
 
 vardecllist
-    : vardecl vardecllist
-    | 
+    : vardecl*
     ;
 
 vardecl
@@ -410,7 +387,7 @@ vardecl
     ;
 
 referencedecl
-    : varspec vartype REFERENCE varlist ASSIGNING expression SEMICOLON
+    : varspec vartype REFERENCE referencelist ASSIGNING expression SEMICOLON
     ;
 
 varspec
@@ -419,18 +396,20 @@ varspec
     ;
 
 varlist
-    : varunit vartail
-    | varunit
+    : varunit (COMMA varunit)*
     ;
 
-vartail
-    : COMMA varunit vartail
-    | 
+varunit
+    : IDENTIFIERS (ASSIGNING expression)?
     ;
 
-varunit
+referencelist
+    : referenceunit (COMMA referenceunit)*
+    ;
+
+referenceunit
     : assignvar
-    | IDENTIFIERS 
+    | IDENTIFIERS
     ;
 
 assignvar
@@ -438,12 +417,7 @@ assignvar
     ;
 
 statementlist
-    : statement statementlist
-    | 
-    ;
-
-reassign
-    : lhs ASSIGNING expression
+    : statement*
     ;
 
 lhspostfix
@@ -452,14 +426,8 @@ lhspostfix
     | indexing
     ;
 
-lhs
-    : IDENTIFIERS
-    | postfixexp
-    ;
-
 statement
-    : reassign SEMICOLON
-    | expression SEMICOLON
+    : exprstatement
     | blockstatement
     | ifstatement
     | forstatement
@@ -468,20 +436,19 @@ statement
     | returnstatement
     ;
 
-ifstatement
-    : IF expression THEN blockstatement iftail
-    | IF expression THEN statement iftail
+// assignments and expression statements share their prefix, so the target is
+// parsed as an expression and checked once ':=' is seen instead of being
+// predicted by scanning ahead for ':='
+exprstatement
+    : target=expression ({self.isAssignable($target.ctx)}? ASSIGNING expression)? SEMICOLON
     ;
 
-iftail
-    : ELSE blockstatement
-    | ELSE statement
-    | 
+ifstatement
+    : IF expression THEN statement (ELSE statement)?
     ;
 
 forstatement
-    : FOR scalar ASSIGNING expression fordirection expression DO blockstatement
-    | FOR scalar ASSIGNING expression fordirection expression DO statement
+    : FOR scalar ASSIGNING expression fordirection expression DO statement
     ;
 
 scalar
@@ -510,11 +477,5 @@ arraylit                                       //Array literal
     ;
 
 literallist
-    : expression literallisttail
-    | expression
-    ;
-
-literallisttail
-    : COMMA expression literallisttail
-    |
+    : expression (COMMA expression)*
     ;
\ No newline at end of file
@@ -7,9 +7,21 @@ programming language including type checking, scope management, and error detect
 
 from .static_error import *
 from .static_checker import StaticChecker
+from .parallel_checker import ParallelStaticChecker
+from .incremental_checker import IncrementalChecker
+from .typed_ast import TypingChecker, TypedAST
+from .name_resolution import NameResolver, Bindings
+from .constant_folding import ConstantFolder
 
 __all__ = [
     'StaticChecker',
+    'ParallelStaticChecker',
+    'IncrementalChecker',
+    'TypingChecker',
+    'TypedAST',
+    'NameResolver',
+    'Bindings',
+    'ConstantFolder',
     'StaticError',
     'Redeclared',
     'UndeclaredIdentifier', 
@@ -0,0 +1,98 @@
+"""
+Builtin classes of OPLang.
+
+The classes a program uses without declaring them are described here
+once, as data: each builtin class maps its method names to their return
+type and parameter types. Every builtin method is static.
+
+A BuiltinLibrary turns such a description into class scopes the first
+time a checker asks for them and keeps them. Every program checked
+afterwards declares the same ClassScope objects instead of building the
+io class again. Their member tables are read-only, so no check can change
+them for the next one. The builtins are always declared first and in the
+same order, so the position ProgramScope.declare gives them is the same
+in every program.
+
+StaticChecker.library is the library a checker declares. More builtin
+classes, such as string or math helpers, are added by deriving a library
+from it:
+
+    checker = StaticChecker()
+    checker.library = BUILTINS.extend({"math": {"sqrt": (FLOAT, (FLOAT,))}})
+"""
+
+from types import MappingProxyType
+
+from .symbol_table import Symbol, ClassScope
+from ..utils.type_table import INT, FLOAT, BOOLEAN, STRING, VOID
+
+IO = {
+    "readInt": (INT, ()),
+    "writeInt": (VOID, (INT,)),
+    "writeIntLn": (VOID, (INT,)),
+    "readFloat": (FLOAT, ()),
+    "writeFloat": (VOID, (FLOAT,)),
+    "writeFloatLn": (VOID, (FLOAT,)),
+    "readBool": (BOOLEAN, ()),
+    "writeBool": (VOID, (BOOLEAN,)),
+    "writeBoolLn": (VOID, (BOOLEAN,)),
+    "readStr": (STRING, ()),
+    "writeStr": (VOID, (STRING,)),
+    "writeStrLn": (VOID, (STRING,)),
+}
+
+BUILTIN_CLASSES = {"io": IO}  # class name -> {method name: (return type, parameter types)}
+
+
+class BuiltinClassScope(ClassScope):
+    """The shared, read-only scope of a builtin class."""
+
+    __slots__ = ("library",)
+
+    def __reduce__(self):
+        # unpickles to the scope of the same class in the unpickled library
+        return builtin_class_scope, (self.library, self.name)
+
+
+def builtin_class_scope(library, name):
+    return library.class_scopes()[library.names.index(name)]
+
+
+class BuiltinLibrary:
+    """
+    Builtin classes, described as in BUILTIN_CLASSES, and their class scopes once built.
+
+    Args:
+        classes (dict): class name -> {method name: (return type, parameter types)}
+    """
+
+    def __init__(self, classes: dict):
+        self.classes = {name: dict(methods) for name, methods in classes.items()}
+        self.names = list(self.classes)
+        self.scopes = None  # built on first use
+
+    def class_scopes(self):
+        """The scopes of the builtin classes, in declaration order."""
+        if self.scopes is None:
+            self.scopes = [self.build(name, methods, index)
+                           for index, (name, methods) in enumerate(self.classes.items())]
+        return self.scopes
+
+    def build(self, name, methods, index):
+        class_scope = BuiltinClassScope(name, None, MappingProxyType({
+            method: Symbol(method, return_type, is_static=True, params=params)
+            for method, (return_type, params) in methods.items()
+        }))
+        class_scope.index = index  # ProgramScope.declare gives it the same position
+        class_scope.library = self
+        return class_scope
+
+    def extend(self, classes: dict):
+        """A new library with the classes of this one followed by classes."""
+        return BuiltinLibrary({**self.classes, **classes})
+
+    def __reduce__(self):
+        return BuiltinLibrary, (self.classes,)
+
+
+BUILTINS = BuiltinLibrary(BUILTIN_CLASSES)
@@ -0,0 +1,52 @@
+"""
+Class-hierarchy index for the OPLang static checker.
+
+Every declared class gets a bit, and its ancestor set is the bitset of
+the class itself and all its superclasses. A class is registered at the
+end of its pass 0, when its superclass is known to be registered already
+(a superclass has to be declared first), so the ancestor set is the
+superclass's set plus one bit. A subtype test is then a single bit test
+instead of a walk up the superclass links.
+
+The index belongs to the ProgramScope of the program being checked (see
+symbol_table.py), so StaticChecker itself stays stateless. Bits follow
+declaration order, so HierarchyPrefix can show the hierarchy as it was
+when only the first classes had been declared.
+"""
+
+
+class ClassHierarchy:
+    """Ancestor bitsets of the classes declared so far."""
+
+    def __init__(self):
+        self.bits = {}       # class name -> its own bit
+        self.ancestors = {}  # class name -> bitset of the class and its superclasses
+
+    def add(self, name, superclass=None):
+        bit = 1 << len(self.bits)
+        self.bits[name] = bit
+        self.ancestors[name] = self.ancestors.get(superclass, 0) | bit
+
+    def is_subclass(self, name, ancestor):
+        """True when ancestor is name or one of its superclasses."""
+        ancestors = self.ancestors.get(name)
+        if ancestors is None:
+            # undeclared classes are only related to themselves
+            return name == ancestor
+        return ancestors & self.bits.get(ancestor, 0) != 0
+
+
+class HierarchyPrefix:
+    """A ClassHierarchy restricted to the first count classes added to it."""
+
+    def __init__(self, hierarchy, count):
+        self.hierarchy = hierarchy
+        self.mask = (1 << count) - 1
+
+    def is_subclass(self, name, ancestor):
+        hierarchy = self.hierarchy
+        if not hierarchy.bits.get(name, 0) & self.mask:
+            # classes added later are as undeclared as unknown ones
+            return name == ancestor
+        # a visible class only has visible ancestors
+        return hierarchy.ancestors[name] & hierarchy.bits.get(ancestor, 0) != 0
@@ -0,0 +1,222 @@
+"""
+Constant folding for checked OPLang programs.
+
+StaticChecker only tells whether an expression is constant. ConstantFolder
+works out the value of every scalar constant of a program that passes the
+checker and puts a literal in place of its expression tree, so later
+stages read precomputed values:
+
+- arithmetic, relational, logical and ^ expressions whose operands are
+  constant, computed with src/utils/operators.py;
+- names of final variables, and final attributes accessed through their
+  class (A.k) or this (this.k), whose initializer folds to a scalar.
+
+A final int, float, boolean or string keeps the value of its initializer
+converted to its declared type, so a final float set to 1 is read as
+1.0, as assignment coercion has it. An expression of a mixed operation is
+computed as a float one, and / is always a float division, so a value has
+the type the checker gave its expression. An expression stays as it is
+when computing it raises, such as a division by zero, so it fails when it
+runs. So do array literals, object creations and anything reading a
+non-final name or calling a method. Initializers are folded too, the
+declarations stay; names in assignment targets are never replaced.
+
+The program is folded in place: fold replaces child fields of the AST it
+is given (copy.deepcopy it first to keep the original). It checks the
+program with TypingChecker and resolves its names with NameResolver unless
+their results are passed in, and returns a Folding holding both, with the
+types of the new literals added, so a back end gets the folded AST and
+what it needs to compile it in one call.
+"""
+
+from typing import Any
+
+from .typed_ast import TypingChecker
+from .name_resolution import NameResolver
+from ..utils.visitor import BaseVisitor
+from ..utils.nodes import (
+    Identifier, ThisExpression, MemberAccess, AttributeDecl, NilLiteral,
+    Literal, IntLiteral, FloatLiteral, BoolLiteral, StringLiteral
+)
+from ..utils.operators import BINARY_OPERATORS, UNARY_OPERATORS
+from ..utils.type_table import INT, FLOAT, BOOLEAN, STRING, canonical_type
+
+LITERALS = {bool: (BoolLiteral, BOOLEAN), int: (IntLiteral, INT), float: (FloatLiteral, FLOAT), str: (StringLiteral, STRING)}
+
+FOLDING = object()  # value of an attribute whose initializer is being folded
+
+
+def coerce(value, declared_type):
+    """value as stored in a final of declared_type, None when it is not a scalar of that type."""
+    if value is None:
+        return None
+    declared_type = canonical_type(declared_type)
+    if declared_type is FLOAT and type(value) is int:
+        return float(value)
+    if LITERALS[type(value)][1] is not declared_type:
+        return None
+    return value
+
+
+class Folding:
+    """A program being folded, and its types and bindings once fold returns."""
+
+    __slots__ = ("program", "typed", "bindings", "classes", "finals", "attributes", "folded")
+
+    def __init__(self, program, typed, bindings):
+        self.program = program
+        self.typed = typed        # TypedAST of the program, with the types of the new literals
+        self.bindings = bindings  # Bindings of the program
+        self.classes = {x.name: x for x in program.class_decls}
+        self.finals = {}          # Variable of a final variable -> its value
+        self.attributes = {}      # Attribute -> its value when final and scalar, None otherwise
+        self.folded = 0           # expressions computed into a literal, nested ones included
+
+    def attribute(self, class_name, name):
+        """(AttributeDecl, Attribute) declaring attribute name of class_name or one of its superclasses."""
+        class_decl = self.classes.get(class_name)
+        while class_decl is not None:
+            for member in class_decl.members:
+                if isinstance(member, AttributeDecl):
+                    for x in member.attributes:
+                        if x.name == name:
+                            return member, x
+            class_decl = self.classes.get(class_decl.superclass)
+        return None
+
+
+class ConstantFolder(BaseVisitor):
+    """Replaces the scalar constants of a checked program by literals, see the module docstring."""
+
+    def fold(self, node, typed=None, bindings=None):
+        """Fold program node in place and return its Folding; raises the first error of an invalid program."""
+        if typed is None:
+            typed = TypingChecker().check_typed(node)
+        if bindings is None:
+            bindings = NameResolver().resolve(node)
+        folding = Folding(node, typed, bindings)
+        self.visit(node, folding)
+        return folding
+
+    def fold_expression(self, node, o):
+        """The value of expression node, or None, and the node to put in its place."""
+        value = self.visit(node, o)
+        if value is None or isinstance(node, Literal):
+            return node, value
+        literal_class, literal_type = LITERALS[type(value)]
+        literal = literal_class(value)
+        o.typed.types[literal] = literal_type
+        o.typed.constants.add(literal)
+        o.folded += 1
+        return literal, value
+
+    def fold_attribute(self, decl, node, o):
+        """Fold the initializer of attribute node once and return its value when it is a final scalar."""
+        if node in o.attributes:
+            value = o.attributes[node]
+            return None if value is FOLDING else value
+        o.attributes[node] = FOLDING
+        value = None
+        if node.init_value is not None and not isinstance(node.init_value, NilLiteral):
+            node.init_value, value = self.fold_expression(node.init_value, o)
+        value = coerce(value, decl.attr_type) if decl.is_final else None
+        o.attributes[node] = value
+        return value
+
+    # _________________________________Declarations_________________________________
+    def visit_attribute_decl(self, node, o: Any = None):
+        for x in node.attributes:
+            self.fold_attribute(node, x, o)
+
+    def visit_variable_decl(self, node, o: Any = None):
+        for x in node.variables:
+            if x.init_value is not None and not isinstance(x.init_value, NilLiteral):
+                x.init_value, value = self.fold_expression(x.init_value, o)
+                if node.is_final:
+                    value = coerce(value, node.var_type)
+                    if value is not None:
+                        o.finals[x] = value
+
+    # _________________________________Statements_________________________________
+    def visit_assignment_statement(self, node, o: Any = None):
+        self.visit(node.lhs, o)
+        node.rhs, _ = self.fold_expression(node.rhs, o)
+
+    def visit_if_statement(self, node, o: Any = None):
+        node.condition, _ = self.fold_expression(node.condition, o)
+        self.visit(node.then_stmt, o)
+        if node.else_stmt is not None:
+            self.visit(node.else_stmt, o)
+
+    def visit_for_statement(self, node, o: Any = None):
+        node.start_expr, _ = self.fold_expression(node.start_expr, o)
+        node.end_expr, _ = self.fold_expression(node.end_expr, o)
+        self.visit(node.body, o)
+
+    def visit_return_statement(self, node, o: Any = None):
+        node.value, _ = self.fold_expression(node.value, o)
+
+    # _________________________________Expressions_________________________________
+    # visit expressions returning their value, None when they have none at compile time
+    def visit_binary_op(self, node, o: Any = None):
+        node.left, left = self.fold_expression(node.left, o)
+        node.right, right = self.fold_expression(node.right, o)
+        if left is None or right is None:
+            return None
+        try:
+            return BINARY_OPERATORS[node.operator](left, right)
+        except ZeroDivisionError:
+            return None
+
+    def visit_unary_op(self, node, o: Any = None):
+        node.operand, operand = self.fold_expression(node.operand, o)
+        if operand is None:
+            return None
+        return UNARY_OPERATORS[node.operator](operand)
+
+    def visit_parenthesized_expression(self, node, o: Any = None):
+        node.expr, value = self.fold_expression(node.expr, o)
+        return value
+
+    def visit_postfix_expression(self, node, o: Any = None):
+        # the primary is an object, an array or a class, never a scalar
+        self.visit(node.primary, o)
+        for x in node.postfix_ops:
+            self.visit(x, o)
+        if len(node.postfix_ops) != 1 or not isinstance(node.postfix_ops[0], MemberAccess):
+            return None
+        primary = node.primary
+        # only through the class or this: folding obj.k would drop the evaluation of obj
+        if not (isinstance(primary, ThisExpression)
+                or isinstance(primary, Identifier) and isinstance(o.typed.type_of(primary), str)):
+            return None
+        member = node.postfix_ops[0]
+        attribute = o.attribute(o.typed.owners.get(member), member.member_name)
+        if attribute is None:
+            return None
+        return self.fold_attribute(attribute[0], attribute[1], o)
+
+    def visit_method_call(self, node, o: Any = None):
+        node.args = [self.fold_expression(x, o)[0] for x in node.args]
+
+    def visit_array_access(self, node, o: Any = None):
+        node.index, _ = self.fold_expression(node.index, o)
+
+    def visit_object_creation(self, node, o: Any = None):
+        node.args = [self.fold_expression(x, o)[0] for x in node.args]
+
+    def visit_identifier(self, node, o: Any = None):
+        declaration = o.bindings.declaration_of(node)
+        return None if declaration is None else o.finals.get(declaration.node)
+
+    def visit_int_literal(self, node, o: Any = None):
+        return node.value
+
+    def visit_float_literal(self, node, o: Any = None):
+        return node.value
+
+    def visit_bool_literal(self, node, o: Any = None):
+        return node.value
+
+    def visit_string_literal(self, node, o: Any = None):
+        return node.value
@@ -0,0 +1,61 @@
+"""
+Diagnostics of the static checker's collecting mode.
+
+StaticChecker.collect_errors checks a whole program and, instead of
+raising the first StaticError, records every error as a Diagnostic with
+the node that was being checked, then carries on with the next
+statement, member or class.
+
+Errors that only follow from an earlier one are suppressed. A name
+whose declaration failed, or that was used undeclared, gets the
+ErrorType, which is compatible with every type and has no members, so
+its later uses pass silently. An undeclared class is reported the first
+time it is used.
+"""
+
+from ..utils.nodes import Type
+from .static_error import UndeclaredClass
+
+
+class ErrorType(Type):
+    """Type of a name whose declaration failed, compatible with every type."""
+
+    __slots__ = ()
+
+    def accept(self, visitor, o=None):
+        # the error has been reported already, there is nothing left to check
+        return None
+
+    def __str__(self):
+        return "ErrorType()"
+
+
+ERROR = ErrorType()
+
+
+class Diagnostic:
+    """A semantic error and the statement, member or class it was found in."""
+
+    __slots__ = ("error", "node")
+
+    def __init__(self, error, node):
+        self.error = error
+        self.node = node
+
+    def __str__(self):
+        return str(self.error)
+
+
+class Diagnostics:
+    """The diagnostics of one program, in the order the checker found them."""
+
+    def __init__(self):
+        self.items = []
+        self.undeclared_classes = set()
+
+    def add(self, error, node):
+        if isinstance(error, UndeclaredClass):
+            if error.name in self.undeclared_classes:
+                return
+            self.undeclared_classes.add(error.name)
+        self.items.append(Diagnostic(error, node))
@@ -0,0 +1,209 @@
+"""
+Incremental re-checking for the OPLang static checker.
+
+An editor or a watch loop checks the same program again and again with
+one method body changed. StaticChecker starts from nothing every time:
+it collects the signatures of every class (pass 0) and checks every
+attribute initializer and method body (pass 1).
+
+An IncrementalChecker keeps what does not change between runs:
+
+- the member table of every class, keyed by the class's signature (its
+  name, superclass and member signatures, without initializers and
+  bodies), so pass 0 only runs for classes whose signature changed;
+- the outcome of pass 1 for every member, keyed by a hash of the member's
+  text, together with its dependencies: every class the member looked
+  up, every member symbol it resolved on those classes and every
+  ancestor chain a subtype test read, each with the value it saw.
+
+A member whose text is unchanged is only re-checked when one of its
+dependencies now looks different, for instance when a method it calls
+changed its parameters or a class it names is no longer declared before
+it. Classes are still declared and members visited in program order, so
+the error raised is the one StaticChecker would raise.
+
+Only the first-error mode is incremental; collect_errors runs as usual.
+"""
+
+from hashlib import blake2b
+
+from .static_checker import StaticChecker
+from .static_error import Redeclared, NoEntryPoint
+from .symbol_table import Lifecycle
+from ..utils.nodes import AttributeDecl, MethodDecl, ConstructorDecl
+
+
+def member_signature(member):
+    """What pass 0 reads of member: everything but initializers and bodies."""
+    if isinstance(member, AttributeDecl):
+        return ("attribute", member.is_static, member.is_final, str(member.attr_type),
+                tuple(x.name for x in member.attributes))
+    if isinstance(member, MethodDecl):
+        return ("method", member.is_static, str(member.return_type), member.name,
+                tuple(str(x) for x in member.params))
+    if isinstance(member, ConstructorDecl):
+        return ("constructor", member.name, tuple(str(x) for x in member.params))
+    return ("destructor", member.name)
+
+
+def class_signature(node):
+    return (node.name, node.superclass, tuple(member_signature(x) for x in node.members))
+
+
+def member_digest(member):
+    return blake2b(str(member).encode(), digest_size=16).digest()
+
+
+def symbol_fingerprint(symbol):
+    """A value equal for two symbols exactly when pass 1 can not tell them apart."""
+    if symbol is None:
+        return None
+    if isinstance(symbol, Lifecycle):
+        constructors = symbol.constructors
+        return ("lifecycle", None if constructors is None else tuple(map(tuple, constructors.signatures)), symbol.destructor)
+    # types are canonical, so equal types are the same object
+    params = symbol.params
+    return (symbol.type, symbol.is_final, symbol.is_static, None if params is None else tuple(params))
+
+
+class RecordingProgram:
+    """A ProgramScope recording the classes, members and ancestor chains pass 1 reads."""
+
+    __slots__ = ("program", "used", "diagnostics", "typed")
+
+    def __init__(self, program):
+        self.program = program
+        self.used = set()  # ("class", name), ("member", class name, member name) or ("ancestors", name)
+        self.diagnostics = None
+        self.typed = None
+
+    @property
+    def hierarchy(self):
+        return self
+
+    def lookup(self, name):
+        self.used.add(("class", name))
+        class_scope = self.program.lookup(name)
+        return None if class_scope is None else RecordingClass(class_scope, self.used)
+
+    def is_subclass(self, name, ancestor):
+        self.used.add(("ancestors", name))
+        return self.program.hierarchy.is_subclass(name, ancestor)
+
+
+class RecordingClass:
+    """A ClassScope recording the members looked up on it."""
+
+    __slots__ = ("class_scope", "name", "used")
+
+    def __init__(self, class_scope, used):
+        self.class_scope = class_scope
+        self.name = class_scope.name
+        self.used = used
+
+    def lookup(self, name):
+        self.used.add(("member", self.name, name))
+        return self.class_scope.lookup(name)
+
+
+class IncrementalChecker:
+    """
+    Checking session that re-checks only the members a change can affect.
+
+    Args:
+        checker (StaticChecker | None): the checker running pass 0 and pass 1
+
+    After every check_program, checked and reused count the members whose
+    pass 1 ran and the members whose earlier outcome was taken over.
+    """
+
+    def __init__(self, checker: StaticChecker = None):
+        self.checker = checker if checker is not None else StaticChecker()
+        self.classes = {}  # class signature -> member table
+        self.bodies = {}   # (class name, member digest) -> (error or None, ((dependency, value), ...))
+        self.checked = 0
+        self.reused = 0
+
+    def check_program(self, node):
+        program = self.checker.program_scope()
+        classes = {}
+        bodies = {}
+        observed = {}
+        entry = []
+        self.checked = self.reused = 0
+        complete = False
+        try:
+            for decl in node.class_decls:
+                self.declare_class(decl, program, entry, classes)
+                for member in decl.members:
+                    self.check_member(member, program, decl.name, bodies, observed)
+            complete = True
+        finally:
+            # a run stopping at an error has not seen the classes and members after it
+            if complete:
+                self.classes, self.bodies = classes, bodies
+            else:
+                self.classes.update(classes)
+                self.bodies.update(bodies)
+        if len(entry) < 1:
+            raise NoEntryPoint()
+
+    def declare_class(self, node, program, entry, classes):
+        """Pass 0 of one class, reusing its member table when its signature is unchanged."""
+        signature = class_signature(node)
+        members = self.classes.get(signature)
+        if members is None:
+            self.checker.declare_class(node, program, entry)
+            members = program.lookup(node.name).members
+        else:
+            if program.lookup(node.name):
+                raise Redeclared("Class", node.name)
+            if members.get("main"):
+                entry.append(1)
+            self.checker.link_class(node, program, members)
+        classes[signature] = members
+
+    def check_member(self, member, program, class_name, bodies, observed):
+        """Pass 1 of one member, reusing its outcome when neither it nor what it depends on changed."""
+        key = (class_name, member_digest(member))
+        outcome = self.bodies.get(key)
+        if outcome is not None and all(self.observe(dependency, program, observed) == value
+                                       for dependency, value in outcome[1]):
+            self.reused += 1
+        else:
+            recording = RecordingProgram(program)
+            try:
+                # the program holds the classes up to this one, as pass 1 of StaticChecker sees it
+                self.checker.visit(member, (1, recording, class_name))
+                error = None
+            except Exception as e:
+                error = e
+            outcome = (error, tuple((dependency, self.observe(dependency, program, observed))
+                                    for dependency in recording.used))
+            self.checked += 1
+        bodies[key] = outcome
+        if outcome[0] is not None:
+            raise outcome[0].with_traceback(None)
+
+    def observe(self, dependency, program, observed):
+        """The value of dependency in program, remembered once its class is declared."""
+        value = observed.get(dependency)
+        if value is not None or dependency in observed:
+            return value
+        kind, name = dependency[0], dependency[1]
+        class_scope = program.lookup(name)
+        if class_scope is None:
+            # the class may still be declared further down the program
+            return None if kind != "class" else False
+        if kind == "class":
+            value = True
+        elif kind == "member":
+            value = symbol_fingerprint(class_scope.lookup(dependency[2]))
+        else:
+            value = []
+            while class_scope is not None:
+                value.append(class_scope.name)
+                class_scope = class_scope.parent
+            value = tuple(value)
+        observed[dependency] = value
+        return value
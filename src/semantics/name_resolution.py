@@ -0,0 +1,185 @@
+"""
+Name resolution pass for OPLang: slot indices for parameters and locals.
+
+A name in a method body denotes a parameter, a local variable or, as the
+primary of a postfix expression, a class. NameResolver runs once over the
+AST built by ASTGeneration and binds every Identifier, IdLHS and for
+statement that names a parameter or local to a Declaration: the name, its
+canonical type, whether it is a parameter or a local, and its slot in the
+frame of the method, constructor or destructor declaring it. A back end
+keeps the values of a call in a list of Frame.size entries and reads or
+writes a bound name with one index, without looking the name up.
+
+Scoping is the checker's (see SymbolTable): the parameters and the
+variables of the body's outer block share one scope, every block opens a
+new one, a variable is visible from its own initializer on and shadows
+outer names of the same name, and the variable of a for statement is one
+declared before it. Slots are handed out in that order: slot 0 holds this
+in every frame but that of a static method, the parameters come next and
+then the locals. A block gives its slots back when it ends, so sibling
+blocks share slots and Frame.size is the most slots live at once; a
+variable must therefore be set when its declaration runs, even without an
+initializer.
+
+The pass reports no errors. Names the checker would report as undeclared
+or as class names stay unbound, and a redeclared name gets a declaration
+of its own, so the pass also runs on programs the checker rejects; the
+checker still decides whether a program is valid.
+"""
+
+from typing import Any
+
+from .symbol_table import SymbolTable
+from .typed_ast import PARAMETER, LOCAL
+from ..utils.visitor import BaseVisitor
+from ..utils.type_table import canonical_type
+
+
+class Declaration:
+    """A parameter or local variable and its slot in the frame declaring it."""
+
+    __slots__ = ("name", "type", "kind", "slot", "node")
+
+    def __init__(self, name, type, kind, slot, node):
+        self.name = name
+        self.type = type
+        self.kind = kind  # PARAMETER or LOCAL
+        self.slot = slot
+        self.node = node  # the Parameter or Variable node declaring it
+
+    def __repr__(self):
+        return f"Declaration({self.name}, {self.kind}, slot {self.slot})"
+
+
+class Frame:
+    """The slots of one method, constructor or destructor."""
+
+    __slots__ = ("member", "receiver", "params", "declarations", "size")
+
+    def __init__(self, member, receiver):
+        self.member = member
+        self.receiver = receiver  # True when slot 0 holds this
+        self.params = 0           # parameter count, their slots follow this
+        self.declarations = []    # every Declaration of the member, in program order
+        self.size = 1 if receiver else 0
+
+
+class Bindings:
+    """The frames of one program and what its names are bound to."""
+
+    __slots__ = ("frames", "bindings")
+
+    def __init__(self):
+        self.frames = {}    # MethodDecl, ConstructorDecl or DestructorDecl -> Frame
+        self.bindings = {}  # Identifier, IdLHS or ForStatement -> Declaration
+
+    def frame_of(self, member):
+        return self.frames.get(member)
+
+    def declaration_of(self, node):
+        return self.bindings.get(node)
+
+    def slot_of(self, node):
+        """The frame slot node reads or writes, None when it is not bound to a parameter or local."""
+        declaration = self.bindings.get(node)
+        return None if declaration is None else declaration.slot
+
+
+class FrameScopes(SymbolTable):
+    """The block scopes of one frame, handing out the slots of its declarations."""
+
+    __slots__ = ("frame", "bindings", "live", "marks")
+
+    def __init__(self, frame, bindings):
+        super().__init__(None, None)
+        self.frame = frame
+        self.bindings = bindings
+        self.live = frame.size  # slots in use where the next declaration goes
+        self.marks = []         # live when each open block started
+
+    def push_scope(self):
+        super().push_scope()
+        self.marks.append(self.live)
+
+    def pop_scope(self):
+        super().pop_scope()
+        self.live = self.marks.pop()
+
+    def declare_slot(self, name, type, kind, node):
+        declaration = Declaration(name, canonical_type(type), kind, self.live, node)
+        self.live += 1
+        frame = self.frame
+        frame.declarations.append(declaration)
+        if self.live > frame.size:
+            frame.size = self.live
+        self.declare(declaration)
+        return declaration
+
+    def bind(self, node, name):
+        declaration = self.symbols.get(name)
+        if declaration is not None:
+            self.bindings.bindings[node] = declaration
+
+
+class NameResolver(BaseVisitor):
+    """Binds the parameter and local names of a program to frame slots, see the module docstring."""
+
+    def resolve(self, node):
+        """The Bindings of program node."""
+        bindings = Bindings()
+        self.visit(node, bindings)
+        return bindings
+
+    def visit_attribute_decl(self, node, o: Any = None):
+        # initializers see no parameters or locals, nothing in them is bound
+        pass
+
+    def visit_method_decl(self, node, o: Any = None):
+        self.visit_frame(node, not node.is_static, node.params, o)
+
+    def visit_constructor_decl(self, node, o: Any = None):
+        self.visit_frame(node, True, node.params, o)
+
+    def visit_destructor_decl(self, node, o: Any = None):
+        self.visit_frame(node, True, [], o)
+
+    def visit_frame(self, node, receiver, params, bindings):
+        frame = Frame(node, receiver)
+        frame.params = len(params)
+        bindings.frames[node] = frame
+        self.visit(node.body, (FrameScopes(frame, bindings), params))
+
+    def visit_block_statement(self, node, o: Any = None):
+        #o: frame scopes, or (frame scopes, parameters) for a member body
+        if isinstance(o, tuple):
+            scopes, params = o
+        else:
+            scopes, params = o, []
+
+        scopes.push_scope()
+        try:
+            for x in params:
+                scopes.declare_slot(x.name, x.param_type, PARAMETER, x)
+            for x in node.var_decls:
+                self.visit(x, scopes)
+            for x in node.statements:
+                self.visit(x, scopes)
+        finally:
+            scopes.pop_scope()
+
+    def visit_variable_decl(self, node, o: Any = None):
+        for x in node.variables:
+            o.declare_slot(x.name, node.var_type, LOCAL, x)
+            # declared first, so the initializer already sees the variable
+            if x.init_value is not None:
+                self.visit(x.init_value, o)
+
+    def visit_for_statement(self, node, o: Any = None):
+        o.bind(node, node.variable)
+        super().visit_for_statement(node, o)
+
+    def visit_id_lhs(self, node, o: Any = None):
+        o.bind(node, node.name)
+
+    def visit_identifier(self, node, o: Any = None):
+        o.bind(node, node.name)
@@ -0,0 +1,148 @@
+"""
+Overload index for the constructors of an OPLang class.
+
+A constructor matches an argument list when every argument is
+compatible with the parameter at its position, where only the positions
+the two lists share are compared (they are zipped, so a constructor also
+matches longer or shorter argument lists). Object creation looks for any
+matching constructor, and pass 0 reports a constructor as redeclared when
+an earlier one matches its parameter types. Both used to run compareType
+over every constructor.
+
+Most parameter types only accept arguments of the same type: int,
+boolean, string and arrays (whose element types and sizes have to be
+equal). An overload with only such parameters matches exactly when its
+parameter list and the argument list agree on their common prefix, which
+two hash tables answer:
+
+- full: parameter types of an overload -> its position, for overloads
+  no longer than the arguments (looked up with the argument prefix of
+  each overload length);
+- prefixes: every prefix of the parameter types of an overload -> its
+  position, for overloads at least as long as the arguments (looked up
+  with the whole argument list).
+
+Only overloads with a float or class parameter, which accept ints and
+subclasses, have to be compared one by one. They are indexed the same
+way by their shape, the parameter types with int and float both read as
+a number and every class type read as a class: an argument list can only
+match an overload of the same shape, so only those are compared. The
+candidates are compared in declaration order and only up to the first
+exact match, so the outcome, including which comparison runs first, is
+the one of a scan over all overloads. Parameter types with no shape
+(arrays of arrays or references) put their overload on a list that is
+always compared. An argument of the error type (collecting mode) is
+compatible with everything, so such lists are compared with every
+overload.
+"""
+
+from heapq import merge
+
+from .diagnostics import ERROR
+from ..utils.nodes import PrimitiveType, ArrayType, ClassType, ReferenceType
+from ..utils.type_table import INT, FLOAT, canonical_type
+
+NUMBER = "number"
+CLASS = "class"
+
+
+def overload_key(types):
+    """The canonical types of an argument or parameter list, references resolved."""
+    key = []
+    for t in types:
+        if isinstance(t, ReferenceType):
+            t = t.referenced_type
+        key.append(canonical_type(t))
+    return tuple(key)
+
+
+def exact_only(t):
+    """True when parameter type t only accepts arguments of type t."""
+    if isinstance(t, ArrayType):
+        return isinstance(t.element_type, (PrimitiveType, ClassType))
+    return isinstance(t, PrimitiveType) and t is not FLOAT
+
+
+def shape(t):
+    """What an argument must look like to be compatible with a parameter of type t, or t with it."""
+    if t is INT or t is FLOAT:
+        return NUMBER
+    if isinstance(t, ClassType):
+        return CLASS
+    return t
+
+
+def has_shape(t):
+    """True when a parameter of type t only accepts arguments of its shape."""
+    return not isinstance(t, (ReferenceType, ArrayType)) or exact_only(t)
+
+
+class Overloads:
+    """The parameter type lists of the constructors of a class, indexed for resolution."""
+
+    __slots__ = ("signatures", "full", "prefixes", "arities", "shapes", "shape_prefixes", "unshaped")
+
+    def __init__(self):
+        self.signatures = []      # parameter types of each overload, in declaration order
+        self.full = {}            # parameter key -> position of the first overload with it
+        self.prefixes = {}        # prefix of a parameter key -> position of the first overload starting with it
+        self.arities = []         # parameter counts of the overloads, ascending
+        self.shapes = {}          # shape -> (position, parameter types) of the coercible overloads with it
+        self.shape_prefixes = {}  # prefix of a shape -> (position, parameter types) of the coercible overloads starting with it
+        self.unshaped = []        # (position, parameter types) of the overloads with parameters of no shape
+
+    def __iter__(self):
+        return iter(self.signatures)
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def add(self, params):
+        position = len(self.signatures)
+        self.signatures.append(params)
+        key = overload_key(params)
+        self.full.setdefault(key, position)
+        for end in range(len(key) + 1):
+            self.prefixes.setdefault(key[:end], position)
+        if len(key) not in self.arities:
+            self.arities.append(len(key))
+            self.arities.sort()
+        if all(exact_only(t) for t in key):
+            # only matches exactly, the two tables above find it
+            return
+        entry = (position, params)
+        if not all(has_shape(t) for t in key):
+            self.unshaped.append(entry)
+            return
+        key_shape = tuple(map(shape, key))
+        self.shapes.setdefault(key_shape, []).append(entry)
+        for end in range(len(key_shape) + 1):
+            self.shape_prefixes.setdefault(key_shape[:end], []).append(entry)
+
+    def resolve(self, args, compatible):
+        """
+        True when an overload matches args.
+
+        compatible(params) compares one overload with args; it is only
+        called for the overloads that can match through coercion.
+        """
+        if any(t is ERROR for t in args):
+            return any(compatible(params) for params in self.signatures)
+        key = overload_key(args)
+        key_shape = tuple(map(shape, key))
+        exact = self.prefixes.get(key)
+        candidates = [self.unshaped, self.shape_prefixes.get(key_shape, ())]
+        for arity in self.arities:
+            if arity >= len(key):
+                break
+            position = self.full.get(key[:arity])
+            if position is not None and (exact is None or position < exact):
+                exact = position
+            candidates.append(self.shapes.get(key_shape[:arity], ()))
+        # each list is in declaration order and no overload is in two of them
+        for position, params in merge(*candidates):
+            if exact is not None and position > exact:
+                break
+            if compatible(params):
+                return True
+        return exact is not None
@@ -0,0 +1,176 @@
+"""
+Parallel pass 1 for the OPLang static checker.
+
+StaticChecker runs pass 0 of a class (collecting its member signatures)
+and then pass 1 (checking attribute initializers and method bodies)
+before it moves on to the next class. Pass 1 of a member only reads the
+signatures of the classes declared so far, so once pass 0 has run over
+every class the members can be checked in any order, as long as each
+one sees the program as it was when its own class had just been
+declared (a ProgramView).
+
+ParallelStaticChecker runs pass 0 over the whole program, stopping at
+the first class that fails it, then splits the members of the classes
+before that point into contiguous batches and checks them in a process
+pool. A batch stops at its first error and results are read in program
+order, so the error raised is the one StaticChecker would report first:
+the earliest failing member, then the failing class, then a missing
+entry point.
+
+Pickling an AST costs about as much as checking it, so where the fork
+start method exists the workers are forked after pass 0 and inherit the
+signature table and the members, and a task is only a range of member
+positions. The inherited objects are moved out of reach of the garbage
+collector (gc.freeze) first, so the workers do not copy the pages they
+live in. Elsewhere every worker unpickles the signature table once, when
+it starts, and every batch of members is pickled to its worker.
+
+The pool only pays off on large files. Below min_members members, or
+with a single worker, the program is checked serially by StaticChecker.
+"""
+
+import gc
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .static_checker import StaticChecker
+from .static_error import NoEntryPoint
+from ..utils.nodes import AttributeDecl
+
+_program = None  # signature table of the worker process
+_members = None  # (class name, member) pairs, inherited by forked workers
+
+
+def _start_worker(program_bytes):
+    global _program
+    _program = pickle.loads(program_bytes)
+
+
+def _check_batch(start, members):
+    """Check (class name, member) pairs in order; return (position, error) of the first failure."""
+    checker = StaticChecker()
+    for offset, (class_name, member) in enumerate(members):
+        try:
+            checker.check_member(member, _program, class_name)
+        except Exception as e:
+            return start + offset, e
+    return None
+
+
+def _check_inherited_batch(start, stop):
+    return _check_batch(start, _members[start:stop])
+
+
+def _fork_context():
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def default_workers():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class ParallelStaticChecker(StaticChecker):
+    """
+    StaticChecker running pass 1 of large programs across a process pool.
+
+    Args:
+        workers (int | None): pool size, the number of usable CPUs by default
+        min_members (int): smallest number of members worth a pool
+        batches_per_worker (int): batches handed to each worker, more
+            batches balance uneven method sizes better
+    """
+
+    def __init__(self, workers: int = None, min_members: int = 256, batches_per_worker: int = 4):
+        self.workers = workers if workers is not None else default_workers()
+        self.min_members = min_members
+        self.batches_per_worker = batches_per_worker
+
+    def check_program(self, node):
+        member_count = sum(len(x.members) for x in node.class_decls)
+        if self.workers <= 1 or member_count < self.min_members:
+            return super().check_program(node)
+
+        program = self.program_scope()
+        entry = []
+        members = []
+        failure = None
+        for decl in node.class_decls:
+            try:
+                declared = self.declare_class(decl, program, entry)
+            except Exception as e:
+                failure = e
+                break
+            members += [(decl.name, x) for x in declared]
+
+        error = self.check_members_in_pool(program, members)
+        if error is not None:
+            raise error
+        if failure is not None:
+            raise failure
+        if len(entry) < 1:
+            raise NoEntryPoint()
+
+    def check_members_in_pool(self, program, members):
+        """The error of the first member failing pass 1, None when all pass."""
+        global _program, _members
+        batches = self.split(members)
+        if not batches:
+            return None
+        workers = min(self.workers, len(batches))
+        context = _fork_context()
+        if context is None:
+            pool = ProcessPoolExecutor(workers, initializer=_start_worker, initargs=(pickle.dumps(program),))
+            tasks = [(_check_batch, start, batch) for start, batch in batches]
+        else:
+            _program, _members = program, members
+            gc.freeze()
+            pool = ProcessPoolExecutor(workers, mp_context=context)
+            tasks = [(_check_inherited_batch, start, start + len(batch)) for start, batch in batches]
+        try:
+            with pool:
+                futures = [pool.submit(*task) for task in tasks]
+                for future in futures:
+                    result = future.result()
+                    if result is not None:
+                        # batches after this one can only hold later errors
+                        for later in futures:
+                            later.cancel()
+                        return result[1]
+            return None
+        finally:
+            if context is not None:
+                _program, _members = None, None
+                gc.unfreeze()
+
+    def split(self, members):
+        """Contiguous (start, batch) pairs of about the same estimated checking work."""
+        weights = [self.weight(member) for _, member in members]
+        target = sum(weights) / max(self.workers * self.batches_per_worker, 1)
+        batches = []
+        start = 0
+        total = 0
+        for i, weight in enumerate(weights):
+            total += weight
+            if total >= target:
+                batches.append((start, members[start:i + 1]))
+                start = i + 1
+                total = 0
+        if start < len(members):
+            batches.append((start, members[start:]))
+        return batches
+
+    def weight(self, member: Any):
+        """Rough cost of checking member: its top-level statements and declarations."""
+        if isinstance(member, AttributeDecl):
+            return len(member.attributes)
+        body = member.body
+        return 1 + len(body.var_decls) + len(body.statements)
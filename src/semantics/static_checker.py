@@ -28,6 +28,13 @@ from .static_error import (
     MustInLoop, IllegalConstantExpression, IllegalArrayLiteral,
     IllegalMemberAccess, NoEntryPoint
 )
+from .symbol_table import Symbol, Lifecycle, ClassScope, ProgramScope, ProgramView, SymbolTable
+from .diagnostics import Diagnostics, ERROR
+from .builtins import BUILTINS
+from .overloads import Overloads
+from ..utils.type_table import (
+    INT, FLOAT, BOOLEAN, STRING, class_type, array_type, canonical_type
+)
 
 
 
@@ -49,12 +56,25 @@ class StaticChecker(ASTVisitor):
     10. IllegalMemberAccess - Improper access to static/instance members
 
     Also checks for valid entry point: static void main() with no parameters.
+
+    Every program is checked against the builtin classes of library, see src/semantics/builtins.py.
     """
 
+    library = BUILTINS
+
     def compareType(self, left : "Type", right: "Type", environment: Any = None, coercible: bool = True):
         """
         Method for type compatible check
+
+        Types built by ASTGeneration and by this checker are canonical (see
+        src/utils/type_table.py), so a type compared with itself is found by
+        identity before any structural comparison.
         """
+        if left is right and isinstance(left, Type):
+            return True
+        if left is ERROR or right is ERROR:
+            # an error reported already, see src/semantics/diagnostics.py
+            return True
         if isinstance(left, ReferenceType) or isinstance(right, ReferenceType):
             return self.compareType(left.referenced_type if isinstance(left, ReferenceType) else left, right.referenced_type if isinstance(right, ReferenceType) else right, environment=environment)
         elif isinstance(left, PrimitiveType) and isinstance(right, PrimitiveType):
@@ -70,21 +90,7 @@ class StaticChecker(ASTVisitor):
                 return left.type_name == right.type_name
         elif isinstance(left, ClassType) and isinstance(right, ClassType):
             if (coercible):
-                env = environment
-                if env.get("program") is None:
-                    while env.get("global") is not None:
-                        env = env.get("global")
-
-                if env.get("program") is not None:
-                    env = env.get("program")
-                parentlist = [right.class_name]
-                if env.get(right.class_name) is not None:
-                    parent = env.get(right.class_name)[1]
-                    while parent is not None:
-                        parentlist.append(parent)
-                        parent = env.get(parent)[1]
-
-                return left.class_name in parentlist
+                return self.is_subclass(right.class_name, left.class_name, environment.program)
             else:
                 return left.class_name == right.class_name
         elif isinstance(left, ArrayType) and isinstance(right, ArrayType):
@@ -97,194 +103,190 @@ class StaticChecker(ASTVisitor):
 
 
 
+    def is_subclass(self, name, ancestor, program):
+        """
+        Subtype test on the class-hierarchy index of the program being checked
+        """
+        return program.hierarchy.is_subclass(name, ancestor)
+
     def check_program(self, node):
         self.visit(node)
+
+    def collect_errors(self, node):
+        """
+        Check node in collecting mode and return every error found as a Diagnostic
+
+        The first diagnostic is the error check_program raises, see
+        src/semantics/diagnostics.py for how later errors are recovered from.
+        """
+        program = self.program_scope()
+        program.diagnostics = Diagnostics()
+        try:
+            self.visit(node, program)
+        except Exception:
+            # an internal error stops checking; past a reported error check_program
+            # would not have got this far, so the errors reported so far stand
+            if not program.diagnostics.items:
+                raise
+        return program.diagnostics.items
+
+    def report(self, error: StaticError, node: "ASTNode", program: ProgramScope):
+        """
+        Raise error, or record it when program collects diagnostics
+        """
+        if program.diagnostics is None:
+            raise error
+        program.diagnostics.add(error, node)
+
+    def recover(self, node: "ASTNode", o: Any, program: ProgramScope):
+        """
+        Visit node and tell whether it passed; in collecting mode its error is recorded instead of raised
+        """
+        if program.diagnostics is None:
+            self.visit(node, o)
+            return True
+        try:
+            self.visit(node, o)
+            return True
+        except StaticError as e:
+            program.diagnostics.add(e, node)
+            return False
+
+    def undeclared_identifier(self, name: str, table: SymbolTable):
+        """
+        The error for an undeclared name; in collecting mode the name gets the error type so it is reported once
+        """
+        if table.program.diagnostics is not None:
+            table.declare_outer(Symbol(name, ERROR))
+        return UndeclaredIdentifier(name)
     # _________________________________Program and class declarations_________________________________
+    def program_scope(self):
+        """A ProgramScope holding only the builtin classes of self.library"""
+        program = ProgramScope()
+        for class_scope in self.library.class_scopes():
+            program.declare(class_scope)
+        return program
+
     def visit_program(self, node: "Program", o: Any = None):
         #double pass, o:{pass, local:list, entry:boolean}
         Op = 0 #0:get class struct, 1:validate and 
-        env = {
-            "io" : ({
-                "readInt": {
-                    "type" : PrimitiveType("int"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : []
-                },
-                "writeInt": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("int")]
-                },
-                "writeIntLn": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("int")]
-                },
-                "readFloat": {
-                    "type" : PrimitiveType("float"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : []
-                },
-                "writeFloat": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("float")]
-                },
-                "writeFloatLn": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("float")]
-                },
-                "readBool": {
-                    "type" : PrimitiveType("boolean"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : []
-                },
-                "writeBool": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("boolean")]
-                },
-                "writeBoolLn": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("boolean")]
-                },
-                "readStr": {
-                    "type" : PrimitiveType("string"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : []
-                },
-                "writeStr": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("string")]
-                },
-                "writeStrLn": {
-                    "type" : PrimitiveType("void"),
-                    "is_static" : True,
-                    "is_final" : False,
-                    "params" : [PrimitiveType("string")]
-                }
-            }, None)
-        } #env will be like: "name": (localenv:{}, supername)
+        program = o if o is not None else self.program_scope()
         entry = []
-        [self.visit(x, (Op, env, entry)) for x in node.class_decls]
+        [self.recover(x, (Op, program, entry), program) for x in node.class_decls]
 
         if len(entry) < 1:
-            raise NoEntryPoint()
+            self.report(NoEntryPoint(), node, program)
         
 
 
     def visit_class_decl(self, node: "ClassDecl", o: Any = None): 
-        #pass 0 get class struct and members (name, parent, classenv)
+        #pass 0 get class struct and members (name, parent, members), then pass 1 on every member
         if o[0] == 0:
-            if o[1].get(node.name):
-                raise Redeclared("Class", node.name)
-            else:
-                super_class = node.superclass
-                env = {}            #classenv will be like: {"name": {"type", "is_static", "is_final", "params"}}
-                Op = 0
-                [self.visit(x, (Op, env, o[1], node.name)) for x in node.members]
-
-                #check for entry
-                if env.get("main"):
-                    if len(env["main"]["params"]) > 0:
-                        pass
-                    o[2].append(1)
-
-                #get environment of superclass here since it needs to be declared before use
-                if super_class is not None:
-                    if o[1].get(super_class):
-                        pass
-                    else:
-                        raise UndeclaredClass(super_class)
+            program = o[1]
+            declared = self.declare_class(node, program, o[2])
 
-                if super_class is not None:
-                    superenv = o[1].get(super_class)[0].copy()
+            Op = 1
+            [self.recover(x, (Op, program, node.name), program) for x in declared]
 
-                    superenv.update(env)
+    def declare_class(self, node: "ClassDecl", program: ProgramScope, entry: list):
+        """
+        Pass 0 of one class: collect its member signatures and declare it in program
 
-                    o[1][node.name] = (superenv, super_class)
-                else:
-                    o[1][node.name] = (env, super_class)
+        Returns the members whose signatures were collected, all of them unless errors are collected.
+        """
+        if program.lookup(node.name):
+            raise Redeclared("Class", node.name)
+        else:
+            members = {}        #members will be like: {"name": Symbol}
+            Op = 0
+            declared = [x for x in node.members if self.recover(x, (Op, members, program, node.name), program)]
 
-            Op = 1
-            [self.visit(x, (Op, o[1], node.name)) for x in node.members]
+            #check for entry
+            if members.get("main"):
+                if len(members["main"].params) > 0:
+                    pass
+                entry.append(1)
+
+            self.link_class(node, program, members)
+            return declared
+
+    def link_class(self, node: "ClassDecl", program: ProgramScope, members: dict):
+        """
+        End of pass 0 of one class: check its superclass and declare it in program with members
+        """
+        super_class = node.superclass
+        #superclass needs to be declared before use, its members are looked up through the parent scope
+        if super_class is not None:
+            if program.lookup(super_class):
+                pass
+            else:
+                self.report(UndeclaredClass(super_class), node, program)
 
+        parent = program.lookup(super_class) if super_class is not None else None
+        program.declare(ClassScope(node.name, parent, members))
+
+
+    def check_member(self, node: "ASTNode", program: ProgramScope, class_name: str):
+        """
+        Pass 1 of one member of a class declared in program, seeing only the classes declared up to it
+        """
+        view = ProgramView(program, program.lookup(class_name))
+        self.visit(node, (1, view, class_name))
 
     # _________________________________Attribute declarations_________________________________
     def visit_attribute_decl(self, node: "AttributeDecl", o: Any = None):
         #Pass 0: 
         #Pass 1: check for type mismatch, init values check
         if o[0] == 0:
-            #pass 0: o: (Op, classenv, programenv, classname)
+            #pass 0: o: (Op, members, program, classname)
             final = node.is_final
             static = node.is_static
-            attrType = node.attr_type
+            attrType = canonical_type(node.attr_type)
             Op = 0
             [self.visit(x, (Op, o[1], o[3], attrType, final, static)) for x in node.attributes]
         
         else:
-            #pass 1: o: (Op, programenv, classname)
+            #pass 1: o: (Op, program, classname)
             #check for type
             Op = 1
-            classenv = o[1].get(o[2])[0]
+            classScope = o[1].lookup(o[2])
             attrType = node.attr_type
 
-            self.visit(attrType, o[1])
+            self.recover(attrType, o[1], o[1])
 
-            [self.visit(x, (Op, o[1], classenv, node, o[2])) for x in node.attributes]
+            [self.recover(x, (Op, o[1], classScope, node), o[1]) for x in node.attributes]
 
 
     def visit_attribute(self, node: "Attribute", o: Any = None):
         #pass 0: return attribute name
         #pass 1: validate attribute initvalue
         if o[0] == 0:
-            #pass 0: o: (Op, classenv, classname, type, final, static)
+            #pass 0: o: (Op, members, classname, type, final, static)
             if node.name == o[2] or o[1].get(node.name):
                 raise Redeclared("Attribute", node.name)
 
-            o[1][node.name] = {
-                "type" : o[3],
-                "is_final" : o[4],
-                "is_static" : o[5],
-            }
+            o[1][node.name] = Symbol(node.name, o[3], is_final=o[4], is_static=o[5])
         else:
-            #pass 1: o: (Op=1, programenv, classenv, declarenode, classname)
+            #pass 1: o: (Op=1, program, classscope, declarenode)
             #check for initialization for final and reference type
-            attr = o[2].get(node.name)
-            if attr["is_final"]:
+            attr = o[2].lookup(node.name)
+            if attr.is_final:
                 if isinstance(node.init_value, NilLiteral) or node.init_value is None:
                     raise IllegalConstantExpression(NilLiteral())
 
             if not isinstance(node.init_value, NilLiteral) and node.init_value is not None:
-                env = {
-                    "program" : o[1],
-                    "name": o[4]
-                }
-                init_type, eval = self.visit(node.init_value, env)
-                attr_type = attr.get("type")
-                if not self.compareType(attr_type, init_type, o[1]):
-                    if attr["is_final"]:
+                table = SymbolTable(o[1], o[2])
+                init_type, eval = self.visit(node.init_value, table)
+                attr_type = attr.type
+                if not self.compareType(attr_type, init_type, table):
+                    if attr.is_final:
                         raise TypeMismatchInConstant(o[3])
                     else:
                         raise TypeMismatchInStatement(o[3])
-                if attr["is_final"] and not eval:
+                if attr.is_final and not eval:
                     raise IllegalConstantExpression(node.init_value)
             else:
-                if attr["is_final"]:
+                if attr.is_final:
                     raise IllegalConstantExpression(NilLiteral())
 
     # _________________________________Method declarations_________________________________
@@ -292,7 +294,7 @@ class StaticChecker(ASTVisitor):
         #pass 0: get method signatures: name, params
         #pass 1: validate type mismatch for initvalues, statements
         if o[0] == 0:
-            #pass 0: o: (Op, classenv, programenv, classname)
+            #pass 0: o: (Op, members, program, classname)
             if node.name == o[3] or o[1].get(node.name):
                 raise Redeclared("Method", node.name)
             Op = 0
@@ -309,36 +311,25 @@ class StaticChecker(ASTVisitor):
             #get the type
             paramlist = list(paramlist.values())
 
-            o[1][node.name] = {
-                "type" : retType,
-                "is_static" : static,
-                "is_final" : False,
-                "params" : paramlist
-            }
+            o[1][node.name] = Symbol(node.name, canonical_type(retType), is_static=static, params=paramlist)
 
         else:
             #pass 1: get inside, check param type legit and return type legit
-            #o : (Op=1, programenv, classname)
-            self.visit(node.return_type, o[1])
+            #o : (Op=1, program, classname)
+            self.recover(node.return_type, o[1], o[1])
             paramlist = {}
-            [self.visit(x, (o[0], o[1], o[2], paramlist)) for x in node.params]
+            [self.recover(x, (o[0], o[1], o[2], paramlist), o[1]) for x in node.params]
 
-            classenv = o[1].get(o[2])[0]
-            retType = classenv.get(node.name)["type"]
-            is_static = classenv.get(node.name)["is_static"]
-            env = {
-                "program" : o[1], 
-                "type": retType,
-                "name": o[2],
-                "is_static": is_static
-            }
+            classScope = o[1].lookup(o[2])
+            method = classScope.lookup(node.name)
+            table = SymbolTable(o[1], classScope, method.type, method.is_static)
 
-            self.visit(node.body, (env, paramlist))
+            self.visit(node.body, (table, paramlist))
 
 
     def visit_constructor_decl(self, node: "ConstructorDecl", o: Any = None):
         if o[0] == 0:
-            #pass 0: o: (Op, classenv, programenv, classname)
+            #pass 0: o: (Op, members, program, classname)
             name = node.name
 
             if name != o[3]:
@@ -352,62 +343,48 @@ class StaticChecker(ASTVisitor):
 
             paramlist = list(paramlist.values())
 
-            #Tuple for constructor decl: (name, params:list, methodenv:list) (size 2)
+            #constructors and destructor live in one Lifecycle symbol under the class name
             if o[1].get(name) is None:
-                o[1][name] = {
-                    "constructor": [paramlist]
-                }
-            elif o[1][name].get("constructor") is not None:
-                constructor = o[1][name].get("constructor")
-                for params in constructor:
-                        if params is not None:
-                            if all(self.compareType(x, y, o) for x, y in zip(params, paramlist)):
-                                raise Redeclared("Constructor", name)
-                o[1][name]["constructor"].append(paramlist)
-            else:
-                o[1][name]["constructor"] = [paramlist]
+                o[1][name] = Lifecycle(name)
+            lifecycle = o[1][name]
+            if lifecycle.constructors is None:
+                lifecycle.constructors = Overloads()
+            elif lifecycle.constructors.resolve(paramlist, lambda params: all(self.compareType(x, y, o) for x, y in zip(params, paramlist))):
+                raise Redeclared("Constructor", name)
+            lifecycle.constructors.add(paramlist)
             
         else:
             #pass 1: get inside, check param type legit
-            #o : (Op=1, programenv, classname)
+            #o : (Op=1, program, classname)
             paramlist = {}
-            [self.visit(x, (o[0], o[1], o[2], paramlist)) for x in node.params]
+            [self.recover(x, (o[0], o[1], o[2], paramlist), o[1]) for x in node.params]
 
-            env = {
-                "program" : o[1],
-                "name": o[2]
-            }
+            table = SymbolTable(o[1], o[1].lookup(o[2]))
 
-            self.visit(node.body, (env, paramlist))
+            self.visit(node.body, (table, paramlist))
 
     def visit_destructor_decl(self, node: "DestructorDecl", o: Any = None):
         if o[0] == 0:
-            #pass 0: o: (Op, classenv, programenv, classname)
+            #pass 0: o: (Op, members, program, classname)
             name = node.name
 
             if name != o[3]:
                 raise UndeclaredMethod("Destructor")
 
-            #Tuple for destructor decl: (name, params:list, methodenv:list) (size 2)
             if o[1].get(name) is None:
-                o[1][name] = {
-                    "destructor": []
-                }
-            elif o[1][name].get("destructor") is not None:
+                o[1][name] = Lifecycle(name)
+                o[1][name].destructor = True
+            elif o[1][name].destructor:
                 raise Redeclared("Destructor", name)
             else:
-                o[1][name]["destructor"] = []
+                o[1][name].destructor = True
 
         else:
             #pass 1: get inside
-            #o : (Op=1, programenv, classname)
-            classenv = o[1].get(o[2])[0]
-            env = {
-                "program" : o[1],
-                "name": o[2]
-            }
+            #o : (Op=1, program, classname)
+            table = SymbolTable(o[1], o[1].lookup(o[2]))
 
-            self.visit(node.body, env)
+            self.visit(node.body, table)
 
     def visit_parameter(self, node: "Parameter", o: Any = None):
         #pass 0: get name, type tuple
@@ -417,93 +394,83 @@ class StaticChecker(ASTVisitor):
             if o[1].get(node.name):
                 raise Redeclared("Parameter", node.name)
             
-            o[1][node.name] = node.param_type
+            o[1][node.name] = canonical_type(node.param_type)
         else:
-            #pass 1: o: (Op=1, programenv, classname)
+            #pass 1: o: (Op=1, program, classname, paramlist)
             #check for type legit
-            o[3][node.name] = {
-                "type": node.param_type,
-                "is_final": False
-            }
+            o[3][node.name] = Symbol(node.name, canonical_type(node.param_type))
             self.visit(node.param_type, o[1])
 
 
     # _________________________________Type system_________________________________
     def visit_primitive_type(self, node: "PrimitiveType", o: Any = None):
-        #o : programenv
+        #o : program
         pass
 
      
     def visit_array_type(self, node: "ArrayType", o: Any = None):
         #pass 0: check for illegal classtype as elementtype
-        #o: programenv
+        #o: program
         self.visit(node.element_type, o)
 
      
     def visit_class_type(self, node: "ClassType", o: Any = None):
         #pass 0: check for undeclared class type
-        #o : programenv
-        if o.get(node.class_name) is None:
+        #o : program
+        if o.lookup(node.class_name) is None:
             raise UndeclaredClass(node.class_name)
      
     def visit_reference_type(self, node: "ReferenceType", o: Any = None):
         #pass 0: check for reference to illegal class type
-        #o : programenv
+        #o : program
         self.visit(node.referenced_type, o)
 
     # _________________________________Statements_________________________________
      
     def visit_block_statement(self, node: "BlockStatement", o: Any = None):
-        #o: global environment type: dict {"program", "class"}
-        env = None
+        #o: symbol table, or (symbol table, parameters) for a method body
         if isinstance(o, tuple):
-            env = {
-                "local": o[1],
-                "global": o[0]
-            }
+            table, params = o
         else:
-            env = {
-                "local" : {},
-                "global" : o
-            }
+            table, params = o, {}
 
-        [self.visit(x, env) for x in node.var_decls]
-        [self.visit(x, env) for x in node.statements]
+        program = table.program
+        table.push_scope()
+        try:
+            [table.declare(x) for x in params.values()]
+            [self.recover(x, table, program) for x in node.var_decls]
+            [self.recover(x, table, program) for x in node.statements]
+        finally:
+            table.pop_scope()
 
 
      
     def visit_variable_decl(self, node: "VariableDecl", o: Any = None):
-        #o : env
-        v_type = node.var_type
-        programenv = o
-        while programenv.get("program") is None:
-            programenv = programenv.get("global")
-        programenv = programenv.get("program")
+        #o : symbol table
+        v_type = canonical_type(node.var_type)
 
         # validate type    
-        self.visit(v_type, programenv)
+        if not self.recover(v_type, o.program, o.program):
+            v_type = ERROR
 
         final = node.is_final
-        [self.visit(x, (o, v_type, final, node)) for x in node.variables]
+        [self.recover(x, (o, v_type, final, node), o.program) for x in node.variables]
 
      
     def visit_variable(self, node: "Variable", o: Any = None):
-        # o: (env, type, final, declnode)
-        env = o[0]
+        # o: (table, type, final, declnode)
+        table = o[0]
         v_type = o[1]
         is_final = o[2]
         declStatement = o[3]
 
-        if env["local"].get(node.name) is not None:
+        if table.declared_in_scope(node.name):
             raise Redeclared("Variable", node.name)
         else:
-            env["local"][node.name] = {
-                "type" : v_type,
-                "is_final" : is_final
-            }
+            table.declare(Symbol(node.name, v_type, is_final))
             if node.init_value is not None and not isinstance(node.init_value, NilLiteral):
-                init_type, eval = self.visit(node.init_value, env)
-                if not self.compareType(v_type, init_type, o[0]):
+                init_type, eval = self.visit(node.init_value, table)
+                if not self.compareType(v_type, init_type, table):
                     if is_final:
                         raise TypeMismatchInConstant(declStatement)
                     else:
@@ -530,85 +497,60 @@ class StaticChecker(ASTVisitor):
 
      
     def visit_if_statement(self, node: "IfStatement", o: Any = None):
-        cond, _ = self.visit(node.condition, o)
-        if not self.compareType(cond, PrimitiveType("boolean")):
-            raise TypeMismatchInStatement(node)
+        try:
+            cond, _ = self.visit(node.condition, o)
+            if not self.compareType(cond, BOOLEAN):
+                raise TypeMismatchInStatement(node)
+        except StaticError as e:
+            self.report(e, node, o.program)
         
-        env = {
-            "global": o,
-            "local": {}
-        }
-        self.visit(node.then_stmt, env)
+        self.recover(node.then_stmt, o, o.program)
 
         if node.else_stmt is not None:
-            else_env = {
-                "global": o,
-                "local": {}
-            }
-            self.visit(node.else_stmt, else_env)
+            self.recover(node.else_stmt, o, o.program)
 
 
 
      
     def visit_for_statement(self, node: "ForStatement", o: Any = None):
-        env = o
-
-        found = False
-        while env.get("local") is not None and not found:
-            iden = env["local"].get(node.variable)
-            if iden is not None:
-                idType = iden["type"]
-                if not self.compareType(idType, PrimitiveType("int"), coercible=False):
-                    raise TypeMismatchInStatement(node)
-                found = True
-            else:
-                env = env.get("global")
-        if not found:
-            raise UndeclaredIdentifier(node.variable)
-
-        exp1, _ = self.visit(node.start_expr, o)
-        if not self.compareType(PrimitiveType("int"), exp1):
-            raise TypeMismatchInStatement(node)
-        exp2, _ = self.visit(node.end_expr, o)
-        if not self.compareType(PrimitiveType("int"), exp2):
-            raise TypeMismatchInStatement(node)
+        try:
+            iden = o.lookup(node.variable)
+            if iden is None:
+                raise self.undeclared_identifier(node.variable, o)
+            if not self.compareType(iden.type, INT, coercible=False):
+                raise TypeMismatchInStatement(node)
+
+            exp1, _ = self.visit(node.start_expr, o)
+            if not self.compareType(INT, exp1):
+                raise TypeMismatchInStatement(node)
+            exp2, _ = self.visit(node.end_expr, o)
+            if not self.compareType(INT, exp2):
+                raise TypeMismatchInStatement(node)
+        except StaticError as e:
+            self.report(e, node, o.program)
         
-        stmt_env = {
-            "local": {},
-            "global": o,
-            "for": True
-        }
-        self.visit(node.body, stmt_env)
+        o.loops += 1
+        try:
+            self.recover(node.body, o, o.program)
+        finally:
+            o.loops -= 1
 
      
     def visit_break_statement(self, node: "BreakStatement", o: Any = None):
-        env = o
-        while env.get("global") is not None:
-            if env.get("for") is not None:
-                return
-            env = env.get("global")
-        
-        raise MustInLoop(node)
+        if o.loops == 0:
+            raise MustInLoop(node)
 
 
      
     def visit_continue_statement(self, node: "ContinueStatement", o: Any = None):
-        env = o
-        while env.get("global") is not None:
-            if env.get("for") is not None:
-                return
-            env = env.get("global")
-        
-        raise MustInLoop(node)
+        if o.loops == 0:
+            raise MustInLoop(node)
 
      
     def visit_return_statement(self, node: "ReturnStatement", o: Any = None):
-        env = o
         expType, _ = self.visit(node.value, o)
-        while env.get("global") is not None:
-            env = env.get("global")
         
-        if env.get("type") is None or not self.compareType(env["type"], expType):
+        if o.return_type is None or not self.compareType(o.return_type, expType):
             raise TypeMismatchInStatement(node)
 
      
@@ -627,21 +569,10 @@ class StaticChecker(ASTVisitor):
     # _________________________________Left-hand side (LHS)_________________________________
      
     def visit_id_lhs(self, node: "IdLHS", o: Any = None):
-        env = o
-        while env.get("local") is not None:
-            item = env["local"].get(node.name)
-            if item is not None:
-                return item.get("type"), item.get("is_final")
-            else:
-                env = env.get("global")
-        
-        raise UndeclaredIdentifier(node.name)
-        env = env.get("class")
-        if env.get(node.name) is None:
-            raise UndeclaredIdentifier(node.name)
-        else:
-            item = env.get(node.name)
-            return item["type"], item["is_final"]
+        item = o.lookup(node.name)
+        if item is None:
+            raise self.undeclared_identifier(node.name, o)
+        return item.type, item.is_final
 
 
      
@@ -659,38 +590,41 @@ class StaticChecker(ASTVisitor):
         right, r_eval = self.visit(node.right, o)
 
         if node.operator in ["\\", "%"]:
-            if not (self.compareType(left, PrimitiveType("int"), coercible=False, environment=env) and self.compareType(right, PrimitiveType("int"), environment=env, coercible=False)):
+            if not (self.compareType(left, INT, coercible=False, environment=env) and self.compareType(right, INT, environment=env, coercible=False)):
                 raise TypeMismatchInExpression(node)
             else:
-                return PrimitiveType("int"), l_eval and r_eval
+                return INT, l_eval and r_eval
         elif node.operator in ["+", "-", "*", "/", ">", "<", ">=", "<="]:
-            if not self.compareType(left, PrimitiveType("int")) or not self.compareType(right, PrimitiveType("int")):
+            if not self.compareType(left, INT) or not self.compareType(right, INT):
                 raise TypeMismatchInExpression(node)
             else:
                 if node.operator in [">", "<", ">=", "<="]:
-                    return PrimitiveType("boolean"), l_eval and r_eval
+                    return BOOLEAN, l_eval and r_eval
+                if node.operator == "/":
+                    # / is a float division whatever the types of its operands
+                    return FLOAT, l_eval and r_eval
                 if self.compareType(left, right, coercible=False):
                     return left, l_eval and r_eval
                 else:
-                    return PrimitiveType("float"), l_eval and r_eval
+                    return FLOAT, l_eval and r_eval
         elif node.operator in ["==", "!="]:
-            if not (self.compareType(left, PrimitiveType("int"), coercible=False) or self.compareType(left, PrimitiveType("boolean"))) or not (self.compareType(right, PrimitiveType("int"), coercible=False) or self.compareType(right, PrimitiveType("boolean"))):
+            if not (self.compareType(left, INT, coercible=False) or self.compareType(left, BOOLEAN)) or not (self.compareType(right, INT, coercible=False) or self.compareType(right, BOOLEAN)):
                 raise TypeMismatchInExpression(node)
             else:
                 if not self.compareType(left, right):
                     raise TypeMismatchInExpression(node)
                 else:
-                    return PrimitiveType("boolean"), l_eval and r_eval
+                    return BOOLEAN, l_eval and r_eval
         elif node.operator in ["&&", "||"]:
-            if not (self.compareType(left, PrimitiveType("boolean")) and self.compareType(right, PrimitiveType("boolean"))):
+            if not (self.compareType(left, BOOLEAN) and self.compareType(right, BOOLEAN)):
                 raise TypeMismatchInExpression(node)
             else:
-                return PrimitiveType("boolean"), l_eval and r_eval
+                return BOOLEAN, l_eval and r_eval
         elif node.operator == "^":
-            if not (self.compareType(left, PrimitiveType("string")) and self.compareType(right, PrimitiveType("string"))):
+            if not (self.compareType(left, STRING) and self.compareType(right, STRING)):
                 raise TypeMismatchInExpression(node)
             else:
-                return PrimitiveType("string"), l_eval and r_eval
+                return STRING, l_eval and r_eval
 
      
     def visit_unary_op(self, node: "UnaryOp", o: Any = None):
@@ -699,15 +633,16 @@ class StaticChecker(ASTVisitor):
         operand, eval = self.visit(node.operand, o)
 
         if node.operator == "!":
-            if self.compareType(operand, PrimitiveType("boolean")):
-                return PrimitiveType("boolean"), eval
+            if self.compareType(operand, BOOLEAN):
+                return BOOLEAN, eval
             else:
                 raise TypeMismatchInExpression(node)
         else:
-            if self.compareType(operand, PrimitiveType("int")):
-                return PrimitiveType("int"), eval
-            elif self.compareType(operand, PrimitiveType("float")):
-                return PrimitiveType("float"), eval
+            # compareType(operand, INT) holds for a float operand too, so float is tested first
+            if self.compareType(operand, FLOAT, coercible=False):
+                return FLOAT, eval
+            elif self.compareType(operand, INT):
+                return INT, eval
             else:
                 raise TypeMismatchInExpression(node)
 
@@ -725,6 +660,8 @@ class StaticChecker(ASTVisitor):
         if pType is not None:
             while isinstance(pType, ReferenceType):
                 pType = pType.referenced_type
+            if pType is ERROR:
+                return ERROR, False
             if not (isinstance(pType, ClassType) or isinstance(pType, ArrayType) or isinstance(pType, str)):
                 raise TypeMismatchInExpression(node)
 
@@ -771,46 +708,43 @@ class StaticChecker(ASTVisitor):
         if isinstance(primary, ArrayType):
             raise TypeMismatchInExpression(node)
         
-        while env.get("global") is not None:
-            env = env.get("global")
-
-        env = env.get("program")
+        program = env.program
         if isinstance(primary, ClassType):
             #instance access
-            if env.get(primary.class_name):
-                env, _ = env.get(primary.class_name)
+            if program.lookup(primary.class_name):
+                classScope = program.lookup(primary.class_name)
                 if node.method_name == primary.class_name:
                     raise IllegalMemberAccess(node)
-                ret = env.get(node.method_name)
+                ret = classScope.lookup(node.method_name)
                 if ret is None:
                     raise UndeclaredMethod(node.method_name)
-                elif ret.get("type") is None or ret.get("is_static"):
+                elif ret.type is None or ret.is_static:
                     raise IllegalMemberAccess(node)
                 else:
                     argument = list(map(lambda x: x[0], [self.visit(it, o[1]) for it in node.args]))
-                    params = ret.get("params")
+                    params = ret.params
                     if all(self.compareType(x,y, o[1]) for x, y in zip(params, argument)):
-                        return ret.get("type"), False
+                        return ret.type, False
                     else:
                         raise TypeMismatchInExpression(node)
             else:
                 raise UndeclaredClass(primary.class_name)
         else:
             #static mem access
-            if env.get(primary):
-                env, _ = env.get(primary)
+            if program.lookup(primary):
+                classScope = program.lookup(primary)
                 if node.method_name == primary:
                     raise IllegalMemberAccess(node)
-                ret = env.get(node.method_name)
+                ret = classScope.lookup(node.method_name)
                 if ret is None:
                     raise UndeclaredMethod(node.method_name)
-                elif ret.get("type") is None or not ret.get("is_static"):
+                elif ret.type is None or not ret.is_static:
                     raise IllegalMemberAccess(node)
                 else:
                     argument = list(map(lambda x: x[0], [self.visit(it, o[1]) for it in node.args]))
-                    params = ret.get("params")
+                    params = ret.params
                     if all(self.compareType(x, y, o[1]) for x, y in zip(params, argument)):
-                        return ret.get("type"), False
+                        return ret.type, False
                     else:
                         raise TypeMismatchInExpression(node)
             else:
@@ -824,39 +758,36 @@ class StaticChecker(ASTVisitor):
             primary = primary.referenced_type
         if isinstance(primary, ArrayType):
             raise TypeMismatchInExpression(node)
-        while env.get("global") is not None:
-            env = env.get("global")
-        
-        env = env.get("program")
+        program = env.program
 
         if isinstance(primary, ClassType):
             #instance memaccess
-            if env.get(primary.class_name):
-                env, _ = env.get(primary.class_name)
+            if program.lookup(primary.class_name):
+                classScope = program.lookup(primary.class_name)
                 if node.member_name == primary.class_name:
                     raise IllegalMemberAccess(node)
-                ret = env.get(node.member_name)
+                ret = classScope.lookup(node.member_name)
                 if ret is None:
                     raise UndeclaredAttribute(node.member_name)
-                elif ret.get("is_static"):
+                elif ret.is_static:
                     raise IllegalMemberAccess(node)
                 else:
-                    return ret.get("type"), ret.get("is_final")
+                    return ret.type, ret.is_final
             else:
                 raise UndeclaredClass(primary.class_name)
         else:
             #static memaccess
-            if env.get(primary):
-                env, _ = env.get(primary)
+            if program.lookup(primary):
+                classScope = program.lookup(primary)
                 if node.member_name == primary:
                     raise IllegalMemberAccess(node)
-                ret = env.get(node.member_name)
+                ret = classScope.lookup(node.member_name)
                 if ret is None:
                     raise UndeclaredAttribute(node.member_name)
-                elif not ret.get("is_static"):
+                elif not ret.is_static:
                     raise IllegalMemberAccess(node)
                 else:
-                    return ret.get("type"), ret.get("is_final")
+                    return ret.type, ret.is_final
             else:
                 raise UndeclaredClass(primary)
 
@@ -870,75 +801,54 @@ class StaticChecker(ASTVisitor):
             raise TypeMismatchInExpression(node)
         else:
             index, _ = self.visit(node.index, env)
-            if not self.compareType(index, PrimitiveType("int")):
+            if not self.compareType(INT, index):
                 raise TypeMismatchInExpression(node)
             return primary.element_type, False
 
     # _________________________________Back to expressions_________________________________
     def visit_object_creation(self, node: "ObjectCreation", o: Any = None):
-        env = o
-        while env.get("global") is not None:
-            env = env.get("global")
-        
-        env = env.get("program")
-        if env.get(node.class_name) is None:
+        classScope = o.program.lookup(node.class_name)
+        if classScope is None:
             raise UndeclaredClass(node.class_name)
         else:
             args = list(map(lambda x: x[0], [self.visit(it, o) for it in node.args]))
             if len(args) == 0:
                 #default constructor
-                return ClassType(node.class_name), True
+                return class_type(node.class_name), True
             else:
-                env, _ = env.get(node.class_name)
-                if env.get(node.class_name) is not None:
-                    constructor = env[node.class_name].get("constructor")
-                    for params in constructor:
-                        if params is not None:
-                            if all(self.compareType(x, y, o) for x, y in zip(params, args)):
-                                return ClassType(node.class_name), True
+                lifecycle = classScope.lookup(node.class_name)
+                if lifecycle is not None and lifecycle.constructors is not None:
+                    #see src/semantics/overloads.py for how constructors are matched
+                    if lifecycle.constructors.resolve(args, lambda params: all(self.compareType(x, y, o) for x, y in zip(params, args))):
+                        return class_type(node.class_name), True
                 raise TypeMismatchInExpression(node)
 
 
      
     def visit_identifier(self, node: "Identifier", o: Any = None):
         if isinstance(o, tuple):
-            env = o[0]
-
-            found = False
-            while env.get("local") is not None:
-                iden = env["local"].get(node.name)
-                if iden is not None:
-                    return iden["type"], iden["is_final"]
-                else:
-                    env = env.get("global")
-            if not found:
-                iden = env["program"].get(node.name)
-                if iden is None:
-                    raise UndeclaredIdentifier(node.name)
-                else:
-                    return node.name, None
+            #primary of a postfix expression: may also name a class
+            table = o[0]
+            iden = table.lookup(node.name)
+            if iden is not None:
+                return iden.type, iden.is_final
+            if table.program.lookup(node.name) is None:
+                raise self.undeclared_identifier(node.name, table)
+            else:
+                return node.name, None
         else:
-            env = o
-            while env.get("local") is not None:
-                iden = env["local"].get(node.name)
-                if iden is not None:
-                    return iden["type"], iden["is_final"]
-                else:
-                    env = env.get("global")
-            raise UndeclaredIdentifier(node.name)
+            iden = o.lookup(node.name)
+            if iden is not None:
+                return iden.type, iden.is_final
+            raise self.undeclared_identifier(node.name, o)
 
 
 
      
     def visit_this_expression(self, node: "ThisExpression", o: Any = None):
-        env = o
-        while env.get("global") is not None:
-            env = env.get("global")
-        
-        class_name = env.get("name")
-        if env.get("is_static") == True:
+        if o.is_static:
             raise IllegalMemberAccess(node)
-        return ClassType(class_name), False
+        return class_type(o.class_scope.name), False
 
 
      
@@ -950,30 +860,32 @@ class StaticChecker(ASTVisitor):
     # _________________________________Literals_________________________________
      
     def visit_int_literal(self, node: "IntLiteral", o: Any = None):
-        return PrimitiveType("int"), True
+        return INT, True
 
      
     def visit_float_literal(self, node: "FloatLiteral", o: Any = None):
-        return PrimitiveType("float"), True
+        return FLOAT, True
 
      
     def visit_bool_literal(self, node: "BoolLiteral", o: Any = None):
-        return PrimitiveType("boolean"), True
+        return BOOLEAN, True
 
      
     def visit_string_literal(self, node: "StringLiteral", o: Any = None):
-        return PrimitiveType("string"), True
+        return STRING, True
 
      
     def visit_array_literal(self, node: "ArrayLiteral", o: Any = None):
         env = o
         ele = list(map(lambda x: x[0], [self.visit(it, env) for it in node.value]))
+        if any(x is ERROR for x in ele):
+            return ERROR, True
         if not all(type(x) == type(ele[0]) for x in ele):
             raise IllegalArrayLiteral(node)
         if not all(self.compareType(x, ele[0], environment=env, coercible=False) for x in ele):
             raise IllegalArrayLiteral(node)
         else:
-            return ArrayType(ele[0], len(ele)), True
+            return array_type(ele[0], len(ele)), True
 
      
     def visit_nil_literal(self, node: "NilLiteral", o: Any = None):
@@ -7,8 +7,40 @@ static semantic checking of OPLang programs according to the language specificat
 
 
 class StaticError(Exception):
-    """Base class for all static semantic errors in OPLang"""
-    pass
+    """
+    Base class for all static semantic errors in OPLang
+
+    The message is rendered on the first str() call and cached. Errors are
+    often created and re-raised several times before anyone reads them, and
+    rendering means stringifying a whole AST subtree.
+
+    Attributes:
+        max_message_length (int | None): cap for rendered messages, longer
+            messages are cut and end with "...". None keeps them whole.
+    """
+    max_message_length = None
+
+    def __init__(self, *args):
+        # args are the constructor arguments, so errors stay picklable
+        super().__init__(*args)
+        self._message = None
+
+    def render(self):
+        """Build the full message, subclasses override this."""
+        return self.__class__.__name__
+
+    def __str__(self):
+        if self._message is None:
+            message = self.render()
+            limit = self.max_message_length
+            if limit is not None and len(message) > limit:
+                message = message[:max(limit - 3, 0)] + "..."
+            self._message = message
+        return self._message
+
+    @property
+    def message(self):
+        return str(self)
 
 
 class Redeclared(StaticError):
@@ -23,7 +55,10 @@ class Redeclared(StaticError):
     def __init__(self, kind, name):
         self.kind = kind
         self.name = name
-        super().__init__(f"Redeclared({kind}, {name})")
+        super().__init__(kind, name)
+
+    def render(self):
+        return f"Redeclared({self.kind}, {self.name})"
 
 
 class UndeclaredIdentifier(StaticError):
@@ -35,7 +70,10 @@ class UndeclaredIdentifier(StaticError):
     """
     def __init__(self, name):
         self.name = name
-        super().__init__(f"UndeclaredIdentifier({name})")
+        super().__init__(name)
+
+    def render(self):
+        return f"UndeclaredIdentifier({self.name})"
 
 
 class UndeclaredClass(StaticError):
@@ -47,7 +85,10 @@ class UndeclaredClass(StaticError):
     """
     def __init__(self, name):
         self.name = name
-        super().__init__(f"UndeclaredClass({name})")
+        super().__init__(name)
+
+    def render(self):
+        return f"UndeclaredClass({self.name})"
 
 
 class UndeclaredAttribute(StaticError):
@@ -59,7 +100,10 @@ class UndeclaredAttribute(StaticError):
     """
     def __init__(self, name):
         self.name = name
-        super().__init__(f"UndeclaredAttribute({name})")
+        super().__init__(name)
+
+    def render(self):
+        return f"UndeclaredAttribute({self.name})"
 
 
 class UndeclaredMethod(StaticError):
@@ -71,7 +115,10 @@ class UndeclaredMethod(StaticError):
     """
     def __init__(self, name):
         self.name = name
-        super().__init__(f"UndeclaredMethod({name})")
+        super().__init__(name)
+
+    def render(self):
+        return f"UndeclaredMethod({self.name})"
 
 
 class CannotAssignToConstant(StaticError):
@@ -83,7 +130,10 @@ class CannotAssignToConstant(StaticError):
     """
     def __init__(self, stmt):
         self.stmt = stmt
-        super().__init__(f"CannotAssignToConstant({stmt})")
+        super().__init__(stmt)
+
+    def render(self):
+        return f"CannotAssignToConstant({self.stmt})"
 
 
 class TypeMismatchInStatement(StaticError):
@@ -95,7 +145,10 @@ class TypeMismatchInStatement(StaticError):
     """
     def __init__(self, stmt):
         self.stmt = stmt
-        super().__init__(f"TypeMismatchInStatement({stmt})")
+        super().__init__(stmt)
+
+    def render(self):
+        return f"TypeMismatchInStatement({self.stmt})"
 
 
 class TypeMismatchInExpression(StaticError):
@@ -107,7 +160,10 @@ class TypeMismatchInExpression(StaticError):
     """
     def __init__(self, expr):
         self.expr = expr
-        super().__init__(f"TypeMismatchInExpression({expr})")
+        super().__init__(expr)
+
+    def render(self):
+        return f"TypeMismatchInExpression({self.expr})"
 
 
 class TypeMismatchInConstant(StaticError):
@@ -120,7 +176,10 @@ class TypeMismatchInConstant(StaticError):
     """
     def __init__(self, const_decl):
         self.const_decl = const_decl
-        super().__init__(f"TypeMismatchInConstant({const_decl})")
+        super().__init__(const_decl)
+
+    def render(self):
+        return f"TypeMismatchInConstant({self.const_decl})"
 
 
 class MustInLoop(StaticError):
@@ -132,7 +191,10 @@ class MustInLoop(StaticError):
     """
     def __init__(self, stmt):
         self.stmt = stmt
-        super().__init__(f"MustInLoop({stmt})")
+        super().__init__(stmt)
+
+    def render(self):
+        return f"MustInLoop({self.stmt})"
 
 
 class IllegalConstantExpression(StaticError):
@@ -145,7 +207,10 @@ class IllegalConstantExpression(StaticError):
     """
     def __init__(self, expr):
         self.expr = expr
-        super().__init__(f"IllegalConstantExpression({expr})")
+        super().__init__(expr)
+
+    def render(self):
+        return f"IllegalConstantExpression({self.expr})"
 
 
 class IllegalArrayLiteral(StaticError):
@@ -157,7 +222,10 @@ class IllegalArrayLiteral(StaticError):
     """
     def __init__(self, array_literal):
         self.array_literal = array_literal
-        super().__init__(f"IllegalArrayLiteral({array_literal})")
+        super().__init__(array_literal)
+
+    def render(self):
+        return f"IllegalArrayLiteral({self.array_literal})"
 
 
 class IllegalMemberAccess(StaticError):
@@ -172,7 +240,10 @@ class IllegalMemberAccess(StaticError):
     """
     def __init__(self, access_expr):
         self.access_expr = access_expr
-        super().__init__(f"IllegalMemberAccess({access_expr})")
+        super().__init__(access_expr)
+
+    def render(self):
+        return f"IllegalMemberAccess({self.access_expr})"
 
 
 class NoEntryPoint(StaticError):
@@ -185,7 +256,10 @@ class NoEntryPoint(StaticError):
     - Be static
     """
     def __init__(self):
-        super().__init__("No Entry Point")
+        super().__init__()
+
+    def render(self):
+        return "No Entry Point"
 
 
 # Note: Only 3 Illegal* errors are defined in OPLang specification:
@@ -0,0 +1,167 @@
+"""
+Symbol tables for the OPLang static checker.
+
+The program scope maps class names to class scopes and holds the
+class-hierarchy index. A class scope maps member names to their symbols:
+attributes, methods and, under the class name itself, the constructors
+and destructor of the class. It only stores the members the class
+declares and is chained to the scope of its superclass. An inherited
+name is found by walking up the chain once and is then remembered in the
+class's index of resolved names, so no class copies its superclass's
+members and repeated lookups of an inherited name cost one dict access.
+A ProgramView shows the program as it was when a given class had just
+been declared, which is what pass 1 of that class sees when the checker
+runs it apart from the other classes.
+
+Each method, constructor, destructor and attribute initializer is checked
+against its own SymbolTable, which reaches the program and class scopes
+in one step. Its block scopes form a stack: the table keeps a single dict
+from every name to its innermost visible symbol, and each scope records
+the symbols its declarations shadow, so a lookup is one dict access and
+leaving a block restores exactly the names the block declared.
+"""
+
+from .class_hierarchy import ClassHierarchy, HierarchyPrefix
+
+
+class Symbol:
+    """A variable, parameter, attribute or method."""
+
+    __slots__ = ("name", "type", "is_final", "is_static", "params")
+
+    def __init__(self, name, type, is_final=False, is_static=False, params=None):
+        self.name = name
+        self.type = type
+        self.is_final = is_final
+        self.is_static = is_static
+        self.params = params  # parameter types of a method, None for anything else
+
+
+class Lifecycle(Symbol):
+    """The constructors and destructor of a class, stored under the class name."""
+
+    __slots__ = ("constructors", "destructor")
+
+    def __init__(self, name):
+        super().__init__(name, None, None, None)
+        self.constructors = None  # Overloads holding one list of parameter types per constructor
+        self.destructor = False
+
+
+class ClassScope:
+    """A class, its own members and the scope of its superclass."""
+
+    __slots__ = ("name", "parent", "superclass", "members", "resolved", "index")
+
+    def __init__(self, name, parent=None, members=None):
+        self.name = name
+        self.index = None  # position in declaration order, set by ProgramScope.declare
+        self.parent = parent  # ClassScope of the superclass
+        self.superclass = parent.name if parent is not None else None
+        self.members = {} if members is None else members  # member name -> Symbol
+        self.resolved = {}  # inherited member name -> Symbol, None when there is none
+
+    def lookup(self, name):
+        """The symbol of member name, declared in this class or inherited."""
+        symbol = self.members.get(name)
+        if symbol is not None or self.parent is None:
+            return symbol
+        resolved = self.resolved
+        if name in resolved:
+            return resolved[name]
+        scope = self.parent
+        while scope is not None:
+            symbol = scope.members.get(name)
+            if symbol is not None:
+                break
+            if name in scope.resolved:
+                symbol = scope.resolved[name]
+                break
+            scope = scope.parent
+        resolved[name] = symbol
+        return symbol
+
+
+class ProgramScope:
+    """The classes declared so far and their hierarchy index."""
+
+    __slots__ = ("classes", "hierarchy", "diagnostics", "typed")
+
+    def __init__(self):
+        self.classes = {}  # class name -> ClassScope
+        self.hierarchy = ClassHierarchy()
+        self.diagnostics = None  # Diagnostics in collecting mode, None when errors are raised
+        self.typed = None  # TypedAST being filled by check_typed, None otherwise
+
+    def lookup(self, name):
+        return self.classes.get(name)
+
+    def declare(self, class_scope):
+        class_scope.index = len(self.classes)
+        self.classes[class_scope.name] = class_scope
+        self.hierarchy.add(class_scope.name, class_scope.superclass)
+
+
+class ProgramView:
+    """A ProgramScope restricted to the classes declared up to and including one class."""
+
+    __slots__ = ("classes", "count", "hierarchy", "diagnostics", "typed")
+
+    def __init__(self, program, class_scope):
+        self.classes = program.classes
+        self.count = class_scope.index + 1
+        self.hierarchy = HierarchyPrefix(program.hierarchy, self.count)
+        self.diagnostics = program.diagnostics
+        self.typed = program.typed
+
+    def lookup(self, name):
+        class_scope = self.classes.get(name)
+        if class_scope is None or class_scope.index >= self.count:
+            return None
+        return class_scope
+
+
+class SymbolTable:
+    """Block scopes of one method, constructor, destructor or attribute initializer."""
+
+    __slots__ = ("program", "class_scope", "return_type", "is_static", "symbols", "scopes", "loops")
+
+    def __init__(self, program, class_scope, return_type=None, is_static=False):
+        self.program = program
+        self.class_scope = class_scope
+        self.return_type = return_type  # None where a return statement is not allowed
+        self.is_static = is_static
+        self.symbols = {}  # name -> innermost visible symbol
+        self.scopes = []   # one dict per open block: name -> the symbol it shadows
+        self.loops = 0     # for statements around the statement being checked
+
+    def push_scope(self):
+        self.scopes.append({})
+
+    def pop_scope(self):
+        symbols = self.symbols
+        for name, shadowed in self.scopes.pop().items():
+            if shadowed is None:
+                del symbols[name]
+            else:
+                symbols[name] = shadowed
+
+    def declare(self, symbol):
+        """Declare symbol in the innermost block, shadowing outer ones of the same name."""
+        scope = self.scopes[-1]
+        if symbol.name not in scope:
+            scope[symbol.name] = self.symbols.get(symbol.name)
+        self.symbols[symbol.name] = symbol
+
+    def declare_outer(self, symbol):
+        """Declare symbol, whose name is not visible yet, in the outermost block."""
+        if self.scopes:
+            self.scopes[0][symbol.name] = None
+            self.symbols[symbol.name] = symbol
+
+    def declared_in_scope(self, name):
+        """True when name is declared in the innermost block."""
+        return bool(self.scopes) and name in self.scopes[-1]
+
+    def lookup(self, name):
+        return self.symbols.get(name)
@@ -0,0 +1,189 @@
+"""
+Typed AST output of the OPLang static checker.
+
+Every expression visitor of StaticChecker works out the type of its
+expression and whether its value is constant, and every name or member
+reference is resolved to the symbol it denotes, but StaticChecker only
+keeps what it needs to find the next error. TypingChecker.check_typed
+checks a program like check_program and keeps these results in a
+TypedAST, so later stages (optimizers, code generators) can read them
+instead of inferring types a second time. Recording lives in this
+subclass so that plain checking does not pay for it.
+
+A TypedAST holds side tables keyed by node, the AST itself is not
+touched:
+
+- types: every expression and postfix operation checked -> its Type; an
+  identifier naming a class, as in Math.sqrt(x), maps to the class name;
+- constants: the expressions whose value is constant, among those used
+  as values (not the primary of a postfix expression or an assignment
+  target, for which the checker tracks finality instead);
+- declarations: Identifier, IdLHS, MemberAccess, MethodCall and
+  ObjectCreation nodes -> the Symbol they resolve to (the Lifecycle of
+  the class for an object creation with arguments), ForStatement nodes
+  -> the symbol of their loop variable;
+- owners: MemberAccess, MethodCall and ObjectCreation nodes -> the name
+  of the class their member was looked up on;
+- kinds: the symbol of every parameter and local variable -> PARAMETER or
+  LOCAL; any other declaration is a class member.
+
+The tables are filled while checking, so a TypedAST is only complete
+when check_typed returns; it raises the first error as check_program
+does.
+"""
+
+from functools import wraps
+from typing import Any
+
+from .static_checker import StaticChecker
+from .symbol_table import SymbolTable
+from ..utils.nodes import ClassType, ReferenceType
+
+MEMBER = "member"
+PARAMETER = "parameter"
+LOCAL = "local"
+
+
+class TypedAST:
+    """Types, constness and declarations resolved for the expressions of one program."""
+
+    __slots__ = ("types", "constants", "declarations", "owners", "kinds")
+
+    def __init__(self):
+        self.types = {}         # expression or postfix operation -> Type, or class name
+        self.constants = set()  # expressions with a constant value
+        self.declarations = {}  # name or member reference -> Symbol
+        self.owners = {}        # member reference -> name of the class it was looked up on
+        self.kinds = {}         # parameter or local Symbol -> PARAMETER or LOCAL
+
+    def type_of(self, node):
+        return self.types.get(node)
+
+    def is_constant(self, node):
+        return node in self.constants
+
+    def declaration_of(self, node):
+        return self.declarations.get(node)
+
+    def kind_of(self, node):
+        """MEMBER, PARAMETER or LOCAL for a resolved reference, None for anything else."""
+        symbol = self.declarations.get(node)
+        if symbol is None:
+            return None
+        return self.kinds.get(symbol, MEMBER)
+
+
+def symbol_table(o):
+    """The SymbolTable an expression visitor gets, bare or in a (table, 1) or (primary type, table) tuple."""
+    if isinstance(o, tuple):
+        return o[0] if isinstance(o[0], SymbolTable) else o[1]
+    return o
+
+
+def typed_expression(visit):
+    """Make an expression visitor record the (type, constant) pair it returns in typed mode."""
+
+    @wraps(visit)
+    def visit_expression(self, node, o=None):
+        result = visit(self, node, o)
+        typed = symbol_table(o).program.typed
+        if typed is not None and result is not None and result[0] is not None:
+            typed.types[node] = result[0]
+            # visited with a bare table the expression is used as a value
+            if result[1] and not isinstance(o, tuple):
+                typed.constants.add(node)
+        return result
+
+    return visit_expression
+
+
+class TypingChecker(StaticChecker):
+    """StaticChecker recording the types and declarations it resolves in a TypedAST."""
+
+    def check_typed(self, node):
+        """Check node like check_program and return the TypedAST of its expressions."""
+        program = self.program_scope()
+        program.typed = TypedAST()
+        self.visit(node, program)
+        return program.typed
+
+    def resolve(self, node, symbol, table, owner=None):
+        """Record the symbol node refers to and the class it was looked up on."""
+        typed = table.program.typed
+        if typed is not None:
+            if symbol is not None:
+                typed.declarations[node] = symbol
+            if owner is not None:
+                typed.owners[node] = owner
+
+    def resolve_member(self, node, name, o):
+        """Record member name of the class of primary type o[0] as what node refers to."""
+        primary, table = o
+        while isinstance(primary, ReferenceType):
+            primary = primary.referenced_type
+        # a ClassType for instance access, the class name for static access
+        owner = primary.class_name if isinstance(primary, ClassType) else primary
+        self.resolve(node, table.program.lookup(owner).lookup(name), table, owner)
+
+    # the visitors below run StaticChecker's and then record what it resolved,
+    # which the scopes still show when the visitor returns
+
+    def visit_parameter(self, node, o: Any = None):
+        super().visit_parameter(node, o)
+        if o[0] == 1 and o[1].typed is not None:
+            #pass 1: o: (Op=1, program, classname, paramlist)
+            o[1].typed.kinds[o[3][node.name]] = PARAMETER
+
+    def visit_variable(self, node, o: Any = None):
+        super().visit_variable(node, o)
+        table = o[0]
+        if table.program.typed is not None:
+            table.program.typed.kinds[table.lookup(node.name)] = LOCAL
+
+    def visit_for_statement(self, node, o: Any = None):
+        super().visit_for_statement(node, o)
+        self.resolve(node, o.lookup(node.variable), o)
+
+    def visit_id_lhs(self, node, o: Any = None):
+        result = super().visit_id_lhs(node, o)
+        self.resolve(node, o.lookup(node.name), o)
+        return result
+
+    @typed_expression
+    def visit_identifier(self, node, o: Any = None):
+        result = super().visit_identifier(node, o)
+        table = symbol_table(o)
+        self.resolve(node, table.lookup(node.name), table)
+        return result
+
+    @typed_expression
+    def visit_method_call(self, node, o: Any = None):
+        result = super().visit_method_call(node, o)
+        self.resolve_member(node, node.method_name, o)
+        return result
+
+    @typed_expression
+    def visit_member_access(self, node, o: Any = None):
+        result = super().visit_member_access(node, o)
+        self.resolve_member(node, node.member_name, o)
+        return result
+
+    @typed_expression
+    def visit_object_creation(self, node, o: Any = None):
+        result = super().visit_object_creation(node, o)
+        # a creation without arguments uses the default constructor, there is no symbol for it
+        lifecycle = o.program.lookup(node.class_name).lookup(node.class_name) if node.args else None
+        self.resolve(node, lifecycle, o, node.class_name)
+        return result
+
+    visit_binary_op = typed_expression(StaticChecker.visit_binary_op)
+    visit_unary_op = typed_expression(StaticChecker.visit_unary_op)
+    visit_postfix_expression = typed_expression(StaticChecker.visit_postfix_expression)
+    visit_array_access = typed_expression(StaticChecker.visit_array_access)
+    visit_this_expression = typed_expression(StaticChecker.visit_this_expression)
+    visit_parenthesized_expression = typed_expression(StaticChecker.visit_parenthesized_expression)
+    visit_int_literal = typed_expression(StaticChecker.visit_int_literal)
+    visit_float_literal = typed_expression(StaticChecker.visit_float_literal)
+    visit_bool_literal = typed_expression(StaticChecker.visit_bool_literal)
+    visit_string_literal = typed_expression(StaticChecker.visit_string_literal)
+    visit_array_literal = typed_expression(StaticChecker.visit_array_literal)
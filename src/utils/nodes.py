@@ -2,6 +2,11 @@
 AST Node classes for OPLang programming language.
 This module defines all the AST node types used to represent
 the abstract syntax tree for OPLang programs.
+
+Every node class declares __slots__, so nodes carry no per-instance
+__dict__ and large programs keep their ASTs compact. Subclasses list
+only the fields their own __init__ sets; adding a field to a node means
+adding it to that class's __slots__ as well.
 """
 
 from abc import ABC, abstractmethod
@@ -14,9 +19,20 @@ if TYPE_CHECKING:
 class ASTNode(ABC):
     """Base class for all AST nodes."""
 
-    def __init__(self):
-        self.line = None
-        self.column = None
+    __slots__ = ()
+
+    # source positions are not tracked; class-level defaults cost no memory per node
+    line = None
+    column = None
+
+    def fields(self):
+        """(name, value) pairs of the node's fields, base-class fields first."""
+        return [
+            (name, getattr(self, name))
+            for cls in reversed(type(self).__mro__)
+            for name in cls.__dict__.get("__slots__", ())
+            if name != "__weakref__"
+        ]
 
     @abstractmethod
     def accept(self, visitor: "ASTVisitor", o: Any = None):
@@ -36,6 +52,8 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire OPLang program."""
 
+    __slots__ = ("class_decls",)
+
     def __init__(self, class_decls: List["ClassDecl"]):
         super().__init__()
         self.class_decls = class_decls
@@ -54,6 +72,8 @@ class Program(ASTNode):
 class ClassDecl(ASTNode):
     """Class declaration node."""
 
+    __slots__ = ("name", "superclass", "members")
+
     def __init__(
         self, name: str, superclass: Optional[str], members: List["ClassMember"]
     ):
@@ -75,7 +95,7 @@ class ClassDecl(ASTNode):
 class ClassMember(ASTNode):
     """Base class for class members (attributes, methods, constructors, destructors)."""
 
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -86,6 +106,8 @@ class ClassMember(ASTNode):
 class AttributeDecl(ClassMember):
     """Attribute declaration node."""
 
+    __slots__ = ("is_static", "is_final", "attr_type", "attributes")
+
     def __init__(
         self,
         is_static: bool,
@@ -112,6 +134,8 @@ class AttributeDecl(ClassMember):
 class Attribute(ASTNode):
     """Individual attribute node."""
 
+    __slots__ = ("name", "init_value")
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -133,6 +157,8 @@ class Attribute(ASTNode):
 class MethodDecl(ClassMember):
     """Method declaration node."""
 
+    __slots__ = ("is_static", "return_type", "name", "params", "body")
+
     def __init__(
         self,
         is_static: bool,
@@ -161,6 +187,8 @@ class MethodDecl(ClassMember):
 class ConstructorDecl(ClassMember):
     """Constructor declaration node."""
 
+    __slots__ = ("name", "params", "body")
+
     def __init__(self, name: str, params: List["Parameter"], body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -179,6 +207,8 @@ class ConstructorDecl(ClassMember):
 class DestructorDecl(ClassMember):
     """Destructor declaration node."""
 
+    __slots__ = ("name", "body")
+
     def __init__(self, name: str, body: "BlockStatement"):
         super().__init__()
         self.name = name
@@ -194,6 +224,8 @@ class DestructorDecl(ClassMember):
 class Parameter(ASTNode):
     """Method/Constructor parameter node."""
 
+    __slots__ = ("param_type", "name")
+
     def __init__(self, param_type: "Type", name: str):
         super().__init__()
         self.param_type = param_type
@@ -214,12 +246,15 @@ class Parameter(ASTNode):
 class Type(ASTNode):
     """Base class for type annotations."""
 
-    pass
+    # canonical types are held weakly by src/utils/type_table.py
+    __slots__ = ("__weakref__",)
 
 
 class PrimitiveType(Type):
     """Primitive type node."""
 
+    __slots__ = ("type_name",)
+
     def __init__(self, type_name: str):
         super().__init__()
         self.type_name = type_name  # "int", "float", "boolean", "string", "void"
@@ -234,6 +269,8 @@ class PrimitiveType(Type):
 class ArrayType(Type):
     """Array type node."""
 
+    __slots__ = ("element_type", "size")
+
     def __init__(self, element_type: Type, size: int):
         super().__init__()
         self.element_type = element_type
@@ -249,6 +286,8 @@ class ArrayType(Type):
 class ClassType(Type):
     """Class type node."""
 
+    __slots__ = ("class_name",)
+
     def __init__(self, class_name: str):
         super().__init__()
         self.class_name = class_name
@@ -263,6 +302,8 @@ class ClassType(Type):
 class ReferenceType(Type):
     """Reference type node."""
 
+    __slots__ = ("referenced_type",)
+
     def __init__(self, referenced_type: Type):
         super().__init__()
         self.referenced_type = referenced_type
@@ -282,12 +323,14 @@ class ReferenceType(Type):
 class Statement(ASTNode):
     """Base class for all statement nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BlockStatement(Statement):
     """Block statement containing variable declarations and statements."""
 
+    __slots__ = ("var_decls", "statements")
+
     def __init__(self, var_decls: List["VariableDecl"], statements: List[Statement]):
         super().__init__()
         self.var_decls = var_decls
@@ -309,6 +352,8 @@ class BlockStatement(Statement):
 class VariableDecl(ASTNode):
     """Variable declaration node."""
 
+    __slots__ = ("is_final", "var_type", "variables")
+
     def __init__(self, is_final: bool, var_type: Type, variables: List["Variable"]):
         super().__init__()
         self.is_final = is_final
@@ -327,6 +372,8 @@ class VariableDecl(ASTNode):
 class Variable(ASTNode):
     """Individual variable node."""
 
+    __slots__ = ("name", "init_value")
+
     def __init__(self, name: str, init_value: Optional["Expr"] = None):
         super().__init__()
         self.name = name
@@ -343,6 +390,8 @@ class Variable(ASTNode):
 class AssignmentStatement(Statement):
     """Assignment statement."""
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs: "LHS", rhs: "Expr"):
         super().__init__()
         self.lhs = lhs
@@ -358,6 +407,8 @@ class AssignmentStatement(Statement):
 class IfStatement(Statement):
     """If statement."""
 
+    __slots__ = ("condition", "then_stmt", "else_stmt")
+
     def __init__(
         self,
         condition: "Expr",
@@ -380,6 +431,8 @@ class IfStatement(Statement):
 class ForStatement(Statement):
     """For statement."""
 
+    __slots__ = ("variable", "start_expr", "direction", "end_expr", "body")
+
     def __init__(
         self,
         variable: str,
@@ -405,6 +458,8 @@ class ForStatement(Statement):
 class BreakStatement(Statement):
     """Break statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -418,6 +473,8 @@ class BreakStatement(Statement):
 class ContinueStatement(Statement):
     """Continue statement."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -431,6 +488,8 @@ class ContinueStatement(Statement):
 class ReturnStatement(Statement):
     """Return statement."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: "Expr"):
         super().__init__()
         self.value = value
@@ -445,6 +504,8 @@ class ReturnStatement(Statement):
 class MethodInvocationStatement(Statement):
     """Method invocation statement."""
 
+    __slots__ = ("method_call",)
+
     def __init__(self, method_call: "PostfixExpression"):
         super().__init__()
         self.method_call = method_call
@@ -464,12 +525,14 @@ class MethodInvocationStatement(Statement):
 class LHS(ASTNode):
     """Base class for left-hand side expressions in assignment."""
 
-    pass
+    __slots__ = ()
 
 
 class IdLHS(LHS):
     """Identifier left-hand side."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -484,6 +547,8 @@ class IdLHS(LHS):
 class PostfixLHS(LHS):
     """Postfix expression left-hand side (for member access, array access)."""
 
+    __slots__ = ("postfix_expr",)
+
     def __init__(self, postfix_expr: "PostfixExpression"):
         super().__init__()
         self.postfix_expr = postfix_expr
@@ -503,12 +568,14 @@ class PostfixLHS(LHS):
 class Expr(ASTNode):
     """Base class for all expression nodes."""
 
-    pass
+    __slots__ = ()
 
 
 class BinaryOp(Expr):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expr, operator: str, right: Expr):
         super().__init__()
         self.left = left
@@ -525,6 +592,8 @@ class BinaryOp(Expr):
 class UnaryOp(Expr):
     """Unary operation expression."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(self, operator: str, operand: Expr):
         super().__init__()
         self.operator = operator  # '+', '-', '!'
@@ -540,6 +609,8 @@ class UnaryOp(Expr):
 class PostfixExpression(Expr):
     """Postfix expression for method calls, member access, array access."""
 
+    __slots__ = ("primary", "postfix_ops")
+
     def __init__(self, primary: Expr, postfix_ops: List["PostfixOp"]):
         super().__init__()
         self.primary = primary
@@ -556,12 +627,14 @@ class PostfixExpression(Expr):
 class PostfixOp(ASTNode):
     """Base class for postfix operations."""
 
-    pass
+    __slots__ = ()
 
 
 class MethodCall(PostfixOp):
     """Method invocation postfix operation."""
 
+    __slots__ = ("method_name", "args")
+
     def __init__(self, method_name: str, args: List[Expr]):
         super().__init__()
         self.method_name = method_name
@@ -578,6 +651,8 @@ class MethodCall(PostfixOp):
 class MemberAccess(PostfixOp):
     """Member access postfix operation."""
 
+    __slots__ = ("member_name",)
+
     def __init__(self, member_name: str):
         super().__init__()
         self.member_name = member_name
@@ -592,6 +667,8 @@ class MemberAccess(PostfixOp):
 class ArrayAccess(PostfixOp):
     """Array access postfix operation."""
 
+    __slots__ = ("index",)
+
     def __init__(self, index: Expr):
         super().__init__()
         self.index = index
@@ -606,6 +683,8 @@ class ArrayAccess(PostfixOp):
 class ObjectCreation(Expr):
     """Object creation expression."""
 
+    __slots__ = ("class_name", "args")
+
     def __init__(self, class_name: str, args: List[Expr]):
         super().__init__()
         self.class_name = class_name
@@ -622,6 +701,8 @@ class ObjectCreation(Expr):
 class Identifier(Expr):
     """Identifier expression."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
@@ -636,6 +717,8 @@ class Identifier(Expr):
 class ThisExpression(Expr):
     """This expression."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -649,6 +732,8 @@ class ThisExpression(Expr):
 class ParenthesizedExpression(Expr):
     """Parenthesized expression."""
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expr):
         super().__init__()
         self.expr = expr
@@ -668,6 +753,8 @@ class ParenthesizedExpression(Expr):
 class Literal(Expr):
     """Base class for literal expressions."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -676,6 +763,8 @@ class Literal(Expr):
 class IntLiteral(Literal):
     """Integer literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         super().__init__(value)
 
@@ -689,6 +778,8 @@ class IntLiteral(Literal):
 class FloatLiteral(Literal):
     """Float literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         super().__init__(value)
 
@@ -702,6 +793,8 @@ class FloatLiteral(Literal):
 class BoolLiteral(Literal):
     """Boolean literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: bool):
         super().__init__(value)
 
@@ -715,6 +808,8 @@ class BoolLiteral(Literal):
 class StringLiteral(Literal):
     """String literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value)
 
@@ -728,6 +823,8 @@ class StringLiteral(Literal):
 class ArrayLiteral(Literal):
     """Array literal expression."""
 
+    __slots__ = ()
+
     def __init__(self, elements: List[Expr]):
         super().__init__(elements)
 
@@ -742,6 +839,8 @@ class ArrayLiteral(Literal):
 class NilLiteral(Literal):
     """Nil literal expression."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(None)
 
@@ -0,0 +1,70 @@
+"""
+What the OPLang operators compute, on Python values.
+
+An int is a Python int, a float a Python float, a boolean a Python bool
+and a string the text of its literal, escape sequences included, so ^
+joins the texts of its operands. Every stage that computes values, the
+constant folder as much as a back end, takes its operators from here so
+they agree on every value.
+
+The arithmetic and relational operators work on ints and floats alike: a
+float operand makes the operation a float one, as Python does. \\ and %
+round the quotient toward zero, so the remainder has the sign of the
+dividend, and / is a float division whatever the types of its operands.
+Dividing by zero raises ZeroDivisionError.
+"""
+
+import operator
+
+
+def int_divide(left, right):
+    """left \\ right: the quotient rounded toward zero."""
+    quotient = abs(left) // abs(right)
+    return quotient if (left < 0) == (right < 0) else -quotient
+
+
+def remainder(left, right):
+    """left % right, with the sign of left."""
+    return left - right * int_divide(left, right)
+
+
+def divide(left, right):
+    """left / right, always a float."""
+    return left / right
+
+
+def concatenate(left, right):
+    return left + right
+
+
+def logical_and(left, right):
+    return left and right
+
+
+def logical_or(left, right):
+    return left or right
+
+
+BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": divide,
+    "\\": int_divide,
+    "%": remainder,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "&&": logical_and,
+    "||": logical_or,
+    "^": concatenate,
+}
+
+UNARY_OPERATORS = {
+    "+": operator.pos,
+    "-": operator.neg,
+    "!": operator.not_,
+}
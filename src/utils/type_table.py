@@ -0,0 +1,89 @@
+"""
+Canonical type objects for OPLang.
+
+Types are immutable once built, so equal types can share one object.
+The primitive types are singletons and array, class and reference types
+are hash-consed: building the same type twice returns the same object,
+and two canonical types are equal exactly when they are the same object.
+
+ASTGeneration, the fast parser and StaticChecker build their types
+through these functions. Composite types are held weakly, so the table
+only keeps the types some AST or checker environment still refers to.
+Types built directly with the node constructors still work everywhere,
+canonical_type maps them to their canonical object. Types pickle as
+calls to these functions, so they are canonical again once unpickled in
+another process.
+"""
+
+import copyreg
+from weakref import WeakValueDictionary
+
+from .nodes import Type, PrimitiveType, ArrayType, ClassType, ReferenceType
+
+INT = PrimitiveType("int")
+FLOAT = PrimitiveType("float")
+BOOLEAN = PrimitiveType("boolean")
+STRING = PrimitiveType("string")
+VOID = PrimitiveType("void")
+
+PRIMITIVES = {t.type_name: t for t in (INT, FLOAT, BOOLEAN, STRING, VOID)}
+
+_class_types = WeakValueDictionary()
+_array_types = WeakValueDictionary()
+_reference_types = WeakValueDictionary()
+
+
+def primitive_type(name: str) -> PrimitiveType:
+    """The primitive type called name ("int", "float", "boolean", "string" or "void")."""
+    return PRIMITIVES[name]
+
+
+def class_type(name: str) -> ClassType:
+    t = _class_types.get(name)
+    if t is None:
+        t = _class_types[name] = ClassType(name)
+    return t
+
+
+def array_type(element_type: Type, size: int) -> ArrayType:
+    element_type = canonical_type(element_type)
+    # the canonical element is kept alive by the array type, so its id is a stable key
+    key = (id(element_type), size)
+    t = _array_types.get(key)
+    if t is None:
+        t = _array_types[key] = ArrayType(element_type, size)
+    return t
+
+
+def reference_type(referenced_type: Type) -> ReferenceType:
+    referenced_type = canonical_type(referenced_type)
+    key = id(referenced_type)
+    t = _reference_types.get(key)
+    if t is None:
+        t = _reference_types[key] = ReferenceType(referenced_type)
+    return t
+
+
+def canonical_type(t: Type) -> Type:
+    """The canonical object equal to t; t itself when it already is one."""
+    if isinstance(t, PrimitiveType):
+        return PRIMITIVES.get(t.type_name, t)
+    if isinstance(t, ClassType):
+        return class_type(t.class_name)
+    if isinstance(t, ArrayType):
+        return array_type(t.element_type, t.size)
+    if isinstance(t, ReferenceType):
+        return reference_type(t.referenced_type)
+    return t
+
+
+def _reduce_primitive(t):
+    if t.type_name in PRIMITIVES:
+        return primitive_type, (t.type_name,)
+    return object.__reduce_ex__(t, 2)
+
+
+copyreg.pickle(PrimitiveType, _reduce_primitive)
+copyreg.pickle(ClassType, lambda t: (class_type, (t.class_name,)))
+copyreg.pickle(ArrayType, lambda t: (array_type, (t.element_type, t.size)))
+copyreg.pickle(ReferenceType, lambda t: (reference_type, (t.referenced_type,)))
@@ -297,7 +297,7 @@ class BaseVisitor(ASTVisitor):
     def visit_method_invocation_statement(
         self, node: "MethodInvocationStatement", o: Any = None
     ):
-        self.visit(node.method_invocation, o)
+        self.visit(node.method_call, o)
 
     def visit_id_lhs(self, node: "IdLHS", o: Any = None):
         pass
@@ -1,4 +1,5 @@
 from tests.utils import ASTGenerator
+from src.utils.nodes import ASTNode, BinaryOp
 
 
 def test_001():
@@ -1161,4 +1162,99 @@ def test_0100():
         }
     }"""
 	expected = "Program([ClassDecl(RefBox, [AttributeDecl(PrimitiveType(int), [Attribute(size)]), ConstructorDecl(RefBox([Parameter(ReferenceType(PrimitiveType(int) &) s)]), BlockStatement(stmts=[AssignmentStatement(IdLHS(size) := Identifier(s))]))])])"
-	assert str(ASTGenerator(source).generate()) == expected
\ No newline at end of file
+	assert str(ASTGenerator(source).generate()) == expected
+	
+def test_101():
+	"""Long statement lists are built without deep recursion"""
+	source = "class Main { static void main() { " + "break; " * 5000 + "} }"
+	expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[" + ", ".join(["BreakStatement()"] * 5000) + "]))])])"
+	assert str(ASTGenerator(source).generate()) == expected
+
+def test_102():
+	"""Many classes and long binary chains in one file"""
+	source = " ".join(f"class C{i} {{}}" for i in range(3000)) + " class Main { int x := " + " + ".join(["1"] * 2000) + "; }"
+	ast = ASTGenerator(source).generate()
+	assert len(ast.class_decls) == 3001
+	assert str(ast.class_decls[0]) == "ClassDecl(C0, [])"
+	expr = ast.class_decls[-1].members[0].attributes[0].init_value
+	depth = 0
+	while isinstance(expr, BinaryOp):
+		assert str(expr.right) == "IntLiteral(1)"
+		expr = expr.left
+		depth += 1
+	assert depth == 1999 and str(expr) == "IntLiteral(1)"
+
+def test_103():
+	"""Nested postfix chains in call arguments are built once per level"""
+	expr, expected_expr = "x", "Identifier(x)"
+	for i in range(18):
+		expr = f"a{i}.f({expr})"
+		expected_expr = f"PostfixExpression(Identifier(a{i}).f({expected_expr}))"
+	source = "class Main { static void main() { " + expr + "; } }"
+	expected = "Program([ClassDecl(Main, [MethodDecl(static PrimitiveType(void) main([]), BlockStatement(stmts=[MethodInvocationStatement(" + expected_expr + ")]))])])"
+	assert str(ASTGenerator(source).generate()) == expected
+
+def test_104():
+	"""Assignment targets are parsed as expressions but keep their LHS nodes"""
+	source = "class Main { void m() { a := 1; (a) := 2; this.x := 3; a.f()[0] := 4; a.g(); } }"
+	expected = "Program([ClassDecl(Main, [MethodDecl(PrimitiveType(void) m([]), BlockStatement(stmts=[AssignmentStatement(IdLHS(a) := IntLiteral(1)), AssignmentStatement(PostfixLHS(ParenthesizedExpression((Identifier(a)))) := IntLiteral(2)), AssignmentStatement(PostfixLHS(PostfixExpression(ThisExpression(this).x)) := IntLiteral(3)), AssignmentStatement(PostfixLHS(PostfixExpression(Identifier(a).f()[IntLiteral(0)])) := IntLiteral(4)), MethodInvocationStatement(PostfixExpression(Identifier(a).g()))]))])])"
+	assert str(ASTGenerator(source).generate()) == expected
+
+def test_105():
+	"""A dangling else belongs to the nearest if, blocks and single statements alike"""
+	source = "class Main { void m() { if a then if b then x := 1; else { x := 2; } for i := 1 to 2 do {} } }"
+	expected = "Program([ClassDecl(Main, [MethodDecl(PrimitiveType(void) m([]), BlockStatement(stmts=[IfStatement(if Identifier(a) then IfStatement(if Identifier(b) then AssignmentStatement(IdLHS(x) := IntLiteral(1)), else BlockStatement(stmts=[AssignmentStatement(IdLHS(x) := IntLiteral(2))]))), ForStatement(for i := IntLiteral(1) to IntLiteral(2) do BlockStatement(stmts=[]))]))])])"
+	assert str(ASTGenerator(source).generate()) == expected
+
+def same_tree(a, b):
+	"""Node by node comparison: same classes and same fields all the way down"""
+	if type(a) is not type(b):
+		return False
+	if isinstance(a, (list, tuple)):
+		return len(a) == len(b) and all(same_tree(x, y) for x, y in zip(a, b))
+	if isinstance(a, ASTNode):
+		return all(same_tree(x, y) for (_, x), (_, y) in zip(a.fields(), b.fields()))
+	return a == b
+
+def test_106():
+	"""The fast parser accepts exactly what ANTLR accepts and builds the same AST, over every test program"""
+	from src.frontend.corpus import iter_test_sources
+	from src.frontend.fast_parser import parse
+	from tests.utils import Parser
+	for test_id, source in iter_test_sources():
+		try:
+			fast_ast = parse(source)
+		except Exception:
+			fast_ast = None
+		accepted = Parser(source).parse() == "success"
+		assert (fast_ast is not None) == accepted, test_id
+		if accepted:
+			assert same_tree(fast_ast, ASTGenerator(source).generate()), test_id
+
+def test_107():
+	"""The fast backend is selected per call and defers to ANTLR for rejected programs"""
+	from src.frontend import FAST
+	source = "class A { int& r := x, y := z; A(B) {} void m() { if a then if b then x := 1; else { x := {1, 2}; } } }"
+	expected = str(ASTGenerator(source).generate())
+	assert str(ASTGenerator(source, backend=FAST).generate()) == expected
+	source = "class A { void m() { a < b < c; } }"
+	assert str(ASTGenerator(source, backend=FAST).generate()) == str(ASTGenerator(source).generate())
+
+def test_108():
+	"""AST nodes are slotted: no instance __dict__, fields listed base class first"""
+	ast = ASTGenerator("class A { final int x := 1 + 2; void m() { return {1, 2}; } }").generate()
+	nodes = [ast]
+	for node in nodes:
+		assert not hasattr(node, "__dict__")
+		assert node.line is None and node.column is None
+		for _, value in node.fields():
+			nodes.extend(v for v in (value if isinstance(value, list) else [value]) if isinstance(v, ASTNode))
+	assert len(nodes) == 15
+	assert [name for name, _ in nodes[-1].fields()] == ["value"]
+	expr = BinaryOp(nodes[-2], "+", nodes[-1])
+	assert expr.fields() == [("left", nodes[-2]), ("operator", "+"), ("right", nodes[-1])]
+	try:
+		expr.type = "int"
+		assert False
+	except AttributeError:
+		pass
@@ -1,4 +1,5 @@
 from utils import Checker
+from src.semantics.static_error import StaticError
 
 
 def test_001():
@@ -1681,7 +1682,7 @@ def test_085():
     source = """
 class Test {
     static int main(){
-        int c := 5 * 3 + 7 * 2 - (10 / 2) + 5;
+        float c := 5 * 3 + 7 * 2 - (10 / 2) + 5;
     }
 }
 """
@@ -1971,4 +1972,354 @@ class Test {
 }
 """
     expected = "Static checking passed"
-    assert Checker(source).check_from_source() == expected
\ No newline at end of file
+    assert Checker(source).check_from_source() == expected
+
+def test_101():
+    """Error messages can be capped with StaticError.max_message_length"""
+    source = """
+class Test {
+    static void main() {
+        int x := "a very long string literal that makes the message long";
+    }
+}
+"""
+    full = "TypeMismatchInStatement(VariableDecl(PrimitiveType(int), [Variable(x = StringLiteral('a very long string literal that makes the message long'))]))"
+    assert Checker(source).check_from_source() == full
+    StaticError.max_message_length = 40
+    try:
+        assert Checker(source).check_from_source() == full[:37] + "..."
+    finally:
+        StaticError.max_message_length = None
+
+def test_102():
+    """Types are canonical: the same type is one object, in the AST and in the checker"""
+    from tests.utils import ASTGenerator
+    from src.frontend import FAST
+    from src.utils.nodes import PrimitiveType, ArrayType, ClassType, ReferenceType
+    from src.utils.type_table import INT, primitive_type, class_type, array_type, reference_type, canonical_type
+    source = """
+class A {
+    int[3] a; int[3] b;
+    A& r := x;
+    A m(A& p; int[3] q) { return p; }
+    static void main() { A x := new A(); x := this.m(x, this.a); }
+}
+"""
+    for backend in ("antlr", FAST):
+        ast = ASTGenerator(source, backend=backend).generate()
+        a, b, r, m, main = ast.class_decls[0].members
+        assert a.attr_type is b.attr_type is m.params[1].param_type is array_type(INT, 3)
+        assert r.attr_type is m.params[0].param_type is reference_type(class_type("A"))
+        assert m.return_type is class_type("A") is r.attr_type.referenced_type
+    assert primitive_type("int") is INT and canonical_type(PrimitiveType("int")) is INT
+    assert canonical_type(ArrayType(ReferenceType(ClassType("A")), 2)) is array_type(reference_type(class_type("A")), 2)
+    assert array_type(INT, 3) is not array_type(INT, 4)
+    source = """
+class A {
+    int[3] a; float f;
+    void m(int[3] q; int i) { this.a := q; q := {1, 2, 3}; this.f := i + this.a[0] * 2; }
+    static void main() { A x := new A(); x.m({1, 2, 3}, 4); }
+}
+"""
+    assert Checker(source).check_from_source() == "Static checking passed"
+
+def test_103():
+    """Subtype checks through a class hierarchy: upcasts pass, downcasts and siblings fail"""
+    from src.semantics.class_hierarchy import ClassHierarchy
+    hierarchy = ClassHierarchy()
+    hierarchy.add("A")
+    hierarchy.add("B", "A")
+    hierarchy.add("C", "B")
+    hierarchy.add("D", "A")
+    assert hierarchy.is_subclass("C", "A") and hierarchy.is_subclass("C", "C") and hierarchy.is_subclass("D", "A")
+    assert not hierarchy.is_subclass("A", "C") and not hierarchy.is_subclass("C", "D")
+    assert hierarchy.is_subclass("X", "X") and not hierarchy.is_subclass("X", "A") and not hierarchy.is_subclass("A", "X")
+    classes = "class A {} class B extends A {} class C extends B {} class D extends A {}\n"
+    main = "class Main { static void main() { A a; B b; C c := new C(); D d; %s } }"
+    assert Checker(classes + main % "a := c; b := c; a := new D();").check_from_source() == "Static checking passed"
+    assert Checker(classes + main % "c := b;").check_from_source() == "TypeMismatchInStatement(AssignmentStatement(IdLHS(c) := Identifier(b)))"
+    assert Checker(classes + main % "d := c;").check_from_source() == "TypeMismatchInStatement(AssignmentStatement(IdLHS(d) := Identifier(c)))"
+
+def test_104():
+    """Block scopes: inner declarations shadow outer ones and end with their block"""
+    from src.semantics.symbol_table import Symbol, SymbolTable, ProgramScope
+    from src.utils.type_table import INT, STRING
+    table = SymbolTable(ProgramScope(), None)
+    table.push_scope()
+    table.declare(Symbol("x", INT))
+    table.push_scope()
+    assert not table.declared_in_scope("x")
+    table.declare(Symbol("x", STRING, is_final=True))
+    table.declare(Symbol("y", INT))
+    assert table.lookup("x").type is STRING and table.declared_in_scope("x")
+    table.pop_scope()
+    assert table.lookup("x").type is INT and table.lookup("y") is None
+    table.pop_scope()
+    assert table.lookup("x") is None
+    main = "class Main { static void main() { %s } }"
+    assert Checker(main % "int x := 1; { string x := \"s\"; x := x ^ \"t\"; } x := x + 1;").check_from_source() == "Static checking passed"
+    assert Checker(main % "{ int y := 1; } y := 2;").check_from_source() == "UndeclaredIdentifier(y)"
+    assert Checker(main % "int i; for i := 1 to 2 do { break; } continue;").check_from_source() == "MustInLoop(ContinueStatement())"
+    assert Checker(main % "int i; for i := 1 to 2 do if true then { continue; }").check_from_source() == "Static checking passed"
+    assert Checker("class Main { static void main(int x) { int x; } }").check_from_source() == "Redeclared(Variable, x)"
+
+def test_105():
+    """Inherited members are found through the superclass chain, overrides first"""
+    from src.semantics.symbol_table import Symbol, ClassScope
+    from src.utils.type_table import INT, STRING
+    a = ClassScope("A", None, {"x": Symbol("x", INT), "m": Symbol("m", INT, params=[])})
+    b = ClassScope("B", a, {"y": Symbol("y", INT)})
+    c = ClassScope("C", b, {"m": Symbol("m", STRING, params=[])})
+    assert c.lookup("x") is a.members["x"] and c.lookup("m") is c.members["m"] and b.lookup("m") is a.members["m"]
+    assert c.lookup("z") is None and "x" not in c.members and c.resolved["x"] is a.members["x"]
+    assert c.superclass == "B" and a.superclass is None
+    classes = """
+class A { int x := 1; static int s; int m() { return 1; } A(int v) {} }
+class B extends A { string m() { return "b"; } }
+class C extends B {}
+"""
+    main = "class Main { static void main() { C c := new C(); %s } }"
+    assert Checker(classes + main % "int i := c.x + C.s; string t := c.m();").check_from_source() == "Static checking passed"
+    assert Checker(classes + main % "int i := c.m();").check_from_source() == "TypeMismatchInStatement(VariableDecl(PrimitiveType(int), [Variable(i = PostfixExpression(Identifier(c).m()))]))"
+    assert Checker(classes + main % "c.A();").check_from_source() == "IllegalMemberAccess(PostfixExpression(Identifier(c).A()))"
+    assert Checker(classes + main % "C d := new C(1);").check_from_source() == "TypeMismatchInExpression(ObjectCreation(new C(IntLiteral(1))))"
+
+def test_106():
+    """Parallel pass 1 reports the same first error as the serial checker"""
+    from tests.utils import ASTGenerator
+    from src.semantics import ParallelStaticChecker
+    sources = [
+        "class A { int m() { return 1; } } class Main { static void main() { A a := new A(); int x := a.m(); } }",
+        "class A { B b; } class B {} class Main { static void main() {} }",
+        "class A { void m() { break; } } class A {} class Main { static void main() {} }",
+        "class A { void m() { int x := 1; } } class B extends Nope {} class Main { static void main() {} }",
+        "class A { void m() { int x := true; } } class B { void n() { break; } static void main() {} }",
+        "class A { void m() { this.n(); } void n() {} }",
+    ]
+    for source in sources:
+        ast = ASTGenerator(source).generate()
+        expected = Checker(source).check_from_source()
+        for checker in (ParallelStaticChecker(workers=2, min_members=0, batches_per_worker=2),
+                        ParallelStaticChecker(workers=1)):
+            try:
+                checker.check_program(ast)
+                result = "Static checking passed"
+            except Exception as e:
+                result = str(e)
+            assert result == expected
+
+def test_107():
+    """Collecting mode reports every independent error once, the first one as check_program does"""
+    source = """
+class A {
+    int m(int p) {
+        Foo x := new Foo();
+        y := 1; y := y + 1;
+        if 1 then { x.go(); break; }
+        for p := 1 to "s" do { continue; q := 2; }
+        return true;
+    }
+}
+class B extends Missing { void n() { int z := "s"; this.m(1); } }
+class C { void main() {} }
+"""
+    assert Checker(source).check_all_from_source() == [
+        "UndeclaredClass(Foo)",
+        "UndeclaredIdentifier(y)",
+        "TypeMismatchInStatement(IfStatement(if IntLiteral(1) then BlockStatement(stmts=[MethodInvocationStatement(PostfixExpression(Identifier(x).go())), BreakStatement()])))",
+        "MustInLoop(BreakStatement())",
+        "TypeMismatchInStatement(ForStatement(for p := IntLiteral(1) to StringLiteral('s') do BlockStatement(stmts=[ContinueStatement(), AssignmentStatement(IdLHS(q) := IntLiteral(2))])))",
+        "UndeclaredIdentifier(q)",
+        "TypeMismatchInStatement(ReturnStatement(return BoolLiteral(True)))",
+        "UndeclaredClass(Missing)",
+        "TypeMismatchInStatement(VariableDecl(PrimitiveType(int), [Variable(z = StringLiteral('s'))]))",
+        "UndeclaredMethod(m)",
+    ]
+    assert Checker(source).check_from_source() == "UndeclaredClass(Foo)"
+    assert Checker("class A { int a; int a; void m() { break; } }").check_all_from_source() == [
+        "Redeclared(Attribute, a)", "MustInLoop(BreakStatement())", "No Entry Point"]
+    assert Checker("class A { static void main() { int x := 1; } }").check_all_from_source() == []
+
+def test_108():
+    """An incremental session re-checks changed members and the members depending on them"""
+    from tests.utils import ASTGenerator
+    from src.semantics import IncrementalChecker
+    program = """
+class A { int x := 1; int f(int p) { return 1; } int g() { return %s; } }
+class B { int h() { A a := new A(); return a.f(2); } int k() { A a := new A(); return a.x; } }
+class Main { static void main() { B b := new B(); int y := b.h(); } }
+"""
+    session = IncrementalChecker()
+    versions = [
+        (program % "1", 6),
+        (program % "2", 1),
+        ((program % "2").replace("int f(int p)", "int f(string p)"), 2),
+        ((program % "2").replace("int x := 1", "string x := \"s\""), 3),
+        (program % "2", 1),
+    ]
+    for source, checked in versions:
+        try:
+            session.check_program(ASTGenerator(source).generate())
+            result = "Static checking passed"
+        except Exception as e:
+            result = str(e)
+        assert result == Checker(source).check_from_source()
+        assert session.checked == checked
+
+def test_109():
+    """Typed mode records the type, constness and declaration of every expression"""
+    from tests.utils import ASTGenerator
+    from src.semantics import TypingChecker
+    from src.semantics.typed_ast import MEMBER, PARAMETER, LOCAL
+    from src.utils.type_table import INT, FLOAT, class_type
+    source = """
+class A { static final int k := 2; float f(int p) { final int c := 1 + 2; float x := p * 2.5 + A.k; return x + c; } }
+class Main { static void main() { A a := new A(); int i; for i := 1 to 3 do io.writeFloat(a.f(i)); } }
+"""
+    ast = ASTGenerator(source).generate()
+    typed = TypingChecker().check_typed(ast)
+    body = ast.class_decls[0].members[1].body
+    c_init = body.var_decls[0].variables[0].init_value
+    x_init = body.var_decls[1].variables[0].init_value
+    ret = body.statements[0].value
+    assert typed.type_of(c_init) is INT and typed.is_constant(c_init) and typed.is_constant(c_init.left)
+    assert typed.type_of(x_init) is FLOAT and not typed.is_constant(x_init)
+    assert typed.kind_of(x_init.left.left) == PARAMETER and typed.declaration_of(x_init.left.left).type is INT
+    assert typed.kind_of(ret.left) == LOCAL and typed.kind_of(ret.right) == LOCAL and typed.type_of(ret) is FLOAT
+    a_k = x_init.right
+    assert typed.type_of(a_k.primary) == "A" and typed.kind_of(a_k.postfix_ops[0]) == MEMBER and typed.type_of(a_k) is INT
+    assert typed.owners[a_k.postfix_ops[0]] == "A" and typed.declaration_of(a_k.postfix_ops[0]).is_static
+    main = ast.class_decls[1].members[0].body
+    creation = main.var_decls[0].variables[0].init_value
+    loop = main.statements[0]
+    call = loop.body.method_call
+    assert typed.type_of(creation) is class_type("A") and typed.owners[creation] == "A"
+    assert typed.kind_of(loop) == LOCAL and typed.type_of(call.primary) == "io" and typed.owners[call.postfix_ops[0]] == "io"
+    assert typed.type_of(call.postfix_ops[0].args[0].postfix_ops[0]) is FLOAT
+    try:
+        TypingChecker().check_typed(ASTGenerator("class Main { static void main() { int x := 1.5; } }").generate())
+        assert False
+    except StaticError as e:
+        assert str(e) == "TypeMismatchInStatement(VariableDecl(PrimitiveType(int), [Variable(x = FloatLiteral(1.5))]))"
+
+def test_110():
+    """Builtin classes are built once, shared read-only and extensible"""
+    from tests.utils import ASTGenerator
+    from src.semantics.static_checker import StaticChecker
+    from src.semantics.builtins import BUILTINS
+    from src.utils.type_table import FLOAT
+    io = StaticChecker().program_scope().lookup("io")
+    assert StaticChecker().program_scope().lookup("io") is io and io.index == 0
+    try:
+        io.members["readInt"] = None
+        assert False
+    except TypeError:
+        pass
+    source = "class Main { static void main() { float r := math.sqrt(2); io.writeFloat(r); } }"
+    assert Checker(source).check_from_source() == "UndeclaredIdentifier(math)"
+    checker = StaticChecker()
+    checker.library = BUILTINS.extend({"math": {"sqrt": (FLOAT, (FLOAT,))}})
+    checker.check_program(ASTGenerator(source).generate())
+    assert [x.name for x in checker.library.class_scopes()] == ["io", "math"] and BUILTINS.names == ["io"]
+    assert Checker("class io {} class Main { static void main() {} }").check_from_source() == "Redeclared(Class, io)"
+
+def test_111():
+    """Constructors resolve through the overload index as a scan over all of them would"""
+    from src.semantics.overloads import Overloads
+    from src.utils.type_table import INT, FLOAT, STRING, BOOLEAN, class_type, reference_type
+    overloads = Overloads()
+    for params in ([INT, STRING], [STRING, BOOLEAN], [FLOAT, INT], [class_type("A")], [INT, INT, INT]):
+        overloads.add(params)
+    compared = []
+    def compatible(params):
+        compared.append(params)
+        return params == [FLOAT, INT]
+    assert overloads.resolve([reference_type(INT), STRING], compatible) and compared == []
+    assert overloads.resolve([INT, INT], compatible) and compared == [[FLOAT, INT]]
+    compared.clear()
+    assert not overloads.resolve([BOOLEAN], compatible) and compared == []
+    assert overloads.resolve([STRING], compatible) and overloads.resolve([INT, INT, INT, STRING], compatible)
+    assert list(overloads) == overloads.signatures and len(overloads) == 5
+    classes = "class A {} class B extends A {} class K { K(int a; string b) {} K(float a; A b) {} K(boolean b) {} }"
+    main = " class Main { static void main() { %s } }"
+    assert Checker(classes + main % "K k := new K(1, \"s\"); K l := new K(1, new B()); K m := new K(true);").check_from_source() == "Static checking passed"
+    assert Checker(classes + main % "K k := new K(\"s\");").check_from_source() == "TypeMismatchInExpression(ObjectCreation(new K(StringLiteral('s'))))"
+    assert Checker("class K { K(float a) {} K(int a) {} }" + main % "").check_from_source() == "Redeclared(Constructor, K)"
+    assert Checker("class K { K(int a) {} K(float a) {} ~K() {} }" + main % "K k := new K(1.5);").check_from_source() == "Static checking passed"
+    assert Checker("class K { ~K() {} }" + main % "K k := new K(1);").check_from_source() == "TypeMismatchInExpression(ObjectCreation(new K(IntLiteral(1))))"
+
+def test_112():
+    """Name resolution binds parameters and locals to frame slots, reusing the slots of closed blocks"""
+    from tests.utils import ASTGenerator
+    from src.semantics import NameResolver
+    from src.semantics.typed_ast import PARAMETER, LOCAL
+    from src.utils.type_table import INT, FLOAT
+    source = """
+class A { int n := 1; int f(int p; float q) { int x := x + p; { int y := x; x := y; } { float z := q; for x := 1 to p do { int w := A.g(); } } return x; }
+static int g() { int a := 2; return a; } ~A() { int d; } }
+class Main { static void main() { int x := 1; io.writeInt(x); } }
+"""
+    ast = ASTGenerator(source).generate()
+    bindings = NameResolver().resolve(ast)
+    f, g, destructor = ast.class_decls[0].members[1:]
+    frame = bindings.frame_of(f)
+    assert frame.receiver and frame.params == 2 and frame.size == 6
+    assert [(d.name, d.kind, d.slot) for d in frame.declarations] == [
+        ("p", PARAMETER, 1), ("q", PARAMETER, 2), ("x", LOCAL, 3), ("y", LOCAL, 4), ("z", LOCAL, 4), ("w", LOCAL, 5)]
+    x = frame.declarations[2]
+    x_init = f.body.var_decls[0].variables[0].init_value
+    assert bindings.declaration_of(x_init.left) is x and bindings.slot_of(x_init.right) == 1 and x.type is INT
+    inner, outer = f.body.statements[:2]
+    assert bindings.declaration_of(inner.statements[0].lhs) is x and bindings.slot_of(inner.statements[0].rhs) == 4
+    loop = outer.statements[0]
+    assert bindings.declaration_of(loop) is x and bindings.slot_of(loop.end_expr) == 1
+    assert bindings.declaration_of(loop.body.var_decls[0].variables[0].init_value.primary) is None
+    assert frame.declarations[4].type is FLOAT
+    assert not bindings.frame_of(g).receiver and bindings.frame_of(g).declarations[0].slot == 0
+    assert bindings.frame_of(destructor).size == 2 and bindings.slot_of(f.body.statements[2].value) == 3
+    # frames are lists indexed by slot
+    values = [None] * frame.size
+    values[bindings.slot_of(x_init.right)] = 7
+    assert values[frame.declarations[0].slot] == 7
+    undeclared = ASTGenerator("class Main { static void main() { y := io.readInt(); } }").generate()
+    assert NameResolver().resolve(undeclared).bindings == {}
+
+def test_113():
+    """Constant folding puts literals in place of constant expressions, final names and final attributes"""
+    from tests.utils import ASTGenerator
+    from src.semantics import ConstantFolder, TypingChecker
+    from src.utils.type_table import FLOAT
+    source = r"""
+class A { static final int k := -7 \ 2; final string s := "ab" ^ "c"; int n := -7 % 3 + A.k;
+float f(int p) { final int c := (3 + 2) * 3; final float d := c; float x := p * 2.5 + d / 2; boolean b := !(c > 3) || c == 15;
+float q := 7 / 2 + 10 / 4.0; x := -2.5; p := 1 \ 0; return x + A.k; } }
+class Main { static void main() { io.writeStr(new A().s); } }
+"""
+    ast = ASTGenerator(source).generate()
+    folding = ConstantFolder().fold(ast)
+    attributes = [decl.attributes[0].init_value for decl in ast.class_decls[0].members[:3]]
+    assert [str(x) for x in attributes] == ["IntLiteral(-3)", "StringLiteral('abc')", "IntLiteral(-4)"]
+    body = ast.class_decls[0].members[3].body
+    inits = [decl.variables[0].init_value for decl in body.var_decls]
+    assert str(inits[0]) == "IntLiteral(15)" and str(inits[1]) == "IntLiteral(15)"
+    assert str(inits[2]) == "BinaryOp(BinaryOp(Identifier(p), *, FloatLiteral(2.5)), +, FloatLiteral(7.5))"
+    assert str(inits[3]) == "BoolLiteral(True)" and str(inits[4]) == "FloatLiteral(6.0)"
+    assert str(body.statements[0].rhs) == "FloatLiteral(-2.5)"
+    assert str(body.statements[1].rhs) == "BinaryOp(IntLiteral(1), \\, IntLiteral(0))"
+    assert str(body.statements[2].value) == "BinaryOp(Identifier(x), +, IntLiteral(-3))"
+    assert folding.typed.type_of(inits[2].right) is FLOAT and folding.folded == 25
+    assert str(TypingChecker().check_typed(ast).type_of(inits[4])) == "PrimitiveType(float)"
+    assert ConstantFolder().fold(ast).folded == 0
+
+def test_114():
+    """/ gives a float, which does not index an array"""
+    source = """
+class Test {
+    static void main(){
+        int[3] a := {1, 2, 3};
+        int x := a[4 / 2];
+    }
+}
+"""
+    expected = "TypeMismatchInExpression(PostfixExpression(Identifier(a)[BinaryOp(IntLiteral(4), /, IntLiteral(2))]))"
+    assert Checker(source).check_from_source() == expected
@@ -0,0 +1,845 @@
+from utils import Executor
+
+
+def test_001():
+    """Test printing an int"""
+    source = """
+class Test {
+    static void main() {
+        io.writeIntLn(42);
+    }
+}
+"""
+    expected = "42\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_002():
+    """Test arithmetic operators and their precedence"""
+    source = """
+class Test {
+    static void main() {
+        int a := 7, b := 2;
+        io.writeIntLn(a + b * 3);
+        io.writeIntLn((a + b) * 3);
+        io.writeIntLn(a - b - 1);
+    }
+}
+"""
+    expected = "13\n27\n4\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_003():
+    """Test integer division and remainder round toward zero, / divides as floats"""
+    source = """
+class Test {
+    static void main() {
+        int a := -7;
+        io.writeIntLn(a \\ 2);
+        io.writeIntLn(a % 2);
+        io.writeIntLn(7 \\ -2);
+        io.writeFloatLn(a / 2);
+    }
+}
+"""
+    expected = "-3\n-1\n-3\n-3.5\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_004():
+    """Test float arithmetic and int to float conversion on assignment"""
+    source = """
+class Test {
+    static void main() {
+        float x := 3;
+        float y := x / 2;
+        io.writeFloatLn(x);
+        io.writeFloatLn(y);
+        io.writeFloatLn(1 + 0.5);
+        io.writeFloat(2);
+    }
+}
+"""
+    expected = "3.0\n1.5\n1.5\n2.0"
+    assert Executor(source).run_from_source() == expected
+
+def test_005():
+    """Test boolean operators and relational operators"""
+    source = """
+class Test {
+    static void main() {
+        int a := 3;
+        io.writeBoolLn(a > 2 && a < 5);
+        io.writeBoolLn(a == 4 || !(a != 3));
+        io.writeBoolLn(a >= 4);
+        io.writeBool(2.5 <= a);
+    }
+}
+"""
+    expected = "true\ntrue\nfalse\ntrue"
+    assert Executor(source).run_from_source() == expected
+
+def test_006():
+    """Test && and || do not evaluate their right operand when the left decides"""
+    source = """
+class Test {
+    static int calls := 0;
+    static boolean touch(boolean value) {
+        Test.calls := Test.calls + 1;
+        return value;
+    }
+    static void main() {
+        boolean a := false && Test.touch(true);
+        boolean b := true || Test.touch(false);
+        boolean c := true && Test.touch(false);
+        io.writeIntLn(Test.calls);
+        io.writeBoolLn(c);
+    }
+}
+"""
+    expected = "1\nfalse\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_007():
+    """Test string concatenation and escape sequences"""
+    source = """
+class Test {
+    static void main() {
+        string s := "Hello";
+        string t := s ^ ", " ^ "World";
+        io.writeStrLn(t);
+        io.writeStr("a\\tb\\n\\"c\\"\\\\");
+    }
+}
+"""
+    expected = "Hello, World\na\tb\n\"c\"\\"
+    assert Executor(source).run_from_source() == expected
+
+def test_008():
+    """Test if and else statements"""
+    source = """
+class Test {
+    static void main() {
+        int x := 5;
+        if x > 3 then io.writeStrLn("big"); else io.writeStrLn("small");
+        if x > 10 then io.writeStrLn("huge");
+        if x % 2 == 1 then {
+            io.writeStrLn("odd");
+        } else {
+            io.writeStrLn("even");
+        }
+    }
+}
+"""
+    expected = "big\nodd\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_009():
+    """Test for loops counting up and down, and the variable after the loop"""
+    source = """
+class Test {
+    static void main() {
+        int i, sum := 0;
+        for i := 1 to 10 do sum := sum + i;
+        io.writeIntLn(sum);
+        io.writeIntLn(i);
+        for i := 3 downto 1 do io.writeInt(i);
+        io.writeIntLn(i);
+        for i := 5 to 1 do io.writeStrLn("never");
+    }
+}
+"""
+    expected = "55\n11\n3210\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_010():
+    """Test break and continue in nested loops"""
+    source = """
+class Test {
+    static void main() {
+        int i, j;
+        for i := 1 to 5 do {
+            if i == 2 then continue;
+            if i == 5 then break;
+            for j := 1 to 10 do {
+                if j > i then break;
+                io.writeInt(j);
+            }
+            io.writeStr(";");
+        }
+    }
+}
+"""
+    expected = "1;123;1234;"
+    assert Executor(source).run_from_source() == expected
+
+def test_011():
+    """Test the bound of a for loop is computed once"""
+    source = """
+class Test {
+    static void main() {
+        int i, n := 3, count := 0;
+        for i := 1 to n do {
+            n := n + 1;
+            count := count + 1;
+        }
+        io.writeIntLn(count);
+        io.writeIntLn(n);
+    }
+}
+"""
+    expected = "3\n6\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_012():
+    """Test recursive static methods"""
+    source = """
+class Test {
+    static int fib(int n) {
+        if n < 2 then return n;
+        return Test.fib(n - 1) + Test.fib(n - 2);
+    }
+    static int fact(int n) {
+        if n == 0 then return 1;
+        return n * Test.fact(n - 1);
+    }
+    static void main() {
+        io.writeIntLn(Test.fib(20));
+        io.writeIntLn(Test.fact(25));
+    }
+}
+"""
+    expected = "6765\n15511210043330985984000000\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_013():
+    """Test deep recursion does not grow the Python stack"""
+    source = """
+class Test {
+    static int depth(int n) {
+        if n == 0 then return 0;
+        return 1 + Test.depth(n - 1);
+    }
+    static void main() {
+        io.writeIntLn(Test.depth(20000));
+    }
+}
+"""
+    expected = "20000\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_014():
+    """Test objects, constructors and instance methods"""
+    source = """
+class Point {
+    int x, y;
+    Point(int x; int y) {
+        this.x := x;
+        this.y := y;
+    }
+    int manhattan() {
+        return this.x + this.y;
+    }
+    void move(int dx; int dy) {
+        this.x := this.x + dx;
+        this.y := this.y + dy;
+    }
+}
+class Test {
+    static void main() {
+        Point p := new Point(3, 4);
+        p.move(1, -2);
+        io.writeIntLn(p.manhattan());
+        io.writeIntLn(p.x);
+    }
+}
+"""
+    expected = "6\n4\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_015():
+    """Test attribute initializers and default values"""
+    source = """
+class Box {
+    int a := 2 * 3;
+    float f;
+    boolean b;
+    string s;
+    int[3] items;
+    Box self;
+}
+class Test {
+    static void main() {
+        Box x := new Box();
+        io.writeIntLn(x.a);
+        io.writeFloatLn(x.f);
+        io.writeBoolLn(x.b);
+        io.writeStrLn("[" ^ x.s ^ "]");
+        io.writeIntLn(x.items[2]);
+    }
+}
+"""
+    expected = "6\n0.0\nfalse\n[]\n0\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_016():
+    """Test each object gets its own array attribute"""
+    source = """
+class Bag {
+    int[2] items := {1, 2};
+}
+class Test {
+    static void main() {
+        Bag a := new Bag();
+        Bag b := new Bag();
+        a.items[0] := 10;
+        io.writeIntLn(a.items[0]);
+        io.writeIntLn(b.items[0]);
+    }
+}
+"""
+    expected = "10\n1\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_017():
+    """Test constructor overloads are chosen by their arguments, none runs without arguments"""
+    source = """
+class Value {
+    string kind := "none";
+    Value(boolean b) { this.kind := "bool"; }
+    Value(int i; int j) { this.kind := "ints"; }
+    Value(string s) { this.kind := "string"; }
+}
+class Test {
+    static void main() {
+        io.writeStrLn((new Value()).kind);
+        io.writeStrLn((new Value(true)).kind);
+        io.writeStrLn((new Value(1, 2)).kind);
+        io.writeStrLn((new Value("s")).kind);
+    }
+}
+"""
+    expected = "none\nbool\nints\nstring\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_018():
+    """Test static attributes are shared and inherited"""
+    source = """
+class Counter {
+    static int count := 10;
+    Counter() { Counter.count := Counter.count + 1; }
+}
+class Sub extends Counter {
+    static int twice() { return Sub.count * 2; }
+}
+class Test {
+    static void main() {
+        Counter a := new Counter();
+        Counter b := new Counter();
+        io.writeIntLn(Counter.count);
+        io.writeIntLn(Sub.twice());
+    }
+}
+"""
+    expected = "12\n24\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_019():
+    """Test inherited fields and overridden methods are dispatched on the object"""
+    source = """
+class Animal {
+    string name;
+    string sound() { return "..."; }
+    string speak() { return this.name ^ " says " ^ this.sound(); }
+}
+class Dog extends Animal {
+    Dog(string name) { this.name := name; }
+    string sound() { return "woof"; }
+}
+class Cat extends Animal {
+    Cat(string name) { this.name := name; }
+    string sound() { return "meow"; }
+}
+class Test {
+    static void main() {
+        Animal[2] pets;
+        int i;
+        pets[0] := new Dog("rex");
+        pets[1] := new Cat("tom");
+        for i := 0 to 1 do io.writeStrLn(pets[i].speak());
+    }
+}
+"""
+    expected = "rex says woof\ntom says meow\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_020():
+    """Test a field redeclared in a subclass does not hide the superclass one from its methods"""
+    source = """
+class A {
+    int v := 1;
+    int get() { return this.v; }
+}
+class B extends A {
+    int v := 2;
+    int own() { return this.v; }
+}
+class Test {
+    static void main() {
+        B b := new B();
+        io.writeIntLn(b.get());
+        io.writeIntLn(b.own());
+    }
+}
+"""
+    expected = "1\n2\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_021():
+    """Test arrays, array literals and array parameters share their elements"""
+    source = """
+class Test {
+    static void fill(int[4] a; int v) {
+        int i;
+        for i := 0 to 3 do a[i] := v + i;
+    }
+    static void main() {
+        int[4] a := {9, 9, 9, 9};
+        int[4] b := a;
+        Test.fill(a, 10);
+        io.writeIntLn(b[3]);
+        b[0] := b[1] + b[2];
+        io.writeIntLn(a[0]);
+    }
+}
+"""
+    expected = "13\n23\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_022():
+    """Test indexing outside of an array"""
+    source = """
+class Test {
+    static void main() {
+        int[3] a;
+        int i := 3;
+        io.writeIntLn(a[i - 1]);
+        a[i] := 1;
+        io.writeIntLn(1);
+    }
+}
+"""
+    expected = "IndexOutOfRange(3, 3)"
+    assert Executor(source).run_from_source() == expected
+
+def test_023():
+    """Test negative indexes are out of range"""
+    source = """
+class Test {
+    static void main() {
+        int[3] a := {1, 2, 3};
+        int i := -1;
+        io.writeIntLn(a[i]);
+    }
+}
+"""
+    expected = "IndexOutOfRange(-1, 3)"
+    assert Executor(source).run_from_source() == expected
+
+def test_024():
+    """Test division by zero at run time"""
+    source = """
+class Test {
+    static void main() {
+        int zero := 0;
+        io.writeIntLn(1 \\ zero);
+    }
+}
+"""
+    expected = "DivisionByZero()"
+    assert Executor(source).run_from_source() == expected
+
+def test_025():
+    """Test calling a method on nil"""
+    source = """
+class Node {
+    int value;
+    int get() { return this.value; }
+}
+class Test {
+    static void main() {
+        Node n;
+        io.writeIntLn(n.get());
+    }
+}
+"""
+    expected = "NilDereference()"
+    assert Executor(source).run_from_source() == expected
+
+def test_026():
+    """Test reference parameters write to the caller's variables"""
+    source = """
+class Test {
+    static void swap(int & a; int & b) {
+        int t := a;
+        a := b;
+        b := t;
+    }
+    static void main() {
+        int x := 1, y := 2;
+        Test.swap(x, y);
+        io.writeIntLn(x);
+        io.writeIntLn(y);
+    }
+}
+"""
+    expected = "2\n1\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_027():
+    """Test references to array elements and fields"""
+    source = """
+class Cell {
+    int value := 5;
+}
+class Test {
+    static void bump(int & v) { v := v + 1; }
+    static void main() {
+        int[3] a := {1, 2, 3};
+        Cell c := new Cell();
+        Test.bump(a[2]);
+        Test.bump(c.value);
+        Test.bump(a[0] + 1);
+        io.writeIntLn(a[2]);
+        io.writeIntLn(c.value);
+        io.writeIntLn(a[0]);
+    }
+}
+"""
+    expected = "4\n6\n1\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_028():
+    """Test methods returning references"""
+    source = """
+class Test {
+    static int & first(int[3] a) {
+        return a[0];
+    }
+    static void set(int & target; int value) {
+        target := value;
+    }
+    static void main() {
+        int[3] a := {1, 2, 3};
+        Test.set(Test.first(a), 100);
+        io.writeIntLn(a[0]);
+        io.writeIntLn(Test.first(a) + 1);
+    }
+}
+"""
+    expected = "100\n101\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_029():
+    """Test a reference parameter as the variable of a for loop"""
+    source = """
+class Test {
+    static void count(int & k; int[4] seen) {
+        for k := 1 to 3 do seen[k] := k * 10;
+    }
+    static void main() {
+        int i := 0;
+        int[4] seen;
+        Test.count(i, seen);
+        io.writeIntLn(i);
+        io.writeIntLn(seen[1] + seen[2] + seen[3]);
+    }
+}
+"""
+    expected = "4\n60\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_030():
+    """Test destructors run once their object is unreachable"""
+    source = """
+class Resource {
+    string name;
+    Resource(string name) { this.name := name; }
+    ~Resource() { io.writeStrLn("free " ^ this.name); }
+}
+class Test {
+    static void use() {
+        Resource r := new Resource("a");
+        io.writeStrLn("using " ^ r.name);
+    }
+    static void main() {
+        Resource kept := new Resource("b");
+        Test.use();
+        io.writeStrLn("done");
+    }
+}
+"""
+    expected = "using a\nfree a\ndone\nfree b\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_031():
+    """Test reading input with the io methods"""
+    source = """
+class Test {
+    static void main() {
+        int a := io.readInt();
+        float f := io.readFloat();
+        boolean b := io.readBool();
+        string s := io.readStr();
+        io.writeIntLn(a * 2);
+        io.writeFloatLn(f + 1);
+        io.writeBoolLn(!b);
+        io.writeStrLn(s ^ "!");
+    }
+}
+"""
+    expected = "42\n3.5\nfalse\nhi there!\n"
+    assert Executor(source, input="21\n2.5\ntrue\nhi there\n").run_from_source() == expected
+
+def test_032():
+    """Test reading a value of the wrong type"""
+    source = """
+class Test {
+    static void main() {
+        int a := io.readInt();
+    }
+}
+"""
+    expected = "InvalidInput(abc)"
+    assert Executor(source, input="abc\n").run_from_source() == expected
+
+def test_033():
+    """Test final constants and static final attributes"""
+    source = """
+class Config {
+    static final int SIZE := 4;
+    static final float SCALE := 2;
+}
+class Test {
+    static void main() {
+        final int twice := 4 * 2;
+        io.writeIntLn(twice);
+        io.writeFloatLn(Config.SCALE * Config.SIZE);
+    }
+}
+"""
+    expected = "8\n8.0\n"
+    assert Executor(source).run_from_source() == expected
+    assert Executor(source, fold=False).run_from_source() == expected
+
+def test_034():
+    """Test an instance main method runs on a new object"""
+    source = """
+class Program {
+    int start := 7;
+    void main() {
+        io.writeIntLn(this.start);
+    }
+}
+"""
+    expected = "7\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_035():
+    """Test a bubble sort on an array"""
+    source = """
+class Sort {
+    static void sort(int[6] a) {
+        int i, j;
+        for i := 0 to 4 do
+            for j := 0 to 4 - i do
+                if a[j] > a[j + 1] then {
+                    int t := a[j];
+                    a[j] := a[j + 1];
+                    a[j + 1] := t;
+                }
+    }
+    static void main() {
+        int[6] a := {5, 3, 8, 1, 9, 2};
+        int i;
+        Sort.sort(a);
+        for i := 0 to 5 do io.writeInt(a[i]);
+    }
+}
+"""
+    expected = "123589"
+    assert Executor(source).run_from_source() == expected
+
+def test_036():
+    """Test a linked list built from objects"""
+    source = """
+class Node {
+    int value;
+    Node next;
+    Node(int value; Node next) {
+        this.value := value;
+        this.next := next;
+    }
+}
+class Test {
+    static void main() {
+        Node head;
+        int i, sum := 0;
+        for i := 1 to 4 do head := new Node(i, head);
+        for i := 1 to 4 do {
+            sum := sum * 10 + head.value;
+            head := head.next;
+        }
+        io.writeIntLn(sum);
+    }
+}
+"""
+    expected = "4321\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_037():
+    """Test unbounded recursion stops with a stack overflow"""
+    source = """
+class Test {
+    static int forever(int n) {
+        return Test.forever(n + 1);
+    }
+    static void main() {
+        io.writeIntLn(Test.forever(0));
+    }
+}
+"""
+    expected = "StackOverflow(100000)"
+    assert Executor(source).run_from_source() == expected
+
+def test_038():
+    """Test a value loaded where a jump lands is not fused with the load before it"""
+    source = """
+class Test {
+    static void main() {
+        boolean a := false, b := true, c := false;
+        int i, n := 0;
+        io.writeBoolLn((a && b) == c);
+        io.writeBoolLn((b || a) != c);
+        for i := 1 to 3 do {
+            if i == 2 then continue;
+            n := n + i;
+        }
+        io.writeIntLn(n);
+    }
+}
+"""
+    expected = "true\ntrue\n4\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_039():
+    """Test / gives a float, which the checker refuses as an index, a loop bound or an int to write"""
+    for use in ["int[3] a := {1, 2, 3}; io.writeIntLn(a[4 / 2]);",
+                "int i; for i := 1 to 5 / 2 do io.writeIntLn(i);",
+                "int x := 7 / 2;",
+                "io.writeInt(7 / 2);"]:
+        source = "class Test { static void main() { %s } }" % use
+        assert Executor(source).run_from_source().startswith("TypeMismatchIn")
+    source = """
+class Test {
+    static void main() {
+        int[3] a := {1, 2, 3};
+        int i;
+        for i := 1 to 5 \\ 2 do io.writeInt(a[4 \\ 2] + i);
+        io.writeFloatLn(7 / 2);
+    }
+}
+"""
+    expected = "453.5\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_040():
+    """Test reference variables alias what they are initialised with, as in Example 4 of the specification"""
+    source = """
+class MathUtils {
+    static void swap(int & a; int & b) {
+        int temp := a;
+        a := b;
+        b := temp;
+    }
+    static void modifyArray(int[5] & arr; int index; int value) {
+        arr[index] := value;
+    }
+    static int & findMax(int[5] & arr) {
+        int & max := arr[0];
+        int i;
+        for i := 1 to 4 do {
+            if (arr[i] > max) then {
+                max := arr[i];
+            }
+        }
+        return max;
+    }
+}
+class Example4 {
+    static void main() {
+        int x := 10, y := 20;
+        int & xRef := x;
+        int & yRef := y;
+        int[5] numbers := {1, 2, 3, 4, 5};
+        int & maxRef := numbers[4];
+        io.writeIntLn(xRef);
+        io.writeIntLn(yRef);
+        MathUtils.swap(x, y);
+        io.writeIntLn(x);
+        io.writeIntLn(xRef);
+        xRef := 30;
+        io.writeIntLn(x);
+        MathUtils.modifyArray(numbers, 2, 99);
+        io.writeIntLn(numbers[2]);
+        maxRef := 100;
+        io.writeIntLn(numbers[4]);
+        io.writeIntLn(MathUtils.findMax(numbers));
+    }
+}
+"""
+    expected = "10\n20\n20\n20\n30\n99\n100\n100\n"
+    assert Executor(source).run_from_source() == expected
+
+def test_041():
+    """Test a reference variable without an initializer does not compile"""
+    source = """
+class Test {
+    static void main() {
+        int x := 1;
+        int & a, b := x;
+        io.writeIntLn(b);
+    }
+}
+"""
+    expected = "reference a has no initializer"
+    assert Executor(source).run_from_source() == expected
+
+def test_042():
+    """Test destructors print before what the program prints after dropping their object, locals first slot first"""
+    source = """
+class A {
+    int n;
+    A(int n) { this.n := n; }
+    ~A() { io.writeIntLn(this.n); }
+}
+class Test {
+    static int f() {
+        A x := new A(3), y := new A(4);
+        A z := new A(5);
+        return 0;
+    }
+    static void main() {
+        A a := new A(1);
+        A[2] both;
+        int k;
+        a := new A(2);
+        io.writeStrLn("stored");
+        k := Test.f();
+        both[0] := new A(6);
+        both[1] := new A(7);
+        both[0] := both[1];
+        io.writeStrLn("end");
+    }
+}
+"""
+    expected = "1\nstored\n3\n4\n5\n6\nend\n2\n7\n"
+    assert Executor(source).run_from_source() == expected
@@ -1107,4 +1107,27 @@ def test_0103():
     """String with escaped single quote (treated as normal char)"""
     source = """\""""
     expected = "Unclosed String: "
-    assert Tokenizer(source).get_tokens_as_string() == expected
\ No newline at end of file
+    assert Tokenizer(source).get_tokens_as_string() == expected
+
+def test_0104():
+    """The regex lexer emits the same tokens and lexer errors as the ANTLR lexer"""
+    from src.frontend.corpus import load_test_corpus
+    from src.frontend.regex_lexer import RegexLexer
+    sources = load_test_corpus() + [
+        "/* a **/ b */ c", "/* open * ", "1.e5 1e+3 1.5E 12abc", '"a\\q" x', '"a\\\\" "b',
+        "a\r\nb\n\n  c", "x := y; # tail", "~A(){}", "@", "",
+    ]
+    for source in sources:
+        expected = Tokenizer(source).get_tokens_as_string()
+        assert Tokenizer(source, RegexLexer).get_tokens_as_string() == expected, source
+
+
+def test_0105():
+    """Regex lexer tokens carry the ANTLR token types and positions"""
+    from antlr4 import InputStream
+    from build.OPLangLexer import OPLangLexer
+    from src.frontend.regex_lexer import RegexLexer
+    source = 'class A {\n  int x := 1.5; /* c\n */ string s := "a\\tb";\n}'
+    fields = lambda t: (t.type, t.text, t.line, t.column, t.start, t.stop)
+    expected = [fields(t) for t in OPLangLexer(InputStream(source)).getAllTokens()]
+    assert [fields(t) for t in RegexLexer(InputStream(source)).getAllTokens()] == expected
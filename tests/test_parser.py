@@ -1,4 +1,14 @@
+import pytest
+
 from utils import Parser
+from antlr4 import InputStream, CommonTokenStream
+from src.frontend.parsing import ParseStats, run_program, clear_dfa_caches, TWO_STAGE, SLL
+from src.frontend.profiler import profile_sources, format_report
+from src.frontend.dfa_cache import save_dfa_cache, load_dfa_cache, train_dfa_cache
+from src.frontend.session import CompilationSession, session_pool
+from src.utils.error_listener import NewErrorListener
+from build.OPLangLexer import OPLangLexer
+from build.OPLangParser import OPLangParser
 
 
 def test_001():
@@ -1421,3 +1431,145 @@ def test_105():
 	}"""
     expected = "success"
     assert Parser(source).parse() == expected
+
+def test_106():
+    """Two-stage parsing accepts valid programs without falling back to LL"""
+    source = """class Test {
+        int[3] a := {1, 2, 3};
+        static void main() {
+            Test t := new Test();
+            for i := 0 to 2 do io.writeIntLn(t.a[i]);
+        }
+    }"""
+    parser = Parser(source, TWO_STAGE)
+    stats = ParseStats()
+    run_program(parser.parser, TWO_STAGE, stats)
+    assert (stats.sll_attempts, stats.sll_successes, stats.ll_fallbacks) == (1, 1, 0)
+    assert Parser(source, TWO_STAGE).parse() == "success"
+
+def test_107():
+    """Two-stage parsing reports the same error as full LL"""
+    source = """class Program {
+            static void main(){
+                int a := ;
+            }
+        }"""
+    expected = "Error on line 3 col 25: ;"
+    assert Parser(source).parse() == expected
+    assert Parser(source, TWO_STAGE).parse() == expected
+    stats = ParseStats()
+    with pytest.raises(Exception) as error:
+        run_program(Parser(source).parser, TWO_STAGE, stats)
+    assert str(error.value) == expected
+    assert stats.ll_fallbacks == 1
+
+def test_108():
+    """Reference attributes need full LL context, two-stage falls back and succeeds"""
+    source = """class TestClass {
+        int& x := y;
+    }"""
+    assert Parser(source, SLL).parse() == "Error on line 2 col 19: ;"
+    assert Parser(source, TWO_STAGE).parse() == "success"
+
+def test_109():
+    """Only postfix expressions can be assigned to, the error is reported at :="""
+    source = """class Program {
+        static void main() {
+            a + b := 1;
+        }
+    }"""
+    assert Parser(source).parse() == "Error on line 3 col 18: :="
+    assert Parser(source, TWO_STAGE).parse() == "Error on line 3 col 18: :="
+
+
+def test_110():
+    """The decision profiler counts predictions per rule and ranks them in its report"""
+    source = """class A {
+        static final int x := 1;
+        void m() { a.b.c := 1; if x then y := 2; else z.f(); }
+    }"""
+    decisions = profile_sources([source])
+    by_rule = {}
+    for d in decisions:
+        by_rule.setdefault(d.rule_name, []).append(d)
+    assert sum(d.invocations for d in by_rule["exprstatement"]) == 3
+    assert max(d.max_look for d in by_rule["statement"]) <= 2
+    report = format_report(decisions, 1)
+    assert report.startswith("OPLang grammar decision profile\ninputs: 1,")
+    assert "memberspec" in report and "SLL->LL" in report
+    # the profiler parses with the recognizers, and their shared DFAs, every other front end uses
+    from src.frontend import profiler
+    assert profiler.OPLangParser is OPLangParser and profiler.OPLangLexer is OPLangLexer
+
+
+def test_111(tmp_path):
+    """Saved prediction DFAs load back into a cold parser and give the same results"""
+    source = """class A {
+        int& r := x, y := z;
+        void m() { a.b[1].c := 1; if x < y then y := {1, 2}; else for i := 0 to 3 do z.f(i); }
+    }"""
+    bad_source = "class A { void m() { a < b < c; } }"
+    cache = str(tmp_path / "OPLang.dfa")
+    train_dfa_cache([source, bad_source])
+    save_dfa_cache(cache)
+    count = lambda: sum(len(dfa._states) for dfa in OPLangParser.decisionsToDFA + OPLangLexer.decisionsToDFA)
+    saved = count()
+    clear_dfa_caches(OPLangLexer, OPLangParser)
+    assert count() == 0
+    assert load_dfa_cache(cache)
+    assert count() == saved
+    assert Parser(source).parse() == "success"
+    assert Parser(bad_source).parse() == "Error on line 1 col 27: <"
+    assert count() == saved
+    assert not load_dfa_cache(str(tmp_path / "missing.dfa"))
+    # caches of another layout or runtime, or that do not decode, restore nothing
+    import pickle
+    from src.frontend.dfa_cache import CACHE_FORMAT
+    with open(cache, "rb") as f:
+        good = pickle.load(f)
+    lexer_only = {"format": CACHE_FORMAT, "recognizers": dict(good["recognizers"])}
+    lexer_only["recognizers"]["OPLangParser"] = (good["recognizers"]["OPLangParser"][0], b"not a pickle")
+    clear_dfa_caches(OPLangLexer, OPLangParser)
+    for broken in [{"format": CACHE_FORMAT}, {"format": CACHE_FORMAT, "recognizers": None}, lexer_only, [1]]:
+        with open(cache, "wb") as f:
+            pickle.dump(broken, f)
+        assert not load_dfa_cache(cache)
+        assert count() == 0
+
+
+def test_112():
+    """A reused session gives the same results as new parsers, also after errors"""
+    sources = [
+        "class A { void m() { a.b[1].c := 1; } }",
+        "class A { void m() { a < b < c; } }",
+        "class A { string s := \"abc; }",
+        "class A { void m() { x := ; } }",
+        "class B extends A { static final int x := 1, y := 2; }",
+    ]
+
+    def fresh(source):
+        parser = OPLangParser(CommonTokenStream(OPLangLexer(InputStream(source))))
+        parser.removeErrorListeners()
+        parser.addErrorListener(NewErrorListener.INSTANCE)
+        try:
+            return run_program(parser).toStringTree(recog=parser)
+        except Exception as e:
+            return str(e)
+
+    session = CompilationSession()
+    for source in sources + sources[::-1]:
+        try:
+            result = session.parse(source, error_listener=NewErrorListener.INSTANCE).toStringTree(recog=session.parser)
+        except Exception as e:
+            result = str(e)
+        assert result == fresh(source)
+    assert session.inputs == 10
+
+    pool = session_pool()
+    with pool.session() as first:
+        with pool.session() as second:
+            assert first is not second
+    created = pool.created
+    for source in sources:
+        Parser(source).parse()
+    assert pool.created == created
@@ -0,0 +1,605 @@
+import io
+import os
+
+from utils import Executor, ASTGenerator
+from src.codegen import Transpiler, Runtime, CodeCache
+from src.codegen import cache as cache_module
+from src.codegen.runtime import execution_error
+
+
+def test_001():
+    """Test arithmetic, int division and remainder round toward zero, / divides as floats"""
+    source = """
+class Test {
+    static void main() {
+        int a := -7, b := 2;
+        io.writeIntLn(a + b * 3);
+        io.writeIntLn(a \\ b);
+        io.writeIntLn(a % b);
+        io.writeIntLn(7 \\ -2);
+        io.writeFloatLn(a / 2);
+        io.writeIntLn(-a % 3);
+    }
+}
+"""
+    expected = "-1\n-3\n-1\n-3\n-3.5\n1\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+    assert Executor(source, transpile=True, fold=False).run_from_source() == expected
+
+def test_002():
+    """Test ints stored in float variables and passed as float arguments become floats"""
+    source = """
+class Test {
+    static float half(float x) { return x / 2; }
+    static void main() {
+        float x := 3;
+        float[2] a := {1.0, 2.5};
+        a[0] := 1;
+        io.writeFloatLn(x);
+        io.writeFloatLn(Test.half(5));
+        io.writeFloatLn(a[0] + a[1]);
+        io.writeStrLn("a" ^ "b");
+    }
+}
+"""
+    expected = "3.0\n2.5\n3.5\nab\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_003():
+    """Test for loops leave their variable one step past the bound"""
+    source = """
+class Test {
+    static void main() {
+        int i, n := 0;
+        for i := 1 to 4 do n := n + i;
+        io.writeIntLn(i);
+        for i := 3 downto 1 do io.writeInt(i);
+        io.writeIntLn(i);
+        for i := 5 to 1 do n := 0;
+        io.writeIntLn(i);
+        io.writeIntLn(n);
+    }
+}
+"""
+    expected = "5\n3210\n5\n10\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_004():
+    """Test break and continue in for loops"""
+    source = """
+class Test {
+    static void main() {
+        int i, j, n := 0;
+        for i := 1 to 10 do {
+            if i == 2 then continue;
+            if i == 6 then break;
+            for j := i downto 1 do {
+                if j == 3 then break;
+                n := n + j;
+            }
+        }
+        io.writeIntLn(i);
+        io.writeIntLn(n);
+    }
+}
+"""
+    expected = "6\n14\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_005():
+    """Test a for loop whose body assigns its variable"""
+    source = """
+class Test {
+    static void main() {
+        int i, n := 0;
+        for i := 1 to 10 do {
+            n := n + 1;
+            if i == 3 then continue;
+            i := i + 1;
+        }
+        io.writeIntLn(i);
+        io.writeIntLn(n);
+    }
+}
+"""
+    expected = "12\n6\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_006():
+    """Test a reference parameter and an aliased local as the variable of a for loop"""
+    source = """
+class Test {
+    static void count(int & k; int[4] seen) {
+        for k := 1 to 3 do seen[k] := k * 10;
+    }
+    static void main() {
+        int i := 0, j;
+        int[4] seen;
+        int & r := j;
+        Test.count(i, seen);
+        for j := 1 to 2 do r := r + 1;
+        io.writeIntLn(i);
+        io.writeIntLn(seen[1] + seen[2] + seen[3]);
+        io.writeIntLn(j);
+    }
+}
+"""
+    expected = "4\n60\n3\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_007():
+    """Test recursion, and recursion deeper than the default Python limit"""
+    source = """
+class Test {
+    static int fib(int n) {
+        if n < 2 then return n;
+        return Test.fib(n - 1) + Test.fib(n - 2);
+    }
+    static int depth(int n) {
+        if n == 0 then return 0;
+        return Test.depth(n - 1) + 1;
+    }
+    static void main() {
+        io.writeIntLn(Test.fib(15));
+        io.writeIntLn(Test.depth(20000));
+    }
+}
+"""
+    expected = "610\n20000\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_008():
+    """Test unbounded recursion, also through field initializers, stops with a stack overflow"""
+    source = """
+class Test {
+    static int forever(int n) {
+        return Test.forever(n + 1);
+    }
+    static void main() {
+        io.writeIntLn(Test.forever(0));
+    }
+}
+"""
+    expected = "StackOverflow(100000)"
+    assert Executor(source, transpile=True).run_from_source() == expected
+    source = """
+class Node {
+    Node next := new Node();
+}
+class Test {
+    static void main() {
+        Node n := new Node();
+    }
+}
+"""
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_009():
+    """Test constructors, field initializers and overridden methods"""
+    source = """
+class Animal {
+    string name := "?";
+    int legs := 4;
+    string sound() { return "..."; }
+    string speak() { return this.name ^ " says " ^ this.sound(); }
+}
+class Dog extends Animal {
+    Dog(string name) { this.name := name; }
+    string sound() { return "woof"; }
+}
+class Bird extends Animal {
+    int wings := 2;
+    Bird(boolean named) { if named then this.name := "tweety"; else this.legs := this.wings; }
+    string sound() { return "tweet"; }
+}
+class Test {
+    static void main() {
+        Animal[3] pets;
+        int i;
+        pets[0] := new Dog("rex");
+        pets[1] := new Bird(false);
+        pets[2] := new Bird(true);
+        for i := 0 to 2 do {
+            io.writeStrLn(pets[i].speak());
+            io.writeIntLn(pets[i].legs);
+        }
+    }
+}
+"""
+    expected = "rex says woof\n4\n? says tweet\n2\ntweety says tweet\n4\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_010():
+    """Test a field redeclared in a subclass does not hide the superclass one from its methods"""
+    source = """
+class A {
+    int v := 1;
+    int get() { return this.v; }
+}
+class B extends A {
+    int v := 2;
+    int own() { return this.v; }
+}
+class Test {
+    static void main() {
+        B b := new B();
+        io.writeIntLn(b.get());
+        io.writeIntLn(b.own());
+    }
+}
+"""
+    expected = "1\n2\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_011():
+    """Test static attributes are shared, inherited and initialized in order"""
+    source = """
+class Counter {
+    static int count := 10;
+    static int twice := Counter.count * 2;
+    Counter() { Counter.count := Counter.count + 1; }
+}
+class Sub extends Counter {
+    static int total() { return Sub.count + Sub.twice; }
+}
+class Test {
+    static void main() {
+        Counter a := new Counter();
+        Counter b := new Sub();
+        io.writeIntLn(Counter.count);
+        io.writeIntLn(Sub.total());
+    }
+}
+"""
+    expected = "11\n31\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_012():
+    """Test arrays share their elements and indexes are checked"""
+    source = """
+class Test {
+    static void fill(int[4] a; int v) {
+        int i;
+        for i := 0 to 3 do a[i] := v + i;
+    }
+    static void main() {
+        int[4] a := {9, 9, 9, 9};
+        int[4] b := a;
+        int i := 4;
+        Test.fill(a, 10);
+        io.writeIntLn(b[3]);
+        io.writeIntLn(a[i - 1]);
+        a[i] := 1;
+    }
+}
+"""
+    expected = "IndexOutOfRange(4, 4)"
+    assert Executor(source, transpile=True).run_from_source() == expected
+    source = source.replace("int i := 4;", "int i := -1;").replace("a[i - 1]", "a[i + 1]")
+    assert Executor(source, transpile=True).run_from_source() == "IndexOutOfRange(-1, 4)"
+
+def test_013():
+    """Test division by zero and reaching through nil, and only those, raise their ExecutionError"""
+    source = """
+class Test {
+    static void main() {
+        int zero := 0;
+        io.writeIntLn(1 % zero);
+    }
+}
+"""
+    assert Executor(source, transpile=True).run_from_source() == "DivisionByZero()"
+    source = """
+class Node {
+    int value;
+    int get() { return this.value; }
+}
+class Test {
+    Node next;
+    static void main() {
+        Test t := new Test();
+        io.writeIntLn(t.next.get());
+    }
+}
+"""
+    assert Executor(source, transpile=True).run_from_source() == "NilDereference()"
+    # an array method without a return statement returns nil
+    source = """
+class Node {
+    int value;
+}
+class Test {
+    static int[2] values() { }
+    static void main() {
+        Node[2] nodes;
+        int[2] a := Test.values();
+        io.writeIntLn(a[0]);
+    }
+}
+"""
+    assert Executor(source, transpile=True).run_from_source() == "NilDereference()"
+    assert Executor(source.replace("a[0]", "nodes[1].value"), transpile=True).run_from_source() == "NilDereference()"
+    # any other Python error is a bug of the back end, not a nil
+    assert execution_error(AttributeError("F0_value")) is None
+    assert execution_error(TypeError("'float' object cannot be interpreted as an integer")) is None
+
+def test_014():
+    """Test references to variables, array elements, fields and static attributes"""
+    source = """
+class Box {
+    int value := 5;
+    static int shared := 7;
+}
+class Test {
+    static void swap(int & a; int & b) {
+        int t := a;
+        a := b;
+        b := t;
+    }
+    static void bump(int & v) { v := v + 1; }
+    static void main() {
+        int x := 1, y := 2;
+        int[3] a := {1, 2, 3};
+        Box c := new Box();
+        Test.swap(x, y);
+        Test.bump(a[2]);
+        Test.bump(c.value);
+        Test.bump(Box.shared);
+        Test.bump(a[0] + 1);
+        io.writeIntLn(x * 10 + y);
+        io.writeIntLn(a[2]);
+        io.writeIntLn(c.value);
+        io.writeIntLn(Box.shared);
+        io.writeIntLn(a[0]);
+    }
+}
+"""
+    expected = "21\n4\n6\n8\n1\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_015():
+    """Test methods returning references"""
+    source = """
+class Test {
+    static int & first(int[3] a) {
+        return a[0];
+    }
+    static void set(int & target; int value) {
+        target := value;
+    }
+    static void main() {
+        int[3] a := {1, 2, 3};
+        Test.set(Test.first(a), 100);
+        io.writeIntLn(a[0]);
+        io.writeIntLn(Test.first(a) + 1);
+    }
+}
+"""
+    expected = "100\n101\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_016():
+    """Test destructors run once their object is unreachable"""
+    source = """
+class Resource {
+    string name;
+    Resource(string name) { this.name := name; }
+    ~Resource() { io.writeStrLn("free " ^ this.name); }
+}
+class Test {
+    static void use() {
+        Resource r := new Resource("a");
+        io.writeStrLn("using " ^ r.name);
+    }
+    static void main() {
+        Resource kept := new Resource("b");
+        Test.use();
+        io.writeStrLn("done");
+    }
+}
+"""
+    expected = "using a\nfree a\ndone\nfree b\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_017():
+    """Test reading input, and reading a value of the wrong type"""
+    source = """
+class Test {
+    static void main() {
+        int a := io.readInt();
+        float f := io.readFloat();
+        boolean b := io.readBool();
+        string s := io.readStr();
+        io.writeIntLn(a * 2);
+        io.writeFloatLn(f + 1);
+        io.writeBoolLn(!b);
+        io.writeStrLn(s ^ "!");
+    }
+}
+"""
+    expected = "42\n3.5\nfalse\nhi there!\n"
+    assert Executor(source, input="21\n2.5\ntrue\nhi there\n", transpile=True).run_from_source() == expected
+    assert Executor(source, input="abc\n", transpile=True).run_from_source() == "InvalidInput(abc)"
+
+def test_018():
+    """Test && and || do not evaluate their right operand, and comparisons do not chain"""
+    source = """
+class Test {
+    static boolean touch(boolean v) {
+        io.writeStrLn("touched");
+        return v;
+    }
+    static void main() {
+        boolean a := false, b := true, c := false;
+        io.writeBoolLn(a && Test.touch(true));
+        io.writeBoolLn(b || Test.touch(false));
+        io.writeBoolLn((a && b) == c);
+        io.writeBoolLn((1 < 2) == (2 < 1));
+    }
+}
+"""
+    expected = "false\ntrue\ntrue\nfalse\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_019():
+    """Test an instance main method runs on a new object"""
+    source = """
+class Program {
+    int start := 7;
+    void main() {
+        io.writeIntLn(this.start);
+    }
+}
+"""
+    expected = "7\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+
+def test_020():
+    """Test classes become slotted Python classes and for loops range loops"""
+    source = """
+class Point {
+    int x, y;
+}
+class Test {
+    static void main() {
+        int i, n := 0;
+        for i := 10 downto 1 do n := n + i;
+        io.writeIntLn(n);
+    }
+}
+"""
+    python = Transpiler().transpile(ASTGenerator(source).generate())
+    assert "class C_Point:\n    __slots__ = ('F0_x', 'F1_y')\n" in python
+    assert "for L0_i in range(L0_i, 0, -1):" in python
+
+def test_021(tmp_path, monkeypatch):
+    """Test compiled programs are cached by their source and the compiler, and run again without compiling"""
+    source = """
+class Test {
+    static void main() {
+        io.writeIntLn(6 * 7);
+    }
+}
+"""
+    directory = str(tmp_path / "transpiled")
+    cache = CodeCache(directory)
+    code = cache.load(source)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert os.listdir(directory) == [os.path.basename(cache.path(source))]
+    cache = CodeCache(directory)
+    cached = cache.load(source)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cached == code
+    for x in (code, cached):
+        output = io.StringIO()
+        Runtime(io.StringIO(), output).run(x)
+        assert output.getvalue() == "42\n"
+    assert CodeCache(directory, fold=False).path(source) != cache.path(source)
+    # a change to any source of the compiler, such as the transpiler, is a new key
+    key = cache.key(source)
+    monkeypatch.setattr(cache_module, "compiler_digest", lambda: b"another transpiler")
+    assert cache.key(source) != key
+    monkeypatch.undo()
+    with open(cache.path(source), "wb") as f:
+        f.write(b"garbage")
+    cache.load(source)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert os.listdir(directory) == []
+
+def test_022():
+    """Test a failing destructor stops the program, and objects held by static attributes are not destroyed"""
+    source = """
+class Resource {
+    static Resource kept := new Resource();
+    ~Resource() {
+        int n;
+        io.writeStrLn("free");
+        n := io.readInt();
+    }
+    int use() { return 1; }
+}
+class Test {
+    static void main() {
+        int n := new Resource().use();
+        io.writeStrLn("after");
+    }
+}
+"""
+    assert Executor(source, input="1\n", transpile=True).run_from_source() == "free\nafter\n"
+    assert Executor(source, input="x\n", transpile=True).run_from_source() == "InvalidInput(x)"
+    assert Executor(source, input="x\n").run_from_source() == "InvalidInput(x)"
+
+def test_023():
+    """Test reference variables alias their initializer on both back ends, as in Example 4 of the specification"""
+    source = """
+class MathUtils {
+    static void swap(int & a; int & b) {
+        int temp := a;
+        a := b;
+        b := temp;
+    }
+    static int & findMax(int[5] & arr) {
+        int & max := arr[0];
+        int i;
+        for i := 1 to 4 do {
+            if (arr[i] > max) then {
+                max := arr[i];
+            }
+        }
+        return max;
+    }
+}
+class Example4 {
+    static void main() {
+        int x := 10, y := 20;
+        int & xRef := x;
+        int[5] numbers := {1, 2, 3, 4, 5};
+        int & last := numbers[4];
+        MathUtils.swap(x, y);
+        io.writeIntLn(xRef);
+        xRef := 30;
+        io.writeIntLn(x);
+        last := 100;
+        io.writeIntLn(MathUtils.findMax(numbers));
+        io.writeFloatLn(numbers[1 \\ 1] / 2);
+    }
+}
+"""
+    expected = "20\n30\n100\n1.0\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+    assert Executor(source).run_from_source() == expected
+    source = "class Test { static void main() { int x := 1; int & a, b := x; io.writeIntLn(b); } }"
+    assert Executor(source, transpile=True).run_from_source() == "reference a has no initializer"
+
+def test_024():
+    """Test both back ends run destructors in the same order as their objects are dropped"""
+    source = """
+class A {
+    int n;
+    A(int n) { this.n := n; }
+    ~A() { io.writeIntLn(this.n); }
+}
+class Test {
+    static int f() {
+        A x := new A(3), y := new A(4);
+        A z := new A(5);
+        return 0;
+    }
+    static void main() {
+        A a := new A(1);
+        A[2] both;
+        int k;
+        a := new A(2);
+        io.writeStrLn("stored");
+        k := Test.f();
+        both[0] := new A(6);
+        both[1] := new A(7);
+        both[0] := both[1];
+        io.writeStrLn("end");
+    }
+}
+"""
+    expected = "1\nstored\n3\n4\n5\n6\nend\n2\n7\n"
+    assert Executor(source, transpile=True).run_from_source() == expected
+    assert Executor(source).run_from_source() == expected
@@ -1,3 +1,4 @@
+import io
 import sys
 import os
 import subprocess
@@ -11,33 +12,47 @@ from antlr4 import *
 from build.OPLangLexer import OPLangLexer
 from build.OPLangParser import OPLangParser
 from src.utils.error_listener import NewErrorListener
+from src.frontend.parsing import LL
+from src.frontend.backends import ANTLR, parse_source
+from src.frontend.session import session_pool
 from src.astgen.ast_generation import ASTGeneration
 from src.semantics.static_checker import StaticChecker
+from src.codegen import CodeGenerator, VirtualMachine, Transpiler, Runtime
 from src.utils.nodes import *
 
 
 class Tokenizer:
-    def __init__(self, input_string):
-        self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
+    def __init__(self, input_string, lexer=OPLangLexer):
+        self.input_string = input_string
+        self.lexer_class = lexer
 
     def get_tokens(self):
+        with session_pool(self.lexer_class).session() as session:
+            session.load(self.input_string)
+            return self.read_tokens(session.lexer)
+
+    def get_tokens_as_string(self):
+        with session_pool(self.lexer_class).session() as session:
+            session.load(self.input_string)
+            return self.read_tokens_as_string(session.lexer)
+
+    def read_tokens(self, lexer):
         tokens = []
-        token = self.lexer.nextToken()
+        token = lexer.nextToken()
         while token.type != Token.EOF:
             tokens.append(token.text)
             try:
-                token = self.lexer.nextToken()
+                token = lexer.nextToken()
             except Exception as e:
                 tokens.append(str(e))
                 return tokens
         return tokens + ["EOF"]
 
-    def get_tokens_as_string(self):
+    def read_tokens_as_string(self, lexer):
         tokens = []
         try:
             while True:
-                token = self.lexer.nextToken()
+                token = lexer.nextToken()
                 if token.type == Token.EOF:
                     tokens.append("EOF")
                     break
@@ -51,17 +66,27 @@ class Tokenizer:
 
 
 class Parser:
-    def __init__(self, input_string):
-        self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
-        self.parser = OPLangParser(self.token_stream)
-        self.parser.removeErrorListeners()
-        self.parser.addErrorListener(NewErrorListener.INSTANCE)
+    def __init__(self, input_string, mode=LL, lexer=OPLangLexer):
+        self.input_string = input_string
+        self.mode = mode
+        self.lexer_class = lexer
+        self._parser = None
+
+    @property
+    def parser(self):
+        """A parser of its own over the input, for callers that drive it directly."""
+        if self._parser is None:
+            lexer = self.lexer_class(InputStream(self.input_string))
+            self._parser = OPLangParser(CommonTokenStream(lexer))
+            self._parser.removeErrorListeners()
+            self._parser.addErrorListener(NewErrorListener.INSTANCE)
+        return self._parser
 
     def parse(self):
         try:
-            self.parser.program()  # Assuming 'program' is the entry point of your grammar
+            # parsers are reused from a pool, see src/frontend/session.py
+            with session_pool(self.lexer_class).session() as session:
+                session.parse(self.input_string, self.mode, NewErrorListener.INSTANCE)
             return "success"
         except Exception as e:
             return str(e)
@@ -70,23 +95,20 @@ class Parser:
 class ASTGenerator:
     """Class to generate AST from HLang source code."""
 
-    def __init__(self, input_string):
+    def __init__(self, input_string, mode=LL, backend=ANTLR):
         self.input_string = input_string
-        self.input_stream = InputStream(input_string)
-        self.lexer = OPLangLexer(self.input_stream)
-        self.token_stream = CommonTokenStream(self.lexer)
-        self.parser = OPLangParser(self.token_stream)
-        self.ast_generator = ASTGeneration()
+        self.mode = mode
+        self.backend = backend
 
     def generate(self):
         """Generate AST from the input string."""
         try:
-            # Parse the program starting from the entry point
-            parse_tree = self.parser.program()
+            if self.backend != ANTLR:
+                return parse_source(self.input_string, self.backend, self.mode)
 
-            # Generate AST using the visitor
-            ast = self.ast_generator.visit(parse_tree)
-            return ast
+            # Parse the program starting from the entry point and build the AST
+            with session_pool().session() as session:
+                return session.build_ast(self.input_string, self.mode)
         except Exception as e:
             return f"AST Generation Error: {str(e)}"
 
@@ -94,9 +116,11 @@ class ASTGenerator:
 class Checker:
     """Class to perform static checking on the AST."""
 
-    def __init__(self, source=None, ast=None):
+    def __init__(self, source=None, ast=None, mode=LL, backend=ANTLR):
         self.source = source
         self.ast = ast
+        self.mode = mode
+        self.backend = backend
         self.checker = StaticChecker()
 
     def check_from_ast(self):
@@ -110,7 +134,7 @@ class Checker:
     def check_from_source(self):
         """Perform static checking on the source code."""
         try:
-            ast_gen = ASTGenerator(self.source)
+            ast_gen = ASTGenerator(self.source, self.mode, self.backend)
             self.ast = ast_gen.generate()
             if isinstance(self.ast, str):  # If AST generation failed
                 return self.ast
@@ -118,3 +142,45 @@ class Checker:
             return "Static checking passed"
         except Exception as e:
             return str(e)
+
+    def check_all_from_source(self):
+        """Check the source code in collecting mode and return every error message, [] when it passes."""
+        try:
+            ast_gen = ASTGenerator(self.source, self.mode, self.backend)
+            self.ast = ast_gen.generate()
+            if isinstance(self.ast, str):  # If AST generation failed
+                return [self.ast]
+            return [str(x) for x in self.checker.collect_errors(self.ast)]
+        except Exception as e:
+            return [str(e)]
+
+
+class Executor:
+    """Class to compile a program to bytecode and run it on the virtual machine, or to run it transpiled to Python."""
+
+    def __init__(self, source=None, ast=None, input="", mode=LL, backend=ANTLR, fold=True, transpile=False):
+        self.source = source
+        self.ast = ast
+        self.input = input
+        self.mode = mode
+        self.backend = backend
+        self.fold = fold
+        self.transpile = transpile
+
+    def run_from_source(self):
+        """Run the source code and return what it printed, or the error stopping it."""
+        if self.ast is None:
+            self.ast = ASTGenerator(self.source, self.mode, self.backend).generate()
+            if isinstance(self.ast, str):  # If AST generation failed
+                return self.ast
+        try:
+            output = io.StringIO()
+            if self.transpile:
+                code = Transpiler().compile(self.ast, fold=self.fold)
+                Runtime(io.StringIO(self.input), output).run(code)
+            else:
+                module = CodeGenerator().generate(self.ast, fold=self.fold)
+                VirtualMachine(io.StringIO(self.input), output).run(module)
+            return output.getvalue()
+        except Exception as e:
+            return str(e)